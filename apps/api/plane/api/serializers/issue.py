@@ -23,6 +23,7 @@ from plane.db.models import (
     User,
     EstimatePoint,
 )
+from plane.utils.issue_stats import refresh_issue_cycle_stats
 from plane.utils.content_validator import (
     validate_html_content,
     validate_binary_data,
@@ -257,6 +258,7 @@ class IssueSerializer(BaseSerializer):
                 )
             except IntegrityError:
                 pass
+            refresh_issue_cycle_stats([instance.id])
 
         if labels is not None:
             IssueLabel.objects.filter(issue=instance).delete()
@@ -11,6 +11,7 @@ from plane.db.models import (
     ModuleIssue,
     ProjectMember,
 )
+from plane.utils.issue_stats import refresh_module_stats
 
 
 class ModuleCreateSerializer(BaseSerializer):
@@ -104,6 +105,7 @@ class ModuleCreateSerializer(BaseSerializer):
                 batch_size=10,
                 ignore_conflicts=True,
             )
+        refresh_module_stats([module.id])
 
         return module
 
@@ -149,6 +151,7 @@ class ModuleUpdateSerializer(ModuleCreateSerializer):
                 batch_size=10,
                 ignore_conflicts=True,
             )
+            refresh_module_stats([instance.id])
 
         return super().update(instance, validated_data)
 
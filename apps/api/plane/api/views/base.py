@@ -2,7 +2,6 @@
 import zoneinfo
 
 # Django imports
-from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.db import IntegrityError
 from django.urls import resolve
@@ -106,10 +105,6 @@ class BaseAPIView(TimezoneMixin, GenericAPIView, ReadReplicaControlMixin, BasePa
     def dispatch(self, request, *args, **kwargs):
         try:
             response = super().dispatch(request, *args, **kwargs)
-            if settings.DEBUG:
-                from django.db import connection
-
-                print(f"{request.method} - {request.get_full_path()} of Queries: {len(connection.queries)}")
             return response
         except Exception as exc:
             response = self.handle_exception(exc)
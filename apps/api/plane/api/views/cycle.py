@@ -43,6 +43,8 @@ from plane.db.models import (
 )
 from plane.utils.cycle_transfer_issues import transfer_cycle_issues
 from plane.utils.host import base_host
+from plane.utils.issue_counters import refresh_issue_counters
+from plane.utils.issue_stats import refresh_cycle_stats
 from .base import BaseAPIView
 from plane.bgtasks.webhook_task import model_activity
 from plane.utils.openapi.decorators import cycle_docs
@@ -1018,6 +1020,8 @@ class CycleIssueListCreateAPIEndpoint(BaseAPIView):
 
         # Update the cycle issues
         CycleIssue.objects.bulk_update(updated_records, ["cycle_id"], batch_size=100)
+        refresh_cycle_stats([cycle_id, *[record["old_cycle_id"] for record in update_cycle_issue_activity]])
+        refresh_issue_counters(issues)
 
         # Capture Issue Activity
         issue_activity.delay(
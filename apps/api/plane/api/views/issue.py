@@ -72,6 +72,7 @@ from plane.settings.storage import S3Storage
 from plane.bgtasks.storage_metadata_task import get_asset_object_metadata
 from .base import BaseAPIView
 from plane.utils.host import base_host
+from plane.utils.activity_archive import TieredActivityPaginator, get_archive_filter
 from plane.bgtasks.webhook_task import model_activity
 from plane.app.permissions import ROLE
 from plane.utils.openapi import (
@@ -1649,11 +1650,31 @@ class IssueActivityListAPIEndpoint(BaseAPIView):
             )
             .filter(project__archived_at__isnull=True)
             .select_related("actor", "workspace", "issue", "project")
-        ).order_by(request.GET.get("order_by", "created_at"))
+        )
+
+        # The archived activities are only read by members of the project
+        is_member = ProjectMember.objects.filter(
+            workspace__slug=slug,
+            project_id=project_id,
+            member=self.request.user,
+            is_active=True,
+            project__archived_at__isnull=True,
+        ).exists()
 
         return self.paginate(
+            order_by=request.GET.get("order_by", "created_at"),
             request=request,
             queryset=(issue_activities),
+            paginator_cls=TieredActivityPaginator,
+            archive_filter=(
+                get_archive_filter(
+                    exclude_fields=["comment", "vote", "reaction", "draft"],
+                    issue_id=issue_id,
+                    project_id=project_id,
+                )
+                if is_member
+                else None
+            ),
             on_results=lambda issue_activity: IssueActivitySerializer(
                 issue_activity, many=True, fields=self.fields, expand=self.expand
             ).data,
@@ -1704,11 +1725,31 @@ class IssueActivityDetailAPIEndpoint(BaseAPIView):
             )
             .filter(project__archived_at__isnull=True)
             .select_related("actor", "workspace", "issue", "project")
-        ).order_by(request.GET.get("order_by", "created_at"))
+        )
+
+        # The archived activities are only read by members of the project
+        is_member = ProjectMember.objects.filter(
+            workspace__slug=slug,
+            project_id=project_id,
+            member=self.request.user,
+            is_active=True,
+            project__archived_at__isnull=True,
+        ).exists()
 
         return self.paginate(
+            order_by=request.GET.get("order_by", "created_at"),
             request=request,
             queryset=(issue_activities),
+            paginator_cls=TieredActivityPaginator,
+            archive_filter=(
+                get_archive_filter(
+                    exclude_fields=["comment", "vote", "reaction", "draft"],
+                    issue_id=issue_id,
+                    project_id=project_id,
+                )
+                if is_member
+                else None
+            ),
             on_results=lambda issue_activity: IssueActivitySerializer(
                 issue_activity, many=True, fields=self.fields, expand=self.expand
             ).data,
@@ -38,6 +38,7 @@ from plane.db.models import (
 from .base import BaseAPIView
 from plane.bgtasks.webhook_task import model_activity
 from plane.utils.host import base_host
+from plane.utils.issue_stats import refresh_module_stats
 from plane.utils.openapi import (
     module_docs,
     module_issue_docs,
@@ -707,6 +708,7 @@ class ModuleIssueListCreateAPIEndpoint(BaseAPIView):
         ModuleIssue.objects.bulk_create(record_to_create, batch_size=10, ignore_conflicts=True)
 
         ModuleIssue.objects.bulk_update(records_to_update, ["module"], batch_size=10)
+        refresh_module_stats([module_id, *[record["old_module_id"] for record in update_module_issue_activity]])
 
         # Capture Issue Activity
         issue_activity.delay(
@@ -39,6 +39,7 @@ from plane.db.models import (
     ProjectMember,
     EstimatePoint,
 )
+from plane.utils.issue_stats import refresh_issue_cycle_stats
 from plane.utils.content_validator import (
     validate_html_content,
     validate_binary_data,
@@ -295,6 +296,7 @@ class IssueCreateSerializer(BaseSerializer):
                 )
             except IntegrityError:
                 pass
+            refresh_issue_cycle_stats([instance.id])
 
         if labels is not None:
             IssueLabel.objects.filter(issue=instance).delete()
@@ -17,6 +17,7 @@ from plane.db.models import (
     ModuleLink,
     ModuleUserProperties,
 )
+from plane.utils.issue_stats import refresh_module_stats
 
 
 class ModuleWriteSerializer(BaseSerializer):
@@ -84,6 +85,7 @@ class ModuleWriteSerializer(BaseSerializer):
                 batch_size=10,
                 ignore_conflicts=True,
             )
+        refresh_module_stats([module.id])
 
         return module
 
@@ -112,6 +114,7 @@ class ModuleWriteSerializer(BaseSerializer):
                 batch_size=10,
                 ignore_conflicts=True,
             )
+            refresh_module_stats([instance.id])
 
         return super().update(instance, validated_data)
 
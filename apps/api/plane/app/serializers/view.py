@@ -59,6 +59,8 @@ class IssueViewSerializer(DynamicBaseSerializer):
             "workspace",
             "project",
             "query",
+            "compiled_filters",
+            "filter_signature",
             "owned_by",
             "access",
             "is_locked",
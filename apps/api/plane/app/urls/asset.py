@@ -9,6 +9,7 @@ from plane.app.views import (
     WorkspaceFileAssetEndpoint,
     UserAssetsV2Endpoint,
     StaticFileAssetEndpoint,
+    StaticFileAssetBatchEndpoint,
     AssetRestoreEndpoint,
     ProjectAssetEndpoint,
     ProjectBulkAssetEndpoint,
@@ -71,6 +72,11 @@ urlpatterns = [
         StaticFileAssetEndpoint.as_view(),
         name="static-file-asset",
     ),
+    path(
+        "assets/v2/static/batch/",
+        StaticFileAssetBatchEndpoint.as_view(),
+        name="static-file-asset-batch",
+    ),
     path(
         "assets/v2/workspaces/<str:slug>/projects/<uuid:project_id>/",
         ProjectAssetEndpoint.as_view(),
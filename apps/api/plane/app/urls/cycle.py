@@ -11,6 +11,7 @@ from plane.app.views import (
     TransferCycleIssueEndpoint,
     CycleUserPropertiesEndpoint,
     CycleArchiveUnarchiveEndpoint,
+    CycleCriticalPathEndpoint,
 )
 
 
@@ -32,6 +33,11 @@ urlpatterns = [
         ),
         name="project-cycle",
     ),
+    path(
+        "workspaces/<str:slug>/projects/<uuid:project_id>/cycles/<uuid:cycle_id>/critical-path/",
+        CycleCriticalPathEndpoint.as_view(),
+        name="project-cycle-critical-path",
+    ),
     path(
         "workspaces/<str:slug>/projects/<uuid:project_id>/cycles/<uuid:cycle_id>/cycle-issues/",
         CycleIssueViewSet.as_view({"get": "list", "post": "create"}),
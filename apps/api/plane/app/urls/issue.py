@@ -14,6 +14,7 @@ from plane.app.views import (
     IssueListEndpoint,
     IssueReactionViewSet,
     IssueRelationViewSet,
+    IssueDependencyEndpoint,
     IssueSubscriberViewSet,
     IssueUserDisplayPropertyEndpoint,
     IssueViewSet,
@@ -253,6 +254,11 @@ urlpatterns = [
         IssueRelationViewSet.as_view({"post": "remove_relation"}),
         name="issue-relation",
     ),
+    path(
+        "workspaces/<str:slug>/projects/<uuid:project_id>/issue-dependencies/",
+        IssueDependencyEndpoint.as_view(),
+        name="issue-dependencies",
+    ),
     ## End Issue Relation
     path(
         "workspaces/<str:slug>/projects/<uuid:project_id>/deleted-issues/",
@@ -104,6 +104,7 @@ from .asset.v2 import (
     WorkspaceFileAssetEndpoint,
     UserAssetsV2Endpoint,
     StaticFileAssetEndpoint,
+    StaticFileAssetBatchEndpoint,
     AssetRestoreEndpoint,
     ProjectAssetEndpoint,
     ProjectBulkAssetEndpoint,
@@ -142,7 +143,7 @@ from .issue.label import LabelViewSet, BulkCreateIssueLabelsEndpoint
 
 from .issue.link import IssueLinkViewSet
 
-from .issue.relation import IssueRelationViewSet
+from .issue.relation import CycleCriticalPathEndpoint, IssueDependencyEndpoint, IssueRelationViewSet
 
 from .issue.reaction import IssueReactionViewSet
 
@@ -25,6 +25,8 @@ from plane.utils.date_utils import (
 
 
 class AdvanceAnalyticsBaseView(BaseAPIView):
+    use_read_replica = True
+
     def initialize_workspace(self, slug: str, type: str) -> None:
         self._workspace_slug = slug
         self.filters = get_analytics_filters(
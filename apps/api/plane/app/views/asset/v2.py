@@ -3,7 +3,6 @@ import uuid
 
 # Django imports
 from django.conf import settings
-from django.http import HttpResponseRedirect
 from django.utils import timezone
 from django.db import IntegrityError
 
@@ -19,6 +18,15 @@ from plane.settings.storage import S3Storage
 from plane.app.permissions import allow_permission, ROLE
 from plane.utils.cache import invalidate_cache_directly
 from plane.bgtasks.storage_metadata_task import get_asset_object_metadata
+from plane.utils.signed_url import get_cached_signed_url, get_signed_url, get_signed_urls, signed_url_redirect
+
+# Assets served publicly through the static endpoint
+STATIC_ASSET_ENTITY_TYPES = [
+    FileAsset.EntityTypeContext.USER_AVATAR,
+    FileAsset.EntityTypeContext.USER_COVER,
+    FileAsset.EntityTypeContext.WORKSPACE_LOGO,
+    FileAsset.EntityTypeContext.PROJECT_COVER,
+]
 
 
 class UserAssetsV2Endpoint(BaseAPIView):
@@ -414,14 +422,11 @@ class WorkspaceFileAssetEndpoint(BaseAPIView):
 
         # Get the presigned URL
         storage = S3Storage(request=request)
-        # Generate a presigned URL to share an S3 object
-        signed_url = storage.generate_presigned_url(
-            object_name=asset.asset.name,
-            disposition="attachment",
-            filename=asset.attributes.get("name"),
+        signed_url, max_age = get_signed_url(
+            storage, asset, disposition="attachment", filename=asset.attributes.get("name")
         )
         # Redirect to the signed URL
-        return HttpResponseRedirect(signed_url)
+        return signed_url_redirect(signed_url, max_age)
 
 
 class StaticFileAssetEndpoint(BaseAPIView):
@@ -430,6 +435,13 @@ class StaticFileAssetEndpoint(BaseAPIView):
     permission_classes = [AllowAny]
 
     def get(self, request, asset_id):
+        storage = S3Storage(request=request)
+
+        # Only static assets are cached with the inline disposition, a hit skips the lookup
+        cached = get_cached_signed_url(storage, asset_id, disposition="inline")
+        if cached is not None:
+            return signed_url_redirect(*cached)
+
         # get the asset id
         asset = FileAsset.objects.get(id=asset_id)
 
@@ -441,23 +453,44 @@ class StaticFileAssetEndpoint(BaseAPIView):
             )
 
         # Check if the entity type is allowed
-        if asset.entity_type not in [
-            FileAsset.EntityTypeContext.USER_AVATAR,
-            FileAsset.EntityTypeContext.USER_COVER,
-            FileAsset.EntityTypeContext.WORKSPACE_LOGO,
-            FileAsset.EntityTypeContext.PROJECT_COVER,
-        ]:
+        if asset.entity_type not in STATIC_ASSET_ENTITY_TYPES:
             return Response(
                 {"error": "Invalid entity type.", "status": False},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Get the presigned URL
-        storage = S3Storage(request=request)
         # Generate a presigned URL to share an S3 object
-        signed_url = storage.generate_presigned_url(object_name=asset.asset.name)
+        signed_url, max_age = get_signed_url(storage, asset, disposition="inline")
         # Redirect to the signed URL
-        return HttpResponseRedirect(signed_url)
+        return signed_url_redirect(signed_url, max_age)
+
+
+class StaticFileAssetBatchEndpoint(BaseAPIView):
+    """Resolve the signed URLs of many static assets in one request."""
+
+    def post(self, request):
+        asset_ids = request.data.get("asset_ids", [])
+        if not isinstance(asset_ids, list) or len(asset_ids) > settings.SIGNED_URL_BATCH_SIZE:
+            return Response(
+                {"error": f"asset_ids must be a list of at most {settings.SIGNED_URL_BATCH_SIZE} ids."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        valid_ids = []
+        for asset_id in asset_ids:
+            try:
+                valid_ids.append(uuid.UUID(str(asset_id)))
+            except ValueError:
+                continue
+
+        assets = FileAsset.objects.filter(
+            id__in=valid_ids, is_uploaded=True, entity_type__in=STATIC_ASSET_ENTITY_TYPES
+        ).only("id", "asset")
+        signed_urls = get_signed_urls(S3Storage(request=request), list(assets), disposition="inline")
+        return Response(
+            {str(asset_id): url for asset_id, url in signed_urls.items()},
+            status=status.HTTP_200_OK,
+        )
 
 
 class AssetRestoreEndpoint(BaseAPIView):
@@ -612,14 +645,11 @@ class ProjectAssetEndpoint(BaseAPIView):
 
         # Get the presigned URL
         storage = S3Storage(request=request)
-        # Generate a presigned URL to share an S3 object
-        signed_url = storage.generate_presigned_url(
-            object_name=asset.asset.name,
-            disposition="attachment",
-            filename=asset.attributes.get("name"),
+        signed_url, max_age = get_signed_url(
+            storage, asset, disposition="attachment", filename=asset.attributes.get("name")
         )
         # Redirect to the signed URL
-        return HttpResponseRedirect(signed_url)
+        return signed_url_redirect(signed_url, max_age)
 
 
 class ProjectBulkAssetEndpoint(BaseAPIView):
@@ -710,13 +740,11 @@ class WorkspaceAssetDownloadEndpoint(BaseAPIView):
             )
 
         storage = S3Storage(request=request)
-        signed_url = storage.generate_presigned_url(
-            object_name=asset.asset.name,
-            disposition="attachment",
-            filename=asset.attributes.get("name", uuid.uuid4().hex),
+        signed_url, max_age = get_signed_url(
+            storage, asset, disposition="attachment", filename=asset.attributes.get("name", uuid.uuid4().hex)
         )
 
-        return HttpResponseRedirect(signed_url)
+        return signed_url_redirect(signed_url, max_age)
 
 
 class ProjectAssetDownloadEndpoint(BaseAPIView):
@@ -738,10 +766,8 @@ class ProjectAssetDownloadEndpoint(BaseAPIView):
             )
 
         storage = S3Storage(request=request)
-        signed_url = storage.generate_presigned_url(
-            object_name=asset.asset.name,
-            disposition="attachment",
-            filename=asset.attributes.get("name", uuid.uuid4().hex),
+        signed_url, max_age = get_signed_url(
+            storage, asset, disposition="attachment", filename=asset.attributes.get("name", uuid.uuid4().hex)
         )
 
-        return HttpResponseRedirect(signed_url)
+        return signed_url_redirect(signed_url, max_age)
@@ -108,11 +108,6 @@ class BaseViewSet(TimezoneMixin, ReadReplicaControlMixin, ModelViewSet, BasePagi
         try:
             response = super().dispatch(request, *args, **kwargs)
 
-            if settings.DEBUG:
-                from django.db import connection
-
-                print(f"{request.method} - {request.get_full_path()} of Queries: {len(connection.queries)}")
-
             return response
         except Exception as exc:
             response = self.handle_exception(exc)
@@ -204,10 +199,6 @@ class BaseAPIView(TimezoneMixin, ReadReplicaControlMixin, APIView, BasePaginator
         try:
             response = super().dispatch(request, *args, **kwargs)
 
-            if settings.DEBUG:
-                from django.db import connection
-
-                print(f"{request.method} - {request.get_full_path()} of Queries: {len(connection.queries)}")
             return response
 
         except Exception as exc:
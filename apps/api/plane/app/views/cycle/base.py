@@ -4,7 +4,6 @@ import pytz
 
 
 # Django imports
-from django.contrib.postgres.aggregates import ArrayAgg
 from django.contrib.postgres.fields import ArrayField
 from django.db.models import (
     Case,
@@ -40,16 +39,17 @@ from plane.bgtasks.issue_activities_task import issue_activity
 from plane.db.models import (
     Cycle,
     CycleIssue,
+    CycleStats,
     UserFavorite,
     CycleUserProperties,
     Issue,
     Label,
     User,
     Project,
-    UserRecentVisit,
 )
 from plane.utils.analytics_plot import burndown_plot
-from plane.bgtasks.recent_visited_task import recent_visited_task
+from plane.utils.issue_stats import ensure_cycle_stats, get_stats_annotations
+from plane.bgtasks.recent_visited_task import delete_recent_visits, record_recent_visit
 from plane.utils.host import base_host
 from plane.utils.cycle_transfer_issues import transfer_cycle_issues
 from .. import BaseAPIView, BaseViewSet
@@ -109,44 +109,7 @@ class CycleViewSet(BaseViewSet):
                 )
             )
             .annotate(is_favorite=Exists(favorite_subquery))
-            .annotate(
-                total_issues=Count(
-                    "issue_cycle__issue__id",
-                    distinct=True,
-                    filter=Q(
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                        issue_cycle__deleted_at__isnull=True,
-                        issue_cycle__issue__deleted_at__isnull=True,
-                    ),
-                )
-            )
-            .annotate(
-                completed_issues=Count(
-                    "issue_cycle__issue__id",
-                    distinct=True,
-                    filter=Q(
-                        issue_cycle__issue__state__group="completed",
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                        issue_cycle__deleted_at__isnull=True,
-                        issue_cycle__issue__deleted_at__isnull=True,
-                    ),
-                )
-            )
-            .annotate(
-                cancelled_issues=Count(
-                    "issue_cycle__issue__id",
-                    distinct=True,
-                    filter=Q(
-                        issue_cycle__issue__state__group__in=["cancelled"],
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                        issue_cycle__deleted_at__isnull=True,
-                        issue_cycle__issue__deleted_at__isnull=True,
-                    ),
-                )
-            )
+            .annotate(**get_stats_annotations(CycleStats))
             .annotate(
                 status=Case(
                     When(
@@ -166,16 +129,7 @@ class CycleViewSet(BaseViewSet):
             )
             .annotate(
                 assignee_ids=Coalesce(
-                    ArrayAgg(
-                        "issue_cycle__issue__assignees__id",
-                        distinct=True,
-                        filter=~Q(issue_cycle__issue__assignees__id__isnull=True)
-                        & (
-                            Q(
-                                issue_cycle__issue__issue_assignee__deleted_at__isnull=True
-                            )
-                        ),
-                    ),
+                    F("stats__assignee_ids"),
                     Value([], output_field=ArrayField(UUIDField())),
                 )
             )
@@ -185,6 +139,7 @@ class CycleViewSet(BaseViewSet):
 
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST])
     def list(self, request, slug, project_id):
+        ensure_cycle_stats(project_id)
         queryset = self.get_queryset().filter(archived_at__isnull=True)
         cycle_view = request.GET.get("cycle_view", "all")
 
@@ -434,6 +389,7 @@ class CycleViewSet(BaseViewSet):
 
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER])
     def retrieve(self, request, slug, project_id, pk):
+        ensure_cycle_stats(project_id)
         queryset = self.get_queryset().filter(archived_at__isnull=True).filter(pk=pk)
         data = (
             self.get_queryset()
@@ -492,7 +448,7 @@ class CycleViewSet(BaseViewSet):
         datetime_fields = ["start_date", "end_date"]
         data = user_timezone_converter(data, datetime_fields, project_timezone)
 
-        recent_visited_task.delay(
+        record_recent_visit(
             slug=slug,
             entity_name="cycle",
             entity_identifier=pk,
@@ -539,12 +495,7 @@ class CycleViewSet(BaseViewSet):
             project_id=project_id,
         ).delete()
         # Delete the cycle from recent visits
-        UserRecentVisit.objects.filter(
-            project_id=project_id,
-            workspace__slug=slug,
-            entity_identifier=pk,
-            entity_name="cycle",
-        ).delete(soft=False)
+        delete_recent_visits(entity_name="cycle", entity_identifier=pk, project_id=project_id, slug=slug)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
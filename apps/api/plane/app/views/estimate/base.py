@@ -19,6 +19,7 @@ from plane.app.serializers import (
     EstimateReadSerializer,
 )
 from plane.utils.cache import invalidate_cache
+from plane.utils.issue_stats import refresh_project_stats
 from plane.bgtasks.issue_activities_task import issue_activity
 
 
@@ -135,6 +136,7 @@ class BulkEstimatePointEndpoint(BaseViewSet):
                 updated_estimate_points.append(estimate_point)
 
         EstimatePoint.objects.bulk_update(updated_estimate_points, ["key", "value"], batch_size=10)
+        refresh_project_stats(project_id)
 
         estimate_serializer = EstimateReadSerializer(estimate)
         return Response(estimate_serializer.data, status=status.HTTP_200_OK)
@@ -1,12 +1,17 @@
 # Python imports
+from datetime import datetime, time
 from itertools import chain
 
 # Django imports
-from django.db.models import Prefetch, Q
+from django.db.models import Prefetch, Q, prefetch_related_objects
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
 from django.utils.decorators import method_decorator
 from django.views.decorators.gzip import gzip_page
 
 # Third Party imports
+from pymongo import ASCENDING
+from pymongo.errors import PyMongoError
 from rest_framework.response import Response
 from rest_framework import status
 
@@ -14,7 +19,33 @@ from rest_framework import status
 from .. import BaseAPIView
 from plane.app.serializers import IssueActivitySerializer, IssueCommentSerializer
 from plane.app.permissions import ProjectEntityPermission, allow_permission, ROLE
-from plane.db.models import IssueActivity, IssueComment, CommentReaction, IntakeIssue
+from plane.db.models import IssueActivity, IssueComment, CommentReaction, IntakeIssue, ProjectMember
+from plane.utils.activity_archive import (
+    bound_archive_filter,
+    get_archive_collection,
+    get_archive_filter,
+    get_archived_activities,
+)
+from plane.utils.exception_logger import log_exception
+
+
+def parse_created_after(value):
+    """
+    The created_at__gt filter as an aware datetime, a date stands for its
+    midnight. Returns None when the value is not a date.
+    """
+    try:
+        created_after = parse_datetime(value)
+        if created_after is None:
+            day = parse_date(value)
+            if day is None:
+                return None
+            created_after = datetime.combine(day, time.min)
+    except ValueError:
+        return None
+    if timezone.is_naive(created_after):
+        created_after = timezone.make_aware(created_after)
+    return created_after
 
 
 class IssueActivityEndpoint(BaseAPIView):
@@ -26,7 +57,10 @@ class IssueActivityEndpoint(BaseAPIView):
     def get(self, request, slug, project_id, issue_id):
         filters = {}
         if request.GET.get("created_at__gt", None) is not None:
-            filters = {"created_at__gt": request.GET.get("created_at__gt")}
+            created_after = parse_created_after(request.GET.get("created_at__gt"))
+            if created_after is None:
+                return Response({"error": "Invalid created_at__gt"}, status=status.HTTP_400_BAD_REQUEST)
+            filters = {"created_at__gt": created_after}
 
         issue_activities = (
             IssueActivity.objects.filter(issue_id=issue_id)
@@ -60,13 +94,41 @@ class IssueActivityEndpoint(BaseAPIView):
         )
 
         if request.GET.get("activity_type", None) == "issue-property":
-            issue_activities = issue_activities.prefetch_related(
-                Prefetch(
-                    "issue__issue_intake",
-                    queryset=IntakeIssue.objects.only("source_email", "source", "extra"),
-                    to_attr="source_data",
-                )
+            source_data = Prefetch(
+                "issue__issue_intake",
+                queryset=IntakeIssue.objects.only("source_email", "source", "extra"),
+                to_attr="source_data",
             )
+            hot_activities = issue_activities
+            issue_activities = list(issue_activities.prefetch_related(source_data))
+            # The archived activities precede the ones still in Postgres
+            archive_collection = get_archive_collection()
+            if (
+                archive_collection is not None
+                and ProjectMember.objects.filter(
+                    workspace__slug=slug,
+                    project_id=project_id,
+                    member=self.request.user,
+                    is_active=True,
+                    project__archived_at__isnull=True,
+                ).exists()
+            ):
+                archive_filter = get_archive_filter(
+                    exclude_fields=["comment", "vote", "reaction", "draft"],
+                    issue_id=issue_id,
+                    project_id=project_id,
+                )
+                if filters:
+                    archive_filter["created_at"] = {"$gt": filters["created_at__gt"]}
+                archive_filter = bound_archive_filter(archive_filter, hot_activities)
+                try:
+                    archived_activities = get_archived_activities(archive_collection, archive_filter, sort=ASCENDING)
+                except PyMongoError as e:
+                    # Serve the activities still in Postgres rather than failing the request
+                    log_exception(e)
+                    archived_activities = []
+                prefetch_related_objects(archived_activities, source_data)
+                issue_activities = archived_activities + issue_activities
             issue_activities = IssueActivitySerializer(issue_activities, many=True).data
             return Response(issue_activities, status=status.HTTP_200_OK)
 
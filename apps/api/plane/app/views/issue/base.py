@@ -1,5 +1,4 @@
 # Python imports
-import copy
 import json
 
 # Django imports
@@ -7,10 +6,7 @@ from django.contrib.postgres.aggregates import ArrayAgg
 from django.contrib.postgres.fields import ArrayField
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db.models import (
-    Count,
     Exists,
-    F,
-    Func,
     OuterRef,
     Prefetch,
     Q,
@@ -38,11 +34,10 @@ from plane.app.serializers import (
 )
 from plane.bgtasks.issue_activities_task import issue_activity
 from plane.bgtasks.issue_description_version_task import issue_description_version_task
-from plane.bgtasks.recent_visited_task import recent_visited_task
+from plane.bgtasks.recent_visited_task import delete_recent_visits, record_recent_visit
 from plane.bgtasks.webhook_task import model_activity
 from plane.db.models import (
     CycleIssue,
-    FileAsset,
     IntakeIssue,
     Issue,
     IssueAssignee,
@@ -55,19 +50,17 @@ from plane.db.models import (
     ModuleIssue,
     Project,
     ProjectMember,
-    UserRecentVisit,
 )
 from plane.utils.filters import ComplexFilterBackend, IssueFilterSet
 from plane.utils.global_paginator import paginate
-from plane.utils.grouper import (
-    issue_group_values,
-    issue_on_results,
-    issue_queryset_grouper,
-)
+from plane.utils.grouper import issue_queryset_grouper
 from plane.utils.host import base_host
+from plane.utils.issue_counters import get_issue_counter_annotations, refresh_parent_counters
 from plane.utils.issue_filters import issue_filters
+from plane.utils.issue_listing import IssueListQuery
+from plane.utils.issue_stats import refresh_cycle_stats, refresh_module_stats
 from plane.utils.order_queryset import order_issue_queryset
-from plane.utils.paginator import GroupedOffsetPaginator, SubGroupedOffsetPaginator
+from plane.utils.paginator import ColumnarResults
 from plane.utils.timezone_converter import user_timezone_converter
 
 from .. import BaseAPIView, BaseViewSet
@@ -76,6 +69,7 @@ from .. import BaseAPIView, BaseViewSet
 class IssueListEndpoint(BaseAPIView):
     filter_backends = (ComplexFilterBackend,)
     filterset_class = IssueFilterSet
+    use_read_replica = True
 
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST])
     def get(self, request, slug, project_id):
@@ -103,35 +97,7 @@ class IssueListEndpoint(BaseAPIView):
             )
 
         # Add annotations
-        issue_queryset = (
-            issue_queryset.annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(issue=OuterRef("id"), deleted_at__isnull=True).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .distinct()
-        )
+        issue_queryset = issue_queryset.annotate(**get_issue_counter_annotations()).distinct()
 
         order_by_param = request.GET.get("order_by", "-created_at")
         # Issue queryset
@@ -144,7 +110,7 @@ class IssueListEndpoint(BaseAPIView):
         # issue queryset
         issue_queryset = issue_queryset_grouper(queryset=issue_queryset, group_by=group_by, sub_group_by=sub_group_by)
 
-        recent_visited_task.delay(
+        record_recent_visit(
             slug=slug,
             project_id=project_id,
             entity_name="project",
@@ -194,6 +160,7 @@ class IssueViewSet(BaseViewSet):
     search_fields = ["name"]
     filter_backends = (ComplexFilterBackend,)
     filterset_class = IssueFilterSet
+    use_read_replica = True
 
     def get_serializer_class(self):
         return IssueCreateSerializer if self.action in ["create", "update", "partial_update"] else IssueSerializer
@@ -207,40 +174,7 @@ class IssueViewSet(BaseViewSet):
         return issues
 
     def apply_annotations(self, issues):
-        issues = (
-            issues.annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(issue=OuterRef("id"), deleted_at__isnull=True).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=Subquery(
-                    IssueLink.objects.filter(issue=OuterRef("id"))
-                    .values("issue")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-            .annotate(
-                attachment_count=Subquery(
-                    FileAsset.objects.filter(
-                        issue_id=OuterRef("id"),
-                        entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                    )
-                    .values("issue_id")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-            .annotate(
-                sub_issues_count=Subquery(
-                    Issue.issue_objects.filter(parent=OuterRef("id"))
-                    .values("parent")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-        )
+        issues = issues.annotate(**get_issue_counter_annotations())
 
         return issues
 
@@ -252,38 +186,11 @@ class IssueViewSet(BaseViewSet):
             extra_filters = {"updated_at__gt": request.GET.get("updated_at__gt")}
 
         project = Project.objects.get(pk=project_id, workspace__slug=slug)
-        query_params = request.query_params.copy()
-
-        filters = issue_filters(query_params, "GET")
-        order_by_param = request.GET.get("order_by", "-created_at")
 
-        issue_queryset = self.get_queryset()
-
-        # Apply rich filters
-        issue_queryset = self.filter_queryset(issue_queryset)
-
-        # Apply legacy filters
-        issue_queryset = issue_queryset.filter(**filters, **extra_filters)
+        # Apply rich and legacy filters once
+        issue_list = IssueListQuery(self, request, self.get_queryset()).filter(**extra_filters)
 
-        # Keeping a copy of the queryset before applying annotations
-        filtered_issue_queryset = copy.deepcopy(issue_queryset)
-
-        # Applying annotations to the issue queryset
-        issue_queryset = self.apply_annotations(issue_queryset)
-
-        # Issue queryset
-        issue_queryset, order_by_param = order_issue_queryset(
-            issue_queryset=issue_queryset, order_by_param=order_by_param
-        )
-
-        # Group by
-        group_by = request.GET.get("group_by", False)
-        sub_group_by = request.GET.get("sub_group_by", False)
-
-        # issue queryset
-        issue_queryset = issue_queryset_grouper(queryset=issue_queryset, group_by=group_by, sub_group_by=sub_group_by)
-
-        recent_visited_task.delay(
+        record_recent_visit(
             slug=slug,
             project_id=project_id,
             entity_name="project",
@@ -300,89 +207,9 @@ class IssueViewSet(BaseViewSet):
             ).exists()
             and not project.guest_view_all_features
         ):
-            issue_queryset = issue_queryset.filter(created_by=request.user)
-            filtered_issue_queryset = filtered_issue_queryset.filter(created_by=request.user)
-
-        if group_by:
-            if sub_group_by:
-                if group_by == sub_group_by:
-                    return Response(
-                        {
-                            "error": "Group by and sub group by cannot have same parameters"  # noqa: E501
-                        },
-                        status=status.HTTP_400_BAD_REQUEST,
-                    )
-                else:
-                    return self.paginate(
-                        request=request,
-                        order_by=order_by_param,
-                        queryset=issue_queryset,
-                        total_count_queryset=filtered_issue_queryset,
-                        on_results=lambda issues: issue_on_results(
-                            group_by=group_by, issues=issues, sub_group_by=sub_group_by
-                        ),
-                        paginator_cls=SubGroupedOffsetPaginator,
-                        group_by_fields=issue_group_values(
-                            field=group_by,
-                            slug=slug,
-                            project_id=project_id,
-                            filters=filters,
-                            queryset=filtered_issue_queryset,
-                        ),
-                        sub_group_by_fields=issue_group_values(
-                            field=sub_group_by,
-                            slug=slug,
-                            project_id=project_id,
-                            filters=filters,
-                            queryset=filtered_issue_queryset,
-                        ),
-                        group_by_field_name=group_by,
-                        sub_group_by_field_name=sub_group_by,
-                        count_filter=Q(
-                            Q(issue_intake__status=1)
-                            | Q(issue_intake__status=-1)
-                            | Q(issue_intake__status=2)
-                            | Q(issue_intake__isnull=True),
-                            archived_at__isnull=True,
-                            is_draft=False,
-                        ),
-                    )
-            else:
-                # Group paginate
-                return self.paginate(
-                    request=request,
-                    order_by=order_by_param,
-                    queryset=issue_queryset,
-                    total_count_queryset=filtered_issue_queryset,
-                    on_results=lambda issues: issue_on_results(
-                        group_by=group_by, issues=issues, sub_group_by=sub_group_by
-                    ),
-                    paginator_cls=GroupedOffsetPaginator,
-                    group_by_fields=issue_group_values(
-                        field=group_by,
-                        slug=slug,
-                        project_id=project_id,
-                        filters=filters,
-                        queryset=filtered_issue_queryset,
-                    ),
-                    group_by_field_name=group_by,
-                    count_filter=Q(
-                        Q(issue_intake__status=1)
-                        | Q(issue_intake__status=-1)
-                        | Q(issue_intake__status=2)
-                        | Q(issue_intake__isnull=True),
-                        archived_at__isnull=True,
-                        is_draft=False,
-                    ),
-                )
-        else:
-            return self.paginate(
-                order_by=order_by_param,
-                request=request,
-                queryset=issue_queryset,
-                total_count_queryset=filtered_issue_queryset,
-                on_results=lambda issues: issue_on_results(group_by=group_by, issues=issues, sub_group_by=sub_group_by),
-            )
+            issue_list.filter(created_by=request.user)
+
+        return issue_list.paginate(slug=slug, project_id=project_id, annotate=self.apply_annotations)
 
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER])
     def create(self, request, slug, project_id):
@@ -483,34 +310,7 @@ class IssueViewSet(BaseViewSet):
                 pk=pk,
             )
             .select_related("state")
-            .annotate(cycle_id=Subquery(CycleIssue.objects.filter(issue=OuterRef("id")).values("cycle_id")[:1]))
-            .annotate(
-                link_count=Subquery(
-                    IssueLink.objects.filter(issue=OuterRef("id"))
-                    .values("issue")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-            .annotate(
-                attachment_count=Subquery(
-                    FileAsset.objects.filter(
-                        issue_id=OuterRef("id"),
-                        entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                    )
-                    .values("issue_id")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-            .annotate(
-                sub_issues_count=Subquery(
-                    Issue.issue_objects.filter(parent=OuterRef("id"))
-                    .values("parent")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
+            .annotate(**get_issue_counter_annotations())
             .annotate(
                 label_ids=Coalesce(
                     Subquery(
@@ -596,7 +396,7 @@ class IssueViewSet(BaseViewSet):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        recent_visited_task.delay(
+        record_recent_visit(
             slug=slug,
             entity_name="issue",
             entity_identifier=pk,
@@ -694,12 +494,7 @@ class IssueViewSet(BaseViewSet):
 
         issue.delete()
         # delete the issue from recent visits
-        UserRecentVisit.objects.filter(
-            project_id=project_id,
-            workspace__slug=slug,
-            entity_identifier=pk,
-            entity_name="issue",
-        ).delete(soft=False)
+        delete_recent_visits(entity_name="issue", entity_identifier=pk, project_id=project_id, slug=slug)
         issue_activity.delay(
             type="issue.activity.deleted",
             requested_data=json.dumps({"issue_id": str(pk)}),
@@ -747,6 +542,9 @@ class BulkDeleteIssuesEndpoint(BaseAPIView):
 
         total_issues = len(issues)
 
+        cycle_ids = list(CycleIssue.objects.filter(issue_id__in=issue_ids).values_list("cycle_id", flat=True))
+        module_ids = list(ModuleIssue.objects.filter(issue_id__in=issue_ids).values_list("module_id", flat=True))
+
         # First, delete all related cycle issues
         CycleIssue.objects.filter(issue_id__in=issue_ids).delete()
 
@@ -756,6 +554,10 @@ class BulkDeleteIssuesEndpoint(BaseAPIView):
         # Finally, delete the issues themselves
         issues.delete()
 
+        refresh_cycle_stats(cycle_ids)
+        refresh_module_stats(module_ids)
+        refresh_parent_counters(issue_ids)
+
         return Response(
             {"message": f"{total_issues} issues were deleted"},
             status=status.HTTP_200_OK,
@@ -779,52 +581,22 @@ class DeletedIssuesListViewSet(BaseAPIView):
 
 
 class IssuePaginatedViewSet(BaseViewSet):
+    use_read_replica = True
+
     def get_queryset(self):
         workspace_slug = self.kwargs.get("slug")
         project_id = self.kwargs.get("project_id")
 
         issue_queryset = Issue.issue_objects.filter(workspace__slug=workspace_slug, project_id=project_id)
 
-        return (
-            issue_queryset.select_related("state")
-            .annotate(cycle_id=Subquery(CycleIssue.objects.filter(issue=OuterRef("id")).values("cycle_id")[:1]))
-            .annotate(
-                link_count=Subquery(
-                    IssueLink.objects.filter(issue=OuterRef("id"))
-                    .values("issue")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-            .annotate(
-                attachment_count=Subquery(
-                    FileAsset.objects.filter(
-                        issue_id=OuterRef("id"),
-                        entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                    )
-                    .values("issue_id")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-            .annotate(
-                sub_issues_count=Subquery(
-                    Issue.issue_objects.filter(parent=OuterRef("id"))
-                    .values("parent")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-        )
+        return issue_queryset.select_related("state").annotate(**get_issue_counter_annotations())
 
     def process_paginated_result(self, fields, results, timezone):
-        paginated_data = results.values(*fields)
-
-        # converting the datetime fields in paginated data
+        # converting the datetime fields in paginated data, a column at a time
         datetime_fields = ["created_at", "updated_at"]
-        paginated_data = user_timezone_converter(paginated_data, datetime_fields, timezone)
-
-        return paginated_data
+        return ColumnarResults.from_queryset(
+            results, fields, datetime_fields=datetime_fields, timezone=timezone
+        ).to_dicts()
 
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST])
     def list(self, request, slug, project_id):
@@ -943,32 +715,7 @@ class IssueDetailEndpoint(BaseAPIView):
 
     def apply_annotations(self, issues):
         return (
-            issues.annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(issue=OuterRef("id"), deleted_at__isnull=True).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            issues.annotate(**get_issue_counter_annotations())
             .prefetch_related(
                 Prefetch(
                     "issue_assignee",
@@ -991,8 +738,6 @@ class IssueDetailEndpoint(BaseAPIView):
 
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST])
     def get(self, request, slug, project_id):
-        filters = issue_filters(request.query_params, "GET")
-
         # check for the project member role, if the role is 5 then check for the guest_view_all_features
         #  if it is true then show all the issues else show only the issues created by the user
         permission_subquery = (
@@ -1041,27 +786,12 @@ class IssueDetailEndpoint(BaseAPIView):
                     )
                 )
 
-        # Apply filtering from filterset
-        issue = self.filter_queryset(issue)
-
-        # Apply legacy filters
-        issue = issue.filter(**filters)
-
-        # Total count queryset
-        total_issue_queryset = copy.deepcopy(issue)
-
-        # Applying annotations to the issue queryset
-        issue = self.apply_annotations(issue)
-
-        order_by_param = request.GET.get("order_by", "-created_at")
-
-        # Issue queryset
-        issue, order_by_param = order_issue_queryset(issue_queryset=issue, order_by_param=order_by_param)
-        return self.paginate(
-            request=request,
-            order_by=order_by_param,
-            queryset=issue,
-            total_count_queryset=total_issue_queryset,
+        # Apply rich and legacy filters once
+        issue_list = IssueListQuery(self, request, issue, grouped=False)
+        return issue_list.paginate(
+            slug=slug,
+            project_id=project_id,
+            annotate=self.apply_annotations,
             on_results=lambda issue: IssueListDetailSerializer(
                 issue, many=True, fields=self.fields, expand=self.expand
             ).data,
@@ -1200,28 +930,7 @@ class IssueDetailIdentifierEndpoint(BaseAPIView):
             .filter(workspace__slug=slug)
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
-            .annotate(cycle_id=Subquery(CycleIssue.objects.filter(issue=OuterRef("id")).values("cycle_id")[:1]))
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**get_issue_counter_annotations())
             .filter(sequence_id=issue_identifier)
             .annotate(
                 label_ids=Coalesce(
@@ -1319,7 +1028,7 @@ class IssueDetailIdentifierEndpoint(BaseAPIView):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        recent_visited_task.delay(
+        record_recent_visit(
             slug=slug,
             entity_name="issue",
             entity_identifier=str(issue.id),
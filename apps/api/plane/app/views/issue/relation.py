@@ -1,9 +1,10 @@
 # Python imports
 import json
+import uuid
 
 # Django imports
 from django.utils import timezone
-from django.db.models import Q, OuterRef, F, Func, UUIDField, Value, CharField, Subquery
+from django.db.models import Q, OuterRef, F, Func, UUIDField, Value, Subquery
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db.models.functions import Coalesce
 from django.contrib.postgres.aggregates import ArrayAgg
@@ -14,9 +15,9 @@ from rest_framework.response import Response
 from rest_framework import status
 
 # Module imports
-from .. import BaseViewSet
+from .. import BaseAPIView, BaseViewSet
 from plane.app.serializers import IssueRelationSerializer, RelatedIssueSerializer
-from plane.app.permissions import ProjectEntityPermission
+from plane.app.permissions import ProjectEntityPermission, allow_permission, ROLE
 from plane.db.models import (
     Project,
     IssueRelation,
@@ -24,8 +25,16 @@ from plane.db.models import (
     FileAsset,
     IssueLink,
     CycleIssue,
+    Cycle,
 )
 from plane.bgtasks.issue_activities_task import issue_activity
+from plane.utils.issue_relation_graph import (
+    DEPENDENCY_DIRECTIONS,
+    get_cycle_critical_path,
+    get_dependency_depths,
+    get_dependency_edges,
+    get_issue_relations,
+)
 from plane.utils.issue_relation_mapper import get_actual_relation
 from plane.utils.host import base_host
 
@@ -36,65 +45,6 @@ class IssueRelationViewSet(BaseViewSet):
     permission_classes = [ProjectEntityPermission]
 
     def list(self, request, slug, project_id, issue_id):
-        issue_relations = (
-            IssueRelation.objects.filter(Q(issue_id=issue_id) | Q(related_issue=issue_id))
-            .filter(workspace__slug=self.kwargs.get("slug"))
-            .select_related("project")
-            .select_related("workspace")
-            .select_related("issue")
-            .order_by("-created_at")
-            .distinct()
-        )
-        # get all blocking issues
-        blocking_issues = issue_relations.filter(relation_type="blocked_by", related_issue_id=issue_id).values_list(
-            "issue_id", flat=True
-        )
-
-        # get all blocked by issues
-        blocked_by_issues = issue_relations.filter(relation_type="blocked_by", issue_id=issue_id).values_list(
-            "related_issue_id", flat=True
-        )
-
-        # get all duplicate issues
-        duplicate_issues = issue_relations.filter(issue_id=issue_id, relation_type="duplicate").values_list(
-            "related_issue_id", flat=True
-        )
-
-        # get all relates to issues
-        duplicate_issues_related = issue_relations.filter(
-            related_issue_id=issue_id, relation_type="duplicate"
-        ).values_list("issue_id", flat=True)
-
-        # get all relates to issues
-        relates_to_issues = issue_relations.filter(issue_id=issue_id, relation_type="relates_to").values_list(
-            "related_issue_id", flat=True
-        )
-
-        # get all relates to issues
-        relates_to_issues_related = issue_relations.filter(
-            related_issue_id=issue_id, relation_type="relates_to"
-        ).values_list("issue_id", flat=True)
-
-        # get all start after issues
-        start_after_issues = issue_relations.filter(
-            relation_type="start_before", related_issue_id=issue_id
-        ).values_list("issue_id", flat=True)
-
-        # get all start_before issues
-        start_before_issues = issue_relations.filter(relation_type="start_before", issue_id=issue_id).values_list(
-            "related_issue_id", flat=True
-        )
-
-        # get all finish after issues
-        finish_after_issues = issue_relations.filter(
-            relation_type="finish_before", related_issue_id=issue_id
-        ).values_list("issue_id", flat=True)
-
-        # get all finish before issues
-        finish_before_issues = issue_relations.filter(relation_type="finish_before", issue_id=issue_id).values_list(
-            "related_issue_id", flat=True
-        )
-
         queryset = (
             Issue.issue_objects.filter(workspace__slug=slug)
             .select_related("workspace", "project", "state", "parent")
@@ -164,41 +114,9 @@ class IssueRelationViewSet(BaseViewSet):
             "updated_at",
             "created_by",
             "updated_by",
-            "relation_type",
         ]
 
-        response_data = {
-            "blocking": queryset.filter(pk__in=blocking_issues)
-            .annotate(relation_type=Value("blocking", output_field=CharField()))
-            .values(*fields),
-            "blocked_by": queryset.filter(pk__in=blocked_by_issues)
-            .annotate(relation_type=Value("blocked_by", output_field=CharField()))
-            .values(*fields),
-            "duplicate": queryset.filter(pk__in=duplicate_issues)
-            .annotate(relation_type=Value("duplicate", output_field=CharField()))
-            .values(*fields)
-            | queryset.filter(pk__in=duplicate_issues_related)
-            .annotate(relation_type=Value("duplicate", output_field=CharField()))
-            .values(*fields),
-            "relates_to": queryset.filter(pk__in=relates_to_issues)
-            .annotate(relation_type=Value("relates_to", output_field=CharField()))
-            .values(*fields)
-            | queryset.filter(pk__in=relates_to_issues_related)
-            .annotate(relation_type=Value("relates_to", output_field=CharField()))
-            .values(*fields),
-            "start_after": queryset.filter(pk__in=start_after_issues)
-            .annotate(relation_type=Value("start_after", output_field=CharField()))
-            .values(*fields),
-            "start_before": queryset.filter(pk__in=start_before_issues)
-            .annotate(relation_type=Value("start_before", output_field=CharField()))
-            .values(*fields),
-            "finish_after": queryset.filter(pk__in=finish_after_issues)
-            .annotate(relation_type=Value("finish_after", output_field=CharField()))
-            .values(*fields),
-            "finish_before": queryset.filter(pk__in=finish_before_issues)
-            .annotate(relation_type=Value("finish_before", output_field=CharField()))
-            .values(*fields),
-        }
+        response_data = get_issue_relations(issue_id, slug, queryset, fields)
 
         return Response(response_data, status=status.HTTP_200_OK)
 
@@ -278,3 +196,103 @@ class IssueRelationViewSet(BaseViewSet):
             origin=base_host(request=request, is_app=True),
         )
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+# Fields of the issues returned by the dependency endpoints
+DEPENDENCY_ISSUE_FIELDS = [
+    "id",
+    "name",
+    "sequence_id",
+    "project_id",
+    "state_id",
+    "priority",
+    "start_date",
+    "target_date",
+]
+
+
+def filter_visible_issues(queryset, user):
+    """
+    Keep the issues of projects the user is an active member of. Guests only
+    see the issues they created unless the project shares all its features.
+    """
+    return queryset.filter(
+        Q(project__project_projectmember__member=user, project__project_projectmember__is_active=True)
+        & (
+            Q(project__project_projectmember__role__gt=ROLE.GUEST.value)
+            | Q(project__guest_view_all_features=True)
+            | Q(created_by=user)
+        )
+    )
+
+
+class IssueDependencyEndpoint(BaseAPIView):
+    """Transitive blocked_by chains of several issues in one request"""
+
+    @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST])
+    def get(self, request, slug, project_id):
+        direction = request.GET.get("direction", "blocked_by")
+        if direction not in DEPENDENCY_DIRECTIONS:
+            return Response(
+                {"error": f"direction must be one of {', '.join(DEPENDENCY_DIRECTIONS)}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            issue_ids = [uuid.UUID(issue_id) for issue_id in request.GET.get("issues", "").split(",") if issue_id]
+        except ValueError:
+            return Response({"error": "Invalid issue ids"}, status=status.HTTP_400_BAD_REQUEST)
+        if not issue_ids:
+            return Response({"error": "Issue ids are required"}, status=status.HTTP_400_BAD_REQUEST)
+
+        project = Project.objects.get(pk=project_id, workspace__slug=slug)
+        # The chains start from the issues of this project the user can see
+        issue_ids = list(
+            filter_visible_issues(
+                Issue.issue_objects.filter(project_id=project_id, pk__in=issue_ids), request.user
+            ).values_list("id", flat=True)
+        )
+        edges = get_dependency_edges(project.workspace_id, issue_ids, direction)
+        depths = get_dependency_depths(issue_ids, edges, direction)
+
+        # Blockers in other projects are only returned to their members
+        issues = filter_visible_issues(
+            Issue.issue_objects.filter(workspace__slug=slug, pk__in=depths.keys()), request.user
+        ).values(*DEPENDENCY_ISSUE_FIELDS)
+        issues = [{**issue, "depth": depths[issue["id"]]} for issue in issues]
+        visible_ids = {issue["id"] for issue in issues}
+        return Response(
+            {
+                "edges": [
+                    {"issue_id": issue_id, "blocked_by_id": blocked_by_id}
+                    for issue_id, blocked_by_id in edges
+                    if issue_id in visible_ids and blocked_by_id in visible_ids
+                ],
+                "issues": issues,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class CycleCriticalPathEndpoint(BaseAPIView):
+    """Longest blocked_by chain of a cycle, weighted by planned duration"""
+
+    @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST])
+    def get(self, request, slug, project_id, cycle_id):
+        if not Cycle.objects.filter(pk=cycle_id, project_id=project_id, workspace__slug=slug).exists():
+            return Response({"error": "Cycle not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        path, duration = get_cycle_critical_path(cycle_id)
+        issues = {
+            issue["id"]: issue
+            for issue in filter_visible_issues(Issue.issue_objects.filter(pk__in=path), request.user).values(
+                *DEPENDENCY_ISSUE_FIELDS
+            )
+        }
+        return Response(
+            {
+                "duration": duration,
+                "issues": [issues[issue_id] for issue_id in path if issue_id in issues],
+            },
+            status=status.HTTP_200_OK,
+        )
@@ -23,6 +23,7 @@ from plane.bgtasks.issue_activities_task import issue_activity
 from plane.utils.timezone_converter import user_timezone_converter
 from collections import defaultdict
 from plane.utils.host import base_host
+from plane.utils.issue_counters import refresh_issue_counters
 from plane.utils.order_queryset import order_issue_queryset
 
 
@@ -178,10 +179,13 @@ class SubIssuesEndpoint(BaseAPIView):
 
         sub_issues = Issue.issue_objects.filter(id__in=sub_issue_ids)
 
+        old_parent_ids = set()
         for sub_issue in sub_issues:
+            old_parent_ids.add(sub_issue.parent_id)
             sub_issue.parent = parent_issue
 
         _ = Issue.objects.bulk_update(sub_issues, ["parent"], batch_size=10)
+        refresh_issue_counters([parent_issue.id, *old_parent_ids])
 
         updated_sub_issues = Issue.issue_objects.filter(id__in=sub_issue_ids).annotate(state_group=F("state__group"))
 
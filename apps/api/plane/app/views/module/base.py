@@ -2,18 +2,15 @@
 import json
 
 # Django Imports
-from django.contrib.postgres.aggregates import ArrayAgg
 from django.contrib.postgres.fields import ArrayField
 from django.db.models import (
     Count,
     Exists,
     F,
     Func,
-    IntegerField,
     OuterRef,
     Prefetch,
     Q,
-    Subquery,
     UUIDField,
     Value,
     Sum,
@@ -52,15 +49,16 @@ from plane.db.models import (
     UserFavorite,
     ModuleIssue,
     ModuleLink,
+    ModuleStats,
     ModuleUserProperties,
     Project,
-    UserRecentVisit,
 )
 from plane.utils.analytics_plot import burndown_plot
+from plane.utils.issue_stats import ensure_module_stats, get_stats_annotations
 from plane.utils.timezone_converter import user_timezone_converter
 from plane.bgtasks.webhook_task import model_activity
 from .. import BaseAPIView, BaseViewSet
-from plane.bgtasks.recent_visited_task import recent_visited_task
+from plane.bgtasks.recent_visited_task import delete_recent_visits, record_recent_visit
 from plane.utils.host import base_host
 
 
@@ -79,131 +77,6 @@ class ModuleViewSet(BaseViewSet):
             project_id=self.kwargs.get("project_id"),
             workspace__slug=self.kwargs.get("slug"),
         )
-        cancelled_issues = (
-            Issue.issue_objects.filter(
-                state__group="cancelled",
-                issue_module__module_id=OuterRef("pk"),
-                issue_module__deleted_at__isnull=True,
-            )
-            .values("issue_module__module_id")
-            .annotate(cnt=Count("pk"))
-            .values("cnt")
-        )
-        completed_issues = (
-            Issue.issue_objects.filter(
-                state__group="completed",
-                issue_module__module_id=OuterRef("pk"),
-                issue_module__deleted_at__isnull=True,
-            )
-            .values("issue_module__module_id")
-            .annotate(cnt=Count("pk"))
-            .values("cnt")
-        )
-        started_issues = (
-            Issue.issue_objects.filter(
-                state__group="started",
-                issue_module__module_id=OuterRef("pk"),
-                issue_module__deleted_at__isnull=True,
-            )
-            .values("issue_module__module_id")
-            .annotate(cnt=Count("pk"))
-            .values("cnt")
-        )
-        unstarted_issues = (
-            Issue.issue_objects.filter(
-                state__group="unstarted",
-                issue_module__module_id=OuterRef("pk"),
-                issue_module__deleted_at__isnull=True,
-            )
-            .values("issue_module__module_id")
-            .annotate(cnt=Count("pk"))
-            .values("cnt")
-        )
-        backlog_issues = (
-            Issue.issue_objects.filter(
-                state__group="backlog",
-                issue_module__module_id=OuterRef("pk"),
-                issue_module__deleted_at__isnull=True,
-            )
-            .values("issue_module__module_id")
-            .annotate(cnt=Count("pk"))
-            .values("cnt")
-        )
-        total_issues = (
-            Issue.issue_objects.filter(
-                issue_module__module_id=OuterRef("pk"),
-                issue_module__deleted_at__isnull=True,
-            )
-            .values("issue_module__module_id")
-            .annotate(cnt=Count("pk"))
-            .values("cnt")
-        )
-        completed_estimate_point = (
-            Issue.issue_objects.filter(
-                estimate_point__estimate__type="points",
-                state__group="completed",
-                issue_module__module_id=OuterRef("pk"),
-                issue_module__deleted_at__isnull=True,
-            )
-            .values("issue_module__module_id")
-            .annotate(completed_estimate_points=Sum(Cast("estimate_point__value", FloatField())))
-            .values("completed_estimate_points")[:1]
-        )
-
-        total_estimate_point = (
-            Issue.issue_objects.filter(
-                estimate_point__estimate__type="points",
-                issue_module__module_id=OuterRef("pk"),
-                issue_module__deleted_at__isnull=True,
-            )
-            .values("issue_module__module_id")
-            .annotate(total_estimate_points=Sum(Cast("estimate_point__value", FloatField())))
-            .values("total_estimate_points")[:1]
-        )
-        backlog_estimate_point = (
-            Issue.issue_objects.filter(
-                estimate_point__estimate__type="points",
-                state__group="backlog",
-                issue_module__module_id=OuterRef("pk"),
-                issue_module__deleted_at__isnull=True,
-            )
-            .values("issue_module__module_id")
-            .annotate(backlog_estimate_point=Sum(Cast("estimate_point__value", FloatField())))
-            .values("backlog_estimate_point")[:1]
-        )
-        unstarted_estimate_point = (
-            Issue.issue_objects.filter(
-                estimate_point__estimate__type="points",
-                state__group="unstarted",
-                issue_module__module_id=OuterRef("pk"),
-                issue_module__deleted_at__isnull=True,
-            )
-            .values("issue_module__module_id")
-            .annotate(unstarted_estimate_point=Sum(Cast("estimate_point__value", FloatField())))
-            .values("unstarted_estimate_point")[:1]
-        )
-        started_estimate_point = (
-            Issue.issue_objects.filter(
-                estimate_point__estimate__type="points",
-                state__group="started",
-                issue_module__module_id=OuterRef("pk"),
-                issue_module__deleted_at__isnull=True,
-            )
-            .values("issue_module__module_id")
-            .annotate(started_estimate_point=Sum(Cast("estimate_point__value", FloatField())))
-            .values("started_estimate_point")[:1]
-        )
-        cancelled_estimate_point = (
-            Issue.issue_objects.filter(
-                estimate_point__estimate__type="points",
-                state__group="cancelled",
-                issue_module__module_id=OuterRef("pk"),
-                issue_module__deleted_at__isnull=True,
-            )
-            .values("issue_module__module_id")
-            .annotate(cancelled_estimate_point=Sum(Cast("estimate_point__value", FloatField())))
-            .values("cancelled_estimate_point")[:1]
-        )
         return (
             super()
             .get_queryset()
@@ -217,70 +90,10 @@ class ModuleViewSet(BaseViewSet):
                     queryset=ModuleLink.objects.select_related("module", "created_by"),
                 )
             )
-            .annotate(
-                completed_issues=Coalesce(
-                    Subquery(completed_issues[:1]),
-                    Value(0, output_field=IntegerField()),
-                )
-            )
-            .annotate(
-                cancelled_issues=Coalesce(
-                    Subquery(cancelled_issues[:1]),
-                    Value(0, output_field=IntegerField()),
-                )
-            )
-            .annotate(started_issues=Coalesce(Subquery(started_issues[:1]), Value(0, output_field=IntegerField())))
-            .annotate(
-                unstarted_issues=Coalesce(
-                    Subquery(unstarted_issues[:1]),
-                    Value(0, output_field=IntegerField()),
-                )
-            )
-            .annotate(backlog_issues=Coalesce(Subquery(backlog_issues[:1]), Value(0, output_field=IntegerField())))
-            .annotate(total_issues=Coalesce(Subquery(total_issues[:1]), Value(0, output_field=IntegerField())))
-            .annotate(
-                backlog_estimate_points=Coalesce(
-                    Subquery(backlog_estimate_point),
-                    Value(0, output_field=FloatField()),
-                )
-            )
-            .annotate(
-                unstarted_estimate_points=Coalesce(
-                    Subquery(unstarted_estimate_point),
-                    Value(0, output_field=FloatField()),
-                )
-            )
-            .annotate(
-                started_estimate_points=Coalesce(
-                    Subquery(started_estimate_point),
-                    Value(0, output_field=FloatField()),
-                )
-            )
-            .annotate(
-                cancelled_estimate_points=Coalesce(
-                    Subquery(cancelled_estimate_point),
-                    Value(0, output_field=FloatField()),
-                )
-            )
-            .annotate(
-                completed_estimate_points=Coalesce(
-                    Subquery(completed_estimate_point),
-                    Value(0, output_field=FloatField()),
-                )
-            )
-            .annotate(
-                total_estimate_points=Coalesce(Subquery(total_estimate_point), Value(0, output_field=FloatField()))
-            )
+            .annotate(**get_stats_annotations(ModuleStats))
             .annotate(
                 member_ids=Coalesce(
-                    ArrayAgg(
-                        "members__id",
-                        distinct=True,
-                        filter=Q(
-                            members__id__isnull=False,
-                            modulemember__deleted_at__isnull=True,
-                        ),
-                    ),
+                    F("stats__member_ids"),
                     Value([], output_field=ArrayField(UUIDField())),
                 )
             )
@@ -348,6 +161,7 @@ class ModuleViewSet(BaseViewSet):
 
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST])
     def list(self, request, slug, project_id):
+        ensure_module_stats(project_id)
         queryset = self.get_queryset().filter(archived_at__isnull=True)
         if self.fields:
             modules = ModuleSerializer(queryset, many=True, fields=self.fields).data
@@ -390,6 +204,7 @@ class ModuleViewSet(BaseViewSet):
 
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER])
     def retrieve(self, request, slug, project_id, pk):
+        ensure_module_stats(project_id)
         queryset = (
             self.get_queryset()
             .filter(archived_at__isnull=True)
@@ -634,7 +449,7 @@ class ModuleViewSet(BaseViewSet):
                 module_id=pk,
             )
 
-        recent_visited_task.delay(
+        record_recent_visit(
             slug=slug,
             entity_name="module",
             entity_identifier=pk,
@@ -746,12 +561,7 @@ class ModuleViewSet(BaseViewSet):
             project_id=project_id,
         ).delete()
         # delete the module from recent visits
-        UserRecentVisit.objects.filter(
-            project_id=project_id,
-            workspace__slug=slug,
-            entity_identifier=pk,
-            entity_name="module",
-        ).delete(soft=False)
+        delete_recent_visits(entity_name="module", entity_identifier=pk, project_id=project_id, slug=slug)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
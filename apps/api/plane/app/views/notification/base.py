@@ -19,6 +19,12 @@ from plane.db.models import (
     WorkspaceMember,
 )
 from plane.utils.paginator import BasePaginator
+from plane.utils.notification_counter import (
+    get_unread_notification_counts,
+    invalidate_unread_notification_counts,
+    is_unread_notification,
+    update_unread_notification_count,
+)
 from plane.app.permissions import allow_permission, ROLE
 
 # Module imports
@@ -147,44 +153,54 @@ class NotificationViewSet(BaseViewSet, BasePaginator):
     @allow_permission(allowed_roles=[ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST], level="WORKSPACE")
     def partial_update(self, request, slug, pk):
         notification = Notification.objects.get(workspace__slug=slug, pk=pk, receiver=request.user)
+        was_unread = is_unread_notification(notification)
         # Only read_at and snoozed_till can be updated
         notification_data = {"snoozed_till": request.data.get("snoozed_till", None)}
         serializer = NotificationSerializer(notification, data=notification_data, partial=True)
 
         if serializer.is_valid():
             serializer.save()
+            update_unread_notification_count(slug, notification, was_unread)
             return Response(serializer.data, status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     @allow_permission(allowed_roles=[ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST], level="WORKSPACE")
     def mark_read(self, request, slug, pk):
         notification = Notification.objects.get(receiver=request.user, workspace__slug=slug, pk=pk)
+        was_unread = is_unread_notification(notification)
         notification.read_at = timezone.now()
         notification.save()
+        update_unread_notification_count(slug, notification, was_unread)
         serializer = NotificationSerializer(notification)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     @allow_permission(allowed_roles=[ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST], level="WORKSPACE")
     def mark_unread(self, request, slug, pk):
         notification = Notification.objects.get(receiver=request.user, workspace__slug=slug, pk=pk)
+        was_unread = is_unread_notification(notification)
         notification.read_at = None
         notification.save()
+        update_unread_notification_count(slug, notification, was_unread)
         serializer = NotificationSerializer(notification)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     @allow_permission(allowed_roles=[ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST], level="WORKSPACE")
     def archive(self, request, slug, pk):
         notification = Notification.objects.get(receiver=request.user, workspace__slug=slug, pk=pk)
+        was_unread = is_unread_notification(notification)
         notification.archived_at = timezone.now()
         notification.save()
+        update_unread_notification_count(slug, notification, was_unread)
         serializer = NotificationSerializer(notification)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     @allow_permission(allowed_roles=[ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST], level="WORKSPACE")
     def unarchive(self, request, slug, pk):
         notification = Notification.objects.get(receiver=request.user, workspace__slug=slug, pk=pk)
+        was_unread = is_unread_notification(notification)
         notification.archived_at = None
         notification.save()
+        update_unread_notification_count(slug, notification, was_unread)
         serializer = NotificationSerializer(notification)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -194,32 +210,12 @@ class UnreadNotificationEndpoint(BaseAPIView):
 
     @allow_permission(allowed_roles=[ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST], level="WORKSPACE")
     def get(self, request, slug):
-        # Watching Issues Count
-        unread_notifications_count = (
-            Notification.objects.filter(
-                workspace__slug=slug,
-                receiver_id=request.user.id,
-                read_at__isnull=True,
-                archived_at__isnull=True,
-                snoozed_till__isnull=True,
-            )
-            .exclude(sender__icontains="mentioned")
-            .count()
-        )
-
-        mention_notifications_count = Notification.objects.filter(
-            workspace__slug=slug,
-            receiver_id=request.user.id,
-            read_at__isnull=True,
-            archived_at__isnull=True,
-            snoozed_till__isnull=True,
-            sender__icontains="mentioned",
-        ).count()
+        counts = get_unread_notification_counts(slug, request.user.id)
 
         return Response(
             {
-                "total_unread_notifications_count": int(unread_notifications_count),
-                "mention_unread_notifications_count": int(mention_notifications_count),
+                "total_unread_notifications_count": counts["unread"],
+                "mention_unread_notifications_count": counts["mention"],
             },
             status=status.HTTP_200_OK,
         )
@@ -281,6 +277,8 @@ class MarkAllReadNotificationViewSet(BaseViewSet):
             notification.read_at = timezone.now()
             updated_notifications.append(notification)
         Notification.objects.bulk_update(updated_notifications, ["read_at"], batch_size=100)
+        if updated_notifications:
+            invalidate_unread_notification_counts(slug, request.user.id)
         return Response({"message": "Successful"}, status=status.HTTP_200_OK)
 
 
@@ -39,7 +39,6 @@ from plane.db.models import (
     ProjectMember,
     ProjectPage,
     Project,
-    UserRecentVisit,
 )
 from plane.utils.error_codes import ERROR_CODES
 
@@ -47,7 +46,7 @@ from plane.utils.error_codes import ERROR_CODES
 from ..base import BaseAPIView, BaseViewSet
 from plane.bgtasks.page_transaction_task import page_transaction
 from plane.bgtasks.page_version_task import page_version
-from plane.bgtasks.recent_visited_task import recent_visited_task
+from plane.bgtasks.recent_visited_task import delete_recent_visits, record_recent_visit
 from plane.bgtasks.copy_s3_object import copy_s3_objects_of_description_and_assets
 from plane.app.permissions import ProjectPagePermission
 
@@ -220,7 +219,7 @@ class PageViewSet(BaseViewSet):
             data = PageDetailSerializer(page).data
             data["issue_ids"] = issue_ids
             if track_visit:
-                recent_visited_task.delay(
+                record_recent_visit(
                     slug=slug,
                     entity_name="page",
                     entity_identifier=page_id,
@@ -361,12 +360,7 @@ class PageViewSet(BaseViewSet):
             entity_type="page",
         ).delete()
         # Delete the page from recent visit
-        UserRecentVisit.objects.filter(
-            project_id=project_id,
-            workspace__slug=slug,
-            entity_identifier=page_id,
-            entity_name="page",
-        ).delete(soft=False)
+        delete_recent_visits(entity_name="page", entity_identifier=page_id, project_id=project_id, slug=slug)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     def summary(self, request, slug, project_id):
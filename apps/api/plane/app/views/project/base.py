@@ -1,5 +1,4 @@
 # Python imports
-import boto3
 from django.conf import settings
 from django.utils import timezone
 import json
@@ -36,9 +35,10 @@ from plane.db.models import (
 )
 from plane.utils.cache import cache_response
 from plane.bgtasks.webhook_task import model_activity, webhook_activity
-from plane.bgtasks.recent_visited_task import recent_visited_task
+from plane.bgtasks.recent_visited_task import record_recent_visit
 from plane.utils.exception_logger import log_exception
 from plane.utils.host import base_host
+from plane.settings.storage import get_s3_client
 
 
 class ProjectViewSet(BaseViewSet):
@@ -222,7 +222,7 @@ class ProjectViewSet(BaseViewSet):
         if project is None:
             return Response({"error": "Project does not exist"}, status=status.HTTP_404_NOT_FOUND)
 
-        recent_visited_task.delay(
+        record_recent_visit(
             slug=slug,
             project_id=pk,
             entity_name="project",
@@ -561,17 +561,17 @@ class ProjectPublicCoverImagesEndpoint(BaseAPIView):
     def get(self, request):
         files = []
         if settings.USE_MINIO:
-            s3 = boto3.client(
-                "s3",
+            s3 = get_s3_client(
                 endpoint_url=settings.AWS_S3_ENDPOINT_URL,
                 aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
                 aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                signature_version=None,
             )
         else:
-            s3 = boto3.client(
-                "s3",
+            s3 = get_s3_client(
                 aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
                 aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                signature_version=None,
             )
         params = {
             "Bucket": settings.AWS_STORAGE_BUCKET_NAME,
@@ -33,6 +33,7 @@ from plane.db.models import (
 )
 from plane.license.models import Instance, InstanceAdmin
 from plane.utils.paginator import BasePaginator
+from plane.utils.activity_archive import TieredActivityPaginator, get_archive_filter
 from plane.authentication.utils.host import user_ip
 from plane.bgtasks.user_deactivation_email_task import user_deactivation_email
 from plane.utils.host import base_host
@@ -208,6 +209,8 @@ class UserActivityEndpoint(BaseAPIView, BasePaginator):
             order_by=request.GET.get("order_by", "-created_at"),
             request=request,
             queryset=queryset,
+            paginator_cls=TieredActivityPaginator,
+            archive_filter=get_archive_filter(actor_id=request.user.id),
             on_results=lambda issue_activities: IssueActivitySerializer(issue_activities, many=True).data,
         )
 
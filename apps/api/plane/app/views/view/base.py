@@ -1,13 +1,9 @@
-import copy
 
 # Django imports
 from django.db.models import (
     Exists,
-    F,
-    Func,
     OuterRef,
     Q,
-    Subquery,
     Prefetch,
 )
 from django.utils.decorators import method_decorator
@@ -23,26 +19,23 @@ from plane.app.permissions import allow_permission, ROLE
 from plane.app.serializers import IssueViewSerializer, ViewIssueListSerializer
 from plane.db.models import (
     Issue,
-    FileAsset,
-    IssueLink,
     IssueView,
     Workspace,
     WorkspaceMember,
     ProjectMember,
     Project,
-    CycleIssue,
-    UserRecentVisit,
     IssueAssignee,
     IssueLabel,
     ModuleIssue,
 )
-from plane.utils.issue_filters import issue_filters
-from plane.utils.order_queryset import order_issue_queryset
-from plane.bgtasks.recent_visited_task import recent_visited_task
+from plane.utils.issue_counters import get_issue_counter_annotations
+from plane.utils.issue_listing import IssueListQuery
+from plane.bgtasks.recent_visited_task import delete_recent_visits, record_recent_visit
 from .. import BaseViewSet
 from plane.db.models import UserFavorite
 from plane.utils.filters import ComplexFilterBackend
 from plane.utils.filters import IssueFilterSet
+from plane.utils.filters.compiler import compile_filter_tree
 
 
 class WorkspaceViewViewSet(BaseViewSet):
@@ -98,7 +91,7 @@ class WorkspaceViewViewSet(BaseViewSet):
     def retrieve(self, request, slug, pk):
         issue_view = self.get_queryset().filter(pk=pk).first()
         serializer = IssueViewSerializer(issue_view)
-        recent_visited_task.delay(
+        record_recent_visit(
             slug=slug,
             project_id=None,
             entity_name="view",
@@ -159,32 +152,7 @@ class WorkspaceViewIssuesViewSet(BaseViewSet):
 
     def apply_annotations(self, issues):
         return (
-            issues.annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(issue=OuterRef("id"), deleted_at__isnull=True).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            issues.annotate(**get_issue_counter_annotations())
             .prefetch_related(
                 Prefetch(
                     "issue_assignee",
@@ -211,41 +179,37 @@ class WorkspaceViewIssuesViewSet(BaseViewSet):
     @method_decorator(gzip_page)
     @allow_permission(allowed_roles=[ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST], level="WORKSPACE")
     def list(self, request, slug):
-        issue_queryset = self.get_queryset()
-
-        # Apply filtering from filterset
-        issue_queryset = self.filter_queryset(issue_queryset)
-
-        order_by_param = request.GET.get("order_by", "-created_at")
-
-        # Apply legacy filters
-        filters = issue_filters(request.query_params, "GET")
-        issue_queryset = issue_queryset.filter(**filters)
+        # Apply rich and legacy filters once
+        issue_list = IssueListQuery(self, request, self.get_queryset(), grouped=False)
 
-        # Get common project permission filters
-        permission_filters = self._get_project_permission_filters()
         # Apply project permission filters to the issue queryset
-        issue_queryset = issue_queryset.filter(permission_filters)
-
-        # Base query for the counts
-        total_issue_count_queryset = copy.deepcopy(issue_queryset)
-        total_issue_count_queryset = total_issue_count_queryset.only("id")
-
-        # Apply annotations to the issue queryset
-        issue_queryset = self.apply_annotations(issue_queryset)
+        issue_list.filter(self._get_project_permission_filters())
+
+        # Apply the filters of a saved view from its compiled tree
+        view_id = request.GET.get("view_id", None)
+        if view_id:
+            saved_view = (
+                IssueView.objects.filter(pk=view_id, workspace__slug=slug)
+                .filter(Q(owned_by=request.user) | Q(access=1))
+                .only("compiled_filters", "filter_signature")
+                .first()
+            )
+            if saved_view is None:
+                return Response({"error": "View not found"}, status=status.HTTP_404_NOT_FOUND)
 
-        # Issue queryset
-        issue_queryset, order_by_param = order_issue_queryset(
-            issue_queryset=issue_queryset, order_by_param=order_by_param
-        )
+            view_q = compile_filter_tree(
+                saved_view.compiled_filters,
+                filterset_class=self.filterset_class,
+                signature=saved_view.filter_signature,
+            )
+            if view_q is not None:
+                issue_list.filter(view_q)
 
         # List Paginate
-        return self.paginate(
-            order_by=order_by_param,
-            request=request,
-            queryset=issue_queryset,
+        return issue_list.paginate(
+            slug=slug,
+            annotate=self.apply_annotations,
             on_results=lambda issues: ViewIssueListSerializer(issues, many=True).data,
-            total_count_queryset=total_issue_count_queryset,
         )
 
 
@@ -327,7 +291,7 @@ class IssueViewViewSet(BaseViewSet):
             )
 
         serializer = IssueViewSerializer(issue_view)
-        recent_visited_task.delay(
+        record_recent_visit(
             slug=slug,
             project_id=project_id,
             entity_name="view",
@@ -380,12 +344,7 @@ class IssueViewViewSet(BaseViewSet):
                 entity_type="view",
             ).delete()
             # Delete the page from recent visit
-            UserRecentVisit.objects.filter(
-                project_id=project_id,
-                workspace__slug=slug,
-                entity_identifier=pk,
-                entity_name="view",
-            ).delete(soft=False)
+            delete_recent_visits(entity_name="view", entity_identifier=pk, project_id=project_id, slug=slug)
         else:
             return Response(
                 {"error": "Only admin or owner can delete the view"},
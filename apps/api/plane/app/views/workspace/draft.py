@@ -36,6 +36,7 @@ from plane.db.models import (
 from .. import BaseViewSet
 from plane.bgtasks.issue_activities_task import issue_activity
 from plane.utils.issue_filters import issue_filters
+from plane.utils.issue_stats import refresh_module_stats
 from plane.utils.host import base_host
 
 
@@ -275,6 +276,7 @@ class WorkspaceDraftIssueViewSet(BaseViewSet):
                     ],
                     batch_size=10,
                 )
+                refresh_module_stats(request.data.get("module_ids", []))
                 # Update the activity
                 _ = [
                     issue_activity.delay(
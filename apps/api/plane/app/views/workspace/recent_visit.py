@@ -1,9 +1,17 @@
 # Third party imports
 from rest_framework import status
 from rest_framework.response import Response
+from redis.exceptions import RedisError
 
 from plane.db.models import UserRecentVisit
 from plane.app.serializers import WorkspaceRecentVisitSerializer
+from plane.utils.exception_logger import log_exception
+from plane.utils.recent_visit import (
+    RECENT_VISIT_LIMIT,
+    get_recent_visit_id,
+    get_recent_visits,
+    warm_recent_visits,
+)
 
 # Modules imports
 from ..base import BaseViewSet
@@ -17,16 +25,51 @@ class UserRecentVisitViewSet(BaseViewSet):
     def get_serializer_class(self):
         return WorkspaceRecentVisitSerializer
 
+    def get_buffered_visits(self, slug):
+        """Serve visits from the Redis buffer, warming it from the database when cold"""
+        try:
+            visits = get_recent_visits(slug, self.request.user.id)
+            if visits is not None:
+                return visits
+
+            visits = list(
+                UserRecentVisit.objects.filter(workspace__slug=slug, user=self.request.user)
+                .order_by("-visited_at")
+                .values("entity_name", "entity_identifier", "project_id", "visited_at")[:RECENT_VISIT_LIMIT]
+            )
+            warm_recent_visits(slug, self.request.user.id, visits)
+            return visits
+        except RedisError as e:
+            log_exception(e, warning=True)
+            return None
+
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST], level="WORKSPACE")
     def list(self, request, slug):
-        user_recent_visits = UserRecentVisit.objects.filter(workspace__slug=slug, user=request.user)
-
         entity_name = request.query_params.get("entity_name")
+        entity_names = ["issue", "page", "project"]
 
-        if entity_name:
-            user_recent_visits = user_recent_visits.filter(entity_name=entity_name)
+        visits = self.get_buffered_visits(slug)
 
-        user_recent_visits = user_recent_visits.filter(entity_name__in=["issue", "page", "project"])
+        if visits is None:
+            user_recent_visits = UserRecentVisit.objects.filter(workspace__slug=slug, user=request.user)
+            if entity_name:
+                user_recent_visits = user_recent_visits.filter(entity_name=entity_name)
+            user_recent_visits = user_recent_visits.filter(entity_name__in=entity_names)[:RECENT_VISIT_LIMIT]
+        else:
+            user_recent_visits = [
+                UserRecentVisit(
+                    id=get_recent_visit_id(slug, request.user.id, visit["entity_name"], visit["entity_identifier"]),
+                    entity_name=visit["entity_name"],
+                    entity_identifier=visit["entity_identifier"],
+                    project_id=visit["project_id"],
+                    user=request.user,
+                    visited_at=visit["visited_at"],
+                )
+                for visit in visits
+                if visit["entity_name"] in entity_names and (not entity_name or visit["entity_name"] == entity_name)
+            ]
 
-        serializer = WorkspaceRecentVisitSerializer(user_recent_visits[:20], many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        serializer = WorkspaceRecentVisitSerializer(user_recent_visits, many=True)
+        # Visits of deleted entities can outlive the entity in the buffer
+        data = [visit for visit in serializer.data if visit["entity_data"] is not None]
+        return Response(data, status=status.HTTP_200_OK)
@@ -1,25 +1,19 @@
 # Python imports
-import copy
 from datetime import date
 
 from dateutil.relativedelta import relativedelta
 
 # Django imports
 from django.db.models import (
-    Case,
     Count,
     F,
     Func,
-    IntegerField,
     OuterRef,
     Q,
-    Value,
-    When,
     Subquery,
 )
 from django.db.models.fields import DateField
 from django.db.models.functions import Cast, ExtractWeek
-from django.utils import timezone
 
 # Third party modules
 from rest_framework import status
@@ -41,7 +35,6 @@ from plane.db.models import (
     IssueActivity,
     FileAsset,
     IssueLink,
-    IssueSubscriber,
     Project,
     ProjectMember,
     User,
@@ -49,14 +42,9 @@ from plane.db.models import (
     WorkspaceMember,
     WorkspaceUserProperties,
 )
-from plane.utils.grouper import (
-    issue_group_values,
-    issue_on_results,
-    issue_queryset_grouper,
-)
-from plane.utils.issue_filters import issue_filters
-from plane.utils.order_queryset import order_issue_queryset
-from plane.utils.paginator import GroupedOffsetPaginator, SubGroupedOffsetPaginator
+from plane.utils.activity_archive import TieredActivityPaginator, get_archive_filter
+from plane.utils.issue_listing import IssueListQuery
+from plane.utils.profile_stats import get_profile_stats
 from plane.utils.filters import ComplexFilterBackend
 from plane.utils.filters import IssueFilterSet
 
@@ -129,9 +117,6 @@ class WorkspaceUserProfileIssuesEndpoint(BaseAPIView):
         )
 
     def get(self, request, slug, user_id):
-        filters = issue_filters(request.query_params, "GET")
-
-        order_by_param = request.GET.get("order_by", "-created_at")
         issue_queryset = Issue.issue_objects.filter(
             id__in=Issue.issue_objects.filter(
                 Q(assignees__in=[user_id]) | Q(created_by_id=user_id) | Q(issue_subscribers__subscriber_id=user_id),
@@ -142,107 +127,9 @@ class WorkspaceUserProfileIssuesEndpoint(BaseAPIView):
             project__project_projectmember__is_active=True,
         )
 
-        # Apply filtering from filterset
-        issue_queryset = self.filter_queryset(issue_queryset)
-
-        # Apply legacy filters
-        issue_queryset = issue_queryset.filter(**filters)
-
-        # Total count queryset
-        total_issue_queryset = copy.deepcopy(issue_queryset)
-
-        # Apply annotations to the issue queryset
-        issue_queryset = self.apply_annotations(issue_queryset)
-
-        # Issue queryset
-        issue_queryset, order_by_param = order_issue_queryset(
-            issue_queryset=issue_queryset, order_by_param=order_by_param
-        )
-
-        # Group by
-        group_by = request.GET.get("group_by", False)
-        sub_group_by = request.GET.get("sub_group_by", False)
-
-        # issue queryset
-        issue_queryset = issue_queryset_grouper(queryset=issue_queryset, group_by=group_by, sub_group_by=sub_group_by)
-
-        if group_by:
-            if sub_group_by:
-                if group_by == sub_group_by:
-                    return Response(
-                        {
-                            "error": "Group by and sub group by cannot have same parameters"  # noqa: E501
-                        },
-                        status=status.HTTP_400_BAD_REQUEST,
-                    )
-                else:
-                    return self.paginate(
-                        request=request,
-                        order_by=order_by_param,
-                        queryset=issue_queryset,
-                        total_count_queryset=total_issue_queryset,
-                        on_results=lambda issues: issue_on_results(
-                            group_by=group_by, issues=issues, sub_group_by=sub_group_by
-                        ),
-                        paginator_cls=SubGroupedOffsetPaginator,
-                        group_by_fields=issue_group_values(
-                            field=group_by,
-                            slug=slug,
-                            filters=filters,
-                            queryset=total_issue_queryset,
-                        ),
-                        sub_group_by_fields=issue_group_values(
-                            field=sub_group_by,
-                            slug=slug,
-                            filters=filters,
-                            queryset=total_issue_queryset,
-                        ),
-                        group_by_field_name=group_by,
-                        sub_group_by_field_name=sub_group_by,
-                        count_filter=Q(
-                            Q(issue_intake__status=1)
-                            | Q(issue_intake__status=-1)
-                            | Q(issue_intake__status=2)
-                            | Q(issue_intake__isnull=True),
-                            archived_at__isnull=True,
-                            is_draft=False,
-                        ),
-                    )
-            else:
-                # Group paginate
-                return self.paginate(
-                    request=request,
-                    order_by=order_by_param,
-                    queryset=issue_queryset,
-                    total_count_queryset=total_issue_queryset,
-                    on_results=lambda issues: issue_on_results(
-                        group_by=group_by, issues=issues, sub_group_by=sub_group_by
-                    ),
-                    paginator_cls=GroupedOffsetPaginator,
-                    group_by_fields=issue_group_values(
-                        field=group_by,
-                        slug=slug,
-                        filters=filters,
-                        queryset=total_issue_queryset,
-                    ),
-                    group_by_field_name=group_by,
-                    count_filter=Q(
-                        Q(issue_intake__status=1)
-                        | Q(issue_intake__status=-1)
-                        | Q(issue_intake__status=2)
-                        | Q(issue_intake__isnull=True),
-                        archived_at__isnull=True,
-                        is_draft=False,
-                    ),
-                )
-        else:
-            return self.paginate(
-                order_by=order_by_param,
-                request=request,
-                queryset=issue_queryset,
-                total_count_queryset=total_issue_queryset,
-                on_results=lambda issues: issue_on_results(group_by=group_by, issues=issues, sub_group_by=sub_group_by),
-            )
+        # Apply rich and legacy filters once
+        issue_list = IssueListQuery(self, request, issue_queryset)
+        return issue_list.paginate(slug=slug, annotate=self.apply_annotations)
 
 
 class WorkspaceUserPropertiesEndpoint(BaseAPIView):
@@ -375,140 +262,47 @@ class WorkspaceUserActivityEndpoint(BaseAPIView):
             actor=user_id,
         ).select_related("actor", "workspace", "issue", "project")
 
+        # The archived activities of the same projects
+        project_ids = Project.objects.filter(
+            workspace__slug=slug,
+            project_projectmember__member=request.user,
+            project_projectmember__is_active=True,
+            archived_at__isnull=True,
+        )
+
         if projects:
             queryset = queryset.filter(project__in=projects)
+            project_ids = project_ids.filter(id__in=projects)
 
         return self.paginate(
             order_by=request.GET.get("order_by", "-created_at"),
             request=request,
             queryset=queryset,
+            paginator_cls=TieredActivityPaginator,
+            archive_filter=get_archive_filter(
+                exclude_fields=["comment", "vote", "reaction", "draft"],
+                actor_id=user_id,
+                project_id=list(project_ids.values_list("id", flat=True)),
+            ),
             on_results=lambda issue_activities: IssueActivitySerializer(issue_activities, many=True).data,
         )
 
 
 class WorkspaceUserProfileStatsEndpoint(BaseAPIView):
     def get(self, request, slug, user_id):
-        filters = issue_filters(request.query_params, "GET")
-
-        state_distribution = (
-            Issue.issue_objects.filter(
-                (Q(assignees__in=[user_id]) & Q(issue_assignee__deleted_at__isnull=True)),
-                workspace__slug=slug,
-                project__project_projectmember__member=request.user,
-                project__project_projectmember__is_active=True,
-            )
-            .filter(**filters)
-            .annotate(state_group=F("state__group"))
-            .values("state_group")
-            .annotate(state_count=Count("state_group"))
-            .order_by("state_group")
-        )
-
-        priority_order = ["urgent", "high", "medium", "low", "none"]
-
-        priority_distribution = (
-            Issue.issue_objects.filter(
-                (Q(assignees__in=[user_id]) & Q(issue_assignee__deleted_at__isnull=True)),
-                workspace__slug=slug,
-                project__project_projectmember__member=request.user,
-                project__project_projectmember__is_active=True,
-            )
-            .filter(**filters)
-            .values("priority")
-            .annotate(priority_count=Count("priority"))
-            .filter(priority_count__gte=1)
-            .annotate(
-                priority_order=Case(
-                    *[When(priority=p, then=Value(i)) for i, p in enumerate(priority_order)],
-                    default=Value(len(priority_order)),
-                    output_field=IntegerField(),
-                )
-            )
-            .order_by("priority_order")
-        )
-
-        created_issues = (
-            Issue.issue_objects.filter(
-                workspace__slug=slug,
-                project__project_projectmember__member=request.user,
-                project__project_projectmember__is_active=True,
-                created_by_id=user_id,
-            )
-            .filter(**filters)
-            .count()
-        )
-
-        assigned_issues_count = (
-            Issue.issue_objects.filter(
-                (Q(assignees__in=[user_id]) & Q(issue_assignee__deleted_at__isnull=True)),
-                workspace__slug=slug,
-                project__project_projectmember__member=request.user,
-                project__project_projectmember__is_active=True,
-            )
-            .filter(**filters)
-            .count()
-        )
-
-        pending_issues_count = (
-            Issue.issue_objects.filter(
-                ~Q(state__group__in=["completed", "cancelled"]),
-                (Q(assignees__in=[user_id]) & Q(issue_assignee__deleted_at__isnull=True)),
-                workspace__slug=slug,
-                project__project_projectmember__member=request.user,
-                project__project_projectmember__is_active=True,
-            )
-            .filter(**filters)
-            .count()
-        )
-
-        completed_issues_count = (
-            Issue.issue_objects.filter(
-                (Q(assignees__in=[user_id]) & Q(issue_assignee__deleted_at__isnull=True)),
-                workspace__slug=slug,
-                state__group="completed",
-                project__project_projectmember__member=request.user,
-                project__project_projectmember__is_active=True,
-            )
-            .filter(**filters)
-            .count()
-        )
-
-        subscribed_issues_count = (
-            IssueSubscriber.objects.filter(
-                workspace__slug=slug,
-                subscriber_id=user_id,
-                project__project_projectmember__member=request.user,
-                project__project_projectmember__is_active=True,
-                project__archived_at__isnull=True,
-            )
-            .filter(**filters)
-            .count()
-        )
-
-        upcoming_cycles = CycleIssue.objects.filter(
-            workspace__slug=slug,
-            cycle__start_date__gt=timezone.now(),
-            issue__assignees__in=[user_id],
-        ).values("cycle__name", "cycle__id", "cycle__project_id")
-
-        present_cycle = CycleIssue.objects.filter(
-            workspace__slug=slug,
-            cycle__start_date__lt=timezone.now(),
-            cycle__end_date__gt=timezone.now(),
-            issue__assignees__in=[user_id],
-        ).values("cycle__name", "cycle__id", "cycle__project_id")
+        stats = get_profile_stats(slug, user_id, request.user, request.query_params)
 
         return Response(
             {
-                "state_distribution": state_distribution,
-                "priority_distribution": priority_distribution,
-                "created_issues": created_issues,
-                "assigned_issues": assigned_issues_count,
-                "completed_issues": completed_issues_count,
-                "pending_issues": pending_issues_count,
-                "subscribed_issues": subscribed_issues_count,
-                "present_cycles": present_cycle,
-                "upcoming_cycles": upcoming_cycles,
+                "state_distribution": stats["state_distribution"],
+                "priority_distribution": stats["priority_distribution"],
+                "created_issues": stats["created_issues"],
+                "assigned_issues": stats["assigned_issues"],
+                "completed_issues": stats["completed_issues"],
+                "pending_issues": stats["pending_issues"],
+                "subscribed_issues": stats["subscribed_issues"],
+                "present_cycles": stats["present_cycles"],
+                "upcoming_cycles": stats["upcoming_cycles"],
             }
         )
 
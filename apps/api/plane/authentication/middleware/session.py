@@ -2,12 +2,67 @@ import time
 from importlib import import_module
 
 from django.conf import settings
+from django.contrib import auth
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY, load_backend
+from django.contrib.auth.middleware import AuthenticationMiddleware as DjangoAuthenticationMiddleware
+from django.contrib.auth.models import AnonymousUser
+from django.core.exceptions import ImproperlyConfigured
 from django.contrib.sessions.backends.base import UpdateError
 from django.contrib.sessions.exceptions import SessionInterrupted
+from django.core.cache import cache
 from django.utils.cache import patch_vary_headers
+from django.utils.crypto import constant_time_compare
 from django.utils.deprecation import MiddlewareMixin
+from django.utils.functional import SimpleLazyObject
 from django.utils.http import http_date
 
+from plane.db.models.session import get_session_user_cache_key
+
+
+def get_session_user(request):
+    """
+    Return the user of the request session, reading it from the cache before
+    the database. A cached user is only returned when its backend still allows
+    it and the session hash matches, anything else goes through django's
+    get_user which also verifies or flushes the session.
+    """
+    try:
+        user_id = request.session[SESSION_KEY]
+        backend_path = request.session[BACKEND_SESSION_KEY]
+    except KeyError:
+        return AnonymousUser()
+
+    cache_key = get_session_user_cache_key(user_id)
+    user = cache.get(cache_key)
+    if user is not None and backend_path in settings.AUTHENTICATION_BACKENDS:
+        session_hash = request.session.get(HASH_SESSION_KEY)
+        if (
+            load_backend(backend_path).user_can_authenticate(user)
+            and session_hash
+            and constant_time_compare(session_hash, user.get_session_auth_hash())
+        ):
+            return user
+
+    user = auth.get_user(request)
+    if user.is_authenticated:
+        cache.set(cache_key, user, settings.SESSION_USER_CACHE_TTL)
+    return user
+
+
+class AuthenticationMiddleware(DjangoAuthenticationMiddleware):
+    """Authentication middleware reading the session user through the cache"""
+
+    def process_request(self, request):
+        if not hasattr(request, "session"):
+            raise ImproperlyConfigured("The authentication middleware requires the session middleware to be installed.")
+
+        def get_user():
+            if not hasattr(request, "_cached_user"):
+                request._cached_user = get_session_user(request)
+            return request._cached_user
+
+        request.user = SimpleLazyObject(get_user)
+
 
 class SessionMiddleware(MiddlewareMixin):
     def __init__(self, get_response):
@@ -1,19 +1,26 @@
 # Python imports
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import timedelta
+from queue import Queue
+from threading import Event
 import logging
-from typing import List, Dict, Any, Callable, Optional
+import uuid
+from typing import List, Dict, Any, Callable, Iterable, Optional, Sequence
 import os
 
 # Django imports
+from django.conf import settings
+from django.db import connections
 from django.utils import timezone
 from django.db.models import F, Window, Subquery
 from django.db.models.functions import RowNumber
 
 # Third party imports
+from bson.errors import BSONError
 from celery import shared_task
-from pymongo.errors import BulkWriteError
+from pymongo.errors import BulkWriteError, PyMongoError
 from pymongo.collection import Collection
-from pymongo.operations import InsertOne
+from pymongo.operations import ReplaceOne
 
 # Module imports
 from plane.db.models import (
@@ -22,13 +29,26 @@ from plane.db.models import (
     APIActivityLog,
     IssueDescriptionVersion,
     WebhookLog,
+    IssueActivity,
 )
 from plane.settings.mongo import MongoConnection
+from plane.utils.activity_archive import (
+    ARCHIVE_FIELDS,
+    COLLECTION_NAME as ARCHIVE_COLLECTION_NAME,
+    ensure_archive_collection,
+    to_document,
+)
 from plane.utils.exception_logger import log_exception
+from plane.utils.partitions import drop_partition, get_expired_partitions, get_partitions
 
 
 logger = logging.getLogger("plane.worker")
 BATCH_SIZE = 500
+# Parallel readers and writers of the cleanup pipeline
+WORKERS = int(os.environ.get("CLEANUP_TASK_WORKERS", 4))
+# Batches buffered between two stages of the pipeline
+QUEUE_SIZE = 8
+DUPLICATE_KEY_ERROR = 11000
 
 
 def get_mongo_collection(collection_name: str) -> Optional[Collection]:
@@ -47,42 +67,125 @@ def get_mongo_collection(collection_name: str) -> Optional[Collection]:
         return None
 
 
-def flush_to_mongo_and_delete(
-    mongo_collection: Optional[Collection],
-    buffer: List[Dict[str, Any]],
-    ids_to_delete: List[int],
-    model,
-    mongo_available: bool,
-) -> None:
+def write_to_mongo(mongo_collection: Collection, buffer: List[Dict[str, Any]]) -> bool:
     """
-    Inserts a batch of records into MongoDB and deletes the corresponding rows from PostgreSQL.
+    Writes a batch of records to MongoDB, returns False when the write failed.
+
+    Records are keyed by their source id. The batch is inserted unordered and
+    the records already archived by an earlier, interrupted run are upserted,
+    so a retry never archives a record twice.
     """
-    if not buffer:
-        logger.debug("No records to flush - buffer is empty")
-        return
+    try:
+        try:
+            mongo_collection.insert_many(buffer, ordered=False)
+        except BulkWriteError as bwe:
+            errors = bwe.details.get("writeErrors", [])
+            if bwe.details.get("writeConcernErrors") or any(
+                error.get("code") != DUPLICATE_KEY_ERROR for error in errors
+            ):
+                raise
+            mongo_collection.bulk_write(
+                [
+                    ReplaceOne({"_id": buffer[error["index"]]["_id"]}, buffer[error["index"]], upsert=True)
+                    for error in errors
+                ],
+                ordered=False,
+            )
+    except (PyMongoError, BSONError) as e:
+        # BSON errors, such as a document over the size limit, are not PyMongoErrors
+        logger.error(f"MongoDB bulk write error: {str(e)}")
+        log_exception(e)
+        return False
+    return True
 
-    logger.info(f"Starting batch flush: {len(buffer)} records, {len(ids_to_delete)} IDs to delete")
 
-    mongo_archival_failed = False
+def get_keyset_ranges(workers: int) -> List[tuple]:
+    """Split the uuid4 id space into one contiguous (lower, upper) range per worker."""
+    bounds = [None, *(uuid.UUID(int=index * (1 << 128) // workers) for index in range(1, workers)), None]
+    return list(zip(bounds, bounds[1:]))
 
-    # Try to insert into MongoDB if available
-    if mongo_collection is not None and mongo_available:
-        try:
-            mongo_collection.bulk_write([InsertOne(doc) for doc in buffer])
-        except BulkWriteError as bwe:
-            logger.error(f"MongoDB bulk write error: {str(bwe)}")
-            log_exception(bwe)
-            mongo_archival_failed = True
 
-    # If MongoDB is available and archival failed, log the error and return
-    if mongo_available and mongo_archival_failed:
-        logger.error(f"MongoDB archival failed for {len(buffer)} records")
-        return
+def run_in_thread(func: Callable, *args):
+    """Runs a pipeline stage, closing the database connections of its thread."""
+    try:
+        return func(*args)
+    finally:
+        connections.close_all()
+
 
-    # Delete from PostgreSQL - delete() returns (count, {model: count})
-    delete_result = model.all_objects.filter(id__in=ids_to_delete).delete()
-    deleted_count = delete_result[0] if delete_result and isinstance(delete_result, tuple) else 0
-    logger.info(f"Batch flush completed: {deleted_count} records deleted")
+def read_batches(queryset, transform_func, lower, upper, archive_queue: Queue, stop: Event) -> int:
+    """Streams the records of a keyset range into transformed batches until stopped."""
+    buffer: List[Dict[str, Any]] = []
+    ids_to_delete: List[Any] = []
+    total_read = 0
+    try:
+        if lower is not None:
+            queryset = queryset.filter(id__gte=lower)
+        if upper is not None:
+            queryset = queryset.filter(id__lt=upper)
+        for record in queryset.iterator(chunk_size=BATCH_SIZE):
+            if stop.is_set():
+                return total_read
+            buffer.append(transform_func(record))
+            ids_to_delete.append(record["id"])
+            if len(buffer) >= BATCH_SIZE:
+                archive_queue.put((buffer, ids_to_delete))
+                total_read += len(buffer)
+                buffer, ids_to_delete = [], []
+    except Exception as e:
+        # The records read so far are still archived
+        log_exception(e)
+    if buffer and not stop.is_set():
+        archive_queue.put((buffer, ids_to_delete))
+        total_read += len(buffer)
+    return total_read
+
+
+def write_batches(
+    archive_queue: Queue,
+    delete_queue: Queue,
+    mongo_collection: Optional[Collection],
+    stop: Event,
+    stop_on_failure: bool = False,
+) -> int:
+    """
+    Archives the batches and passes the ids of the archived ones on, returns
+    the failed batches. With stop_on_failure, the first failed batch stops
+    the readers and the batches still queued are dropped unarchived. The
+    loop itself always drains the queue, the readers would otherwise block
+    on it.
+    """
+    failed_batches = 0
+    while (batch := archive_queue.get()) is not None:
+        if stop.is_set():
+            continue
+        buffer, ids_to_delete = batch
+        try:
+            # Without MongoDB the records are only deleted
+            archived = mongo_collection is None or write_to_mongo(mongo_collection, buffer)
+        except Exception as e:
+            log_exception(e)
+            archived = False
+        if not archived:
+            logger.error(f"MongoDB archival failed for {len(buffer)} records")
+            failed_batches += 1
+            if stop_on_failure:
+                stop.set()
+            continue
+        delete_queue.put(ids_to_delete)
+    return failed_batches
+
+
+def delete_batches(delete_queue: Queue, model) -> int:
+    """Deletes the archived records from PostgreSQL, returns the deleted count."""
+    total_deleted = 0
+    while (ids_to_delete := delete_queue.get()) is not None:
+        try:
+            # delete() returns (count, {model: count})
+            total_deleted += model.all_objects.filter(id__in=ids_to_delete).delete()[0]
+        except Exception as e:
+            log_exception(e)
+    return total_deleted
 
 
 def process_cleanup_task(
@@ -91,16 +194,29 @@ def process_cleanup_task(
     model,
     task_name: str,
     collection_name: str,
+    require_archive: bool = False,
+    workers: int = WORKERS,
 ):
     """
     Generic function to process cleanup tasks.
 
+    Reading and transforming, writing to MongoDB and deleting from PostgreSQL
+    run as pipelined stages connected by bounded queues, so a slow stage holds
+    back the others instead of buffering the whole backlog. The records are
+    read by parallel workers, each streaming its own keyset range of ids.
+
     Args:
-        queryset_func: Function that returns the queryset to process
+        queryset_func: Function that returns the values() queryset to process
         transform_func: Function to transform each record for MongoDB
         model: Django model class
         task_name: Name of the task for logging
         collection_name: MongoDB collection name
+        require_archive: Keep the records when MongoDB is not available and
+            stop at the first batch that failed to archive
+        workers: Number of parallel readers and writers, a single worker
+            keeps the order of the queryset
+
+    Returns the number of batches that failed to archive, None when skipped.
     """
     logger.info(f"Starting {task_name} cleanup task")
 
@@ -108,52 +224,165 @@ def process_cleanup_task(
     mongo_collection = get_mongo_collection(collection_name)
     mongo_available = mongo_collection is not None
 
+    if require_archive and not mongo_available:
+        logger.info(f"{task_name} cleanup task skipped, the records are only deleted once archived")
+        return
+
     # Get queryset
     queryset = queryset_func()
+    ranges = [(None, None)]
+    if workers > 1:
+        queryset = queryset.order_by("id")
+        ranges = get_keyset_ranges(workers)
+
+    archive_queue: Queue = Queue(maxsize=QUEUE_SIZE)
+    delete_queue: Queue = Queue(maxsize=QUEUE_SIZE)
+    stop = Event()
+
+    with ThreadPoolExecutor(max_workers=len(ranges) + workers + 1, thread_name_prefix="cleanup") as executor:
+        readers = [
+            executor.submit(run_in_thread, read_batches, queryset, transform_func, lower, upper, archive_queue, stop)
+            for lower, upper in ranges
+        ]
+        writers = [
+            executor.submit(
+                run_in_thread, write_batches, archive_queue, delete_queue, mongo_collection, stop, require_archive
+            )
+            for _ in range(workers)
+        ]
+        deleter = executor.submit(run_in_thread, delete_batches, delete_queue, model)
 
-    # Process records in batches
-    buffer: List[Dict[str, Any]] = []
-    ids_to_delete: List[int] = []
-    total_processed = 0
-    total_batches = 0
+        try:
+            total_processed = sum(reader.result() for reader in readers)
+        finally:
+            # Every stage exits on its sentinel, sent even when a stage failed,
+            # so the executor can always shut down
+            for _ in writers:
+                archive_queue.put(None)
+            wait(writers)
+            delete_queue.put(None)
+        failed_batches = sum(writer.result() for writer in writers)
+        total_deleted = deleter.result()
 
-    for record in queryset:
-        # Transform record for MongoDB
-        buffer.append(transform_func(record))
-        ids_to_delete.append(record["id"])
+    logger.info(
+        f"{task_name} cleanup task completed",
+        extra={
+            "total_records_processed": total_processed,
+            "total_records_deleted": total_deleted,
+            "failed_batches": failed_batches,
+            "mongo_available": mongo_available,
+            "collection_name": collection_name,
+        },
+    )
+    return failed_batches
 
-        # Flush batch when it reaches BATCH_SIZE
+
+def export_to_mongo(
+    mongo_collection: Collection,
+    records: Iterable[Dict],
+    transform_func: Callable[[Dict], Dict],
+) -> bool:
+    """Writes records to MongoDB in batches, returns False when a batch failed."""
+    buffer: List[Dict[str, Any]] = []
+    for record in records:
+        buffer.append(transform_func(record))
         if len(buffer) >= BATCH_SIZE:
-            total_batches += 1
-            flush_to_mongo_and_delete(
-                mongo_collection=mongo_collection,
-                buffer=buffer,
-                ids_to_delete=ids_to_delete,
-                model=model,
-                mongo_available=mongo_available,
-            )
-            total_processed += len(buffer)
+            if not write_to_mongo(mongo_collection, buffer):
+                return False
             buffer.clear()
-            ids_to_delete.clear()
-
-    # Process final batch if any records remain
-    if buffer:
-        total_batches += 1
-        flush_to_mongo_and_delete(
-            mongo_collection=mongo_collection,
-            buffer=buffer,
-            ids_to_delete=ids_to_delete,
-            model=model,
-            mongo_available=mongo_available,
-        )
-        total_processed += len(buffer)
+    return not buffer or write_to_mongo(mongo_collection, buffer)
+
+
+def purge_legacy_partition(
+    model,
+    fields: Sequence[str],
+    transform_func: Callable[[Dict], Dict],
+    task_name: str,
+    collection_name: str,
+    cutoff_time,
+):
+    """
+    Archives and deletes the rows of the legacy partition created before the
+    cutoff time batch by batch. The legacy partition holds every row from
+    before the table was partitioned, so it only expires as a whole once its
+    newest rows are past the retention.
+    """
+    table = model._meta.db_table
+    legacy = next((partition for partition in get_partitions(table) if partition.name == f"{table}_legacy"), None)
+    if legacy is None or legacy.upper <= cutoff_time:
+        return
+
+    process_cleanup_task(
+        # The other partitions start after the legacy one, so the query is pruned to it
+        queryset_func=lambda: model.all_objects.filter(created_at__lt=cutoff_time).values(*fields),
+        transform_func=transform_func,
+        model=model,
+        task_name=f"{task_name} legacy partition",
+        collection_name=collection_name,
+    )
+
+
+def process_partition_cleanup(
+    model,
+    fields: Sequence[str],
+    transform_func: Callable[[Dict], Dict],
+    task_name: str,
+    collection_name: str,
+    cutoff_time,
+    require_archive: bool = False,
+    purge_legacy: bool = False,
+):
+    """
+    Archives and drops the partitions of a table partitioned by created_at
+    whose rows were all created before the cutoff time.
+
+    The rows of a partition are streamed to MongoDB through a server side
+    cursor, then the partition is detached and dropped instead of deleting
+    its rows batch by batch. A partition whose export failed stays in place
+    and is exported again, idempotently, by the next run.
+
+    Args:
+        model: Django model class of the partitioned table
+        fields: Fields of the records passed to transform_func
+        transform_func: Function to transform each record for MongoDB
+        task_name: Name of the task for logging
+        collection_name: MongoDB collection name
+        cutoff_time: Partitions ending before this time are dropped
+        require_archive: Keep the partitions when MongoDB is not available
+        purge_legacy: Delete the expired rows of the legacy partition until
+            it expires itself
+    """
+    table = model._meta.db_table
+    if purge_legacy:
+        purge_legacy_partition(model, fields, transform_func, task_name, collection_name, cutoff_time)
+
+    partitions = get_expired_partitions(table, before=cutoff_time)
+    if not partitions:
+        logger.info(f"{task_name} cleanup task found no partition before {cutoff_time}")
+        return
+
+    mongo_collection = get_mongo_collection(collection_name)
+    if require_archive and mongo_collection is None:
+        logger.info(f"{task_name} cleanup task skipped, the partitions are only dropped once archived")
+        return
+
+    for partition in partitions:
+        if mongo_collection is not None:
+            # The created_at range prunes the query to the partition
+            queryset = model.all_objects.filter(created_at__lt=partition.upper)
+            if partition.lower is not None:
+                queryset = queryset.filter(created_at__gte=partition.lower)
+            records = queryset.values(*fields).iterator(chunk_size=BATCH_SIZE)
+            if not export_to_mongo(mongo_collection, records, transform_func):
+                logger.error(f"MongoDB archival failed for partition {partition.name}")
+                continue
+        drop_partition(table, partition.name)
 
     logger.info(
         f"{task_name} cleanup task completed",
         extra={
-            "total_records_processed": total_processed,
-            "total_batches": total_batches,
-            "mongo_available": mongo_available,
+            "partitions": [partition.name for partition in partitions],
+            "mongo_available": mongo_collection is not None,
             "collection_name": collection_name,
         },
     )
@@ -163,6 +392,7 @@ def process_cleanup_task(
 def transform_api_log(record: Dict) -> Dict:
     """Transform API activity log record."""
     return {
+        "_id": str(record["id"]),
         "id": str(record["id"]),
         "created_at": str(record["created_at"]) if record.get("created_at") else None,
         "token_identifier": str(record["token_identifier"]),
@@ -182,6 +412,7 @@ def transform_api_log(record: Dict) -> Dict:
 def transform_email_log(record: Dict) -> Dict:
     """Transform email notification log record."""
     return {
+        "_id": str(record["id"]),
         "id": str(record["id"]),
         "created_at": str(record["created_at"]) if record.get("created_at") else None,
         "receiver_id": str(record["receiver_id"]),
@@ -201,6 +432,7 @@ def transform_email_log(record: Dict) -> Dict:
 def transform_page_version(record: Dict) -> Dict:
     """Transform page version record."""
     return {
+        "_id": str(record["id"]),
         "id": str(record["id"]),
         "created_at": str(record["created_at"]) if record.get("created_at") else None,
         "page_id": str(record["page_id"]),
@@ -221,6 +453,7 @@ def transform_page_version(record: Dict) -> Dict:
 def transform_issue_description_version(record: Dict) -> Dict:
     """Transform issue description version record."""
     return {
+        "_id": str(record["id"]),
         "id": str(record["id"]),
         "created_at": str(record["created_at"]) if record.get("created_at") else None,
         "issue_id": str(record["issue_id"]),
@@ -241,6 +474,7 @@ def transform_issue_description_version(record: Dict) -> Dict:
 def transform_webhook_log(record: Dict):
     """Transfer webhook logs to a new destination."""
     return {
+        "_id": str(record["id"]),
         "id": str(record["id"]),
         "created_at": str(record["created_at"]) if record.get("created_at") else None,
         "workspace_id": str(record["workspace_id"]),
@@ -259,61 +493,71 @@ def transform_webhook_log(record: Dict):
     }
 
 
-# Queryset functions for each cleanup task
-def get_api_logs_queryset():
-    """Get API logs older than cutoff days."""
-    cutoff_days = int(os.environ.get("HARD_DELETE_AFTER_DAYS", 30))
-    cutoff_time = timezone.now() - timedelta(days=cutoff_days)
-    logger.info(f"API logs cutoff time: {cutoff_time}")
-
-    return (
-        APIActivityLog.all_objects.filter(created_at__lte=cutoff_time)
-        .values(
-            "id",
-            "created_at",
-            "token_identifier",
-            "path",
-            "method",
-            "query_params",
-            "headers",
-            "body",
-            "response_code",
-            "response_body",
-            "ip_address",
-            "user_agent",
-            "created_by_id",
-        )
-        .iterator(chunk_size=BATCH_SIZE)
-    )
+def transform_issue_activity(record: Dict) -> Dict:
+    """Transform issue activity record, keeping its dates for the tiered reads."""
+    return to_document(record)
+
+
+# Fields archived from the partitioned log tables
+API_LOG_FIELDS = (
+    "id",
+    "created_at",
+    "token_identifier",
+    "path",
+    "method",
+    "query_params",
+    "headers",
+    "body",
+    "response_code",
+    "response_body",
+    "ip_address",
+    "user_agent",
+    "created_by_id",
+)
+
+EMAIL_LOG_FIELDS = (
+    "id",
+    "created_at",
+    "receiver_id",
+    "triggered_by_id",
+    "entity_identifier",
+    "entity_name",
+    "data",
+    "processed_at",
+    "sent_at",
+    "entity",
+    "old_value",
+    "new_value",
+    "created_by_id",
+)
+
+WEBHOOK_LOG_FIELDS = (
+    "id",
+    "created_at",
+    "workspace_id",
+    "webhook",
+    "event_type",
+    # Request
+    "request_method",
+    "request_headers",
+    "request_body",
+    # Response
+    "response_status",
+    "response_body",
+    "response_headers",
+    "retry_count",
+)
 
 
-def get_email_logs_queryset():
-    """Get email logs older than cutoff days."""
+def get_log_cutoff_time(task_name: str):
+    """Get the time before which log partitions are dropped."""
     cutoff_days = int(os.environ.get("HARD_DELETE_AFTER_DAYS", 30))
     cutoff_time = timezone.now() - timedelta(days=cutoff_days)
-    logger.info(f"Email logs cutoff time: {cutoff_time}")
-
-    return (
-        EmailNotificationLog.all_objects.filter(sent_at__lte=cutoff_time)
-        .values(
-            "id",
-            "created_at",
-            "receiver_id",
-            "triggered_by_id",
-            "entity_identifier",
-            "entity_name",
-            "data",
-            "processed_at",
-            "sent_at",
-            "entity",
-            "old_value",
-            "new_value",
-            "created_by_id",
-        )
-        .iterator(chunk_size=BATCH_SIZE)
-    )
+    logger.info(f"{task_name} cutoff time: {cutoff_time}")
+    return cutoff_time
 
 
+# Queryset functions for each cleanup task
 def get_page_versions_queryset():
     """Get page versions beyond the maximum allowed (20 per page)."""
     subq = (
@@ -328,25 +572,21 @@ def get_page_versions_queryset():
         .values("id")
     )
 
-    return (
-        PageVersion.all_objects.filter(id__in=Subquery(subq))
-        .values(
-            "id",
-            "created_at",
-            "page_id",
-            "workspace_id",
-            "owned_by_id",
-            "description_html",
-            "description_binary",
-            "description_stripped",
-            "description_json",
-            "sub_pages_data",
-            "created_by_id",
-            "updated_by_id",
-            "deleted_at",
-            "last_saved_at",
-        )
-        .iterator(chunk_size=BATCH_SIZE)
+    return PageVersion.all_objects.filter(id__in=Subquery(subq)).values(
+        "id",
+        "created_at",
+        "page_id",
+        "workspace_id",
+        "owned_by_id",
+        "description_html",
+        "description_binary",
+        "description_stripped",
+        "description_json",
+        "sub_pages_data",
+        "created_by_id",
+        "updated_by_id",
+        "deleted_at",
+        "last_saved_at",
     )
 
 
@@ -364,78 +604,57 @@ def get_issue_description_versions_queryset():
         .values("id")
     )
 
-    return (
-        IssueDescriptionVersion.all_objects.filter(id__in=Subquery(subq))
-        .values(
-            "id",
-            "created_at",
-            "issue_id",
-            "workspace_id",
-            "project_id",
-            "created_by_id",
-            "updated_by_id",
-            "owned_by_id",
-            "last_saved_at",
-            "description_binary",
-            "description_html",
-            "description_stripped",
-            "description_json",
-            "deleted_at",
-        )
-        .iterator(chunk_size=BATCH_SIZE)
+    return IssueDescriptionVersion.all_objects.filter(id__in=Subquery(subq)).values(
+        "id",
+        "created_at",
+        "issue_id",
+        "workspace_id",
+        "project_id",
+        "created_by_id",
+        "updated_by_id",
+        "owned_by_id",
+        "last_saved_at",
+        "description_binary",
+        "description_html",
+        "description_stripped",
+        "description_json",
+        "deleted_at",
     )
 
 
-def get_webhook_logs_queryset():
-    """Get email logs older than cutoff days."""
-    cutoff_days = int(os.environ.get("HARD_DELETE_AFTER_DAYS", 30))
-    cutoff_time = timezone.now() - timedelta(days=cutoff_days)
-    logger.info(f"Webhook logs cutoff time: {cutoff_time}")
-
-    return (
-        WebhookLog.all_objects.filter(created_at__lte=cutoff_time)
-        .values(
-            "id",
-            "created_at",
-            "workspace_id",
-            "webhook",
-            "event_type",
-            # Request
-            "request_method",
-            "request_headers",
-            "request_body",
-            # Response
-            "response_status",
-            "response_body",
-            "response_headers",
-            "retry_count",
-        )
-        .order_by("created_at")
-        .iterator(chunk_size=100)
-    )
+def get_issue_activities_queryset():
+    """Get issue activities older than the archive cutoff days, oldest first."""
+    cutoff_time = timezone.now() - timedelta(days=settings.ISSUE_ACTIVITY_ARCHIVE_AFTER_DAYS)
+    logger.info(f"Issue activities cutoff time: {cutoff_time}")
+
+    return IssueActivity.all_objects.filter(created_at__lte=cutoff_time).values(*ARCHIVE_FIELDS).order_by("created_at")
 
 
 @shared_task
 def delete_api_logs():
-    """Delete old API activity logs."""
-    process_cleanup_task(
-        queryset_func=get_api_logs_queryset,
-        transform_func=transform_api_log,
+    """Archive and drop the partitions of old API activity logs."""
+    process_partition_cleanup(
         model=APIActivityLog,
+        fields=API_LOG_FIELDS,
+        transform_func=transform_api_log,
         task_name="API Activity Log",
         collection_name="api_activity_logs",
+        cutoff_time=get_log_cutoff_time("API logs"),
+        purge_legacy=True,
     )
 
 
 @shared_task
 def delete_email_notification_logs():
-    """Delete old email notification logs."""
-    process_cleanup_task(
-        queryset_func=get_email_logs_queryset,
-        transform_func=transform_email_log,
+    """Archive and drop the partitions of old email notification logs."""
+    process_partition_cleanup(
         model=EmailNotificationLog,
+        fields=EMAIL_LOG_FIELDS,
+        transform_func=transform_email_log,
         task_name="Email Notification Log",
         collection_name="email_notification_logs",
+        cutoff_time=get_log_cutoff_time("Email logs"),
+        purge_legacy=True,
     )
 
 
@@ -465,11 +684,49 @@ def delete_issue_description_versions():
 
 @shared_task
 def delete_webhook_logs():
-    """Delete old webhook logs"""
-    process_cleanup_task(
-        queryset_func=get_webhook_logs_queryset,
-        transform_func=transform_webhook_log,
+    """Archive and drop the partitions of old webhook logs"""
+    process_partition_cleanup(
         model=WebhookLog,
+        fields=WEBHOOK_LOG_FIELDS,
+        transform_func=transform_webhook_log,
         task_name="Webhook Log",
         collection_name="webhook_logs",
+        cutoff_time=get_log_cutoff_time("Webhook logs"),
+        purge_legacy=True,
+    )
+
+
+@shared_task
+def archive_issue_activities():
+    """Move old issue activities to the archive collection"""
+    mongo_collection = get_mongo_collection(ARCHIVE_COLLECTION_NAME)
+    if mongo_collection is not None:
+        try:
+            ensure_archive_collection(mongo_collection)
+        except PyMongoError as e:
+            log_exception(e)
+            return
+
+    failed_batches = process_cleanup_task(
+        queryset_func=get_issue_activities_queryset,
+        transform_func=transform_issue_activity,
+        model=IssueActivity,
+        task_name="Issue Activity",
+        collection_name=ARCHIVE_COLLECTION_NAME,
+        require_archive=True,
+        # Activities leave oldest first, the tiered reads rely on it
+        workers=1,
+    )
+    if failed_batches:
+        # Older rows stay in PostgreSQL, the partitions are dropped next run
+        return
+    # Then drop the partitions it emptied, archiving anything left in them
+    process_partition_cleanup(
+        model=IssueActivity,
+        fields=ARCHIVE_FIELDS,
+        transform_func=transform_issue_activity,
+        task_name="Issue Activity",
+        collection_name=ARCHIVE_COLLECTION_NAME,
+        cutoff_time=timezone.now() - timedelta(days=settings.ISSUE_ACTIVITY_ARCHIVE_AFTER_DAYS),
+        require_archive=True,
     )
@@ -13,6 +13,7 @@ from plane.utils.exception_logger import log_exception
 from plane.settings.storage import S3Storage
 from celery import shared_task
 from plane.utils.url import normalize_url_path
+from plane.utils.html_processor import extract_html_content
 
 
 def get_entity_id_field(entity_type, entity_id):
@@ -32,8 +33,7 @@ def get_entity_id_field(entity_type, entity_id):
 
 def extract_asset_ids(html, tag):
     try:
-        soup = BeautifulSoup(html, "html.parser")
-        return [tag.get("src") for tag in soup.find_all(tag) if tag.get("src")]
+        return list(extract_html_content(html).assets.get(tag, ()))
     except Exception as e:
         log_exception(e)
         return []
@@ -87,6 +87,7 @@ def copy_assets(entity, entity_identifier, project_id, asset_ids, user_id):
     storage = S3Storage()
     original_assets = FileAsset.objects.filter(workspace=workspace, project_id=project_id, id__in=asset_ids)
 
+    object_pairs = []
     for original_asset in original_assets:
         destination_key = f"{workspace.id}/{uuid.uuid4().hex}-{original_asset.attributes.get('name')}"
         duplicated_asset = FileAsset.objects.create(
@@ -104,13 +105,17 @@ def copy_assets(entity, entity_identifier, project_id, asset_ids, user_id):
             storage_metadata=original_asset.storage_metadata,
             **get_entity_id_field(original_asset.entity_type, entity_identifier),
         )
-        storage.copy_object(original_asset.asset, destination_key)
+        object_pairs.append((original_asset.asset, destination_key))
         duplicated_assets.append(
             {
                 "new_asset_id": str(duplicated_asset.id),
                 "old_asset_id": str(original_asset.id),
             }
         )
+    if object_pairs:
+        # Copy the objects concurrently on the shared S3 client
+        storage.copy_objects(object_pairs)
+
     if duplicated_assets:
         FileAsset.objects.filter(pk__in=[item["new_asset_id"] for item in duplicated_assets]).update(is_uploaded=True)
 
@@ -5,8 +5,6 @@ import io
 import zipfile
 from typing import List
 from collections import defaultdict
-import boto3
-from botocore.client import Config
 from uuid import UUID
 
 # Third party imports
@@ -19,6 +17,7 @@ from django.db.models import Prefetch
 
 # Module imports
 from plane.db.models import ExporterHistory, Issue, IssueRelation
+from plane.settings.storage import get_s3_client
 from plane.utils.exception_logger import log_exception
 from plane.utils.exporters import Exporter, IssueExportSchema
 
@@ -45,12 +44,10 @@ def upload_to_s3(zip_file: io.BytesIO, workspace_id: UUID, token_id: str, slug:
     expires_in = 7 * 24 * 60 * 60
 
     if settings.USE_MINIO:
-        upload_s3 = boto3.client(
-            "s3",
+        upload_s3 = get_s3_client(
             endpoint_url=settings.AWS_S3_ENDPOINT_URL,
             aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
             aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            config=Config(signature_version="s3v4"),
         )
         upload_s3.upload_fileobj(
             zip_file,
@@ -60,14 +57,12 @@ def upload_to_s3(zip_file: io.BytesIO, workspace_id: UUID, token_id: str, slug:
         )
 
         # Generate presigned url for the uploaded file with different base
-        presign_s3 = boto3.client(
-            "s3",
+        presign_s3 = get_s3_client(
             endpoint_url=(
                 f"{settings.AWS_S3_URL_PROTOCOL}//{str(settings.AWS_S3_CUSTOM_DOMAIN).replace('/uploads', '')}/"
             ),
             aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
             aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            config=Config(signature_version="s3v4"),
         )
 
         presigned_url = presign_s3.generate_presigned_url(
@@ -78,20 +73,16 @@ def upload_to_s3(zip_file: io.BytesIO, workspace_id: UUID, token_id: str, slug:
     else:
         # If endpoint url is present, use it
         if settings.AWS_S3_ENDPOINT_URL:
-            s3 = boto3.client(
-                "s3",
+            s3 = get_s3_client(
                 endpoint_url=settings.AWS_S3_ENDPOINT_URL,
                 aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
                 aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                config=Config(signature_version="s3v4"),
             )
         else:
-            s3 = boto3.client(
-                "s3",
+            s3 = get_s3_client(
                 region_name=settings.AWS_REGION,
                 aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
                 aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                config=Config(signature_version="s3v4"),
             )
 
         # Upload the file to S3
@@ -122,6 +113,50 @@ def upload_to_s3(zip_file: io.BytesIO, workspace_id: UUID, token_id: str, slug:
     exporter_instance.save(update_fields=["status", "url", "key"])
 
 
+def get_export_queryset(workspace_id: UUID, project_ids: List[str], initiated_by_id: UUID):
+    """
+    Issues of the projects the exporting user is an active member of, with
+    everything the export schema reads.
+    """
+    return (
+        Issue.objects.filter(
+            workspace__id=workspace_id,
+            project_id__in=project_ids,
+            project__project_projectmember__member=initiated_by_id,
+            project__project_projectmember__is_active=True,
+            project__archived_at__isnull=True,
+        )
+        .select_related(
+            "project",
+            "workspace",
+            "state",
+            "created_by",
+            "estimate_point",
+        )
+        .prefetch_related(
+            "labels",
+            "issue_cycle__cycle",
+            "issue_module__module",
+            "issue_comments",
+            "assignees",
+            "issue_subscribers",
+            "issue_link",
+            Prefetch(
+                "issue_relation",
+                queryset=IssueRelation.objects.select_related("related_issue", "related_issue__project"),
+            ),
+            Prefetch(
+                "issue_related",
+                queryset=IssueRelation.objects.select_related("issue", "issue__project"),
+            ),
+            Prefetch(
+                "parent",
+                queryset=Issue.objects.select_related("type", "project"),
+            ),
+        )
+    )
+
+
 @shared_task
 def issue_export_task(
     provider: str,
@@ -143,43 +178,7 @@ def issue_export_task(
         exporter_instance.save(update_fields=["status"])
 
         # Build base queryset for issues
-        workspace_issues = (
-            Issue.objects.filter(
-                workspace__id=workspace_id,
-                project_id__in=project_ids,
-                project__project_projectmember__member=exporter_instance.initiated_by_id,
-                project__project_projectmember__is_active=True,
-                project__archived_at__isnull=True,
-            )
-            .select_related(
-                "project",
-                "workspace",
-                "state",
-                "created_by",
-                "estimate_point",
-            )
-            .prefetch_related(
-                "labels",
-                "issue_cycle__cycle",
-                "issue_module__module",
-                "issue_comments",
-                "assignees",
-                "issue_subscribers",
-                "issue_link",
-                Prefetch(
-                    "issue_relation",
-                    queryset=IssueRelation.objects.select_related("related_issue", "related_issue__project"),
-                ),
-                Prefetch(
-                    "issue_related",
-                    queryset=IssueRelation.objects.select_related("issue", "issue__project"),
-                ),
-                Prefetch(
-                    "parent",
-                    queryset=Issue.objects.select_related("type", "project"),
-                ),
-            )
-        )
+        workspace_issues = get_export_queryset(workspace_id, project_ids, exporter_instance.initiated_by_id)
 
         # Create exporter for the specified format
         try:
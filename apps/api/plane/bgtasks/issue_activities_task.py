@@ -31,6 +31,8 @@ from plane.db.models import (
     EstimatePoint,
 )
 from plane.settings.redis import redis_instance
+from plane.space.utils.board_cache import bump_board_version
+from plane.utils.profile_stats import bump_profile_stats_version
 from plane.utils.exception_logger import log_exception
 from plane.utils.issue_relation_mapper import get_inverse_relation
 from plane.utils.uuid import is_valid_uuid
@@ -1519,9 +1521,17 @@ def issue_activity(
         if not is_valid_uuid(str(project_id)):
             return
 
-        project = Project.objects.get(pk=project_id)
+        project = Project.objects.select_related("workspace").get(pk=project_id)
         workspace_id = project.workspace_id
 
+        # Outdate the snapshots of the project's published board and the
+        # cached profile stats of the workspace
+        try:
+            bump_board_version(project_id)
+            bump_profile_stats_version(project.workspace.slug)
+        except Exception as e:
+            log_exception(e, warning=True)
+
         if issue_id is not None:
             if origin:
                 ri = redis_instance()
@@ -13,6 +13,8 @@ from django.utils import timezone
 from plane.bgtasks.issue_activities_task import issue_activity
 from plane.db.models import Issue, Project, State
 from plane.utils.exception_logger import log_exception
+from plane.utils.issue_counters import refresh_parent_counters
+from plane.utils.issue_stats import refresh_issue_stats
 
 
 @shared_task
@@ -62,6 +64,8 @@ def archive_old_issues():
                 # Bulk Update the issues and log the activity
                 if issues_to_update:
                     Issue.objects.bulk_update(issues_to_update, ["archived_at"], batch_size=100)
+                    refresh_issue_stats([issue.id for issue in issues_to_update])
+                    refresh_parent_counters([issue.id for issue in issues_to_update])
                     _ = [
                         issue_activity.delay(
                             type="issue.activity.updated",
@@ -125,6 +129,7 @@ def close_old_issues():
                 # Bulk Update the issues and log the activity
                 if issues_to_update:
                     Issue.objects.bulk_update(issues_to_update, ["state"], batch_size=100)
+                    refresh_issue_stats([issue.id for issue in issues_to_update])
                     [
                         issue_activity.delay(
                             type="issue.activity.updated",
@@ -0,0 +1,48 @@
+# Third party imports
+from celery import shared_task
+
+# Module imports
+from plane.db.models import Cycle, Issue, Module
+from plane.utils.exception_logger import log_exception
+from plane.utils.issue_counters import refresh_issue_counters
+from plane.utils.issue_stats import refresh_cycle_stats, refresh_module_stats
+
+BATCH_SIZE = 500
+
+
+def get_id_batches(queryset, batch_size=BATCH_SIZE):
+    """Yield the ids of a queryset in keyset ordered batches"""
+    last_id = None
+    while True:
+        batch = queryset.order_by("id")
+        if last_id is not None:
+            batch = batch.filter(id__gt=last_id)
+        ids = list(batch.values_list("id", flat=True)[:batch_size])
+        if not ids:
+            return
+        yield ids
+        last_id = ids[-1]
+
+
+@shared_task
+def repair_issue_stats():
+    """Recompute every module and cycle stats row, correcting any drift"""
+    try:
+        for module_ids in get_id_batches(Module.objects.all()):
+            refresh_module_stats(module_ids)
+        for cycle_ids in get_id_batches(Cycle.objects.all()):
+            refresh_cycle_stats(cycle_ids)
+    except Exception as e:
+        log_exception(e)
+        return
+
+
+@shared_task
+def repair_issue_counters():
+    """Recompute the counters and current cycle of every issue, correcting any drift"""
+    try:
+        for issue_ids in get_id_batches(Issue.objects.all()):
+            refresh_issue_counters(issue_ids)
+    except Exception as e:
+        log_exception(e)
+        return
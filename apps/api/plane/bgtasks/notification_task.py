@@ -20,11 +20,15 @@ from plane.db.models import (
     UserNotificationPreference,
     ProjectMember,
 )
+from plane.utils.html_processor import extract_html_content
+from plane.utils.notification_counter import (
+    increment_unread_notification_counts,
+    reconcile_unread_notification_counts,
+)
 from django.db.models import Subquery
 
 # Third Party imports
 from celery import shared_task
-from bs4 import BeautifulSoup
 
 
 # =========== Issue Description Html Parsing and notification Functions ======================
@@ -115,10 +119,7 @@ def extract_mentions(issue_instance):
         # Convert string to dictionary
         data = json.loads(issue_instance)
         html = data.get("description_html")
-        soup = BeautifulSoup(html, "html.parser")
-        mention_tags = soup.find_all("mention-component", attrs={"entity_name": "user_mention"})
-
-        mentions = [mention_tag["entity_identifier"] for mention_tag in mention_tags]
+        mentions = extract_html_content(html).mentions
 
         return list(set(mentions))
     except Exception:
@@ -128,11 +129,7 @@ def extract_mentions(issue_instance):
 # =========== Comment Parsing and notification Functions ======================
 def extract_comment_mentions(comment_value):
     try:
-        mentions = []
-        soup = BeautifulSoup(comment_value, "html.parser")
-        mentions_tags = soup.find_all("mention-component", attrs={"entity_name": "user_mention"})
-        for mention_tag in mentions_tags:
-            mentions.append(mention_tag["entity_identifier"])
+        mentions = extract_html_content(comment_value).mentions
         return list(set(mentions))
     except Exception:
         return []
@@ -663,8 +660,15 @@ def notifications(
             )
             # Bulk create notifications
             Notification.objects.bulk_create(bulk_notifications, batch_size=100)
+            increment_unread_notification_counts(project.workspace.slug, bulk_notifications)
             EmailNotificationLog.objects.bulk_create(bulk_email_logs, batch_size=100, ignore_conflicts=True)
         return
     except Exception as e:
         print(e)
         return
+
+
+@shared_task
+def reconcile_unread_notifications():
+    """Correct any drift of the unread notification counters"""
+    reconcile_unread_notification_counts()
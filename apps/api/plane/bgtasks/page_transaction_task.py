@@ -4,13 +4,11 @@ import logging
 # Django imports
 from django.utils import timezone
 
-# Third-party imports
-from bs4 import BeautifulSoup
-
 # App imports
 from celery import shared_task
 from plane.db.models import Page, PageLog
 from plane.utils.exception_logger import log_exception
+from plane.utils.html_processor import extract_html_content
 
 logger = logging.getLogger("plane.worker")
 
@@ -47,19 +45,14 @@ def extract_all_components(description_html):
         if not description_html:
             return {component: [] for component in component_map.keys()}
 
-        soup = BeautifulSoup(description_html, "html.parser")
+        content = extract_html_content(description_html)
         results = {}
 
         for component, config in component_map.items():
             attributes = config.get("attributes", ["id"])
-            component_tags = soup.find_all(component)
-
-            entities = []
-            for tag in component_tags:
-                entity = {attr: tag.get(attr) for attr in attributes}
-                entities.append(entity)
-
-            results[component] = entities
+            results[component] = [
+                {attr: tag.get(attr) for attr in attributes} for tag in content.components.get(component, ())
+            ]
 
         return results
 
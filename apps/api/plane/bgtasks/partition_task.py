@@ -0,0 +1,29 @@
+# Third party imports
+from celery import shared_task
+
+# Module imports
+from plane.utils.exception_logger import log_exception
+from plane.utils.partitions import create_partitions
+
+# The tables partitioned by month of created_at. Their partitions past the
+# retention are archived and dropped by the cleanup tasks.
+PARTITIONED_TABLES = (
+    "issue_activities",
+    "api_activity_logs",
+    "email_notification_logs",
+    "webhook_logs",
+    "page_versions",
+    "issue_description_versions",
+)
+
+MONTHS_AHEAD = 3
+
+
+@shared_task
+def maintain_partitions():
+    """Create the partitions of the coming months"""
+    for table in PARTITIONED_TABLES:
+        try:
+            create_partitions(table, months_ahead=MONTHS_AHEAD)
+        except Exception as e:
+            log_exception(e)
@@ -1,13 +1,76 @@
 # Python imports
+import uuid
+
+# Django imports
 from django.utils import timezone
-from django.db import DatabaseError
+from django.db import DatabaseError, connection, transaction
 
 # Third party imports
 from celery import shared_task
+from redis.exceptions import RedisError
 
 # Module imports
 from plane.db.models import UserRecentVisit, Workspace
 from plane.utils.exception_logger import log_exception
+from plane.utils.recent_visit import (
+    RECENT_VISIT_LIMIT,
+    mark_recent_visits_dirty,
+    pop_dirty_recent_visits,
+    record_recent_visit as buffer_recent_visit,
+    remove_recent_visit,
+)
+
+# Buffers popped from Redis per flush iteration
+FLUSH_BATCH_SIZE = 500
+
+# Rows written per INSERT statement
+UPSERT_BATCH_SIZE = 1000
+
+
+def record_recent_visit(entity_name, entity_identifier, user_id, project_id, slug):
+    """
+    Record a visit in the Redis buffer, falling back to the Celery task when
+    Redis is unavailable.
+    """
+    try:
+        buffer_recent_visit(
+            entity_name=entity_name,
+            entity_identifier=entity_identifier,
+            user_id=user_id,
+            project_id=project_id,
+            slug=slug,
+        )
+    except RedisError as e:
+        log_exception(e, warning=True)
+        recent_visited_task.delay(
+            entity_name=entity_name,
+            entity_identifier=entity_identifier,
+            user_id=user_id,
+            project_id=project_id,
+            slug=slug,
+        )
+
+
+def delete_recent_visits(entity_name, entity_identifier, project_id, slug):
+    """Delete the visits of a deleted entity from the database and the Redis buffers"""
+    recent_visits = UserRecentVisit.objects.filter(
+        project_id=project_id,
+        workspace__slug=slug,
+        entity_identifier=entity_identifier,
+        entity_name=entity_name,
+    )
+    user_ids = set(recent_visits.values_list("user_id", flat=True))
+    recent_visits.delete(soft=False)
+    try:
+        remove_recent_visit(
+            slug=slug,
+            user_ids=user_ids,
+            entity_name=entity_name,
+            entity_identifier=entity_identifier,
+            project_id=project_id,
+        )
+    except RedisError as e:
+        log_exception(e, warning=True)
 
 
 @shared_task
@@ -55,3 +118,133 @@ def recent_visited_task(entity_name, entity_identifier, user_id, project_id, slu
     except Exception as e:
         log_exception(e)
         return
+
+
+def upsert_recent_visits(rows):
+    """
+    Insert or refresh visits with a single INSERT ... ON CONFLICT statement.
+
+    Each row is (workspace_id, project_id, user_id, entity_name, entity_identifier, visited_at).
+    """
+    if not rows:
+        return
+
+    now = timezone.now()
+    table = UserRecentVisit._meta.db_table
+    values = []
+    params = []
+    for workspace_id, project_id, user_id, entity_name, entity_identifier, visited_at in rows:
+        values.append("(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)")
+        params.extend(
+            [
+                uuid.uuid4(),
+                now,
+                now,
+                workspace_id,
+                project_id,
+                user_id,
+                entity_name,
+                entity_identifier,
+                visited_at,
+                user_id,
+                user_id,
+            ]
+        )
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO {table} (
+                id, created_at, updated_at, workspace_id, project_id, user_id,
+                entity_name, entity_identifier, visited_at, created_by_id, updated_by_id
+            )
+            VALUES {", ".join(values)}
+            ON CONFLICT (workspace_id, user_id, entity_name, entity_identifier)
+            WHERE deleted_at IS NULL
+            DO UPDATE SET
+                visited_at = GREATEST({table}.visited_at, EXCLUDED.visited_at),
+                updated_at = EXCLUDED.updated_at,
+                updated_by_id = EXCLUDED.updated_by_id
+            """,
+            params,
+        )
+
+
+def trim_recent_visits(workspace_ids, user_ids):
+    """Keep only the latest RECENT_VISIT_LIMIT visits per user and workspace"""
+    table = UserRecentVisit._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            DELETE FROM {table}
+            WHERE id IN (
+                SELECT id FROM (
+                    SELECT
+                        id,
+                        ROW_NUMBER() OVER (
+                            PARTITION BY workspace_id, user_id ORDER BY visited_at DESC
+                        ) AS position
+                    FROM {table}
+                    WHERE deleted_at IS NULL
+                        AND workspace_id = ANY(%s::uuid[])
+                        AND user_id = ANY(%s::uuid[])
+                ) ranked
+                WHERE ranked.position > %s
+            )
+            """,
+            [
+                [str(workspace_id) for workspace_id in workspace_ids],
+                [str(user_id) for user_id in user_ids],
+                RECENT_VISIT_LIMIT,
+            ],
+        )
+
+
+@shared_task
+def flush_recent_visits(batch_size=FLUSH_BATCH_SIZE):
+    """Persist buffered recent visits to UserRecentVisit"""
+    try:
+        while True:
+            buffers = pop_dirty_recent_visits(batch_size)
+            if not buffers:
+                return
+
+            workspace_ids = dict(
+                Workspace.objects.filter(slug__in={slug for slug, _ in buffers}).values_list("slug", "id")
+            )
+
+            rows = {}
+            for (slug, user_id), visits in buffers.items():
+                workspace_id = workspace_ids.get(slug)
+                if workspace_id is None:
+                    continue
+                for visit in visits:
+                    conflict_key = (workspace_id, user_id, visit["entity_name"], visit["entity_identifier"])
+                    rows[conflict_key] = (
+                        workspace_id,
+                        visit["project_id"],
+                        user_id,
+                        visit["entity_name"],
+                        visit["entity_identifier"],
+                        visit["visited_at"],
+                    )
+
+            if not rows:
+                continue
+
+            try:
+                rows = list(rows.values())
+                with transaction.atomic():
+                    for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+                        upsert_recent_visits(rows[start : start + UPSERT_BATCH_SIZE])
+                    trim_recent_visits(
+                        workspace_ids={row[0] for row in rows},
+                        user_ids={row[2] for row in rows},
+                    )
+            except Exception:
+                # Keep the buffers queued so the next flush retries them
+                mark_recent_visits_dirty(buffers.keys())
+                raise
+    except Exception as e:
+        log_exception(e)
+        return
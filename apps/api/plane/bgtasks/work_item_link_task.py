@@ -1,16 +1,23 @@
 # Python imports
+import base64
+import hashlib
+import ipaddress
 import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urljoin, urlparse, urlunparse
 
+# Django imports
+from django.core.cache import cache
 
 # Third party imports
 from celery import shared_task
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urlparse, urljoin
-import base64
-import ipaddress
-from typing import Dict, Any
-from typing import Optional
+from requests.adapters import HTTPAdapter
+from requests.compat import chardet
 from plane.db.models import IssueLink
 from plane.utils.exception_logger import log_exception
 
@@ -19,155 +26,296 @@ logger = logging.getLogger("plane.worker")
 
 DEFAULT_FAVICON = "PHN2ZyB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciIHdpZHRoPSIyNCIgaGVpZ2h0PSIyNCIgdmlld0JveD0iMCAwIDI0IDI0IiBmaWxsPSJub25lIiBzdHJva2U9ImN1cnJlbnRDb2xvciIgc3Ryb2tlLXdpZHRoPSIyIiBzdHJva2UtbGluZWNhcD0icm91bmQiIHN0cm9rZS1saW5lam9pbj0icm91bmQiIGNsYXNzPSJsdWNpZGUgbHVjaWRlLWxpbmstaWNvbiBsdWNpZGUtbGluayI+PHBhdGggZD0iTTEwIDEzYTUgNSAwIDAgMCA3LjU0LjU0bDMtM2E1IDUgMCAwIDAtNy4wNy03LjA3bC0xLjcyIDEuNzEiLz48cGF0aCBkPSJNMTQgMTFhNSA1IDAgMCAwLTcuNTQtLjU0bC0zIDNhNSA1IDAgMCAwIDcuMDcgNy4wN2wxLjcxLTEuNzEiLz48L3N2Zz4="  # noqa: E501
 
+# Set up headers to mimic a real browser
+REQUEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"  # noqa: E501
+}
 
-def crawl_work_item_link_title_and_favicon(url: str) -> Dict[str, Any]:
-    """
-    Crawls a URL to extract the title and favicon.
+# Favicon link relations in order of preference
+FAVICON_RELS = ["icon", "shortcut icon", "apple-touch-icon", "apple-touch-icon-precomposed"]
 
-    Args:
-        url (str): The URL to crawl
+# Stop reading a page after this many bytes if `</head>` was not seen
+LINK_HEAD_MAX_BYTES = 512 * 1024
+# Favicons larger than this fall back to the default icon
+LINK_FAVICON_MAX_BYTES = 256 * 1024
+LINK_READ_CHUNK_SIZE = 8 * 1024
 
-    Returns:
-        str: JSON string containing title and base64-encoded favicon
-    """
-    try:
-        # Prevent access to private IP ranges
-        parsed = urlparse(url)
-
-        try:
-            ip = ipaddress.ip_address(parsed.hostname)
-            if ip.is_private or ip.is_loopback or ip.is_reserved:
-                raise ValueError("Access to private/internal networks is not allowed")
-        except ValueError:
-            # Not an IP address, continue with domain validation
-            pass
-
-        # Set up headers to mimic a real browser
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"  # noqa: E501
-        }
+# Shared metadata cache lifetimes, in seconds
+LINK_PAGE_CACHE_TTL = 60 * 60 * 24
+LINK_FAVICON_CACHE_TTL = 60 * 60 * 24 * 7
+LINK_FAILURE_CACHE_TTL = 60 * 5
 
-        soup = None
-        title = None
+# Charset declared by a Content-Type header or a `<meta>` tag of the page
+CHARSET_PATTERN = re.compile(rb"""charset\s*=\s*["']?([\w.:-]+)""", re.IGNORECASE)
+META_TAG_PATTERN = re.compile(rb"<meta\s[^>]*>", re.IGNORECASE)
 
-        try:
-            response = requests.get(url, headers=headers, timeout=1)
+# Concurrent fetches used by the batch crawler
+LINK_CRAWL_MAX_WORKERS = 16
 
-            soup = BeautifulSoup(response.content, "html.parser")
-            title_tag = soup.find("title")
-            title = title_tag.get_text().strip() if title_tag else None
+_session = None
+_session_lock = threading.Lock()
 
-        except requests.RequestException as e:
-            logger.warning(f"Failed to fetch HTML for title: {str(e)}")
 
-        # Fetch and encode favicon
-        favicon_base64 = fetch_and_encode_favicon(headers, soup, url)
+def get_http_session() -> requests.Session:
+    """Process wide session so TCP and TLS connections are reused across links"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=LINK_CRAWL_MAX_WORKERS, pool_maxsize=LINK_CRAWL_MAX_WORKERS)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update(REQUEST_HEADERS)
+            _session = session
+        return _session
 
-        # Prepare result
-        result = {
-            "title": title,
-            "favicon": favicon_base64["favicon_base64"],
-            "url": url,
-            "favicon_url": favicon_base64["favicon_url"],
-        }
 
-        return result
+def normalize_link_url(url: str) -> str:
+    """Normalize a URL so that equivalent links share cache entries"""
+    parsed = urlparse(url.strip())
+    scheme = parsed.scheme.lower()
+    netloc = (parsed.hostname or "").lower()
+    if parsed.port and not ((scheme == "http" and parsed.port == 80) or (scheme == "https" and parsed.port == 443)):
+        netloc = f"{netloc}:{parsed.port}"
+    return urlunparse((scheme, netloc, parsed.path or "/", parsed.params, parsed.query, ""))
 
-    except Exception as e:
-        log_exception(e)
-        return {
-            "error": f"Unexpected error: {str(e)}",
-            "title": None,
-            "favicon": None,
-            "url": url,
-        }
 
+def get_cache_key(kind: str, value: str) -> str:
+    return f"link_metadata:{kind}:{hashlib.sha256(value.encode('utf-8')).hexdigest()}"
 
-def find_favicon_url(soup: Optional[BeautifulSoup], base_url: str) -> Optional[str]:
-    """
-    Find the favicon URL from HTML soup.
 
-    Args:
-        soup: BeautifulSoup object
-        base_url: Base URL for resolving relative paths
+def validate_link_host(url: str) -> None:
+    """Prevent access to private IP ranges"""
+    hostname = urlparse(url).hostname
+    try:
+        ip = ipaddress.ip_address(hostname)
+    except ValueError:
+        # Not an IP address, continue with domain validation
+        return
+    if ip.is_private or ip.is_loopback or ip.is_reserved:
+        raise ValueError("Access to private/internal networks is not allowed")
+
+
+class LinkHeadParser(HTMLParser):
+    """Collects the page title and favicon links from the document head"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title = None
+        self.favicon_hrefs = {}
+        self._in_title = False
+        self._title_parts = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "title" and self.title is None:
+            self._in_title = True
+        elif tag == "link":
+            attributes = dict(attrs)
+            rel = (attributes.get("rel") or "").strip().lower()
+            href = attributes.get("href")
+            if rel in FAVICON_RELS and href and rel not in self.favicon_hrefs:
+                self.favicon_hrefs[rel] = href
+
+    def handle_endtag(self, tag):
+        if tag == "title" and self._in_title:
+            self._in_title = False
+            self.title = "".join(self._title_parts).strip()
+
+    def handle_data(self, data):
+        if self._in_title:
+            self._title_parts.append(data)
+
+    def get_favicon_href(self) -> Optional[str]:
+        for rel in FAVICON_RELS:
+            if rel in self.favicon_hrefs:
+                return self.favicon_hrefs[rel]
+        return None
 
-    Returns:
-        str: Absolute URL to favicon or None
+
+def read_limited(response: requests.Response, max_bytes: int, stop_marker: Optional[bytes] = None) -> Optional[bytes]:
     """
+    Read a streamed response up to max_bytes, stopping early at stop_marker.
 
-    if soup is not None:
-        # Look for various favicon link tags
-        favicon_selectors = [
-            'link[rel="icon"]',
-            'link[rel="shortcut icon"]',
-            'link[rel="apple-touch-icon"]',
-            'link[rel="apple-touch-icon-precomposed"]',
-        ]
-
-        for selector in favicon_selectors:
-            favicon_tag = soup.select_one(selector)
-            if favicon_tag and favicon_tag.get("href"):
-                return urljoin(base_url, favicon_tag["href"])
-
-    # Fallback to /favicon.ico
+    Returns None when the body exceeds max_bytes without hitting the marker
+    and no marker was requested.
+    """
+    content = bytearray()
+    try:
+        for chunk in response.iter_content(LINK_READ_CHUNK_SIZE):
+            content.extend(chunk)
+            if stop_marker is not None and stop_marker in content[-(len(chunk) + len(stop_marker)) :].lower():
+                break
+            if len(content) > max_bytes:
+                if stop_marker is None:
+                    return None
+                break
+    finally:
+        response.close()
+    return bytes(content)
+
+
+def get_head_encoding(response: requests.Response, head: bytes) -> str:
+    """
+    Find the encoding of the page head from the charset sent in the
+    Content-Type header, then the `<meta>` tags, then the bytes themselves.
+
+    response.encoding is not used, as requests falls back to ISO-8859-1 for
+    any text/html response sent without a charset.
+    """
+    match = CHARSET_PATTERN.search(response.headers.get("content-type", "").encode("latin-1", errors="ignore"))
+    if match is None:
+        for tag in META_TAG_PATTERN.findall(head):
+            match = CHARSET_PATTERN.search(tag)
+            if match is not None:
+                break
+    if match is not None:
+        return match.group(1).decode("ascii")
+    return chardet.detect(head)["encoding"] or "utf-8"
+
+
+def fetch_page_head(url: str) -> Dict[str, Optional[str]]:
+    """Fetch only the head of a page and extract its title and favicon URL"""
+    cache_key = get_cache_key("page", normalize_link_url(url))
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    title = None
+    favicon_href = None
+    try:
+        response = get_http_session().get(url, timeout=1, stream=True)
+        if response.ok:
+            head = read_limited(response, LINK_HEAD_MAX_BYTES, stop_marker=b"</head>")
+
+            parser = LinkHeadParser()
+            parser.feed(head.decode(get_head_encoding(response, head), errors="replace"))
+            title = parser.title
+            favicon_href = parser.get_favicon_href()
+            ttl = LINK_PAGE_CACHE_TTL
+        else:
+            # Error pages are not cached as the title of the link
+            response.close()
+            logger.warning(f"Failed to fetch HTML for title: status {response.status_code}")
+            ttl = LINK_FAILURE_CACHE_TTL
+    except (requests.RequestException, LookupError) as e:
+        logger.warning(f"Failed to fetch HTML for title: {str(e)}")
+        ttl = LINK_FAILURE_CACHE_TTL
+
+    result = {
+        "title": title,
+        "favicon_url": urljoin(url, favicon_href) if favicon_href else None,
+    }
+    cache.set(cache_key, result, ttl)
+    return result
+
+
+def find_favicon_url(favicon_url: Optional[str], base_url: str) -> str:
+    """
+    Return the favicon declared by the page, falling back to /favicon.ico on
+    the same host.
+    """
+    if favicon_url:
+        return favicon_url
     parsed_url = urlparse(base_url)
-    fallback_url = f"{parsed_url.scheme}://{parsed_url.netloc}/favicon.ico"
+    return f"{parsed_url.scheme}://{parsed_url.netloc}/favicon.ico"
+
 
-    # Check if fallback exists
+def fetch_and_encode_favicon(favicon_url: Optional[str], url: str) -> Dict[str, Optional[str]]:
+    """
+    Fetch favicon and encode it as base64.
+
+    Favicons are cached by their URL, which is shared by every page of a host.
+
+    Returns:
+        dict: favicon URL and base64 encoded favicon with data URI prefix
+    """
+    default = {
+        "favicon_url": None,
+        "favicon_base64": f"data:image/svg+xml;base64,{DEFAULT_FAVICON}",
+    }
+    favicon_url = find_favicon_url(favicon_url, url)
+
+    cache_key = get_cache_key("favicon", normalize_link_url(favicon_url))
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    result = default
+    ttl = LINK_FAILURE_CACHE_TTL
     try:
-        response = requests.head(fallback_url, timeout=2)
+        validate_link_host(favicon_url)
+        response = get_http_session().get(favicon_url, timeout=1, stream=True)
         if response.status_code == 200:
-            return fallback_url
-    except requests.RequestException as e:
-        log_exception(e, warning=True)
-        return None
+            content = read_limited(response, LINK_FAVICON_MAX_BYTES)
+            if content is not None:
+                # Get content type
+                content_type = response.headers.get("content-type", "image/x-icon")
+                # Convert to base64
+                favicon_base64 = base64.b64encode(content).decode("utf-8")
+                result = {
+                    "favicon_url": favicon_url,
+                    "favicon_base64": f"data:{content_type};base64,{favicon_base64}",
+                }
+                ttl = LINK_FAVICON_CACHE_TTL
+        else:
+            response.close()
+    except Exception as e:
+        logger.warning(f"Failed to fetch favicon: {e}")
 
-    return None
+    cache.set(cache_key, result, ttl)
+    return result
 
 
-def fetch_and_encode_favicon(
-    headers: Dict[str, str], soup: Optional[BeautifulSoup], url: str
-) -> Dict[str, Optional[str]]:
+def crawl_work_item_link_title_and_favicon(url: str) -> Dict[str, Any]:
     """
-    Fetch favicon and encode it as base64.
+    Crawls a URL to extract the title and favicon.
 
     Args:
-        favicon_url: URL to the favicon
-        headers: Request headers
+        url (str): The URL to crawl
 
     Returns:
-        str: Base64 encoded favicon with data URI prefix or None
+        dict: title, base64-encoded favicon and their URLs
     """
     try:
-        favicon_url = find_favicon_url(soup, url)
-        if favicon_url is None:
-            return {
-                "favicon_url": None,
-                "favicon_base64": f"data:image/svg+xml;base64,{DEFAULT_FAVICON}",
-            }
+        validate_link_host(url)
 
-        response = requests.get(favicon_url, headers=headers, timeout=1)
+        page = fetch_page_head(url)
 
-        # Get content type
-        content_type = response.headers.get("content-type", "image/x-icon")
-
-        # Convert to base64
-        favicon_base64 = base64.b64encode(response.content).decode("utf-8")
+        # Fetch and encode favicon
+        favicon = fetch_and_encode_favicon(page["favicon_url"], url)
 
-        # Return as data URI
         return {
-            "favicon_url": favicon_url,
-            "favicon_base64": f"data:{content_type};base64,{favicon_base64}",
+            "title": page["title"],
+            "favicon": favicon["favicon_base64"],
+            "url": url,
+            "favicon_url": favicon["favicon_url"],
         }
 
     except Exception as e:
-        logger.warning(f"Failed to fetch favicon: {e}")
+        log_exception(e)
         return {
-            "favicon_url": None,
-            "favicon_base64": f"data:image/svg+xml;base64,{DEFAULT_FAVICON}",
+            "error": f"Unexpected error: {str(e)}",
+            "title": None,
+            "favicon": None,
+            "url": url,
         }
 
 
+def crawl_work_item_links(urls: Iterable[str], max_workers: int = LINK_CRAWL_MAX_WORKERS) -> Dict[str, Dict[str, Any]]:
+    """
+    Resolve the metadata of many links concurrently.
+
+    Returns a mapping of url -> metadata; duplicated URLs are crawled once.
+    """
+    unique_urls: List[str] = list(dict.fromkeys(urls))
+    if not unique_urls:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_urls))) as executor:
+        results = executor.map(crawl_work_item_link_title_and_favicon, unique_urls)
+        return dict(zip(unique_urls, results))
+
+
 @shared_task
 def crawl_work_item_link_title(id: str, url: str) -> None:
     meta_data = crawl_work_item_link_title_and_favicon(url)
@@ -176,3 +324,15 @@ def crawl_work_item_link_title(id: str, url: str) -> None:
     issue_link.metadata = meta_data
 
     issue_link.save()
+
+
+@shared_task
+def crawl_work_item_link_titles(ids: List[str]) -> None:
+    """Batch variant of crawl_work_item_link_title for imports adding many links"""
+    issue_links = list(IssueLink.objects.filter(id__in=ids))
+    metadata = crawl_work_item_links(issue_link.url for issue_link in issue_links)
+
+    for issue_link in issue_links:
+        issue_link.metadata = metadata.get(issue_link.url)
+
+    IssueLink.objects.bulk_update(issue_links, ["metadata"], batch_size=100)
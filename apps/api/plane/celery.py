@@ -5,7 +5,13 @@ import logging
 # Third party imports
 from celery import Celery
 from pythonjsonlogger.jsonlogger import JsonFormatter
-from celery.signals import after_setup_logger, after_setup_task_logger
+from celery.signals import (
+    after_setup_logger,
+    after_setup_task_logger,
+    worker_init,
+    worker_process_init,
+    worker_process_shutdown,
+)
 from celery.schedules import crontab
 
 # Module imports
@@ -28,6 +34,14 @@ app.conf.beat_schedule = {
         "task": "plane.bgtasks.email_notification_task.stack_email_notification",
         "schedule": crontab(minute="*/5"),  # Every 5 minutes
     },
+    "check-every-minute-to-flush-recent-visits": {
+        "task": "plane.bgtasks.recent_visited_task.flush_recent_visits",
+        "schedule": crontab(minute="*"),  # Every minute
+    },
+    "check-every-ten-minutes-to-reconcile-unread-notifications": {
+        "task": "plane.bgtasks.notification_task.reconcile_unread_notifications",
+        "schedule": crontab(minute="*/10"),  # Every 10 minutes
+    },
     "run-every-6-hours-for-instance-trace": {
         "task": "plane.license.bgtasks.tracer.instance_traces",
         "schedule": crontab(hour="*/6", minute=0),  # Every 6 hours
@@ -73,6 +87,22 @@ app.conf.beat_schedule = {
         "task": "plane.bgtasks.exporter_expired_task.delete_old_s3_link",
         "schedule": crontab(hour=3, minute=45),  # UTC 03:45
     },
+    "check-every-day-to-repair-issue-stats": {
+        "task": "plane.bgtasks.issue_stats_task.repair_issue_stats",
+        "schedule": crontab(hour=4, minute=0),  # UTC 04:00
+    },
+    "check-every-day-to-repair-issue-counters": {
+        "task": "plane.bgtasks.issue_stats_task.repair_issue_counters",
+        "schedule": crontab(hour=4, minute=15),  # UTC 04:15
+    },
+    "check-every-day-to-archive-issue-activities": {
+        "task": "plane.bgtasks.cleanup_task.archive_issue_activities",
+        "schedule": crontab(hour=4, minute=30),  # UTC 04:30
+    },
+    "check-every-day-to-maintain-partitions": {
+        "task": "plane.bgtasks.partition_task.maintain_partitions",
+        "schedule": crontab(hour=5, minute=0),  # UTC 05:00
+    },
 }
 
 
@@ -93,6 +123,36 @@ def setup_task_loggers(logger, *args, **kwargs):
     logger.addHandler(handler)
 
 
+# Database connections
+@worker_init.connect
+def setup_worker_database_connections(*args, **kwargs):
+    # Tasks reuse their connection until it is older than the max age
+    from django.conf import settings
+
+    for database in settings.DATABASES.values():
+        if not database.get("OPTIONS", {}).get("pool"):
+            database["CONN_MAX_AGE"] = settings.WORKER_DATABASE_CONN_MAX_AGE
+
+
+@worker_process_init.connect
+def reset_worker_process_database_pools(*args, **kwargs):
+    # The pool threads do not survive the fork, every child opens its own pools
+    from plane.db.backends.postgresql.base import discard_connection_pools
+
+    discard_connection_pools()
+
+
+@worker_process_shutdown.connect
+def close_worker_process_database_pools(*args, **kwargs):
+    from django.db import connections
+
+    from plane.db.backends.postgresql.base import close_connection_pools, log_pool_stats
+
+    log_pool_stats(force=True)
+    connections.close_all()
+    close_connection_pools()
+
+
 # Load task modules from all registered Django app configs.
 app.autodiscover_tasks()
 
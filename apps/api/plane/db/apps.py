@@ -3,3 +3,8 @@ from django.apps import AppConfig
 
 class DbConfig(AppConfig):
     name = "plane.db"
+
+    def ready(self):
+        # Register the receivers maintaining the module and cycle stats and the issue counters
+        import plane.utils.issue_stats  # noqa
+        import plane.utils.issue_counters  # noqa
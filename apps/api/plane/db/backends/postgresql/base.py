@@ -0,0 +1,130 @@
+"""
+PostgreSQL backend with an optional psycopg connection pool.
+
+The pool is enabled with OPTIONS["pool"], either True or the keyword
+arguments of psycopg_pool.ConnectionPool (min_size, max_size, timeout...).
+There is one pool per database alias and process: connections are taken from
+the pool when Django connects and put back when Django closes them, so
+CONN_MAX_AGE must be 0 for them to return after each request or task. A pool
+inherited by a forked process is discarded with discard_connection_pools()
+and opened again on first use.
+"""
+
+# Python imports
+import logging
+import threading
+import time
+
+# Django imports
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.postgresql.base import DatabaseWrapper as PostgresDatabaseWrapper
+from django.db.backends.postgresql.psycopg_any import IsolationLevel
+
+try:
+    from psycopg_pool import ConnectionPool
+except ImportError:
+    ConnectionPool = None
+
+logger = logging.getLogger("plane.db.pool")
+
+# Pools of the current process by database alias
+_connection_pools = {}
+_connection_pools_lock = threading.Lock()
+_last_stats_log = 0.0
+
+
+def get_pool_stats():
+    """Usage counters of the pools of the current process by database alias"""
+    return {alias: pool.get_stats() for alias, pool in list(_connection_pools.items())}
+
+
+def log_pool_stats(force=False):
+    """Log the pool usage at most once per DATABASE_POOL_STATS_INTERVAL seconds"""
+    global _last_stats_log
+
+    now = time.monotonic()
+    if not force and now - _last_stats_log < settings.DATABASE_POOL_STATS_INTERVAL:
+        return
+    _last_stats_log = now
+    for alias, stats in get_pool_stats().items():
+        logger.info("Database pool stats", extra={"database": alias, **stats})
+
+
+def close_connection_pools():
+    with _connection_pools_lock:
+        pools = list(_connection_pools.values())
+        _connection_pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+def discard_connection_pools():
+    """
+    Forget the pools inherited from a parent process. Closing them would end
+    the connections the parent still uses, so they are only dropped.
+    """
+    with _connection_pools_lock:
+        _connection_pools.clear()
+
+
+class DatabaseWrapper(PostgresDatabaseWrapper):
+    @property
+    def pool(self):
+        pool_options = self.settings_dict["OPTIONS"].get("pool")
+        if not pool_options:
+            return None
+
+        pool = _connection_pools.get(self.alias)
+        if pool is not None:
+            return pool
+
+        if ConnectionPool is None:
+            raise ImproperlyConfigured("The database pool requires the psycopg-pool package to be installed.")
+
+        pool = ConnectionPool(
+            kwargs=self.get_connection_params(),
+            open=False,
+            check=ConnectionPool.check_connection if self.settings_dict["CONN_HEALTH_CHECKS"] else None,
+            name=self.alias,
+            **({} if pool_options is True else pool_options),
+        )
+        with _connection_pools_lock:
+            current = _connection_pools.setdefault(self.alias, pool)
+        if current is pool:
+            pool.open()
+        return current
+
+    def get_connection_params(self):
+        conn_params = super().get_connection_params()
+        conn_params.pop("pool", None)
+        return conn_params
+
+    def get_new_connection(self, conn_params):
+        pool = self.pool
+        if pool is None:
+            return super().get_new_connection(conn_params)
+
+        options = self.settings_dict["OPTIONS"]
+        try:
+            self.isolation_level = IsolationLevel(options.get("isolation_level", IsolationLevel.READ_COMMITTED))
+        except ValueError:
+            raise ImproperlyConfigured(
+                f"Invalid transaction isolation level {options['isolation_level']} "
+                f"specified. Use one of the psycopg.IsolationLevel values."
+            )
+
+        connection = pool.getconn()
+        if "isolation_level" in options:
+            connection.isolation_level = self.isolation_level
+        log_pool_stats()
+        return connection
+
+    def _close(self):
+        pool = _connection_pools.get(self.alias) if self.settings_dict["OPTIONS"].get("pool") else None
+        if self.connection is None or pool is None:
+            return super()._close()
+
+        # Give the connection back to the pool, which resets it for the next user
+        with self.wrap_database_errors:
+            pool.putconn(self.connection)
@@ -0,0 +1,21 @@
+# Django imports
+from django.core.management import BaseCommand
+
+# Module imports
+from plane.utils.filters.compiler import get_missing_filter_indexes
+
+
+class Command(BaseCommand):
+    help = "Check the indexes required by the compiled issue filters"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default="default", help="Database alias to check")
+
+    def handle(self, *args, **options):
+        missing = get_missing_filter_indexes(using=options["database"])
+        if not missing:
+            self.stdout.write(self.style.SUCCESS("All the indexes required by the issue filters exist"))
+            return
+
+        for model_label, table, columns in missing:
+            self.stdout.write(self.style.WARNING(f"Missing index on {table} ({', '.join(columns)}) for {model_label}"))
@@ -0,0 +1,63 @@
+# Python imports
+import json
+import time
+
+# Django imports
+from django.core.management import BaseCommand, CommandError
+
+# Module imports
+from plane.db.models import User, Workspace
+from plane.utils.load_generator import LoadGenerator, LoadProfile
+
+
+class Command(BaseCommand):
+    help = "Generate a deterministic, skewed workspace of the given size for load testing"
+
+    def add_arguments(self, parser):
+        parser.add_argument("slug", type=str, help="Slug of the workspace to create")
+        parser.add_argument("--email", required=True, help="Email of the workspace owner, created if missing")
+        parser.add_argument("--seed", type=int, default=0, help="Seed of the generated data")
+        parser.add_argument("--projects", type=int, default=LoadProfile.projects)
+        parser.add_argument("--issues", type=int, default=LoadProfile.issues)
+        parser.add_argument("--members", type=int, default=LoadProfile.members)
+        parser.add_argument("--labels", type=int, default=LoadProfile.labels)
+        parser.add_argument("--cycles", type=int, default=LoadProfile.cycles)
+        parser.add_argument("--modules", type=int, default=LoadProfile.modules)
+        parser.add_argument("--pages", type=int, default=LoadProfile.pages)
+        parser.add_argument("--project-skew", type=float, default=LoadProfile.project_skew)
+        parser.add_argument("--sub-issue-ratio", type=float, default=LoadProfile.sub_issue_ratio)
+        parser.add_argument("--max-depth", type=int, default=LoadProfile.max_depth)
+        parser.add_argument("--fanout-alpha", type=float, default=LoadProfile.fanout_alpha)
+        parser.add_argument("--batch-size", type=int, default=LoadProfile.batch_size)
+
+    def handle(self, *args, **options):
+        slug = options["slug"]
+        if Workspace.objects.filter(slug=slug).exists():
+            raise CommandError(f"Workspace {slug} already exists")
+
+        owner = User.objects.filter(email=options["email"]).first()
+        if owner is None:
+            owner = User(email=options["email"], username=options["email"])
+            owner.set_unusable_password()
+            owner.save()
+
+        profile = LoadProfile(
+            projects=options["projects"],
+            issues=options["issues"],
+            members=options["members"],
+            labels=options["labels"],
+            cycles=options["cycles"],
+            modules=options["modules"],
+            pages=options["pages"],
+            project_skew=options["project_skew"],
+            sub_issue_ratio=options["sub_issue_ratio"],
+            max_depth=options["max_depth"],
+            fanout_alpha=options["fanout_alpha"],
+            batch_size=options["batch_size"],
+        )
+
+        start = time.monotonic()
+        _, counts = LoadGenerator(options["seed"], profile).generate(slug, owner, stdout=self.stdout)
+
+        self.stdout.write(json.dumps(counts, indent=2))
+        self.stdout.write(self.style.SUCCESS(f"Workspace {slug} generated in {time.monotonic() - start:.1f}s"))
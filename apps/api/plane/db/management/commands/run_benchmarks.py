@@ -0,0 +1,66 @@
+# Python imports
+import json
+import os
+
+# Django imports
+from django.core.management import BaseCommand, CommandError
+
+# Module imports
+from plane.db.models import User, Workspace
+from plane.utils.benchmark import compare_results, load_baseline, run_benchmarks, save_baseline
+
+
+class Command(BaseCommand):
+    help = "Benchmark the hot endpoints on a workspace and compare them with a stored baseline"
+
+    def add_arguments(self, parser):
+        parser.add_argument("slug", type=str, help="Slug of the benchmarked workspace")
+        parser.add_argument("--email", required=True, help="Email of the member the requests are made as")
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument("--warmup", type=int, default=2)
+        parser.add_argument("--scenario", action="append", help="Only run this scenario, can be repeated")
+        parser.add_argument("--baseline", help="Baseline JSON file to compare the results with")
+        parser.add_argument("--save-baseline", action="store_true", help="Store the results as the baseline")
+        parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed p95 slowdown, 0.2 is 20%%")
+        parser.add_argument("--output", help="File to write the results to as JSON")
+
+    def handle(self, *args, **options):
+        workspace = Workspace.objects.filter(slug=options["slug"]).first()
+        if workspace is None:
+            raise CommandError(f"Workspace {options['slug']} does not exist")
+
+        user = User.objects.filter(email=options["email"]).first()
+        if user is None:
+            raise CommandError(f"User {options['email']} does not exist")
+
+        results = run_benchmarks(
+            workspace,
+            user,
+            iterations=options["iterations"],
+            warmup=options["warmup"],
+            only=options["scenario"],
+            stdout=self.stdout,
+        )
+
+        if options["output"]:
+            with open(options["output"], "w") as output_file:
+                json.dump(results, output_file, indent=2, sort_keys=True)
+
+        baseline_path = options["baseline"]
+        if not baseline_path:
+            return
+
+        if options["save_baseline"] or not os.path.exists(baseline_path):
+            save_baseline(
+                baseline_path, results, meta={"workspace": workspace.slug, "iterations": options["iterations"]}
+            )
+            self.stdout.write(self.style.SUCCESS(f"Baseline written to {baseline_path}"))
+            return
+
+        regressions = compare_results(results, load_baseline(baseline_path)["scenarios"], options["tolerance"])
+        if regressions:
+            for regression in regressions:
+                self.stdout.write(self.style.ERROR(regression))
+            raise CommandError(f"{len(regressions)} regressions against {baseline_path}")
+
+        self.stdout.write(self.style.SUCCESS(f"No regressions against {baseline_path}"))
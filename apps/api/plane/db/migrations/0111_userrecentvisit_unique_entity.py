@@ -0,0 +1,35 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0110_aichatconversation_aichatmessage_and_more'),
+    ]
+
+    operations = [
+        # Keep only the latest visit per entity before enforcing uniqueness
+        migrations.RunSQL(
+            sql="""
+            DELETE FROM user_recent_visits
+            WHERE id IN (
+                SELECT id FROM (
+                    SELECT
+                        id,
+                        ROW_NUMBER() OVER (
+                            PARTITION BY workspace_id, user_id, entity_name, entity_identifier
+                            ORDER BY visited_at DESC, created_at DESC
+                        ) AS position
+                    FROM user_recent_visits
+                    WHERE deleted_at IS NULL
+                ) ranked
+                WHERE ranked.position > 1
+            )
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddConstraint(
+            model_name='userrecentvisit',
+            constraint=models.UniqueConstraint(condition=models.Q(('deleted_at__isnull', True)), fields=('workspace', 'user', 'entity_name', 'entity_identifier'), name='user_recent_visit_unique_entity_when_deleted_at_null'),
+        ),
+    ]
@@ -0,0 +1,81 @@
+# Generated by Django 4.2.25 on 2026-10-19 10:19
+
+from django.conf import settings
+import django.contrib.postgres.fields
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0111_userrecentvisit_unique_entity'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ModuleStats',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('deleted_at', models.DateTimeField(blank=True, null=True, verbose_name='Deleted At')),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('total_issues', models.IntegerField(default=0)),
+                ('backlog_issues', models.IntegerField(default=0)),
+                ('unstarted_issues', models.IntegerField(default=0)),
+                ('started_issues', models.IntegerField(default=0)),
+                ('completed_issues', models.IntegerField(default=0)),
+                ('cancelled_issues', models.IntegerField(default=0)),
+                ('total_estimate_points', models.FloatField(default=0)),
+                ('backlog_estimate_points', models.FloatField(default=0)),
+                ('unstarted_estimate_points', models.FloatField(default=0)),
+                ('started_estimate_points', models.FloatField(default=0)),
+                ('completed_estimate_points', models.FloatField(default=0)),
+                ('cancelled_estimate_points', models.FloatField(default=0)),
+                ('member_ids', django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, size=None)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('module', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='stats', to='db.module')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_%(class)s', to='db.project')),
+                ('updated_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_updated_by', to=settings.AUTH_USER_MODEL, verbose_name='Last Modified By')),
+                ('workspace', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='workspace_%(class)s', to='db.workspace')),
+            ],
+            options={
+                'verbose_name': 'Module Stats',
+                'verbose_name_plural': 'Module Stats',
+                'db_table': 'module_stats',
+            },
+        ),
+        migrations.CreateModel(
+            name='CycleStats',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('deleted_at', models.DateTimeField(blank=True, null=True, verbose_name='Deleted At')),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('total_issues', models.IntegerField(default=0)),
+                ('backlog_issues', models.IntegerField(default=0)),
+                ('unstarted_issues', models.IntegerField(default=0)),
+                ('started_issues', models.IntegerField(default=0)),
+                ('completed_issues', models.IntegerField(default=0)),
+                ('cancelled_issues', models.IntegerField(default=0)),
+                ('total_estimate_points', models.FloatField(default=0)),
+                ('backlog_estimate_points', models.FloatField(default=0)),
+                ('unstarted_estimate_points', models.FloatField(default=0)),
+                ('started_estimate_points', models.FloatField(default=0)),
+                ('completed_estimate_points', models.FloatField(default=0)),
+                ('cancelled_estimate_points', models.FloatField(default=0)),
+                ('assignee_ids', django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, size=None)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('cycle', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='stats', to='db.cycle')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_%(class)s', to='db.project')),
+                ('updated_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_updated_by', to=settings.AUTH_USER_MODEL, verbose_name='Last Modified By')),
+                ('workspace', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='workspace_%(class)s', to='db.workspace')),
+            ],
+            options={
+                'verbose_name': 'Cycle Stats',
+                'verbose_name_plural': 'Cycle Stats',
+                'db_table': 'cycle_stats',
+            },
+        ),
+    ]
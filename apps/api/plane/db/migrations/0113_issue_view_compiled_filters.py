@@ -0,0 +1,36 @@
+# Generated by Django 4.2.25 on 2026-10-19 10:46
+
+from django.db import migrations, models
+
+from plane.utils.filters.compiler import get_filter_signature, normalize_rich_filters
+
+
+def compile_view_filters(apps, schema_editor):
+    IssueView = apps.get_model("db", "IssueView")
+    views = []
+    for view in IssueView.objects.exclude(rich_filters={}).only("id", "rich_filters").iterator(chunk_size=1000):
+        view.compiled_filters = normalize_rich_filters(view.rich_filters)
+        view.filter_signature = get_filter_signature(view.compiled_filters) if view.compiled_filters else ""
+        views.append(view)
+    IssueView.objects.bulk_update(views, ["compiled_filters", "filter_signature"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0112_module_cycle_stats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='issueview',
+            name='compiled_filters',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='issueview',
+            name='filter_signature',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+        migrations.RunPython(compile_view_filters, reverse_code=migrations.RunPython.noop),
+    ]
@@ -0,0 +1,104 @@
+# Generated by Django 4.2.25 on 2026-10-19 11:24
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0113_issue_view_compiled_filters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IssueCounter',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('deleted_at', models.DateTimeField(blank=True, null=True, verbose_name='Deleted At')),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('sub_issues_count', models.IntegerField(default=0)),
+                ('link_count', models.IntegerField(default=0)),
+                ('attachment_count', models.IntegerField(default=0)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('cycle', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='issue_counters', to='db.cycle')),
+                ('issue', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='counters', to='db.issue')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_%(class)s', to='db.project')),
+                ('updated_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_updated_by', to=settings.AUTH_USER_MODEL, verbose_name='Last Modified By')),
+                ('workspace', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='workspace_%(class)s', to='db.workspace')),
+            ],
+            options={
+                'verbose_name': 'Issue Counter',
+                'verbose_name_plural': 'Issue Counters',
+                'db_table': 'issue_counters',
+            },
+        ),
+        # Backfill the counters of the existing issues, the same counts as
+        # plane.utils.issue_counters.refresh_issue_counters
+        migrations.RunSQL(
+            sql="""
+            WITH sub_issues AS (
+                SELECT child.parent_id AS issue_id, COUNT(DISTINCT child.id) AS count
+                FROM issues child
+                JOIN states ON states.id = child.state_id
+                JOIN projects ON projects.id = child.project_id
+                WHERE child.parent_id IS NOT NULL
+                    AND child.deleted_at IS NULL
+                    AND child.archived_at IS NULL
+                    AND NOT child.is_draft
+                    AND NOT states.is_triage
+                    AND projects.archived_at IS NULL
+                    AND (
+                        NOT EXISTS (SELECT 1 FROM intake_issues WHERE intake_issues.issue_id = child.id)
+                        OR EXISTS (
+                            SELECT 1 FROM intake_issues
+                            WHERE intake_issues.issue_id = child.id AND intake_issues.status IN (-1, 1, 2)
+                        )
+                    )
+                GROUP BY child.parent_id
+            ),
+            links AS (
+                SELECT issue_id, COUNT(*) AS count
+                FROM issue_links
+                WHERE deleted_at IS NULL
+                GROUP BY issue_id
+            ),
+            attachments AS (
+                SELECT issue_id, COUNT(*) AS count
+                FROM file_assets
+                WHERE deleted_at IS NULL AND issue_id IS NOT NULL AND entity_type = 'ISSUE_ATTACHMENT'
+                GROUP BY issue_id
+            ),
+            cycles AS (
+                SELECT DISTINCT ON (issue_id) issue_id, cycle_id
+                FROM cycle_issues
+                WHERE deleted_at IS NULL
+                ORDER BY issue_id, created_at DESC
+            )
+            INSERT INTO issue_counters (
+                id, created_at, updated_at, workspace_id, project_id, issue_id,
+                sub_issues_count, link_count, attachment_count, cycle_id
+            )
+            SELECT
+                gen_random_uuid(), NOW(), NOW(), issues.workspace_id, issues.project_id, issues.id,
+                COALESCE(sub_issues.count, 0), COALESCE(links.count, 0), COALESCE(attachments.count, 0),
+                cycles.cycle_id
+            FROM issues
+            LEFT JOIN sub_issues ON sub_issues.issue_id = issues.id
+            LEFT JOIN links ON links.issue_id = issues.id
+            LEFT JOIN attachments ON attachments.issue_id = issues.id
+            LEFT JOIN cycles ON cycles.issue_id = issues.id
+            WHERE issues.deleted_at IS NULL
+                AND (
+                    sub_issues.issue_id IS NOT NULL
+                    OR links.issue_id IS NOT NULL
+                    OR attachments.issue_id IS NOT NULL
+                    OR cycles.issue_id IS NOT NULL
+                )
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
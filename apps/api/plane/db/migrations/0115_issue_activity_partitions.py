@@ -0,0 +1,34 @@
+# Generated by Django 4.2.25 on 2026-10-19 11:33
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+from plane.utils.partitions import partition_table
+
+
+def create_activity_partitions(apps, schema_editor):
+    partition_table("issue_activities", using=schema_editor.connection.alias)
+
+
+class Migration(migrations.Migration):
+
+    # The bound of the existing rows is validated outside of the transaction
+    # swapping the tables, so that it does not block writes
+    atomic = False
+
+    dependencies = [
+        ('db', '0114_issue_counters'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='issueversion',
+            name='activity',
+            field=models.ForeignKey(db_constraint=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='versions', to='db.issueactivity'),
+        ),
+        # Partition issue_activities by month of created_at. The existing table
+        # is attached as is as the partition of everything before next month
+        # instead of copying its rows, the archive task empties it over time.
+        # The migration is irreversible, the archived rows would not come back
+        migrations.RunPython(create_activity_partitions),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.25 on 2026-10-19 11:41
+
+from django.db import migrations
+
+from plane.utils.partitions import partition_table
+
+PARTITIONED_TABLES = [
+    "api_activity_logs",
+    "email_notification_logs",
+    "webhook_logs",
+    "page_versions",
+    "issue_description_versions",
+]
+
+
+def create_log_partitions(apps, schema_editor):
+    for table in PARTITIONED_TABLES:
+        partition_table(table, using=schema_editor.connection.alias)
+
+
+class Migration(migrations.Migration):
+
+    # The bound of the existing rows is validated outside of the transaction
+    # swapping the tables, so that it does not block writes
+    atomic = False
+
+    dependencies = [
+        ('db', '0115_issue_activity_partitions'),
+    ]
+
+    operations = [
+        # Partition the log tables by month of created_at, the existing rows
+        # stay in the legacy partitions, purged row by row until they expire.
+        # The migration is irreversible, the dropped partitions are gone
+        migrations.RunPython(create_log_partitions),
+    ]
@@ -90,3 +90,5 @@ from .sticky import Sticky
 from .description import Description, DescriptionVersion
 
 from .ai_chat import AIChatConversation, AIChatMessage
+
+from .stats import CycleStats, IssueCounter, ModuleStats
@@ -5,6 +5,8 @@ from uuid import uuid4
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 # Module import
 from .base import BaseModel
@@ -93,3 +95,13 @@ class FileAsset(BaseModel):
             return f"/api/assets/v2/workspaces/{self.workspace.slug}/projects/{self.project_id}/{self.id}/"
 
         return None
+
+
+@receiver(post_save, sender=FileAsset)
+@receiver(post_delete, sender=FileAsset)
+def invalidate_asset_signed_urls(sender, instance, **kwargs):
+    # Module imports
+    from plane.utils.signed_url import invalidate_signed_urls
+
+    # A deleted or replaced asset must not be served from a cached URL
+    invalidate_signed_urls(instance.id)
@@ -181,6 +181,26 @@ class Issue(ProjectBaseModel):
         db_table = "issues"
         ordering = ("-created_at",)
 
+    # Fields the precomputed module and cycle stats depend on
+    STATS_FIELDS = ("state_id", "estimate_point_id", "archived_at", "is_draft", "deleted_at")
+
+    # Fields the precomputed sub issue count of the parent depends on
+    COUNTER_FIELDS = ("parent_id", "state_id", "archived_at", "is_draft", "deleted_at")
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_stats_values = instance.get_stats_values()
+        instance._loaded_counter_values = instance.get_counter_values()
+        return instance
+
+    def get_stats_values(self):
+        # Read through __dict__ so deferred fields are not fetched
+        return tuple(self.__dict__.get(field) for field in self.STATS_FIELDS)
+
+    def get_counter_values(self):
+        return tuple(self.__dict__.get(field) for field in self.COUNTER_FIELDS)
+
     def save(self, *args, **kwargs):
         if self.state is None:
             try:
@@ -207,6 +227,13 @@ class Issue(ProjectBaseModel):
             except ImportError:
                 pass
 
+        # Strip the html tags using html parser, outside of the sequence lock
+        self.description_stripped = (
+            None
+            if (self.description_html == "" or self.description_html is None)
+            else strip_tags(self.description_html)
+        )
+
         if self._state.adding:
             with transaction.atomic():
                 # Create a lock for this specific project using an advisory lock
@@ -223,12 +250,6 @@ class Issue(ProjectBaseModel):
                         largest=models.Max("sequence")
                     )["largest"]
                     self.sequence_id = last_sequence + 1 if last_sequence else 1
-                    # Strip the html tags using html parser
-                    self.description_stripped = (
-                        None
-                        if (self.description_html == "" or self.description_html is None)
-                        else strip_tags(self.description_html)
-                    )
                     largest_sort_order = Issue.objects.filter(project=self.project, state=self.state).aggregate(
                         largest=models.Max("sort_order")
                     )["largest"]
@@ -243,12 +264,6 @@ class Issue(ProjectBaseModel):
                     with connection.cursor() as cursor:
                         cursor.execute("SELECT pg_advisory_unlock(%s)", [lock_key])
         else:
-            # Strip the html tags using html parser
-            self.description_stripped = (
-                None
-                if (self.description_html == "" or self.description_html is None)
-                else strip_tags(self.description_html)
-            )
             super(Issue, self).save(*args, **kwargs)
 
     def __str__(self):
@@ -723,11 +738,13 @@ class IssueVersion(ProjectBaseModel):
     last_saved_at = models.DateTimeField(default=timezone.now)
 
     issue = models.ForeignKey("db.Issue", on_delete=models.CASCADE, related_name="versions")
+    # issue_activities is partitioned and archived, so no constraint can point at it
     activity = models.ForeignKey(
         "db.IssueActivity",
         on_delete=models.SET_NULL,
         null=True,
         related_name="versions",
+        db_constraint=False,
     )
     owned_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
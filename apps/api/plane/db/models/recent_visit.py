@@ -30,6 +30,13 @@ class UserRecentVisit(WorkspaceBaseModel):
         verbose_name_plural = "User Recent Visits"
         db_table = "user_recent_visits"
         ordering = ("-created_at",)
+        constraints = [
+            models.UniqueConstraint(
+                fields=["workspace", "user", "entity_name", "entity_identifier"],
+                condition=models.Q(deleted_at__isnull=True),
+                name="user_recent_visit_unique_entity_when_deleted_at_null",
+            )
+        ]
 
     def __str__(self):
         return f"{self.entity_name} {self.user.email}"
@@ -2,19 +2,49 @@
 import string
 
 # Django imports
-from django.contrib.sessions.backends.db import SessionStore as DBSessionStore
-from django.contrib.sessions.base_session import AbstractBaseSession
+from django.conf import settings
+from django.contrib.sessions.backends.cached_db import SessionStore as CachedDBSessionStore
+from django.contrib.sessions.base_session import AbstractBaseSession, BaseSessionManager
+from django.core.cache import cache, caches
 from django.db import models
 from django.utils.crypto import get_random_string
 
 VALID_KEY_CHARS = string.ascii_lowercase + string.digits
 
+SESSION_USER_CACHE_PREFIX = "session_user:"
+
+
+def get_session_user_cache_key(user_id):
+    return f"{SESSION_USER_CACHE_PREFIX}{user_id}"
+
+
+def invalidate_session_user(user_id):
+    """Drop the user cached for the authentication of its sessions"""
+    cache.delete(get_session_user_cache_key(user_id))
+
+
+class SessionQuerySet(models.QuerySet):
+    def delete(self):
+        # The cached copies would keep deleted sessions signed in until they expire
+        cache_keys = [
+            SessionStore.cache_key_prefix + session_key for session_key in self.values_list("session_key", flat=True)
+        ]
+        if cache_keys:
+            caches[settings.SESSION_CACHE_ALIAS].delete_many(cache_keys)
+        return super().delete()
+
+
+class SessionManager(BaseSessionManager.from_queryset(SessionQuerySet)):
+    pass
+
 
 class Session(AbstractBaseSession):
     device_info = models.JSONField(null=True, blank=True, default=None)
     session_key = models.CharField(max_length=128, primary_key=True)
     user_id = models.CharField(null=True, max_length=50, db_index=True)
 
+    objects = SessionManager()
+
     @classmethod
     def get_session_store_class(cls):
         return SessionStore
@@ -23,7 +53,15 @@ class Session(AbstractBaseSession):
         db_table = "sessions"
 
 
-class SessionStore(DBSessionStore):
+class SessionStore(CachedDBSessionStore):
+    """
+    Sessions read from the cache first and from the database on a miss. Saves
+    write through to both, so the database stays the source of truth for the
+    user_id and device_info columns.
+    """
+
+    cache_key_prefix = "plane.sessions."
+
     @classmethod
     def get_model_class(cls):
         return Session
@@ -0,0 +1,84 @@
+# Django imports
+from django.contrib.postgres.fields import ArrayField
+from django.db import models
+
+# Module imports
+from .project import ProjectBaseModel
+
+# State groups with a dedicated issue count and estimate total
+STATS_STATE_GROUPS = ("backlog", "unstarted", "started", "completed", "cancelled")
+
+
+class IssueStatsModel(ProjectBaseModel):
+    """Precomputed issue counts and estimate totals of a module or cycle"""
+
+    total_issues = models.IntegerField(default=0)
+    backlog_issues = models.IntegerField(default=0)
+    unstarted_issues = models.IntegerField(default=0)
+    started_issues = models.IntegerField(default=0)
+    completed_issues = models.IntegerField(default=0)
+    cancelled_issues = models.IntegerField(default=0)
+    total_estimate_points = models.FloatField(default=0)
+    backlog_estimate_points = models.FloatField(default=0)
+    unstarted_estimate_points = models.FloatField(default=0)
+    started_estimate_points = models.FloatField(default=0)
+    completed_estimate_points = models.FloatField(default=0)
+    cancelled_estimate_points = models.FloatField(default=0)
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def stats_fields(cls):
+        return [
+            "total_issues",
+            "total_estimate_points",
+            *[f"{group}_issues" for group in STATS_STATE_GROUPS],
+            *[f"{group}_estimate_points" for group in STATS_STATE_GROUPS],
+        ]
+
+
+class ModuleStats(IssueStatsModel):
+    module = models.OneToOneField("db.Module", on_delete=models.CASCADE, related_name="stats")
+    member_ids = ArrayField(models.UUIDField(), default=list)
+
+    class Meta:
+        verbose_name = "Module Stats"
+        verbose_name_plural = "Module Stats"
+        db_table = "module_stats"
+
+    def __str__(self):
+        return f"{self.module_id} <{self.total_issues}>"
+
+
+class CycleStats(IssueStatsModel):
+    cycle = models.OneToOneField("db.Cycle", on_delete=models.CASCADE, related_name="stats")
+    assignee_ids = ArrayField(models.UUIDField(), default=list)
+
+    class Meta:
+        verbose_name = "Cycle Stats"
+        verbose_name_plural = "Cycle Stats"
+        db_table = "cycle_stats"
+
+    def __str__(self):
+        return f"{self.cycle_id} <{self.total_issues}>"
+
+
+class IssueCounter(ProjectBaseModel):
+    """Precomputed counts and current cycle of an issue, read by the issue lists"""
+
+    issue = models.OneToOneField("db.Issue", on_delete=models.CASCADE, related_name="counters")
+    sub_issues_count = models.IntegerField(default=0)
+    link_count = models.IntegerField(default=0)
+    attachment_count = models.IntegerField(default=0)
+    cycle = models.ForeignKey("db.Cycle", on_delete=models.SET_NULL, null=True, related_name="issue_counters")
+
+    class Meta:
+        verbose_name = "Issue Counter"
+        verbose_name_plural = "Issue Counters"
+        db_table = "issue_counters"
+
+    COUNTER_FIELDS = ("sub_issues_count", "link_count", "attachment_count")
+
+    def __str__(self):
+        return f"{self.issue_id} <{self.sub_issues_count}, {self.link_count}, {self.attachment_count}>"
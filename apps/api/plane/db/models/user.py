@@ -7,8 +7,8 @@ import pytz
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin, UserManager
 
 # Django imports
-from django.db import models
-from django.db.models.signals import post_save
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.utils import timezone
 
@@ -266,3 +266,15 @@ def create_user_notification(sender, instance, created, **kwargs):
             mention=True,
             issue_completed=True,
         )
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_session_user_cache(sender, instance, **kwargs):
+    # Module imports
+    from plane.db.models.session import invalidate_session_user
+
+    # Drop it again on commit, a request may cache the old row before then
+    user_id = instance.id
+    invalidate_session_user(user_id)
+    transaction.on_commit(lambda: invalidate_session_user(user_id))
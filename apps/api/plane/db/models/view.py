@@ -59,6 +59,9 @@ class IssueView(WorkspaceBaseModel):
     display_filters = models.JSONField(default=get_default_display_filters)
     display_properties = models.JSONField(default=get_default_display_properties)
     rich_filters = models.JSONField(default=dict)
+    # Canonical tree of the rich filters and its signature, see plane.utils.filters.compiler
+    compiled_filters = models.JSONField(null=True, blank=True)
+    filter_signature = models.CharField(max_length=64, blank=True, default="")
     access = models.PositiveSmallIntegerField(default=1, choices=((0, "Private"), (1, "Public")))
     sort_order = models.FloatField(default=65535)
     logo_props = models.JSONField(default=dict)
@@ -74,6 +77,7 @@ class IssueView(WorkspaceBaseModel):
     def save(self, *args, **kwargs):
         query_params = self.filters
         self.query = issue_filters(query_params, "POST") if query_params else {}
+        self.compile_filters()
 
         if self._state.adding:
             if self.project:
@@ -89,6 +93,18 @@ class IssueView(WorkspaceBaseModel):
 
         super(IssueView, self).save(*args, **kwargs)
 
+    def compile_filters(self):
+        """Store the canonical tree of the view filters so listings skip normalizing them"""
+        from plane.utils.filters.compiler import get_filter_signature, normalize_rich_filters
+        from plane.utils.filters.converters import LegacyToRichFiltersConverter
+
+        rich_filters = self.rich_filters
+        if not rich_filters and self.filters:
+            rich_filters = LegacyToRichFiltersConverter().convert(self.filters)
+
+        self.compiled_filters = normalize_rich_filters(rich_filters)
+        self.filter_signature = get_filter_signature(self.compiled_filters) if self.compiled_filters else ""
+
     def __str__(self):
         """Return name of the View"""
         return f"{self.name} <{self.project.name}>"
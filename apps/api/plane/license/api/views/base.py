@@ -1,6 +1,5 @@
 # Python imports
 import zoneinfo
-from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.db import IntegrityError
 
@@ -94,10 +93,6 @@ class BaseAPIView(TimezoneMixin, APIView, BasePaginator):
         try:
             response = super().dispatch(request, *args, **kwargs)
 
-            if settings.DEBUG:
-                from django.db import connection
-
-                print(f"{request.method} - {request.get_full_path()} of Queries: {len(connection.queries)}")
             return response
 
         except Exception as exc:
@@ -13,7 +13,7 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         from plane.license.utils.encryption import encrypt_data
-        from plane.license.utils.instance_value import get_configuration_value
+        from plane.license.utils.instance_value import get_configuration_value, invalidate_configuration_cache
 
         mandatory_keys = ["SECRET_KEY"]
 
@@ -203,6 +203,9 @@ class Command(BaseCommand):
             else:
                 self.stdout.write(self.style.WARNING(f"{obj.key} configuration already exists"))
 
+        # Later lookups must see the rows created above
+        invalidate_configuration_cache()
+
         keys = ["IS_GOOGLE_ENABLED", "IS_GITHUB_ENABLED", "IS_GITLAB_ENABLED"]
         if not InstanceConfiguration.objects.filter(key__in=keys).exists():
             for key in keys:
@@ -285,3 +288,5 @@ class Command(BaseCommand):
         else:
             for key in keys:
                 self.stdout.write(self.style.WARNING(f"{key} configuration already exists"))
+
+        invalidate_configuration_cache()
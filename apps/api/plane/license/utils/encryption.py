@@ -1,13 +1,16 @@
 import base64
 import hashlib
+from functools import lru_cache
 from django.conf import settings
 from cryptography.fernet import Fernet
 
 from plane.utils.exception_logger import log_exception
 
 
+@lru_cache(maxsize=4)
 def derive_key(secret_key):
-    # Use a key derivation function to get a suitable encryption key
+    # Use a key derivation function to get a suitable encryption key, the
+    # 100k PBKDF2 rounds are only paid once per secret key
     dk = hashlib.pbkdf2_hmac("sha256", secret_key.encode(), b"salt", 100000)
     return base64.urlsafe_b64encode(dk)
 
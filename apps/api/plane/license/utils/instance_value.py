@@ -1,38 +1,104 @@
 # Python imports
 import os
+import threading
+import time
 
 # Django imports
 from django.conf import settings
+from django.core.cache import cache
 
 # Module imports
 from plane.license.models import InstanceConfiguration
 from plane.license.utils.encryption import decrypt_data
+from plane.utils.exception_logger import log_exception
+
+CONFIGURATION_VERSION_KEY = "instance:configuration:version"
+CONFIGURATION_SNAPSHOT_KEY = "instance:configuration:snapshot"
+
+# The shared snapshot holds the stored (still encrypted) values
+CONFIGURATION_SNAPSHOT_TTL = 60 * 60 * 24
+
+_local_lock = threading.Lock()
+_local_configuration = {"version": None, "values": None, "expires_at": 0.0}
+
+
+def get_configuration_version():
+    return cache.get(CONFIGURATION_VERSION_KEY, 0)
+
+
+def load_configuration_snapshot(version):
+    """Return the stored configuration of the given version, reading the database when the snapshot is outdated"""
+    snapshot = cache.get(CONFIGURATION_SNAPSHOT_KEY)
+    if snapshot is not None and snapshot["version"] == version:
+        return snapshot["values"]
+
+    values = {
+        item["key"]: (item["value"], item["is_encrypted"])
+        for item in InstanceConfiguration.objects.values("key", "value", "is_encrypted")
+    }
+    cache.set(CONFIGURATION_SNAPSHOT_KEY, {"version": version, "values": values}, CONFIGURATION_SNAPSHOT_TTL)
+    return values
+
+
+def decrypt_configuration(values):
+    return {key: decrypt_data(value) if is_encrypted else value for key, (value, is_encrypted) in values.items()}
+
+
+def get_configuration_values():
+    """
+    Decrypted instance configuration as a dictionary.
+
+    Each process keeps a decrypted copy for INSTANCE_CONFIGURATION_CACHE_TTL
+    seconds. After that the shared version is checked, and the copy is only
+    rebuilt when an admin update bumped it.
+    """
+    now = time.monotonic()
+    if _local_configuration["values"] is not None and now < _local_configuration["expires_at"]:
+        return _local_configuration["values"]
+
+    with _local_lock:
+        if _local_configuration["values"] is not None and now < _local_configuration["expires_at"]:
+            return _local_configuration["values"]
+
+        try:
+            version = get_configuration_version()
+            if _local_configuration["values"] is None or _local_configuration["version"] != version:
+                _local_configuration["values"] = decrypt_configuration(load_configuration_snapshot(version))
+                _local_configuration["version"] = version
+        except Exception as e:
+            # The cache is unavailable, read the database without keeping a copy
+            log_exception(e, warning=True)
+            return decrypt_configuration(
+                {
+                    item["key"]: (item["value"], item["is_encrypted"])
+                    for item in InstanceConfiguration.objects.values("key", "value", "is_encrypted")
+                }
+            )
+
+        _local_configuration["expires_at"] = now + settings.INSTANCE_CONFIGURATION_CACHE_TTL
+        return _local_configuration["values"]
+
+
+def invalidate_configuration_cache():
+    """Make every process reload the configuration, call after updating InstanceConfiguration"""
+    try:
+        cache.incr(CONFIGURATION_VERSION_KEY)
+    except ValueError:
+        # The key does not exist yet
+        cache.set(CONFIGURATION_VERSION_KEY, 1, timeout=None)
+    cache.delete(CONFIGURATION_SNAPSHOT_KEY)
+    with _local_lock:
+        _local_configuration["expires_at"] = 0.0
 
 
 # Helper function to return value from the passed key
 def get_configuration_value(keys):
-    environment_list = []
     if settings.SKIP_ENV_VAR:
-        # Get the configurations
-        instance_configuration = InstanceConfiguration.objects.values("key", "value", "is_encrypted")
-
-        for key in keys:
-            for item in instance_configuration:
-                if key.get("key") == item.get("key"):
-                    if item.get("is_encrypted", False):
-                        environment_list.append(decrypt_data(item.get("value")))
-                    else:
-                        environment_list.append(item.get("value"))
-
-                    break
-            else:
-                environment_list.append(key.get("default"))
-    else:
-        # Get the configuration from os
-        for key in keys:
-            environment_list.append(os.environ.get(key.get("key"), key.get("default")))
-
-    return tuple(environment_list)
+        configuration = get_configuration_values()
+        return tuple(configuration.get(key.get("key"), key.get("default")) for key in keys)
+
+    # Get the configuration from os
+    return tuple(os.environ.get(key.get("key"), key.get("default")) for key in keys)
 
 
 def get_email_configuration():
@@ -5,8 +5,10 @@ read replicas or the primary database based on HTTP method and view configuratio
 """
 
 import logging
+import time
 from typing import Callable, Optional
 
+from django.conf import settings
 from django.http import HttpRequest, HttpResponse
 
 from plane.utils.core import (
@@ -26,6 +28,9 @@ class ReadReplicaRoutingMiddleware:
         - View has use_read_replica=False ➜ Primary database
         - View has use_read_replica=True ➜ Read replica
         - View has no use_read_replica attribute ➜ Primary database (safe default)
+        - Client wrote within READ_YOUR_WRITES_WINDOW seconds ➜ Primary database
+    Successful writes set a short-lived cookie pinning the client to the
+    primary, so users always read their own writes even when replicas lag.
     The middleware supports both Django CBVs and DRF APIViews/ViewSets.
     Context is properly isolated per request to prevent data leakage.
     """
@@ -33,6 +38,9 @@ class ReadReplicaRoutingMiddleware:
     # HTTP methods that are considered read-only by default
     READ_ONLY_METHODS = {"GET", "HEAD", "OPTIONS"}
 
+    # Cookie holding the time until which reads stay on the primary
+    PRIMARY_PIN_COOKIE = "plane_primary_pin"
+
     def __init__(self, get_response):
         """
         Initialize the middleware with the next middleware/view in the chain.
@@ -57,6 +65,8 @@ class ReadReplicaRoutingMiddleware:
         try:
             # Process the request through the middleware chain
             response = self.get_response(request)
+            if request.method not in self.READ_ONLY_METHODS and response.status_code < 400:
+                self._pin_to_primary(response)
             return response
         finally:
             # Always clean up context, even if an exception occurs
@@ -82,7 +92,7 @@ class ReadReplicaRoutingMiddleware:
         """
         # Only process read operations (write operations already handled in __call__)
         if request.method in self.READ_ONLY_METHODS:
-            use_replica = self._should_use_read_replica(view_func)
+            use_replica = self._should_use_read_replica(view_func) and not self._is_pinned_to_primary(request)
             set_use_read_replica(use_replica)
 
             db_type = "read replica" if use_replica else "primary database"
@@ -91,6 +101,43 @@ class ReadReplicaRoutingMiddleware:
         # Return None to continue normal request processing
         return None
 
+    def _get_pin_window(self) -> int:
+        return int(getattr(settings, "READ_YOUR_WRITES_WINDOW", 10))
+
+    def _pin_to_primary(self, response: HttpResponse) -> None:
+        """
+        Keep the client's reads on the primary for the read-your-writes window.
+        Args:
+            response: The response of a successful write
+        """
+        window = self._get_pin_window()
+        if window <= 0:
+            return
+        response.set_cookie(
+            self.PRIMARY_PIN_COOKIE,
+            str(int(time.time()) + window),
+            max_age=window,
+            httponly=True,
+            samesite="Lax",
+            secure=settings.SESSION_COOKIE_SECURE,
+        )
+
+    def _is_pinned_to_primary(self, request: HttpRequest) -> bool:
+        """
+        Check whether the client wrote recently and must read from the primary.
+        Args:
+            request: The HTTP request object
+        Returns:
+            bool: True while the read-your-writes window is open
+        """
+        pinned_until = request.COOKIES.get(self.PRIMARY_PIN_COOKIE)
+        if not pinned_until:
+            return False
+        try:
+            return int(pinned_until) > time.time()
+        except ValueError:
+            return False
+
     def _should_use_read_replica(self, view_func: Callable) -> bool:
         """
         Determine if the view should use read replica based on its configuration.
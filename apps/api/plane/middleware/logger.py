@@ -5,6 +5,7 @@ import logging
 import time
 
 # Django imports
+from django.conf import settings
 from django.http import HttpRequest
 
 # Third party imports
@@ -13,6 +14,12 @@ from rest_framework.request import Request
 # Module imports
 from plane.utils.ip_address import get_client_ip
 from plane.db.models import APIActivityLog
+from plane.utils.query_instrumentation import (
+    QueryInstrumentation,
+    explain_slow_queries,
+    instrument_queries,
+    should_explain,
+)
 
 api_logger = logging.getLogger("plane.api.request")
 
@@ -31,41 +38,56 @@ class RequestLoggerMiddleware:
         return True
 
     def __call__(self, request):
+        # Check if logging is required
+        log_true = self._should_log_route(request=request)
+
+        # If logging is not required, return the response
+        if not log_true:
+            return self.get_response(request)
+
         # get the start time
         start_time = time.time()
 
-        # Get the response
-        response = self.get_response(request)
+        # Get the response, recording the queries it runs
+        instrumentation = None
+        if settings.QUERY_INSTRUMENTATION_ENABLED:
+            instrumentation = QueryInstrumentation()
+            with instrument_queries(instrumentation):
+                response = self.get_response(request)
+        else:
+            response = self.get_response(request)
 
         # calculate the duration
         duration = time.time() - start_time
 
-        # Check if logging is required
-        log_true = self._should_log_route(request=request)
-
-        # If logging is not required, return the response
-        if not log_true:
-            return response
-
         user_id = (
             request.user.id if getattr(request, "user") and getattr(request.user, "is_authenticated", False) else None
         )
 
         user_agent = request.META.get("HTTP_USER_AGENT", "")
 
+        resolver_match = getattr(request, "resolver_match", None)
+
+        extra = {
+            "path": request.path,
+            "route": resolver_match.route if resolver_match else None,
+            "method": request.method,
+            "status_code": response.status_code,
+            "duration_ms": int(duration * 1000),
+            "remote_addr": get_client_ip(request),
+            "user_agent": user_agent,
+            "user_id": user_id,
+        }
+        if instrumentation is not None:
+            extra.update(instrumentation.get_log_fields())
+            # Sampled requests explain their slow statements after the response is built
+            if should_explain():
+                query_plans = explain_slow_queries(instrumentation)
+                if query_plans:
+                    extra["query_plans"] = query_plans
+
         # Log the request information
-        api_logger.info(
-            f"{request.method} {request.get_full_path()} {response.status_code}",
-            extra={
-                "path": request.path,
-                "method": request.method,
-                "status_code": response.status_code,
-                "duration_ms": int(duration * 1000),
-                "remote_addr": get_client_ip(request),
-                "user_agent": user_agent,
-                "user_id": user_id,
-            },
-        )
+        api_logger.info(f"{request.method} {request.get_full_path()} {response.status_code}", extra=extra)
 
         # return the response
         return response
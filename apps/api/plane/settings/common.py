@@ -58,7 +58,7 @@ MIDDLEWARE = [
     "plane.authentication.middleware.session.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "plane.authentication.middleware.session.AuthenticationMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "crum.CurrentRequestUserMiddleware",
     "django.middleware.gzip.GZipMiddleware",
@@ -157,11 +157,59 @@ if os.environ.get("ENABLE_READ_REPLICA", "0") == "1":
             "PORT": os.environ.get("POSTGRES_READ_REPLICA_PORT", "5432"),
         }
 
+    # Additional replicas, as a comma separated list of database URLs
+    for index, replica_url in enumerate(
+        [url.strip() for url in os.environ.get("DATABASE_READ_REPLICA_URLS", "").split(",") if url.strip()],
+        start=2,
+    ):
+        DATABASES[f"replica_{index}"] = dj_database_url.parse(replica_url)
+
+    # Relative share of reads per replica, e.g. "replica=1,replica_2=2"
+    READ_REPLICA_WEIGHTS = {
+        alias.strip(): float(weight)
+        for alias, weight in (
+            item.split("=", 1) for item in os.environ.get("READ_REPLICA_WEIGHTS", "").split(",") if "=" in item
+        )
+    }
+    # Replicas lagging more than this are ejected until they catch up
+    READ_REPLICA_MAX_LAG_SECONDS = float(os.environ.get("READ_REPLICA_MAX_LAG_SECONDS", 5))
+    READ_REPLICA_MAX_LAG_BYTES = int(os.environ.get("READ_REPLICA_MAX_LAG_BYTES", 64 * 1024 * 1024))
+    READ_REPLICA_HEALTH_CHECK_INTERVAL = float(os.environ.get("READ_REPLICA_HEALTH_CHECK_INTERVAL", 5))
+    # Seconds a client reads from the primary after a write, keep above the max lag
+    READ_YOUR_WRITES_WINDOW = int(os.environ.get("READ_YOUR_WRITES_WINDOW", 10))
+
     # Database Routers
     DATABASE_ROUTERS = ["plane.utils.core.dbrouters.ReadReplicaRouter"]
     # Add middleware at the end for read replica routing
     MIDDLEWARE.append("plane.middleware.db_routing.ReadReplicaRoutingMiddleware")
 
+# Database connections
+# Seconds a connection is kept open for the next requests of a process. The
+# ASGI server runs every request on its own thread, so the web processes keep
+# 0 and rely on the pool instead, while the Celery workers reuse connections.
+DATABASE_CONN_MAX_AGE = int(os.environ.get("DATABASE_CONN_MAX_AGE", 0))
+WORKER_DATABASE_CONN_MAX_AGE = int(os.environ.get("WORKER_DATABASE_CONN_MAX_AGE", 300))
+DATABASE_CONN_HEALTH_CHECKS = os.environ.get("DATABASE_CONN_HEALTH_CHECKS", "1") == "1"
+# Per process psycopg pool, connections then return to the pool after each request or task
+DATABASE_POOL_ENABLED = os.environ.get("DATABASE_POOL_ENABLED", "0") == "1"
+DATABASE_POOL_MIN_SIZE = int(os.environ.get("DATABASE_POOL_MIN_SIZE", 2))
+DATABASE_POOL_MAX_SIZE = int(os.environ.get("DATABASE_POOL_MAX_SIZE", 10))
+DATABASE_POOL_TIMEOUT = float(os.environ.get("DATABASE_POOL_TIMEOUT", 10))
+DATABASE_POOL_STATS_INTERVAL = int(os.environ.get("DATABASE_POOL_STATS_INTERVAL", 60))
+
+for database in DATABASES.values():
+    database["CONN_HEALTH_CHECKS"] = DATABASE_CONN_HEALTH_CHECKS
+    if DATABASE_POOL_ENABLED:
+        database["ENGINE"] = "plane.db.backends.postgresql"
+        database["CONN_MAX_AGE"] = 0
+        database.setdefault("OPTIONS", {})["pool"] = {
+            "min_size": DATABASE_POOL_MIN_SIZE,
+            "max_size": DATABASE_POOL_MAX_SIZE,
+            "timeout": DATABASE_POOL_TIMEOUT,
+        }
+    else:
+        database["CONN_MAX_AGE"] = DATABASE_CONN_MAX_AGE
+
 
 # Redis Config
 REDIS_URL = os.environ.get("REDIS_URL")
@@ -241,6 +289,12 @@ if AWS_S3_ENDPOINT_URL and USE_MINIO:
     AWS_S3_CUSTOM_DOMAIN = f"{parsed_url.netloc}/{AWS_STORAGE_BUCKET_NAME}"
     AWS_S3_URL_PROTOCOL = f"{parsed_url.scheme}:"
 
+# Presigned asset URLs, cached for a fraction of their expiry
+SIGNED_URL_EXPIRATION = int(os.environ.get("SIGNED_URL_EXPIRATION", 3600))
+SIGNED_URL_CACHE_FRACTION = float(os.environ.get("SIGNED_URL_CACHE_FRACTION", 0.5))
+# Most static assets resolved by one batch request
+SIGNED_URL_BATCH_SIZE = int(os.environ.get("SIGNED_URL_BATCH_SIZE", 200))
+
 # RabbitMQ connection settings
 RABBITMQ_HOST = os.environ.get("RABBITMQ_HOST", "localhost")
 RABBITMQ_PORT = os.environ.get("RABBITMQ_PORT", "5672")
@@ -268,6 +322,10 @@ CELERY_IMPORTS = (
     "plane.bgtasks.file_asset_task",
     "plane.bgtasks.email_notification_task",
     "plane.bgtasks.cleanup_task",
+    "plane.bgtasks.recent_visited_task",
+    "plane.bgtasks.notification_task",
+    "plane.bgtasks.issue_stats_task",
+    "plane.bgtasks.partition_task",
     "plane.license.bgtasks.tracer",
     # management tasks
     "plane.bgtasks.dummy_data_task",
@@ -294,6 +352,21 @@ POSTHOG_HOST = os.environ.get("POSTHOG_HOST", False)
 # Skip environment variable configuration
 SKIP_ENV_VAR = os.environ.get("SKIP_ENV_VAR", "1") == "1"
 
+# Seconds each process reuses its copy of the instance configuration
+INSTANCE_CONFIGURATION_CACHE_TTL = int(os.environ.get("INSTANCE_CONFIGURATION_CACHE_TTL", 30))
+
+# Query instrumentation added to the request log
+QUERY_INSTRUMENTATION_ENABLED = os.environ.get("QUERY_INSTRUMENTATION_ENABLED", "1") == "1"
+# Statements slower than this are reported as slow
+QUERY_SLOW_THRESHOLD_MS = float(os.environ.get("QUERY_SLOW_THRESHOLD_MS", 200))
+# Statement shapes run this many times in a request are reported as N+1 signatures
+QUERY_REPEAT_THRESHOLD = int(os.environ.get("QUERY_REPEAT_THRESHOLD", 10))
+QUERY_SLOWEST_LIMIT = int(os.environ.get("QUERY_SLOWEST_LIMIT", 5))
+# Share of requests whose slow SELECT statements are run with EXPLAIN (ANALYZE, BUFFERS), off by default
+QUERY_EXPLAIN_SAMPLE_RATE = float(os.environ.get("QUERY_EXPLAIN_SAMPLE_RATE", 0))
+QUERY_EXPLAIN_MAX_PER_REQUEST = int(os.environ.get("QUERY_EXPLAIN_MAX_PER_REQUEST", 2))
+QUERY_EXPLAIN_TIMEOUT_MS = int(os.environ.get("QUERY_EXPLAIN_TIMEOUT_MS", 5000))
+
 DATA_UPLOAD_MAX_MEMORY_SIZE = int(os.environ.get("FILE_SIZE_LIMIT", 5242880))
 
 # Cookie Settings
@@ -304,6 +377,9 @@ SESSION_COOKIE_AGE = int(os.environ.get("SESSION_COOKIE_AGE", 604800))
 SESSION_COOKIE_NAME = os.environ.get("SESSION_COOKIE_NAME", "session-id")
 SESSION_COOKIE_DOMAIN = os.environ.get("COOKIE_DOMAIN", None)
 SESSION_SAVE_EVERY_REQUEST = os.environ.get("SESSION_SAVE_EVERY_REQUEST", "0") == "1"
+# Sessions are cached in front of the sessions table, and the user is cached with them
+SESSION_CACHE_ALIAS = "default"
+SESSION_USER_CACHE_TTL = int(os.environ.get("SESSION_USER_CACHE_TTL", 300))
 
 # Admin Cookie
 ADMIN_SESSION_COOKIE_NAME = "admin-session-id"
@@ -349,6 +425,9 @@ WEB_URL = os.environ.get("WEB_URL")
 
 HARD_DELETE_AFTER_DAYS = int(os.environ.get("HARD_DELETE_AFTER_DAYS", 60))
 
+# Issue activities older than this move to the Mongo archive
+ISSUE_ACTIVITY_ARCHIVE_AFTER_DAYS = int(os.environ.get("ISSUE_ACTIVITY_ARCHIVE_AFTER_DAYS", 180))
+
 # Instance Changelog URL
 INSTANCE_CHANGELOG_URL = os.environ.get("INSTANCE_CHANGELOG_URL", "")
 
@@ -1,9 +1,13 @@
 # Python imports
 import os
 import uuid
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 # Third party imports
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from urllib.parse import quote
 
@@ -12,6 +16,83 @@ from plane.utils.exception_logger import log_exception
 from storages.backends.s3boto3 import S3Boto3Storage
 
 
+# Maximum number of distinct client configurations kept per process
+S3_CLIENT_REGISTRY_SIZE = 32
+
+# Connections kept alive per client
+S3_MAX_POOL_CONNECTIONS = int(os.environ.get("S3_MAX_POOL_CONNECTIONS", 10))
+
+# Worker threads used by the batch operations
+S3_BATCH_MAX_WORKERS = int(os.environ.get("S3_BATCH_MAX_WORKERS", 8))
+
+
+class S3ClientRegistry:
+    """
+    Process level registry of boto3 S3 clients keyed by their configuration.
+
+    Building a client is expensive and every client owns its own connection
+    pool, so clients are created once and shared. boto3 clients are thread safe
+    but sessions are not, hence creation happens under a lock from a single
+    session. The registry is reset after a fork so that child processes never
+    share sockets with their parent.
+    """
+
+    def __init__(self, max_size=S3_CLIENT_REGISTRY_SIZE):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._clients = OrderedDict()
+        self._session = None
+        self._pid = None
+
+    def get_client(
+        self,
+        aws_access_key_id=None,
+        aws_secret_access_key=None,
+        region_name=None,
+        endpoint_url=None,
+        signature_version="s3v4",
+    ):
+        key = (aws_access_key_id, aws_secret_access_key, region_name, endpoint_url, signature_version)
+        with self._lock:
+            if self._pid != os.getpid():
+                self._clients.clear()
+                self._session = boto3.session.Session()
+                self._pid = os.getpid()
+
+            client = self._clients.get(key)
+            if client is None:
+                client = self._session.client(
+                    "s3",
+                    aws_access_key_id=aws_access_key_id,
+                    aws_secret_access_key=aws_secret_access_key,
+                    region_name=region_name,
+                    endpoint_url=endpoint_url,
+                    config=Config(
+                        signature_version=signature_version,
+                        max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+                    ),
+                )
+                self._clients[key] = client
+                # Request derived endpoints (MinIO) must not grow the registry unbounded
+                while len(self._clients) > self.max_size:
+                    self._clients.popitem(last=False)
+            else:
+                self._clients.move_to_end(key)
+            return client
+
+    def clear(self):
+        with self._lock:
+            self._clients.clear()
+
+
+s3_client_registry = S3ClientRegistry()
+
+
+def get_s3_client(**kwargs):
+    """Return a shared S3 client for the given configuration"""
+    return s3_client_registry.get_client(**kwargs)
+
+
 class S3Storage(S3Boto3Storage):
     def url(self, name, parameters=None, expire=None, http_method=None):
         return name
@@ -36,25 +117,18 @@ class S3Storage(S3Boto3Storage):
                 endpoint_protocol = "https"
             else:
                 endpoint_protocol = request.scheme if request else "http"
-            # Create an S3 client for MinIO
-            self.s3_client = boto3.client(
-                "s3",
-                aws_access_key_id=self.aws_access_key_id,
-                aws_secret_access_key=self.aws_secret_access_key,
-                region_name=self.aws_region,
-                endpoint_url=(f"{endpoint_protocol}://{request.get_host()}" if request else self.aws_s3_endpoint_url),
-                config=boto3.session.Config(signature_version="s3v4"),
-            )
+            # MinIO URLs are presigned against the host serving the request
+            endpoint_url = f"{endpoint_protocol}://{request.get_host()}" if request else self.aws_s3_endpoint_url
         else:
-            # Create an S3 client
-            self.s3_client = boto3.client(
-                "s3",
-                aws_access_key_id=self.aws_access_key_id,
-                aws_secret_access_key=self.aws_secret_access_key,
-                region_name=self.aws_region,
-                endpoint_url=self.aws_s3_endpoint_url,
-                config=boto3.session.Config(signature_version="s3v4"),
-            )
+            endpoint_url = self.aws_s3_endpoint_url
+
+        # Reuse the process wide client for this configuration
+        self.s3_client = get_s3_client(
+            aws_access_key_id=self.aws_access_key_id,
+            aws_secret_access_key=self.aws_secret_access_key,
+            region_name=self.aws_region,
+            endpoint_url=endpoint_url,
+        )
 
     def generate_presigned_post(self, object_name, file_type, file_size, expiration=3600):
         """Generate a presigned URL to upload an S3 object"""
@@ -158,3 +232,28 @@ class S3Storage(S3Boto3Storage):
             return None
 
         return response
+
+    def _run_batch(self, func, items, max_workers):
+        """Run func over items on a thread pool, preserving the input order"""
+        items = list(items)
+        if not items:
+            return []
+        if len(items) == 1:
+            return [func(items[0])]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(func, items))
+
+    def copy_objects(self, object_pairs, max_workers=S3_BATCH_MAX_WORKERS):
+        """
+        Copy many S3 objects concurrently.
+
+        object_pairs is an iterable of (object_name, new_object_name); returns
+        the copy responses in the same order, None for failed copies.
+        """
+        return self._run_batch(lambda pair: self.copy_object(*pair), object_pairs, max_workers)
+
+    def get_objects_metadata(self, object_names, max_workers=S3_BATCH_MAX_WORKERS):
+        """Fetch the metadata of many S3 objects concurrently, keyed by object name"""
+        object_names = list(object_names)
+        results = self._run_batch(self.get_object_metadata, object_names, max_workers)
+        return dict(zip(object_names, results))
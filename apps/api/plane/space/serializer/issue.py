@@ -32,6 +32,7 @@ from plane.utils.content_validator import (
     validate_html_content,
     validate_binary_data,
 )
+from plane.utils.issue_stats import refresh_issue_cycle_stats
 
 
 class IssueStateFlatSerializer(BaseSerializer):
@@ -381,6 +382,7 @@ class IssueCreateSerializer(BaseSerializer):
                 ],
                 batch_size=10,
             )
+            refresh_issue_cycle_stats([instance.id])
 
         if labels is not None:
             IssueLabel.objects.filter(issue=instance).delete()
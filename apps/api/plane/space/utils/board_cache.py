@@ -0,0 +1,128 @@
+# Python imports
+import hashlib
+import json
+import time
+
+# Django imports
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+
+# Third party imports
+from rest_framework import status
+from rest_framework.response import Response
+
+# Seconds a snapshot is served without checking the project version
+BOARD_SNAPSHOT_FRESH_TTL = 30
+
+# Seconds an outdated snapshot may still be served while one request rebuilds it
+BOARD_SNAPSHOT_STALE_TTL = 60 * 5
+
+# Snapshots are rebuilt at least hourly to pick up changes that do not bump
+# the project version (e.g. renamed states or labels)
+BOARD_SNAPSHOT_MAX_AGE = 60 * 60
+
+# Snapshots of boards nobody visits are dropped after a day
+BOARD_SNAPSHOT_TTL = 60 * 60 * 24
+
+BOARD_REBUILD_LOCK_TTL = 30
+
+BOARD_CACHE_CONTROL = f"public, max-age={BOARD_SNAPSHOT_FRESH_TTL}, stale-while-revalidate={BOARD_SNAPSHOT_STALE_TTL}"
+
+
+def get_board_version_key(project_id):
+    return f"space:board:version:{project_id}"
+
+
+def get_board_snapshot_key(anchor, query_params):
+    """Snapshots are keyed by the anchor and the normalized filter signature"""
+    signature = "&".join(f"{key}={','.join(sorted(query_params.getlist(key)))}" for key in sorted(query_params.keys()))
+    digest = hashlib.sha256(signature.encode("utf-8")).hexdigest()
+    return f"space:board:snapshot:{anchor}:{digest}"
+
+
+def get_board_version(project_id):
+    return cache.get(get_board_version_key(project_id), 0)
+
+
+def bump_board_version(project_id):
+    """Mark every snapshot of the project's published board as outdated"""
+    key = get_board_version_key(project_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # The key does not exist yet
+        cache.set(key, 1, timeout=None)
+
+
+def get_etag(data):
+    body = json.dumps(data, cls=DjangoJSONEncoder, sort_keys=True)
+    return f'"{hashlib.sha256(body.encode("utf-8")).hexdigest()[:32]}"'
+
+
+def build_snapshot_response(request, snapshot, cache_status):
+    """Return the snapshot, or a 304 when the client already holds it"""
+    if_none_match = request.headers.get("If-None-Match", "")
+    if snapshot["etag"] in [tag.strip() for tag in if_none_match.split(",")]:
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = Response(snapshot["data"], status=status.HTTP_200_OK)
+    response["ETag"] = snapshot["etag"]
+    response["Cache-Control"] = BOARD_CACHE_CONTROL
+    response["X-Board-Cache"] = cache_status
+    return response
+
+
+def serve_board_snapshot(request, anchor, project_id, build_response):
+    """
+    Serve a published board from its snapshot.
+
+    A snapshot younger than BOARD_SNAPSHOT_FRESH_TTL is served as is. An
+    older one is checked against the project version, which is bumped on
+    every issue change. When it is outdated, one request rebuilds it while
+    concurrent requests keep getting the stale snapshot for up to
+    BOARD_SNAPSHOT_STALE_TTL seconds.
+    """
+    snapshot_key = get_board_snapshot_key(anchor, request.query_params)
+    lock_key = f"{snapshot_key}:lock"
+    snapshot = cache.get(snapshot_key)
+    now = time.time()
+    locked = False
+
+    if snapshot is not None:
+        age = now - snapshot["generated_at"]
+        if age < BOARD_SNAPSHOT_FRESH_TTL:
+            return build_snapshot_response(request, snapshot, "HIT")
+
+        version = get_board_version(project_id)
+        if snapshot["version"] == version and now - snapshot["built_at"] < BOARD_SNAPSHOT_MAX_AGE:
+            # Still current, restart the freshness window
+            snapshot["generated_at"] = now
+            cache.set(snapshot_key, snapshot, BOARD_SNAPSHOT_TTL)
+            return build_snapshot_response(request, snapshot, "REVALIDATED")
+
+        if age < BOARD_SNAPSHOT_FRESH_TTL + BOARD_SNAPSHOT_STALE_TTL:
+            locked = cache.add(lock_key, 1, BOARD_REBUILD_LOCK_TTL)
+            if not locked:
+                # Another request is rebuilding this snapshot
+                return build_snapshot_response(request, snapshot, "STALE")
+    else:
+        version = get_board_version(project_id)
+
+    try:
+        response = build_response()
+        if response.status_code != status.HTTP_200_OK:
+            return response
+
+        snapshot = {
+            "version": version,
+            "generated_at": now,
+            "built_at": now,
+            "data": response.data,
+            "etag": get_etag(response.data),
+        }
+        cache.set(snapshot_key, snapshot, BOARD_SNAPSHOT_TTL)
+    finally:
+        if locked:
+            cache.delete(lock_key)
+
+    return build_snapshot_response(request, snapshot, "MISS")
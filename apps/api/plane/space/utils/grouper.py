@@ -5,19 +5,10 @@ from django.db.models import Q, UUIDField, Value, F, Case, When, JSONField, Char
 from django.db.models.functions import Coalesce, JSONObject, Concat
 from django.db.models import QuerySet
 
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any
 
 # Module imports
-from plane.db.models import (
-    Cycle,
-    Issue,
-    Label,
-    Module,
-    Project,
-    ProjectMember,
-    State,
-    WorkspaceMember,
-)
+from plane.db.models import Issue
 
 
 def issue_queryset_grouper(
@@ -175,73 +166,3 @@ def issue_on_results(
     ).values(*required_fields, "vote_items", "reaction_items")
 
     return issues
-
-
-def issue_group_values(
-    field: str,
-    slug: str,
-    project_id: Optional[str] = None,
-    filters: Dict[str, Any] = {},
-    queryset: Optional[QuerySet] = None,
-) -> List[Union[str, Any]]:
-    if field == "state_id":
-        queryset = State.objects.filter(is_triage=False, workspace__slug=slug).values_list("id", flat=True)
-        if project_id:
-            return list(queryset.filter(project_id=project_id))
-        else:
-            return list(queryset)
-    if field == "labels__id":
-        queryset = Label.objects.filter(workspace__slug=slug).values_list("id", flat=True)
-        if project_id:
-            return list(queryset.filter(project_id=project_id)) + ["None"]
-        else:
-            return list(queryset) + ["None"]
-    if field == "assignees__id":
-        if project_id:
-            return ProjectMember.objects.filter(
-                workspace__slug=slug, project_id=project_id, is_active=True
-            ).values_list("member_id", flat=True)
-        else:
-            return list(
-                WorkspaceMember.objects.filter(workspace__slug=slug, is_active=True).values_list("member_id", flat=True)
-            )
-    if field == "issue_module__module_id":
-        queryset = Module.objects.filter(workspace__slug=slug).values_list("id", flat=True)
-        if project_id:
-            return list(queryset.filter(project_id=project_id)) + ["None"]
-        else:
-            return list(queryset) + ["None"]
-    if field == "cycle_id":
-        queryset = Cycle.objects.filter(workspace__slug=slug).values_list("id", flat=True)
-        if project_id:
-            return list(queryset.filter(project_id=project_id)) + ["None"]
-        else:
-            return list(queryset) + ["None"]
-    if field == "project_id":
-        queryset = Project.objects.filter(workspace__slug=slug).values_list("id", flat=True)
-        return list(queryset)
-    if field == "priority":
-        return ["low", "medium", "high", "urgent", "none"]
-    if field == "state__group":
-        return ["backlog", "unstarted", "started", "completed", "cancelled"]
-    if field == "target_date":
-        queryset = queryset.values_list("target_date", flat=True).distinct()
-        if project_id:
-            return list(queryset.filter(project_id=project_id))
-        else:
-            return list(queryset)
-    if field == "start_date":
-        queryset = queryset.values_list("start_date", flat=True).distinct()
-        if project_id:
-            return list(queryset.filter(project_id=project_id))
-        else:
-            return list(queryset)
-
-    if field == "created_by":
-        queryset = queryset.values_list("created_by", flat=True).distinct()
-        if project_id:
-            return list(queryset.filter(project_id=project_id))
-        else:
-            return list(queryset)
-
-    return []
@@ -1,6 +1,5 @@
 # Python imports
 import zoneinfo
-from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.db import IntegrityError
 
@@ -102,11 +101,6 @@ class BaseViewSet(TimezoneMixin, ModelViewSet, BasePaginator):
         try:
             response = super().dispatch(request, *args, **kwargs)
 
-            if settings.DEBUG:
-                from django.db import connection
-
-                print(f"{request.method} - {request.get_full_path()} of Queries: {len(connection.queries)}")
-
             return response
         except Exception as exc:
             response = self.handle_exception(exc)
@@ -185,10 +179,6 @@ class BaseAPIView(TimezoneMixin, APIView, BasePaginator):
         try:
             response = super().dispatch(request, *args, **kwargs)
 
-            if settings.DEBUG:
-                from django.db import connection
-
-                print(f"{request.method} - {request.get_full_path()} of Queries: {len(connection.queries)}")
             return response
 
         except Exception as exc:
@@ -0,0 +1,27 @@
+# Third party imports
+import pytest
+
+# Module imports
+from plane.utils.load_generator import LoadGenerator, LoadProfile
+
+
+@pytest.fixture
+def load_workspace(create_user):
+    """Generate a single project workspace holding the given number of issues"""
+
+    def generate(count):
+        profile = LoadProfile(
+            projects=1,
+            issues=count,
+            members=10,
+            labels=20,
+            cycles=1,
+            modules=5,
+            pages=0,
+            cycle_ratio=1.0,
+            notification_ratio=0.0,
+        )
+        workspace, _ = LoadGenerator(0, profile).generate(f"benchmark-{count}", create_user)
+        return workspace
+
+    return generate
@@ -0,0 +1,58 @@
+# Python imports
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+
+# Third party imports
+import pytest
+
+# Input sizes of the benchmarks, the largest only runs with the slow tests
+SCALES = [1_000, 10_000, pytest.param(100_000, marks=pytest.mark.slow)]
+
+# Benchmarks too slow to run at 10k rows by default, such as those reading from the database
+HEAVY_SCALES = [1_000, pytest.param(10_000, marks=pytest.mark.slow), pytest.param(100_000, marks=pytest.mark.slow)]
+
+PRIORITIES = ["urgent", "high", "medium", "low", "none"]
+
+
+def run_benchmark(benchmark, func, make_args, count):
+    """
+    Time func on fresh arguments each round, as most of the measured
+    functions update their input rows in place.
+    """
+    rounds = 5 if count < 100_000 else 1
+    return benchmark.pedantic(func, setup=lambda: (make_args(), {}), rounds=rounds, iterations=1)
+
+
+def make_uuids(rng, count):
+    return [uuid.UUID(int=rng.getrandbits(128), version=4) for _ in range(count)]
+
+
+def make_issue_rows(count, seed=0, states=5, labels=50, members=20):
+    """
+    Rows shaped like the values of a grouped issue listing, one per issue and
+    label, and per assignee, as the m2m group by joins return them.
+    """
+    rng = random.Random(seed)
+    state_ids = make_uuids(rng, states)
+    label_ids = make_uuids(rng, labels) + [None]
+    member_ids = make_uuids(rng, members) + [None]
+    created_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    rows = []
+    while len(rows) < count:
+        issue = {
+            "id": uuid.UUID(int=rng.getrandbits(128), version=4),
+            "name": f"Issue {len(rows)}",
+            "state_id": rng.choice(state_ids),
+            "priority": rng.choice(PRIORITIES),
+            "sort_order": rng.random() * 65535,
+            "sequence_id": len(rows) + 1,
+            "created_at": created_at + timedelta(minutes=len(rows)),
+            "updated_at": created_at + timedelta(minutes=len(rows), seconds=30),
+            "completed_at": None,
+        }
+        for label_id in rng.sample(label_ids, rng.randint(1, 3)):
+            for assignee_id in rng.sample(member_ids, rng.randint(1, 2)):
+                rows.append({**issue, "labels__id": label_id, "assignees__id": assignee_id})
+    return rows[:count]
@@ -0,0 +1,32 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from plane.db.models import Cycle, CycleIssue
+from plane.tests.benchmarks.helpers import HEAVY_SCALES
+from plane.utils.analytics_plot import burndown_plot
+
+
+@pytest.mark.benchmark(group="analytics_plot")
+class TestBurndownPlotBenchmark:
+    """Benchmark the burndown of a year long cycle"""
+
+    @pytest.mark.django_db
+    @pytest.mark.parametrize("count", HEAVY_SCALES)
+    def test_cycle_burndown(self, benchmark, load_workspace, count):
+        workspace = load_workspace(count)
+        cycle = Cycle.objects.get(workspace=workspace)
+        cycle.start_date = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        cycle.end_date = datetime(2025, 12, 31, tzinfo=timezone.utc)
+        cycle.save(update_fields=["start_date", "end_date"])
+        cycle.total_issues = CycleIssue.objects.filter(cycle=cycle).count()
+
+        chart = benchmark.pedantic(
+            burndown_plot,
+            args=(cycle, workspace.slug, cycle.project_id, "issues"),
+            kwargs={"cycle_id": cycle.id},
+            rounds=3,
+            iterations=1,
+        )
+        assert len(chart) == 365
+        assert chart["2025-01-01"] <= count
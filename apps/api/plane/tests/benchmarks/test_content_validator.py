@@ -0,0 +1,44 @@
+import pytest
+
+from plane.utils.content_validator import validate_html_content
+
+# Description sizes in bytes, the largest only runs with the slow tests
+SIZES = [100 * 1024, 1024 * 1024, pytest.param(5 * 1024 * 1024, marks=pytest.mark.slow)]
+
+
+def build_description_html(target_size):
+    """Build editor-like HTML of roughly target_size bytes"""
+    block = (
+        '<p class="editor-paragraph-block">Release notes for the sprint with '
+        "<strong>bold</strong>, <em>italic</em> and "
+        '<a href="https://plane.so/docs" target="_blank">a link</a>.</p>'
+        '<mention-component id="4f8a" entity_identifier="9b1c" '
+        'entity_name="user_mention"></mention-component>'
+        '<ul data-tight="true"><li><p>first item</p></li><li><p>second item</p></li></ul>'
+        '<image-component src="6a1d7c2e.png" width="640" height="480" '
+        'aspectratio="1.33" alignment="center"></image-component>'
+        '<table><tbody><tr><td colspan="1" rowspan="1" colwidth="150">'
+        "<p>cell</p></td></tr></tbody></table>"
+        '<pre language="python"><code language="python">print("plane")</code></pre>'
+    )
+    return block * (target_size // len(block) + 1)
+
+
+@pytest.mark.benchmark(group="content_validator")
+class TestValidateHtmlContentBenchmark:
+    """Benchmark the sanitization and diffing of realistic descriptions"""
+
+    @pytest.mark.parametrize("size", SIZES)
+    def test_clean_description(self, benchmark, size):
+        html = build_description_html(size)
+
+        is_valid, error, _ = benchmark.pedantic(validate_html_content, args=(html,), rounds=3, iterations=1)
+        assert is_valid is True, error
+
+    @pytest.mark.parametrize("size", SIZES)
+    def test_dirty_description(self, benchmark, size):
+        html = build_description_html(size) + '<p onclick="evil()">x</p><script>alert(1)</script>'
+
+        is_valid, error, clean_html = benchmark.pedantic(validate_html_content, args=(html,), rounds=3, iterations=1)
+        assert is_valid is True, error
+        assert "<script>" not in clean_html
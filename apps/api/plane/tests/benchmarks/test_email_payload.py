@@ -0,0 +1,44 @@
+import random
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from plane.bgtasks.email_notification_task import create_payload
+from plane.tests.benchmarks.helpers import SCALES, run_benchmark
+
+FIELDS = ["state", "priority", "assignees", "labels", "start_date", "target_date", "name", "description"]
+
+
+def make_notification_data(count, seed=0, actors=10):
+    """count issue activities of a batched email, spread over the actors"""
+    rng = random.Random(seed)
+    actor_ids = [str(uuid.UUID(int=rng.getrandbits(128), version=4)) for _ in range(actors)]
+    start = datetime(2025, 1, 1)
+    values = max(count // 100, 2)
+
+    data = {actor_id: [] for actor_id in actor_ids}
+    for index in range(count):
+        data[rng.choice(actor_ids)].append(
+            {
+                "issue_activity": {
+                    "field": rng.choice(FIELDS),
+                    "old_value": f"value-{rng.randrange(values)}",
+                    "new_value": f"value-{rng.randrange(values)}",
+                    "activity_time": (start + timedelta(seconds=index)).isoformat() + "Z",
+                }
+            }
+        )
+    return data
+
+
+@pytest.mark.benchmark(group="email_payload")
+class TestEmailPayloadBenchmark:
+    """Benchmark the grouping of the activities of a notification email"""
+
+    @pytest.mark.parametrize("count", SCALES)
+    def test_create_payload(self, benchmark, count):
+        notification_data = make_notification_data(count)
+
+        result = run_benchmark(benchmark, create_payload, lambda: (notification_data,), count)
+        assert set(result) == set(notification_data)
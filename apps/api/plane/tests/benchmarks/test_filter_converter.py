@@ -0,0 +1,34 @@
+import random
+import uuid
+
+import pytest
+
+from plane.tests.benchmarks.helpers import SCALES, run_benchmark
+from plane.utils.filters.converters import LegacyToRichFiltersConverter
+
+
+def make_legacy_filters(count, seed=0):
+    """A legacy view filter holding count values over its list filters"""
+    rng = random.Random(seed)
+    per_field = count // 5
+    return {
+        "state": [str(uuid.UUID(int=rng.getrandbits(128), version=4)) for _ in range(per_field)],
+        "labels": [str(uuid.UUID(int=rng.getrandbits(128), version=4)) for _ in range(per_field)],
+        "assignees": [str(uuid.UUID(int=rng.getrandbits(128), version=4)) for _ in range(per_field)],
+        "created_by": [str(uuid.UUID(int=rng.getrandbits(128), version=4)) for _ in range(per_field)],
+        "priority": [rng.choice(["urgent", "high", "medium", "low", "none", "invalid"]) for _ in range(per_field)],
+        "start_date": ["2025-01-01;after", "2025-12-31;before"],
+        "target_date": ["2025-06-30"],
+    }
+
+
+@pytest.mark.benchmark(group="filter_converter")
+class TestFilterConverterBenchmark:
+    """Benchmark the conversion of legacy view filters to rich filters"""
+
+    @pytest.mark.parametrize("count", SCALES)
+    def test_convert(self, benchmark, count):
+        filters = make_legacy_filters(count)
+
+        result = run_benchmark(benchmark, LegacyToRichFiltersConverter().convert, lambda: (filters,), count)
+        assert result["and"]
@@ -0,0 +1,51 @@
+import random
+from datetime import date
+
+import pytest
+
+from plane.tests.benchmarks.helpers import HEAVY_SCALES, SCALES, run_benchmark
+from plane.utils.exporters import IssueExportSchema
+from plane.utils.exporters.formatters import CSVFormatter, XLSXFormatter
+
+
+def make_export_records(count, seed=0):
+    """Records shaped like the serialized issue export schema"""
+    rng = random.Random(seed)
+    fields = list(IssueExportSchema._declared_fields)
+    records = []
+    for index in range(count):
+        record = {field: f"{field}-{index}" for field in fields}
+        record.update(
+            sequence_id=index + 1,
+            start_date=date(2025, 1, 1),
+            labels=[f"label-{rng.randrange(50)}" for _ in range(rng.randint(0, 5))],
+            assignees=[f"member-{rng.randrange(20)}" for _ in range(rng.randint(0, 3))],
+            relations={"blocking": [f"ISSUE-{rng.randrange(count)}"]},
+        )
+        records.append(record)
+    return records
+
+
+@pytest.mark.benchmark(group="export_formatters")
+class TestExportFormatterBenchmark:
+    """Benchmark the CSV and XLSX export formatters"""
+
+    @pytest.mark.parametrize("count", SCALES)
+    def test_csv_format(self, benchmark, count):
+        records = make_export_records(count)
+
+        filename, content = run_benchmark(
+            benchmark, CSVFormatter().format, lambda: ("export", records, IssueExportSchema), count
+        )
+        assert filename == "export.csv"
+        assert content.count("\r\n") == count + 1
+
+    @pytest.mark.parametrize("count", HEAVY_SCALES)
+    def test_xlsx_format(self, benchmark, count):
+        records = make_export_records(count)
+
+        filename, content = run_benchmark(
+            benchmark, XLSXFormatter().format, lambda: ("export", records, IssueExportSchema), count
+        )
+        assert filename == "export.xlsx"
+        assert content
@@ -0,0 +1,35 @@
+import pytest
+
+from plane.app.views.issue.base import IssueViewSet
+from plane.db.models import Issue
+from plane.tests.benchmarks.helpers import HEAVY_SCALES
+from plane.utils.grouper import issue_on_results, issue_queryset_grouper
+
+
+def get_issue_queryset(workspace, group_by=None, sub_group_by=None):
+    """The annotated queryset of the project issue listing"""
+    queryset = IssueViewSet().apply_annotations(Issue.issue_objects.filter(workspace=workspace))
+    return issue_queryset_grouper(queryset=queryset, group_by=group_by, sub_group_by=sub_group_by)
+
+
+@pytest.mark.benchmark(group="grouper")
+class TestIssueOnResultsBenchmark:
+    """Benchmark reading the issue values of a listing page"""
+
+    @pytest.mark.django_db
+    @pytest.mark.parametrize("count", HEAVY_SCALES)
+    def test_ungrouped(self, benchmark, load_workspace, count):
+        queryset = get_issue_queryset(load_workspace(count))
+
+        results = benchmark.pedantic(issue_on_results, args=(queryset, None, None), rounds=3, iterations=1)
+        assert len(results) == count
+
+    @pytest.mark.django_db
+    @pytest.mark.parametrize("count", HEAVY_SCALES)
+    def test_grouped_by_labels(self, benchmark, load_workspace, count):
+        queryset = get_issue_queryset(load_workspace(count), "labels__id", "state_id")
+
+        results = benchmark.pedantic(
+            issue_on_results, args=(queryset, "labels__id", "state_id"), rounds=3, iterations=1
+        )
+        assert len({row["id"] for row in results}) == count
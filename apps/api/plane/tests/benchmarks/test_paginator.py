@@ -0,0 +1,108 @@
+from collections import Counter
+
+import pytest
+from django.db.models import Q
+
+from plane.db.models import Issue
+from plane.tests.benchmarks.helpers import SCALES, make_issue_rows, run_benchmark
+from plane.utils.paginator import ColumnarResults, GroupedOffsetPaginator, SubGroupedOffsetPaginator
+
+
+def get_totals(rows, field):
+    return {str(group): count for group, count in Counter(row[field] for row in rows).items()}
+
+
+def get_sub_group_totals(rows, field, sub_field):
+    totals = {}
+    for row in rows:
+        sub_groups = totals.setdefault(str(row[field]), {})
+        sub_groups[str(row[sub_field])] = sub_groups.get(str(row[sub_field]), 0) + 1
+    return totals
+
+
+def grouped_paginator(mocker, rows, field):
+    # The group totals are read from the database, the grouping itself is pure Python
+    mocker.patch.object(
+        GroupedOffsetPaginator, "_GroupedOffsetPaginator__get_total_dict", return_value=get_totals(rows, field)
+    )
+    return GroupedOffsetPaginator(
+        queryset=Issue.objects.none(),
+        group_by_field_name=field,
+        group_by_fields=list({row[field] for row in rows}),
+        count_filter=Q(),
+        order_by="-created_at",
+    )
+
+
+def sub_grouped_paginator(mocker, rows, field, sub_field):
+    mocker.patch.object(
+        SubGroupedOffsetPaginator,
+        "_SubGroupedOffsetPaginator__get_total_dict",
+        return_value=(get_totals(rows, field), get_sub_group_totals(rows, field, sub_field)),
+    )
+    return SubGroupedOffsetPaginator(
+        queryset=Issue.objects.none(),
+        group_by_field_name=field,
+        sub_group_by_field_name=sub_field,
+        group_by_fields=list({row[field] for row in rows}),
+        sub_group_by_fields=list({row[sub_field] for row in rows}),
+        count_filter=Q(),
+        order_by="-created_at",
+    )
+
+
+@pytest.mark.benchmark(group="paginator")
+class TestPaginatorBenchmark:
+    """Benchmark the grouping of a page of issues by the grouped paginators"""
+
+    @pytest.mark.parametrize("count", SCALES)
+    def test_group_by_state(self, benchmark, mocker, count):
+        rows = make_issue_rows(count)
+        paginator = grouped_paginator(mocker, rows, "state_id")
+
+        result = run_benchmark(benchmark, paginator.process_results, lambda: ([dict(row) for row in rows],), count)
+        assert sum(len(group["results"]) for group in result.values()) == count
+
+    @pytest.mark.parametrize("count", SCALES)
+    def test_group_by_labels(self, benchmark, mocker, count):
+        rows = make_issue_rows(count)
+        paginator = grouped_paginator(mocker, rows, "labels__id")
+
+        result = run_benchmark(benchmark, paginator.process_results, lambda: ([dict(row) for row in rows],), count)
+        assert result
+
+    @pytest.mark.parametrize("count", SCALES)
+    def test_sub_group_by_state_and_priority(self, benchmark, mocker, count):
+        rows = make_issue_rows(count)
+        paginator = sub_grouped_paginator(mocker, rows, "state_id", "priority")
+
+        result = run_benchmark(benchmark, paginator.process_results, lambda: ([dict(row) for row in rows],), count)
+        assert (
+            sum(len(sub_group["results"]) for group in result.values() for sub_group in group["results"].values())
+            == count
+        )
+
+    @pytest.mark.parametrize("count", SCALES)
+    def test_sub_group_by_labels_and_assignees(self, benchmark, mocker, count):
+        rows = make_issue_rows(count)
+        paginator = sub_grouped_paginator(mocker, rows, "labels__id", "assignees__id")
+
+        result = run_benchmark(benchmark, paginator.process_results, lambda: ([dict(row) for row in rows],), count)
+        assert result
+
+    @pytest.mark.parametrize("count", SCALES)
+    def test_group_by_labels_columnar(self, benchmark, mocker, count):
+        # The rows as read by issue_on_results, without the dict of every row
+        rows = make_issue_rows(count)
+        paginator = grouped_paginator(mocker, rows, "labels__id")
+
+        result = run_benchmark(benchmark, paginator.process_results, lambda: (ColumnarResults.from_dicts(rows),), count)
+        assert {row["id"] for group in result.values() for row in group["results"]} == {row["id"] for row in rows}
+
+    @pytest.mark.parametrize("count", SCALES)
+    def test_sub_group_by_labels_and_assignees_columnar(self, benchmark, mocker, count):
+        rows = make_issue_rows(count)
+        paginator = sub_grouped_paginator(mocker, rows, "labels__id", "assignees__id")
+
+        result = run_benchmark(benchmark, paginator.process_results, lambda: (ColumnarResults.from_dicts(rows),), count)
+        assert result
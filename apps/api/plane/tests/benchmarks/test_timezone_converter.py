@@ -0,0 +1,24 @@
+import pytest
+
+from plane.tests.benchmarks.helpers import SCALES, make_issue_rows, run_benchmark
+from plane.utils.timezone_converter import user_timezone_converter
+
+DATETIME_FIELDS = ["created_at", "updated_at", "completed_at"]
+
+
+@pytest.mark.benchmark(group="timezone_converter")
+class TestTimezoneConverterBenchmark:
+    """Benchmark the conversion of the issue datetimes to the user timezone"""
+
+    @pytest.mark.parametrize("count", SCALES)
+    def test_user_timezone_converter(self, benchmark, count):
+        rows = make_issue_rows(count)
+
+        result = run_benchmark(
+            benchmark,
+            user_timezone_converter,
+            lambda: ([dict(row) for row in rows], DATETIME_FIELDS, "Asia/Kolkata"),
+            count,
+        )
+        assert len(result) == count
+        assert result[0]["created_at"].utcoffset().total_seconds() == 19800
@@ -0,0 +1,204 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from django.db import connection
+from pymongo.errors import BulkWriteError, DocumentTooLarge
+
+from plane.bgtasks.cleanup_task import (
+    WEBHOOK_LOG_FIELDS,
+    get_keyset_ranges,
+    process_cleanup_task,
+    process_partition_cleanup,
+    transform_webhook_log,
+)
+from plane.db.models import WebhookLog
+from plane.utils.partitions import add_months, get_partitions, month_start, partition_table
+
+
+class FakeCollection:
+    """Stores the documents by their _id, rejecting duplicates like MongoDB"""
+
+    def __init__(self, failing_ids=()):
+        self.documents = {}
+        self.failing_ids = set(failing_ids)
+        self.upserted_ids = []
+
+    def insert_many(self, documents, ordered=True):
+        errors = []
+        for index, document in enumerate(documents):
+            if document["_id"] in self.failing_ids:
+                errors.append({"index": index, "code": 2, "errmsg": "BadValue"})
+            elif document["_id"] in self.documents:
+                errors.append({"index": index, "code": 11000, "errmsg": "E11000 duplicate key error"})
+            else:
+                self.documents[document["_id"]] = document
+        if errors:
+            raise BulkWriteError({"writeErrors": errors, "writeConcernErrors": [], "nInserted": 0})
+
+    def bulk_write(self, operations, ordered=True):
+        for operation in operations:
+            self.documents[operation._filter["_id"]] = operation._doc
+            self.upserted_ids.append(operation._filter["_id"])
+
+
+@pytest.mark.unit
+class TestPartitionCleanup:
+    """Test the archive and drop of the log partitions past their retention"""
+
+    @pytest.fixture
+    def logs(self, workspace):
+        logs = [WebhookLog.objects.create(workspace=workspace, webhook=workspace.id) for _ in range(3)]
+        with connection.cursor() as cursor:
+            # A table with deferred foreign key checks pending cannot be altered
+            cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+        partition_table("webhook_logs", months_ahead=1)
+        return logs
+
+    def cleanup(self, cutoff_time, **kwargs):
+        process_partition_cleanup(
+            model=WebhookLog,
+            fields=WEBHOOK_LOG_FIELDS,
+            transform_func=transform_webhook_log,
+            task_name="Webhook Log",
+            collection_name="webhook_logs",
+            cutoff_time=cutoff_time,
+            **kwargs,
+        )
+
+    def get_names(self):
+        return [partition.name for partition in get_partitions("webhook_logs")]
+
+    @pytest.mark.django_db
+    def test_expired_partitions_are_archived_and_dropped(self, logs, mocker):
+        collection = FakeCollection()
+        mocker.patch("plane.bgtasks.cleanup_task.get_mongo_collection", return_value=collection)
+        next_month = add_months(month_start(datetime.now(timezone.utc)), 1)
+
+        # Nothing expires while the legacy partition can still get rows
+        self.cleanup(next_month - timedelta(days=1))
+        assert WebhookLog.objects.count() == 3
+
+        self.cleanup(next_month)
+
+        assert WebhookLog.objects.count() == 0
+        assert "webhook_logs_legacy" not in self.get_names()
+        # The documents are keyed by the log ids, so exporting again does not duplicate them
+        assert sorted(collection.documents) == sorted(str(log.id) for log in logs)
+
+    @pytest.mark.django_db
+    def test_partitions_kept_when_archive_is_required(self, logs, mocker):
+        mocker.patch("plane.bgtasks.cleanup_task.get_mongo_collection", return_value=None)
+
+        self.cleanup(datetime(2100, 1, 1, tzinfo=timezone.utc), require_archive=True)
+
+        assert WebhookLog.objects.count() == 3
+        assert "webhook_logs_legacy" in self.get_names()
+
+    @pytest.mark.django_db
+    def test_legacy_rows_are_purged_until_it_expires(self, logs, mocker):
+        process_cleanup_task = mocker.patch("plane.bgtasks.cleanup_task.process_cleanup_task")
+        WebhookLog.objects.filter(pk__in=[log.pk for log in logs[:2]]).update(
+            created_at=datetime.now(timezone.utc) - timedelta(days=60)
+        )
+
+        self.cleanup(datetime.now(timezone.utc) - timedelta(days=30), purge_legacy=True)
+
+        # The rows past the retention are purged from the legacy partition, which is kept
+        queryset = process_cleanup_task.call_args.kwargs["queryset_func"]()
+        assert sorted(record["id"] for record in queryset) == sorted(log.id for log in logs[:2])
+        assert "webhook_logs_legacy" in self.get_names()
+
+        # Once the whole legacy partition expired it is dropped instead
+        process_cleanup_task.reset_mock()
+        mocker.patch("plane.bgtasks.cleanup_task.get_mongo_collection", return_value=FakeCollection())
+        self.cleanup(add_months(month_start(datetime.now(timezone.utc)), 1), purge_legacy=True)
+        process_cleanup_task.assert_not_called()
+        assert "webhook_logs_legacy" not in self.get_names()
+
+
+@pytest.mark.unit
+class TestCleanupPipeline:
+    """Test the pipelined archive and delete of the cleanup tasks"""
+
+    @pytest.fixture
+    def logs(self, workspace, mocker):
+        mocker.patch("plane.bgtasks.cleanup_task.BATCH_SIZE", 3)
+        return [WebhookLog.objects.create(workspace=workspace, webhook=workspace.id) for _ in range(20)]
+
+    def cleanup(self, collection, mocker, workers):
+        mocker.patch("plane.bgtasks.cleanup_task.get_mongo_collection", return_value=collection)
+        process_cleanup_task(
+            queryset_func=lambda: WebhookLog.all_objects.values(*WEBHOOK_LOG_FIELDS),
+            transform_func=transform_webhook_log,
+            model=WebhookLog,
+            task_name="Webhook Log",
+            collection_name="webhook_logs",
+            workers=workers,
+        )
+
+    def test_keyset_ranges_cover_the_ids(self):
+        ranges = get_keyset_ranges(4)
+
+        assert len(ranges) == 4
+        assert ranges[0][0] is None and ranges[-1][1] is None
+        assert all(upper == lower for (_, upper), (lower, _) in zip(ranges, ranges[1:]))
+
+    @pytest.mark.django_db(transaction=True)
+    def test_parallel_workers_archive_each_record_once(self, logs, mocker):
+        collection = FakeCollection()
+        # Records archived by an interrupted run are replaced, not duplicated
+        for log in logs[:4]:
+            collection.documents[str(log.id)] = {"_id": str(log.id)}
+
+        self.cleanup(collection, mocker, workers=3)
+
+        assert WebhookLog.all_objects.count() == 0
+        assert sorted(collection.documents) == sorted(str(log.id) for log in logs)
+        assert sorted(collection.upserted_ids) == sorted(str(log.id) for log in logs[:4])
+        assert all("event_type" in document for document in collection.documents.values())
+
+    @pytest.mark.django_db(transaction=True)
+    def test_failed_batches_are_kept(self, logs, mocker):
+        failing_id = str(logs[0].id)
+        collection = FakeCollection(failing_ids=[failing_id])
+
+        self.cleanup(collection, mocker, workers=1)
+
+        # Only the batch of the failing record stays in PostgreSQL
+        remaining = WebhookLog.all_objects.values_list("id", flat=True)
+        assert 0 < len(remaining) <= 3
+        assert failing_id in [str(log_id) for log_id in remaining]
+
+    @pytest.mark.django_db(transaction=True)
+    def test_required_archive_stops_at_the_first_failed_batch(self, logs, mocker):
+        # The second batch fails, nothing newer may leave PostgreSQL before it
+        collection = FakeCollection(failing_ids=[str(logs[4].id)])
+        mocker.patch("plane.bgtasks.cleanup_task.get_mongo_collection", return_value=collection)
+
+        failed_batches = process_cleanup_task(
+            queryset_func=lambda: WebhookLog.all_objects.values(*WEBHOOK_LOG_FIELDS).order_by("created_at"),
+            transform_func=transform_webhook_log,
+            model=WebhookLog,
+            task_name="Webhook Log",
+            collection_name="webhook_logs",
+            require_archive=True,
+            workers=1,
+        )
+
+        assert failed_batches == 1
+        remaining = set(WebhookLog.all_objects.values_list("id", flat=True))
+        assert remaining == {log.id for log in logs[3:]}
+        # The valid records of the failed batch are archived, the later batches are not
+        assert sorted(collection.documents) == sorted(str(log.id) for log in logs[:6] if log is not logs[4])
+
+    @pytest.mark.django_db(transaction=True)
+    def test_invalid_documents_do_not_stall_the_pipeline(self, logs, mocker):
+        collection = FakeCollection()
+        collection.insert_many = mocker.Mock(side_effect=DocumentTooLarge("document too large"))
+        # A single writer and a one batch queue, a stopped writer would block the reader
+        mocker.patch("plane.bgtasks.cleanup_task.QUEUE_SIZE", 1)
+
+        self.cleanup(collection, mocker, workers=1)
+
+        assert collection.insert_many.call_count == 7
+        assert WebhookLog.all_objects.count() == 20
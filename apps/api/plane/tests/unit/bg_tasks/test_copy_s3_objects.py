@@ -79,8 +79,9 @@ class TestCopyS3Objects:
             # Call the actual function (not .delay())
             copy_s3_objects_of_description_and_assets("ISSUE", issue.id, project.id, "test-workspace", create_user.id)
 
-        # Assert that copy_object was called for each asset
-        assert mock_storage_instance.copy_object.call_count == 2
+        # Assert that both assets were copied in a single batch
+        mock_storage_instance.copy_objects.assert_called_once()
+        assert len(mock_storage_instance.copy_objects.call_args.args[0]) == 2
 
         # Get the updated issue and its new assets
         updated_issue = Issue.objects.get(id=issue.id)
@@ -111,7 +112,10 @@ class TestCopyS3Objects:
 
         # Assert
         # Verify S3 copy was called
-        mock_storage_instance.copy_object.assert_called_once()
+        mock_storage_instance.copy_objects.assert_called_once()
+        object_pairs = mock_storage_instance.copy_objects.call_args.args[0]
+        assert len(object_pairs) == 1
+        assert object_pairs[0][0] == file_asset.asset
 
         # Verify new asset was created
         assert len(result) == 1
@@ -145,7 +149,7 @@ class TestCopyS3Objects:
 
         # Assert
         assert result == []
-        mock_storage_instance.copy_object.assert_not_called()
+        mock_storage_instance.copy_objects.assert_not_called()
 
     @pytest.mark.django_db
     @patch("plane.bgtasks.copy_s3_object.S3Storage")
@@ -167,4 +171,4 @@ class TestCopyS3Objects:
 
         # Assert
         assert result == []
-        mock_storage_instance.copy_object.assert_not_called()
+        mock_storage_instance.copy_objects.assert_not_called()
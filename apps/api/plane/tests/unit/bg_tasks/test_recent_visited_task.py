@@ -0,0 +1,114 @@
+import uuid
+
+import pytest
+
+from plane.bgtasks.recent_visited_task import delete_recent_visits, flush_recent_visits
+from plane.db.models import Project, UserRecentVisit
+from plane.utils.recent_visit import (
+    RECENT_VISIT_DIRTY_KEY,
+    RECENT_VISIT_LIMIT,
+    get_recent_visit_key,
+    get_recent_visits,
+    get_redis_client,
+    record_recent_visit,
+)
+
+
+@pytest.mark.unit
+class TestRecentVisitBuffer:
+    """Test the Redis recent visit buffer and its flush to UserRecentVisit"""
+
+    @pytest.fixture(autouse=True)
+    def clean_buffer(self, create_user, workspace):
+        client = get_redis_client()
+        key = get_recent_visit_key(workspace.slug, create_user.id)
+        client.delete(key, RECENT_VISIT_DIRTY_KEY)
+        yield
+        client.delete(key, RECENT_VISIT_DIRTY_KEY)
+
+    def record(self, user, workspace, entity_identifier, entity_name="issue"):
+        record_recent_visit(
+            entity_name=entity_name,
+            entity_identifier=entity_identifier,
+            user_id=user.id,
+            project_id=None,
+            slug=workspace.slug,
+        )
+
+    @pytest.mark.django_db
+    def test_buffer_is_capped_and_ordered(self, create_user, workspace):
+        identifiers = [str(uuid.uuid4()) for _ in range(RECENT_VISIT_LIMIT + 5)]
+        for identifier in identifiers:
+            self.record(create_user, workspace, identifier)
+
+        visits = get_recent_visits(workspace.slug, create_user.id)
+        assert len(visits) == RECENT_VISIT_LIMIT
+        assert visits[0]["entity_identifier"] == identifiers[-1]
+
+    @pytest.mark.django_db
+    def test_revisit_does_not_duplicate(self, create_user, workspace):
+        identifier = str(uuid.uuid4())
+        self.record(create_user, workspace, identifier)
+        self.record(create_user, workspace, identifier)
+
+        assert len(get_recent_visits(workspace.slug, create_user.id)) == 1
+
+    @pytest.mark.django_db
+    def test_flush_upserts_and_trims(self, create_user, workspace):
+        identifiers = [str(uuid.uuid4()) for _ in range(RECENT_VISIT_LIMIT)]
+        for identifier in identifiers:
+            self.record(create_user, workspace, identifier)
+        flush_recent_visits()
+
+        assert UserRecentVisit.objects.filter(user=create_user, workspace=workspace).count() == RECENT_VISIT_LIMIT
+
+        # Revisiting an entity refreshes the row, a new entity pushes out the oldest
+        self.record(create_user, workspace, identifiers[0])
+        new_identifier = str(uuid.uuid4())
+        self.record(create_user, workspace, new_identifier)
+        flush_recent_visits()
+
+        persisted = set(
+            str(identifier)
+            for identifier in UserRecentVisit.objects.filter(user=create_user, workspace=workspace).values_list(
+                "entity_identifier", flat=True
+            )
+        )
+        assert len(persisted) == RECENT_VISIT_LIMIT
+        assert identifiers[0] in persisted
+        assert new_identifier in persisted
+        assert identifiers[1] not in persisted
+
+    @pytest.mark.django_db
+    def test_flush_without_visits_is_noop(self, create_user, workspace):
+        flush_recent_visits()
+        assert not UserRecentVisit.objects.filter(user=create_user).exists()
+
+    @pytest.mark.django_db
+    def test_deleted_entities_leave_the_buffer(self, create_user, workspace):
+        project = Project.objects.create(name="Test Project", identifier="TP", workspace=workspace)
+        deleted, kept = uuid.uuid4(), uuid.uuid4()
+        for identifier in (deleted, kept):
+            record_recent_visit(
+                entity_name="issue",
+                entity_identifier=identifier,
+                user_id=create_user.id,
+                project_id=project.id,
+                slug=workspace.slug,
+            )
+        flush_recent_visits()
+
+        # The flushed visit and the one awaiting the next flush are both removed
+        record_recent_visit(
+            entity_name="issue",
+            entity_identifier=deleted,
+            user_id=create_user.id,
+            project_id=project.id,
+            slug=workspace.slug,
+        )
+        delete_recent_visits(entity_name="issue", entity_identifier=deleted, project_id=project.id, slug=workspace.slug)
+        flush_recent_visits()
+
+        visits = get_recent_visits(workspace.slug, create_user.id)
+        assert [visit["entity_identifier"] for visit in visits] == [str(kept)]
+        assert list(UserRecentVisit.objects.values_list("entity_identifier", flat=True)) == [kept]
@@ -0,0 +1,144 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.cache import cache
+
+from plane.bgtasks.work_item_link_task import (
+    DEFAULT_FAVICON,
+    LINK_HEAD_MAX_BYTES,
+    crawl_work_item_link_title_and_favicon,
+    crawl_work_item_links,
+    get_cache_key,
+    normalize_link_url,
+)
+
+PAGE_HTML = (
+    b"<html><head><title> Example Page </title>"
+    b'<link rel="apple-touch-icon" href="/touch.png">'
+    b'<link rel="icon" href="/static/icon.png">'
+    b"</head><body>" + b"x" * 4096 + b"</body></html>"
+)
+
+
+def build_response(content, status_code=200, headers=None, chunk_size=1024):
+    response = MagicMock()
+    response.status_code = status_code
+    response.ok = status_code < 400
+    response.headers = headers or {}
+    response.encoding = "utf-8"
+    response.iter_content.side_effect = lambda size: (
+        content[start : start + chunk_size] for start in range(0, len(content), chunk_size)
+    )
+    return response
+
+
+@pytest.fixture
+def http_session():
+    session = MagicMock()
+    with patch("plane.bgtasks.work_item_link_task.get_http_session", return_value=session):
+        yield session
+
+
+@pytest.fixture(autouse=True)
+def clear_link_cache():
+    for url in ("https://example.com/page", "https://example.com/static/icon.png", "https://example.com/favicon.ico"):
+        cache.delete(get_cache_key("page", normalize_link_url(url)))
+        cache.delete(get_cache_key("favicon", normalize_link_url(url)))
+    yield
+
+
+@pytest.mark.unit
+class TestWorkItemLinkCrawler:
+    """Test the link title and favicon crawler"""
+
+    def respond(self, http_session, favicon_status=200):
+        def get(url, **kwargs):
+            if url.endswith(".png") or url.endswith(".ico"):
+                return build_response(b"\x89PNG", favicon_status, {"content-type": "image/png"})
+            return build_response(PAGE_HTML)
+
+        http_session.get.side_effect = get
+
+    def test_extracts_title_and_preferred_favicon(self, http_session):
+        self.respond(http_session)
+        result = crawl_work_item_link_title_and_favicon("https://example.com/page")
+
+        assert result["title"] == "Example Page"
+        assert result["favicon_url"] == "https://example.com/static/icon.png"
+        assert result["favicon"] == "data:image/png;base64,iVBORw=="
+
+    def test_results_are_cached(self, http_session):
+        self.respond(http_session)
+        crawl_work_item_link_title_and_favicon("https://example.com/page")
+        crawl_work_item_link_title_and_favicon("HTTPS://Example.com:443/page#section")
+
+        assert http_session.get.call_count == 2
+
+    def test_stops_reading_after_head(self, http_session):
+        content = PAGE_HTML + b"y" * LINK_HEAD_MAX_BYTES
+        consumed = []
+
+        def iter_content(size):
+            for start in range(0, len(content), 1024):
+                consumed.append(start)
+                yield content[start : start + 1024]
+
+        page = build_response(content)
+        page.iter_content.side_effect = iter_content
+        http_session.get.side_effect = [page, build_response(b"", 404)]
+        result = crawl_work_item_link_title_and_favicon("https://example.com/page")
+
+        assert result["title"] == "Example Page"
+        assert len(consumed) == PAGE_HTML.index(b"</head>") // 1024 + 1
+        page.close.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "content_type, head",
+        [
+            ("text/html", '<meta charset="utf-8"><title>Café déjà vu</title>'),
+            (
+                "text/html",
+                '<meta http-equiv="Content-Type" content="text/html; charset=utf-8"><title>Café déjà vu</title>',
+            ),
+            ("text/html; charset=UTF-8", "<title>Café déjà vu</title>"),
+            ("text/html", "<title>Café déjà vu</title>"),
+        ],
+    )
+    def test_title_uses_declared_charset(self, http_session, content_type, head):
+        page = build_response(
+            f"<html><head>{head}</head></html>".encode("utf-8"), headers={"content-type": content_type}
+        )
+        # requests defaults to ISO-8859-1 for text/html sent without a charset
+        page.encoding = "ISO-8859-1"
+        http_session.get.side_effect = [page, build_response(b"", 404)]
+        result = crawl_work_item_link_title_and_favicon("https://example.com/page")
+
+        assert result["title"] == "Café déjà vu"
+
+    def test_error_pages_are_not_used_as_title(self, http_session):
+        page = build_response(b"<html><head><title>404 Not Found</title></head></html>", 404)
+        http_session.get.side_effect = [page, build_response(b"", 404)]
+        result = crawl_work_item_link_title_and_favicon("https://example.com/page")
+
+        assert result["title"] is None
+        page.close.assert_called_once()
+
+    def test_missing_favicon_uses_default(self, http_session):
+        self.respond(http_session, favicon_status=404)
+        result = crawl_work_item_link_title_and_favicon("https://example.com/page")
+
+        assert result["favicon_url"] is None
+        assert result["favicon"] == f"data:image/svg+xml;base64,{DEFAULT_FAVICON}"
+
+    def test_private_addresses_are_rejected(self, http_session):
+        result = crawl_work_item_link_title_and_favicon("http://127.0.0.1/admin")
+
+        assert "error" in result
+        http_session.get.assert_not_called()
+
+    def test_batch_crawl_deduplicates_urls(self, http_session):
+        self.respond(http_session)
+        results = crawl_work_item_links(["https://example.com/page"] * 3)
+
+        assert list(results) == ["https://example.com/page"]
+        assert results["https://example.com/page"]["title"] == "Example Page"
@@ -13,6 +13,8 @@ Test Organization:
 - TestEdgeCases: Edge cases and error conditions
 """
 
+import time
+
 import pytest
 from unittest.mock import Mock, patch
 
@@ -417,3 +419,45 @@ class TestEdgeCases:
 
         assert result1 is None  # Both should return None safely
         assert result2 is None
+
+
+@pytest.mark.unit
+class TestReadYourWrites:
+    """Test pinning clients to the primary after their writes."""
+
+    def test_successful_write_sets_pin_cookie(self, middleware, post_request, settings):
+        """Test a successful write pins the client to the primary."""
+        settings.READ_YOUR_WRITES_WINDOW = 10
+        response = middleware(post_request)
+
+        cookie = response.cookies[middleware.PRIMARY_PIN_COOKIE]
+        assert cookie["max-age"] == 10
+        assert cookie["httponly"]
+
+    def test_failed_write_does_not_pin(self, middleware, post_request, mock_get_response):
+        """Test a failed write leaves replica routing alone."""
+        mock_get_response.return_value = HttpResponse(status=400)
+        response = middleware(post_request)
+
+        assert middleware.PRIMARY_PIN_COOKIE not in response.cookies
+
+    @patch("plane.middleware.db_routing.set_use_read_replica")
+    def test_pinned_read_uses_primary(self, mock_set, middleware, request_factory, mock_view_func):
+        """Test reads within the window go to the primary."""
+        request = request_factory.get("/api/test/")
+        request.COOKIES[middleware.PRIMARY_PIN_COOKIE] = str(int(time.time()) + 10)
+
+        middleware.process_view(request, mock_view_func, (), {})
+
+        mock_set.assert_called_once_with(False)
+
+    @pytest.mark.parametrize("value", [str(int(time.time()) - 10), "invalid"])
+    @patch("plane.middleware.db_routing.set_use_read_replica")
+    def test_expired_or_invalid_pin_uses_replica(self, mock_set, value, middleware, request_factory, mock_view_func):
+        """Test expired or tampered pins are ignored."""
+        request = request_factory.get("/api/test/")
+        request.COOKIES[middleware.PRIMARY_PIN_COOKIE] = value
+
+        middleware.process_view(request, mock_view_func, (), {})
+
+        mock_set.assert_called_once_with(True)
@@ -0,0 +1,86 @@
+import pytest
+from unittest.mock import patch
+
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from plane.db.models import User
+from plane.middleware.logger import RequestLoggerMiddleware
+from plane.utils.query_instrumentation import (
+    QueryInstrumentation,
+    get_sql_fingerprint,
+    instrument_queries,
+    normalize_sql,
+)
+
+
+@pytest.mark.unit
+class TestQueryInstrumentation:
+    """Test the per-request query instrumentation"""
+
+    def test_statements_differing_in_values_share_a_fingerprint(self):
+        assert normalize_sql("SELECT * FROM t WHERE id IN (%s, %s,  %s) AND name = 'a''b'") == (
+            "SELECT * FROM t WHERE id IN (...) AND name = ?"
+        )
+        assert get_sql_fingerprint("SELECT 1 FROM t WHERE id = 42") == get_sql_fingerprint(
+            "SELECT 1 FROM t WHERE id = %s"
+        )
+        assert get_sql_fingerprint("SELECT * FROM issue_2") != get_sql_fingerprint("SELECT * FROM issue_3")
+
+    @pytest.mark.django_db
+    def test_repeated_statements_are_reported(self, create_user):
+        instrumentation = QueryInstrumentation(repeat_threshold=3, slowest_limit=2)
+
+        with instrument_queries(instrumentation):
+            for _ in range(4):
+                User.objects.filter(pk=create_user.pk).first()
+            User.objects.count()
+
+        fields = instrumentation.get_log_fields()
+        assert fields["query_count"] == 5
+        assert fields["db_time_ms"] > 0
+        assert len(fields["slowest_queries"]) == 2
+        assert [item["count"] for item in fields["repeated_queries"]] == [4]
+
+        # Queries after the request are not recorded
+        User.objects.count()
+        assert instrumentation.query_count == 5
+
+    @pytest.mark.django_db
+    def test_request_log_contains_query_fields(self, settings, create_user):
+        settings.QUERY_REPEAT_THRESHOLD = 2
+
+        def view(request):
+            for _ in range(3):
+                User.objects.filter(pk=create_user.pk).exists()
+            return HttpResponse()
+
+        request = RequestFactory().get("/api/users/me/")
+        request.user = create_user
+        with patch("plane.middleware.logger.api_logger") as api_logger:
+            RequestLoggerMiddleware(view)(request)
+
+        extra = api_logger.info.call_args.kwargs["extra"]
+        assert extra["query_count"] == 3
+        assert extra["repeated_queries"][0]["count"] == 3
+        assert "query_plans" not in extra
+
+    @pytest.mark.django_db
+    def test_sampled_requests_explain_slow_selects(self, settings, create_user):
+        settings.QUERY_EXPLAIN_SAMPLE_RATE = 1
+        settings.QUERY_SLOW_THRESHOLD_MS = 0
+
+        def view(request):
+            User.objects.filter(pk=create_user.pk).exists()
+            return HttpResponse()
+
+        request = RequestFactory().get("/api/users/me/")
+        request.user = create_user
+        with patch("plane.middleware.logger.api_logger") as api_logger:
+            RequestLoggerMiddleware(view)(request)
+
+        plans = api_logger.info.call_args.kwargs["extra"]["query_plans"]
+        assert len(plans) == 1
+        assert "actual time" in plans[0]["plan"]
+        assert not connection.needs_rollback
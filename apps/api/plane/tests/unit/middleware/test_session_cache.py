@@ -0,0 +1,57 @@
+import pytest
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+from django.test import RequestFactory
+
+from plane.authentication.middleware.session import get_session_user
+from plane.db.models import Session
+from plane.db.models.session import SessionStore
+
+
+@pytest.mark.unit
+class TestSessionCache:
+    """Test the cached session store and the cached session user"""
+
+    @pytest.fixture
+    def session(self, create_user):
+        session = SessionStore()
+        session[SESSION_KEY] = str(create_user.id)
+        session[BACKEND_SESSION_KEY] = "django.contrib.auth.backends.ModelBackend"
+        session[HASH_SESSION_KEY] = create_user.get_session_auth_hash()
+        session["device_info"] = {"user_agent": "pytest"}
+        session.save()
+        return session
+
+    def get_request(self, session_key):
+        request = RequestFactory().get("/api/users/me/")
+        request.session = SessionStore(session_key)
+        return request
+
+    @pytest.mark.django_db
+    def test_sessions_are_read_from_the_cache(self, session, create_user, django_assert_num_queries):
+        stored = Session.objects.get(session_key=session.session_key)
+        assert len(session.session_key) == 128
+        assert stored.user_id == str(create_user.id)
+        assert stored.device_info == {"user_agent": "pytest"}
+
+        with django_assert_num_queries(0):
+            assert SessionStore(session.session_key)[SESSION_KEY] == str(create_user.id)
+
+        # Deleting the rows signs the sessions out of the cache too
+        Session.objects.filter(user_id=str(create_user.id)).delete()
+        assert SessionStore(session.session_key).get(SESSION_KEY) is None
+
+    @pytest.mark.django_db
+    def test_session_user_is_cached_until_updated(self, session, create_user, django_assert_num_queries):
+        assert get_session_user(self.get_request(session.session_key)) == create_user
+
+        with django_assert_num_queries(0):
+            assert get_session_user(self.get_request(session.session_key)) == create_user
+
+        create_user.first_name = "Updated"
+        create_user.save()
+        assert get_session_user(self.get_request(session.session_key)).first_name == "Updated"
+
+        # A changed password no longer matches the session hash
+        create_user.set_password("changed-password")
+        create_user.save()
+        assert not get_session_user(self.get_request(session.session_key)).is_authenticated
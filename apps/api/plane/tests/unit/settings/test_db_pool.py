@@ -0,0 +1,52 @@
+import copy
+
+import pytest
+from django.db import connection
+
+from plane.db.backends.postgresql.base import (
+    DatabaseWrapper,
+    close_connection_pools,
+    discard_connection_pools,
+    get_pool_stats,
+)
+
+
+@pytest.mark.unit
+class TestDatabasePool:
+    """Test the pooled PostgreSQL backend"""
+
+    @pytest.fixture
+    def pooled(self):
+        settings_dict = copy.deepcopy(connection.settings_dict)
+        settings_dict["ENGINE"] = "plane.db.backends.postgresql"
+        settings_dict["CONN_MAX_AGE"] = 0
+        settings_dict["OPTIONS"]["pool"] = {"min_size": 1, "max_size": 1, "timeout": 5}
+        wrapper = DatabaseWrapper(settings_dict, alias="pooled")
+        yield wrapper
+        wrapper.close()
+        close_connection_pools()
+
+    @pytest.mark.django_db
+    def test_connections_return_to_the_pool(self, pooled):
+        with pooled.cursor() as cursor:
+            cursor.execute("SELECT 1")
+            assert cursor.fetchone() == (1,)
+        first = pooled.connection
+        pooled.close()
+
+        # The next connect reuses the connection put back in the pool
+        pooled.ensure_connection()
+        assert pooled.connection is first
+        assert get_pool_stats()["pooled"]["pool_max"] == 1
+        pooled.close()
+
+    @pytest.mark.django_db
+    def test_forked_processes_open_their_own_pool(self, pooled):
+        pooled.ensure_connection()
+        inherited = pooled.pool
+        pooled.close()
+
+        discard_connection_pools()
+        assert "pooled" not in get_pool_stats()
+        assert pooled.pool is not inherited
+        inherited.close()
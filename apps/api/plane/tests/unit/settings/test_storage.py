@@ -0,0 +1,53 @@
+import pytest
+from unittest.mock import patch
+
+from plane.settings.storage import S3ClientRegistry, S3Storage
+
+
+@pytest.mark.unit
+class TestS3ClientRegistry:
+    """Test the process level S3 client registry"""
+
+    def test_same_configuration_reuses_client(self):
+        registry = S3ClientRegistry()
+        first = registry.get_client(aws_access_key_id="key", aws_secret_access_key="secret")
+        second = registry.get_client(aws_access_key_id="key", aws_secret_access_key="secret")
+        assert first is second
+
+    def test_distinct_endpoints_get_distinct_clients(self):
+        registry = S3ClientRegistry()
+        first = registry.get_client(endpoint_url="http://minio-a:9000")
+        second = registry.get_client(endpoint_url="http://minio-b:9000")
+        assert first is not second
+
+    def test_registry_is_bounded(self):
+        registry = S3ClientRegistry(max_size=2)
+        oldest = registry.get_client(endpoint_url="http://host-1")
+        registry.get_client(endpoint_url="http://host-2")
+        registry.get_client(endpoint_url="http://host-3")
+        assert registry.get_client(endpoint_url="http://host-1") is not oldest
+
+    def test_storage_instances_share_client(self):
+        assert S3Storage().s3_client is S3Storage().s3_client
+
+
+@pytest.mark.unit
+class TestS3StorageBatchOperations:
+    """Test the concurrent batch helpers of S3Storage"""
+
+    def test_copy_objects_preserves_order(self):
+        storage = S3Storage()
+        pairs = [(f"source-{i}", f"destination-{i}") for i in range(10)]
+        with patch.object(S3Storage, "copy_object", side_effect=lambda source, destination: destination):
+            assert storage.copy_objects(pairs) == [destination for _, destination in pairs]
+
+    def test_copy_objects_with_no_pairs(self):
+        with patch.object(S3Storage, "copy_object") as copy_object:
+            assert S3Storage().copy_objects([]) == []
+            copy_object.assert_not_called()
+
+    def test_get_objects_metadata_is_keyed_by_name(self):
+        storage = S3Storage()
+        with patch.object(S3Storage, "get_object_metadata", side_effect=lambda name: {"ETag": name}):
+            metadata = storage.get_objects_metadata(["a", "b"])
+        assert metadata == {"a": {"ETag": "a"}, "b": {"ETag": "b"}}
@@ -0,0 +1,104 @@
+import uuid
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+
+from plane.space.utils.board_cache import (
+    BOARD_SNAPSHOT_FRESH_TTL,
+    BOARD_SNAPSHOT_STALE_TTL,
+    bump_board_version,
+    get_board_snapshot_key,
+    serve_board_snapshot,
+)
+
+
+class BoardBuilder:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return Response({"results": [self.calls]})
+
+
+def build_request(query="group_by=state&priority=high", **headers):
+    return Request(APIRequestFactory().get(f"/api/public/anchor/boards/test/issues/?{query}", **headers))
+
+
+@pytest.mark.unit
+class TestBoardSnapshot:
+    """Test the published board snapshot cache"""
+
+    @pytest.fixture(autouse=True)
+    def board(self):
+        self.anchor = uuid.uuid4().hex
+        self.project_id = uuid.uuid4()
+        self.builder = BoardBuilder()
+
+    def serve(self, request=None, now=None):
+        with patch("plane.space.utils.board_cache.time.time", return_value=now or 1000.0):
+            return serve_board_snapshot(
+                request=request or build_request(),
+                anchor=self.anchor,
+                project_id=self.project_id,
+                build_response=self.builder,
+            )
+
+    def test_snapshot_is_reused_with_cache_headers(self):
+        first = self.serve()
+        second = self.serve()
+
+        assert self.builder.calls == 1
+        assert first["X-Board-Cache"] == "MISS"
+        assert second["X-Board-Cache"] == "HIT"
+        assert second.data == {"results": [1]}
+        assert second["ETag"] == first["ETag"]
+        assert "stale-while-revalidate" in second["Cache-Control"]
+
+    def test_filter_order_does_not_change_the_key(self):
+        first = build_request("group_by=state&priority=high").query_params
+        second = build_request("priority=high&group_by=state").query_params
+        assert get_board_snapshot_key(self.anchor, first) == get_board_snapshot_key(self.anchor, second)
+
+    def test_matching_etag_returns_not_modified(self):
+        etag = self.serve()["ETag"]
+        response = self.serve(build_request(HTTP_IF_NONE_MATCH=etag))
+
+        assert response.status_code == 304
+        assert response.data is None
+
+    def test_unchanged_project_is_revalidated_without_rebuild(self):
+        self.serve()
+        response = self.serve(now=1000.0 + BOARD_SNAPSHOT_FRESH_TTL + 1)
+
+        assert response["X-Board-Cache"] == "REVALIDATED"
+        assert self.builder.calls == 1
+
+    def test_issue_change_rebuilds_the_snapshot(self):
+        self.serve()
+        bump_board_version(self.project_id)
+        response = self.serve(now=1000.0 + BOARD_SNAPSHOT_FRESH_TTL + 1)
+
+        assert response["X-Board-Cache"] == "MISS"
+        assert response.data == {"results": [2]}
+
+    def test_stale_snapshot_is_served_while_rebuilding(self):
+        self.serve()
+        bump_board_version(self.project_id)
+        later = 1000.0 + BOARD_SNAPSHOT_FRESH_TTL + 1
+
+        # Simulate a concurrent request holding the rebuild lock
+        key = get_board_snapshot_key(self.anchor, build_request().query_params)
+        cache.add(f"{key}:lock", 1, BOARD_SNAPSHOT_STALE_TTL)
+        try:
+            response = self.serve(now=later)
+        finally:
+            cache.delete(f"{key}:lock")
+
+        assert response["X-Board-Cache"] == "STALE"
+        assert response.data == {"results": [1]}
+        assert self.builder.calls == 1
@@ -0,0 +1,235 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from pymongo.errors import ServerSelectionTimeoutError
+
+from plane.bgtasks.cleanup_task import archive_issue_activities
+from plane.db.models import Issue, IssueActivity, Project, ProjectMember, State
+from plane.utils.activity_archive import (
+    ARCHIVE_FIELDS,
+    TieredActivityPaginator,
+    get_archive_filter,
+    to_document,
+)
+from plane.utils.paginator import Cursor
+
+
+class FakeCursor:
+    def __init__(self, documents):
+        self.documents = documents
+
+    def sort(self, keys):
+        for key, direction in reversed(keys):
+            self.documents.sort(key=lambda document: document[key], reverse=direction < 0)
+        return self
+
+    def skip(self, count):
+        self.documents = self.documents[count:]
+        return self
+
+    def limit(self, count):
+        self.documents = self.documents[:count]
+        return self
+
+    def __iter__(self):
+        return iter(self.documents)
+
+
+class FakeCollection:
+    """The subset of a Mongo collection read and written by the archive"""
+
+    def __init__(self):
+        self.documents = {}
+
+    def matches(self, document, archive_filter):
+        for field, condition in archive_filter.items():
+            if field == "$and":
+                if not all(self.matches(document, clause) for clause in condition):
+                    return False
+                continue
+            if field == "$or":
+                if not any(self.matches(document, clause) for clause in condition):
+                    return False
+                continue
+            value = document.get(field)
+            if isinstance(condition, dict):
+                if "$in" in condition and value not in condition["$in"]:
+                    return False
+                if "$nin" in condition and value in condition["$nin"]:
+                    return False
+                if "$gt" in condition and not value > condition["$gt"]:
+                    return False
+                if "$lt" in condition and not value < condition["$lt"]:
+                    return False
+            elif value != condition:
+                return False
+        return True
+
+    def find(self, archive_filter):
+        return FakeCursor([doc for doc in self.documents.values() if self.matches(doc, archive_filter)])
+
+    def count_documents(self, archive_filter):
+        return len(self.find(archive_filter).documents)
+
+    def insert_many(self, documents, ordered=True):
+        for document in documents:
+            self.documents[document["_id"]] = document
+
+
+@pytest.mark.unit
+class TestActivityArchive:
+    """Test the archive of the issue activities and the pages across both tiers"""
+
+    @pytest.fixture
+    def issue(self, create_user, workspace):
+        project = Project.objects.create(name="Test Project", identifier="TP", workspace=workspace)
+        ProjectMember.objects.create(project=project, member=create_user, role=20)
+        State.objects.create(name="Backlog", group="backlog", project=project, default=True)
+        return Issue.objects.create(name="Issue", project=project)
+
+    @pytest.fixture
+    def archive(self, mocker):
+        collection = FakeCollection()
+        mocker.patch("plane.utils.activity_archive.get_archive_collection", return_value=collection)
+        mocker.patch("plane.bgtasks.cleanup_task.get_mongo_collection", return_value=collection)
+        mocker.patch("plane.bgtasks.cleanup_task.ensure_archive_collection")
+        return collection
+
+    def create_activities(self, issue, user, days_ago):
+        now = timezone.now()
+        for days in days_ago:
+            activity = IssueActivity.objects.create(
+                issue=issue, project=issue.project, actor=user, verb="updated", comment=f"{days} days ago"
+            )
+            # created_at is set on insert
+            IssueActivity.objects.filter(pk=activity.pk).update(created_at=now - timedelta(days=days))
+
+    def archive_activities(self, archive, issue, user, days_ago):
+        for days in days_ago:
+            record = dict.fromkeys(ARCHIVE_FIELDS)
+            record.update(
+                id=f"00000000-0000-0000-0000-{days:012d}",
+                created_at=timezone.now() - timedelta(days=days),
+                workspace_id=issue.workspace_id,
+                project_id=issue.project_id,
+                issue_id=issue.id,
+                actor_id=user.id,
+                verb="updated",
+                comment=f"{days} days ago",
+                attachments=[],
+            )
+            document = to_document(record)
+            archive.documents[document["_id"]] = document
+
+    def get_pages(self, queryset, archive_filter, order_by, limit=3):
+        paginator = TieredActivityPaginator(queryset=queryset, order_by=order_by, archive_filter=archive_filter)
+        pages, page = [], 0
+        while True:
+            result = paginator.get_result(limit=limit, cursor=Cursor(limit, page, False))
+            pages.append([activity.comment for activity in result.results])
+            if not result.next.has_results:
+                return pages, result.hits
+            page += 1
+
+    @pytest.mark.django_db(transaction=True)
+    def test_archive_moves_old_activities(self, issue, create_user, archive):
+        self.create_activities(issue, create_user, [1, 200, 300])
+
+        archive_issue_activities()
+
+        assert list(IssueActivity.objects.values_list("comment", flat=True)) == ["1 days ago"]
+        assert sorted(document["comment"] for document in archive.documents.values()) == [
+            "200 days ago",
+            "300 days ago",
+        ]
+
+    @pytest.mark.django_db
+    def test_archive_keeps_activities_without_mongo(self, issue, create_user, mocker):
+        mocker.patch("plane.bgtasks.cleanup_task.get_mongo_collection", return_value=None)
+        self.create_activities(issue, create_user, [300])
+
+        archive_issue_activities()
+
+        assert IssueActivity.objects.count() == 1
+
+    @pytest.mark.django_db
+    def test_pages_span_both_tiers(self, issue, create_user, archive):
+        self.create_activities(issue, create_user, [1, 2, 3])
+        self.archive_activities(archive, issue, create_user, [200, 201, 202, 203])
+
+        queryset = IssueActivity.objects.filter(issue=issue)
+        archive_filter = get_archive_filter(issue_id=issue.id)
+
+        pages, hits = self.get_pages(queryset, archive_filter, "-created_at")
+        assert hits == 7
+        assert pages == [
+            ["1 days ago", "2 days ago", "3 days ago"],
+            ["200 days ago", "201 days ago", "202 days ago"],
+            ["203 days ago"],
+        ]
+
+        pages, hits = self.get_pages(queryset, archive_filter, "created_at", limit=5)
+        assert pages == [
+            ["203 days ago", "202 days ago", "201 days ago", "200 days ago", "3 days ago"],
+            ["2 days ago", "1 days ago"],
+        ]
+
+        # The archived activities are read with their relations
+        paginator = TieredActivityPaginator(queryset=queryset, order_by="created_at", archive_filter=archive_filter)
+        assert paginator.get_result(limit=1).results[0].issue == issue
+
+        # Without an archive only the hot rows are paged
+        pages, hits = self.get_pages(queryset, None, "-created_at")
+        assert hits == 3
+        assert pages == [["1 days ago", "2 days ago", "3 days ago"]]
+
+    @pytest.mark.django_db
+    def test_activities_in_both_tiers_are_read_once(self, issue, create_user, archive):
+        # An archive run interrupted before its delete leaves the batch in both tiers
+        self.create_activities(issue, create_user, [200, 2, 1])
+        self.archive_activities(archive, issue, create_user, [300])
+        for activity in IssueActivity.objects.filter(comment__in=["200 days ago", "2 days ago"]):
+            document = to_document({field: getattr(activity, field) for field in ARCHIVE_FIELDS})
+            archive.documents[document["_id"]] = document
+
+        queryset = IssueActivity.objects.filter(issue=issue)
+        pages, hits = self.get_pages(queryset, get_archive_filter(issue_id=issue.id), "created_at")
+
+        assert hits == 4
+        assert pages == [["300 days ago", "200 days ago", "2 days ago"], ["1 days ago"]]
+
+    @pytest.mark.django_db
+    def test_history_filters_archive_by_date(self, session_client, issue, create_user, archive, mocker):
+        mocker.patch("plane.app.views.issue.activity.get_archive_collection", return_value=archive)
+        self.create_activities(issue, create_user, [1])
+        self.archive_activities(archive, issue, create_user, [200])
+        url = f"/api/workspaces/{issue.workspace.slug}/projects/{issue.project_id}/issues/{issue.id}/history/"
+
+        def get_comments(created_after):
+            response = session_client.get(url, {"activity_type": "issue-property", "created_at__gt": created_after})
+            assert response.status_code == 200
+            return [activity["comment"] for activity in response.data]
+
+        # Date-only values filter both tiers from their midnight
+        assert get_comments((timezone.now() - timedelta(days=300)).date().isoformat()) == [
+            "200 days ago",
+            "1 days ago",
+        ]
+        assert get_comments((timezone.now() - timedelta(days=100)).date().isoformat()) == ["1 days ago"]
+        assert get_comments((timezone.now() - timedelta(days=300)).isoformat()) == ["200 days ago", "1 days ago"]
+
+        response = session_client.get(url, {"activity_type": "issue-property", "created_at__gt": "yesterday"})
+        assert response.status_code == 400
+
+    @pytest.mark.django_db
+    def test_history_serves_postgres_when_archive_fails(self, session_client, issue, create_user, archive, mocker):
+        mocker.patch("plane.app.views.issue.activity.get_archive_collection", return_value=archive)
+        archive.find = mocker.Mock(side_effect=ServerSelectionTimeoutError("no servers"))
+        self.create_activities(issue, create_user, [1])
+        url = f"/api/workspaces/{issue.workspace.slug}/projects/{issue.project_id}/issues/{issue.id}/history/"
+
+        response = session_client.get(url, {"activity_type": "issue-property"})
+
+        assert response.status_code == 200
+        assert [activity["comment"] for activity in response.data] == ["1 days ago"]
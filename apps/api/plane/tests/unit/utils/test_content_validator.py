@@ -0,0 +1,69 @@
+import pytest
+
+from plane.utils.content_validator import (
+    MAX_SIZE,
+    _compute_html_sanitization_diff,
+    validate_html_content,
+)
+
+
+@pytest.mark.unit
+class TestComputeHtmlSanitizationDiff:
+    """Test the single-pass sanitization diff"""
+
+    def test_unchanged_content_reports_nothing(self):
+        """Identical input and output short-circuit without parsing"""
+        html = "<p>hello</p>"
+        assert _compute_html_sanitization_diff(html, html) == {
+            "removed_tags": {},
+            "removed_attributes": {},
+        }
+
+    def test_disallowed_tags_are_counted(self):
+        """Tags outside the allowlist are reported with their counts"""
+        html = "<p>a</p><script>alert(1)</script><iframe></iframe><script></script>"
+        diff = _compute_html_sanitization_diff(html, "<p>a</p>")
+        assert diff["removed_tags"] == {"script": 2, "iframe": 1}
+
+    def test_disallowed_attributes_are_reported(self):
+        """Attributes outside the allowlist are reported per tag"""
+        html = '<p class="x" onclick="evil()" onmouseover="evil()">a</p>'
+        diff = _compute_html_sanitization_diff(html, '<p class="x">a</p>')
+        assert diff["removed_tags"] == {}
+        assert diff["removed_attributes"] == {"p": ["onclick", "onmouseover"]}
+
+    def test_unsafe_url_schemes_are_reported(self):
+        """URL attributes with schemes outside SAFE_PROTOCOLS are reported"""
+        html = '<a href="javascript:alert(1)">a</a><a href="/relative">b</a>'
+        diff = _compute_html_sanitization_diff(html, "<a>a</a>")
+        assert diff["removed_attributes"] == {"a": ["href"]}
+
+    def test_editor_components_are_allowed(self):
+        """Custom editor nodes keep their known attributes"""
+        html = '<mention-component id="1" entity_identifier="2" entity_name="user_mention"></mention-component>'
+        diff = _compute_html_sanitization_diff(html, html.replace('"1"', "'1'"))
+        assert diff == {"removed_tags": {}, "removed_attributes": {}}
+
+
+@pytest.mark.unit
+class TestValidateHtmlContent:
+    """Test validate_html_content"""
+
+    def test_empty_content(self):
+        assert validate_html_content("") == (True, None, None)
+
+    def test_content_is_sanitized(self):
+        is_valid, error, clean_html = validate_html_content("<p>a<script>x</script></p>")
+        assert is_valid is True
+        assert error is None
+        assert "script" not in clean_html
+
+    def test_oversized_content_is_rejected(self):
+        is_valid, error, clean_html = validate_html_content("a" * (MAX_SIZE + 1))
+        assert is_valid is False
+        assert clean_html is None
+
+    def test_multibyte_content_size_is_measured_in_bytes(self):
+        # Fewer characters than MAX_SIZE but more bytes once encoded
+        is_valid, _, _ = validate_html_content("é" * (MAX_SIZE // 2 + 1))
+        assert is_valid is False
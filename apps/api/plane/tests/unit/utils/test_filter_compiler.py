@@ -0,0 +1,89 @@
+import json
+from uuid import uuid4
+
+import pytest
+
+from plane.db.models import Issue, IssueView, Project, ProjectMember, State, WorkspaceMember
+from plane.utils.filters import IssueFilterSet
+from plane.utils.filters.compiler import (
+    clear_compiled_filters,
+    compile_filter_tree,
+    get_filter_signature,
+    get_index_requirements,
+    normalize_legacy_filters,
+    normalize_rich_filters,
+)
+
+
+@pytest.mark.unit
+class TestFilterCompiler:
+    """Test the compiled issue filters"""
+
+    def test_equivalent_filters_share_a_signature(self):
+        state_ids = [str(uuid4()), str(uuid4())]
+        project_id = str(uuid4())
+
+        first = normalize_rich_filters(
+            {
+                "and": [
+                    {"priority__in": ["high", "low"]},
+                    {"and": [{"state_id__in": state_ids}]},
+                    {"project_id": project_id},
+                ]
+            }
+        )
+        second = normalize_rich_filters(
+            {"AND": [{"project_id": project_id, "state_id__in": state_ids[::-1]}, {"priority__in": ["low", "high"]}]}
+        )
+
+        assert first == second
+        assert get_filter_signature(first) == get_filter_signature(second)
+        # The indexed equality comes first, the choice field last
+        assert [node[1] for node in first[1]] == ["project_id", "state_id__in", "priority__in"]
+        assert normalize_rich_filters({"not": {"not": {"priority": "high"}}}) == ["filter", "priority", "high"]
+
+    def test_legacy_filters_are_ordered_by_selectivity(self):
+        tree = normalize_legacy_filters(
+            {"target_date__gte": "2025-01-01", "labels__in": ["b", "a"], "state__in": ["s"], "project__in": ["p"]}
+        )
+
+        assert [node[1] for node in tree[1]] == ["project__in", "state__in", "labels__in", "target_date__gte"]
+        assert tree[1][2][2] == ["a", "b"]
+        assert ("db.IssueLabel", ("label_id",)) in get_index_requirements(tree)
+
+    def test_compiled_filters_are_cached(self):
+        clear_compiled_filters()
+        tree = normalize_rich_filters({"priority__in": ["high"], "state_group": "started"})
+
+        compiled_q = compile_filter_tree(tree, filterset_class=IssueFilterSet)
+
+        assert compile_filter_tree(tree, filterset_class=IssueFilterSet) is compiled_q
+        assert compile_filter_tree(None, filterset_class=IssueFilterSet) is None
+
+    @pytest.mark.django_db
+    def test_saved_view_filters_are_stored_compiled(self, session_client, workspace, create_user):
+        WorkspaceMember.objects.get_or_create(workspace=workspace, member=create_user, defaults={"role": 20})
+        project = Project.objects.create(name="Test Project", identifier="TP", workspace=workspace)
+        ProjectMember.objects.create(project=project, member=create_user, role=20)
+        started = State.objects.create(name="Started", group="started", project=project)
+        Issue.objects.create(name="A", project=project, state=started, priority="high")
+        Issue.objects.create(name="B", project=project, state=started, priority="low")
+
+        view = IssueView.objects.create(
+            name="High",
+            query={},
+            workspace=workspace,
+            owned_by=create_user,
+            rich_filters={"and": [{"priority": "high"}, {"state_group__in": ["started"]}]},
+        )
+        assert view.compiled_filters == normalize_rich_filters(view.rich_filters)
+        assert view.filter_signature == get_filter_signature(view.compiled_filters)
+
+        url = f"/api/workspaces/{workspace.slug}/issues/"
+        response = session_client.get(url, {"view_id": str(view.id)})
+        assert response.status_code == 200
+        assert [issue["name"] for issue in response.data["results"]] == ["A"]
+
+        # Rich filters from the request still apply on top of the view
+        response = session_client.get(url, {"view_id": str(view.id), "filters": json.dumps({"priority": "low"})})
+        assert response.data["results"] == []
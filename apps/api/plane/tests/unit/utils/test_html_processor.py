@@ -0,0 +1,101 @@
+import pytest
+
+from plane.utils.html_processor import (
+    _ExtractionCache,
+    extract_html_content,
+    extraction_cache,
+    get_content_hash,
+    strip_tags,
+)
+
+DESCRIPTION_HTML = (
+    '<p class="editor-paragraph-block">Hello &amp; welcome '
+    '<mention-component id="m1" entity_identifier="user-1" entity_name="user_mention">'
+    "</mention-component> and "
+    '<mention-component id="m2" entity_identifier="issue-1" entity_name="issue_mention">'
+    "</mention-component></p>"
+    '<image-component id="i1" src="asset-1" width="100"></image-component>'
+    '<img src="https://example.com/logo.png" alt="logo">'
+    "<p>second paragraph</p>"
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_extraction_cache():
+    extraction_cache.clear()
+    yield
+    extraction_cache.clear()
+
+
+@pytest.mark.unit
+class TestExtractHtmlContent:
+    """Test the single-pass HTML content extractor"""
+
+    def test_text_and_word_count(self):
+        content = extract_html_content(DESCRIPTION_HTML)
+        assert content.text == "Hello & welcome  and second paragraph"
+        assert content.word_count == 6
+
+    def test_mentions_only_include_user_mentions(self):
+        content = extract_html_content(DESCRIPTION_HTML)
+        assert content.mentions == ("user-1",)
+
+    def test_assets_are_grouped_by_tag(self):
+        content = extract_html_content(DESCRIPTION_HTML)
+        assert content.assets["image-component"] == ("asset-1",)
+        assert content.assets["img"] == ("https://example.com/logo.png",)
+
+    def test_components_keep_all_attributes(self):
+        content = extract_html_content(DESCRIPTION_HTML)
+        assert [m["id"] for m in content.components["mention-component"]] == ["m1", "m2"]
+        assert content.components["image-component"][0]["src"] == "asset-1"
+
+    def test_empty_content(self):
+        for value in ("", None):
+            content = extract_html_content(value)
+            assert content.text == ""
+            assert content.mentions == ()
+            assert content.assets == {}
+
+    def test_results_are_cached_by_content_hash(self):
+        first = extract_html_content(DESCRIPTION_HTML)
+        second = extract_html_content(DESCRIPTION_HTML)
+        assert first is second
+        assert first.content_hash == get_content_hash(DESCRIPTION_HTML)
+
+    def test_cache_can_be_bypassed(self):
+        first = extract_html_content(DESCRIPTION_HTML)
+        assert extract_html_content(DESCRIPTION_HTML, use_cache=False) is not first
+
+    def test_large_values_are_not_cached(self, mocker):
+        mocker.patch("plane.utils.html_processor.EXTRACTION_CACHE_MAX_ENTRY_BYTES", len(DESCRIPTION_HTML) - 1)
+        first = extract_html_content(DESCRIPTION_HTML)
+        assert extract_html_content(DESCRIPTION_HTML) is not first
+        assert extraction_cache.size == 0
+
+    def test_cache_is_bounded_by_size(self):
+        cache = _ExtractionCache(max_bytes=10)
+        cache.set("a", "first", 4)
+        cache.set("b", "second", 4)
+        cache.set("c", "third", 4)
+        # The least recently used entries are evicted until the sizes fit
+        assert cache.get("a") is None
+        assert (cache.get("b"), cache.get("c"), cache.size) == ("second", "third", 8)
+
+    def test_cached_results_are_read_only(self):
+        content = extract_html_content(DESCRIPTION_HTML)
+        with pytest.raises(TypeError):
+            content.assets["img"] = ()
+        with pytest.raises(TypeError):
+            content.components["mention-component"][0]["id"] = "changed"
+
+
+@pytest.mark.unit
+class TestStripTags:
+    """Test strip_tags"""
+
+    def test_strip_tags_keeps_text_and_entities(self):
+        assert strip_tags("<p>a &lt;b&gt;</p>\n<p>c</p>") == "a <b>\nc"
+
+    def test_strip_tags_keeps_trailing_text(self):
+        assert strip_tags("<p>a</p>tail") == "atail"
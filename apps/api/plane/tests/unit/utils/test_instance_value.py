@@ -0,0 +1,55 @@
+import pytest
+
+from plane.license.models import InstanceConfiguration
+from plane.license.utils.encryption import encrypt_data
+from plane.license.utils.instance_value import (
+    get_configuration_value,
+    invalidate_configuration_cache,
+)
+
+
+@pytest.mark.unit
+class TestInstanceConfigurationCache:
+    """Test the cached instance configuration lookups"""
+
+    @pytest.fixture(autouse=True)
+    def configuration(self, db, settings):
+        settings.SKIP_ENV_VAR = True
+        InstanceConfiguration.objects.create(key="EMAIL_HOST", value="smtp.example.com")
+        InstanceConfiguration.objects.create(key="EMAIL_HOST_PASSWORD", value=encrypt_data("secret"), is_encrypted=True)
+        invalidate_configuration_cache()
+        yield
+        invalidate_configuration_cache()
+
+    def test_values_are_decrypted_and_defaulted(self):
+        assert get_configuration_value(
+            [
+                {"key": "EMAIL_HOST"},
+                {"key": "EMAIL_HOST_PASSWORD"},
+                {"key": "MISSING", "default": "fallback"},
+            ]
+        ) == ("smtp.example.com", "secret", "fallback")
+
+    def test_repeated_lookups_do_not_query(self, django_assert_num_queries):
+        get_configuration_value([{"key": "EMAIL_HOST"}])
+
+        with django_assert_num_queries(0):
+            for _ in range(10):
+                assert get_configuration_value([{"key": "EMAIL_HOST"}]) == ("smtp.example.com",)
+
+    def test_invalidation_reloads_updated_values(self):
+        assert get_configuration_value([{"key": "EMAIL_HOST"}]) == ("smtp.example.com",)
+
+        InstanceConfiguration.objects.filter(key="EMAIL_HOST").update(value="smtp.changed.com")
+        assert get_configuration_value([{"key": "EMAIL_HOST"}]) == ("smtp.example.com",)
+
+        invalidate_configuration_cache()
+        assert get_configuration_value([{"key": "EMAIL_HOST"}]) == ("smtp.changed.com",)
+
+    def test_expired_copy_is_reused_when_version_is_unchanged(self, settings, django_assert_num_queries):
+        settings.INSTANCE_CONFIGURATION_CACHE_TTL = 0
+        get_configuration_value([{"key": "EMAIL_HOST"}])
+
+        # Only the shared version is checked, the database is not read again
+        with django_assert_num_queries(0):
+            assert get_configuration_value([{"key": "EMAIL_HOST"}]) == ("smtp.example.com",)
@@ -0,0 +1,74 @@
+import pytest
+
+from plane.bgtasks.issue_stats_task import repair_issue_counters
+from plane.db.models import (
+    Cycle,
+    CycleIssue,
+    FileAsset,
+    Issue,
+    IssueCounter,
+    IssueLink,
+    Project,
+    ProjectMember,
+    State,
+)
+from plane.utils.issue_counters import get_issue_counter_annotations
+
+
+@pytest.mark.unit
+class TestIssueCounters:
+    """Test the precomputed issue counters and current cycle, refreshed once the writes commit"""
+
+    @pytest.fixture
+    def project(self, create_user, workspace):
+        project = Project.objects.create(name="Test Project", identifier="TP", workspace=workspace)
+        ProjectMember.objects.create(project=project, member=create_user, role=20)
+        State.objects.create(name="Backlog", group="backlog", project=project, default=True)
+        return project
+
+    def get_counters(self, issue):
+        return (
+            Issue.objects.filter(pk=issue.pk)
+            .annotate(**get_issue_counter_annotations())
+            .values_list("sub_issues_count", "link_count", "attachment_count", "cycle_id")
+            .get()
+        )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_counters_follow_changes(self, project, create_user):
+        parent = Issue.objects.create(name="Parent", project=project)
+        other = Issue.objects.create(name="Other", project=project)
+        # An issue without a row has no counts and no cycle
+        assert self.get_counters(parent) == (0, 0, 0, None)
+
+        children = [Issue.objects.create(name=f"Child {index}", project=project, parent=parent) for index in range(3)]
+        IssueLink.objects.create(issue=parent, project=project, url="https://plane.so")
+        FileAsset.objects.create(
+            issue=parent,
+            project=project,
+            workspace=project.workspace,
+            asset="attachment.png",
+            entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
+        )
+        cycle = Cycle.objects.create(name="Cycle", project=project, owned_by=create_user)
+        cycle_issue = CycleIssue.objects.create(cycle=cycle, issue=parent, project=project)
+        assert self.get_counters(parent) == (3, 1, 1, cycle.id)
+
+        # Moving, archiving and deleting sub issues update the old and new parents
+        children[0].parent = other
+        children[0].save()
+        children[1].archived_at = children[1].created_at.date()
+        children[1].save()
+        cycle_issue.delete()
+        assert self.get_counters(parent) == (1, 1, 1, None)
+        assert self.get_counters(other) == (1, 0, 0, None)
+
+    @pytest.mark.django_db(transaction=True)
+    def test_repair_corrects_drift(self, project):
+        parent = Issue.objects.create(name="Parent", project=project)
+        Issue.objects.create(name="Child", project=project, parent=parent)
+        IssueCounter.objects.filter(issue=parent).update(sub_issues_count=5, link_count=2)
+
+        repair_issue_counters()
+
+        assert self.get_counters(parent) == (1, 0, 0, None)
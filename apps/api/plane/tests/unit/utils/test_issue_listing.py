@@ -0,0 +1,76 @@
+import datetime
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from plane.db.models import Issue, Label, Project, ProjectMember, State
+from plane.utils.grouper import issue_group_values_batch
+
+
+@pytest.mark.unit
+class TestIssueListing:
+    """Test the shared issue listing queries"""
+
+    @pytest.fixture
+    def project(self, create_user, workspace):
+        project = Project.objects.create(name="Test Project", identifier="TP", workspace=workspace)
+        ProjectMember.objects.create(project=project, member=create_user, role=20)
+        return project
+
+    @pytest.fixture
+    def states(self, project):
+        return [
+            State.objects.create(name="Todo", group="unstarted", project=project, default=True),
+            State.objects.create(name="Backlog", group="backlog", project=project),
+        ]
+
+    @pytest.mark.django_db
+    def test_group_values_are_read_in_one_query(self, workspace, project, states, django_assert_num_queries):
+        labels = [Label.objects.create(name=f"Label {index}", project=project) for index in range(2)]
+
+        with django_assert_num_queries(1):
+            values = issue_group_values_batch(
+                fields=["state_id", "labels__id", "priority"], slug=workspace.slug, project_id=project.id
+            )
+
+        # Each group keeps the default ordering of its model
+        assert values["state_id"] == [states[0].id, states[1].id]
+        assert values["labels__id"] == [labels[1].id, labels[0].id, "None"]
+        assert values["priority"] == ["low", "medium", "high", "urgent", "none"]
+
+    @pytest.mark.django_db
+    def test_issue_derived_group_values(self, workspace, project, states):
+        Issue.objects.create(name="A", project=project, target_date=datetime.date(2025, 1, 1))
+        Issue.objects.create(name="B", project=project, target_date=datetime.date(2025, 1, 1))
+
+        values = issue_group_values_batch(
+            fields=["target_date"], slug=workspace.slug, queryset=Issue.issue_objects.filter(project=project)
+        )
+
+        assert values == {"target_date": [datetime.date(2025, 1, 1)]}
+
+    @pytest.mark.django_db
+    def test_sub_grouped_board(self, session_client, workspace, project, states):
+        for index in range(3):
+            Issue.objects.create(name=f"Todo {index}", project=project, state=states[0], priority="high")
+        Issue.objects.create(name="Backlog", project=project, state=states[1], priority="low")
+        url = f"/api/workspaces/{workspace.slug}/projects/{project.id}/issues/"
+
+        with CaptureQueriesContext(connection) as grouped:
+            response = session_client.get(url, {"group_by": "state_id", "sub_group_by": "priority"})
+
+        assert response.status_code == 200
+        assert response.data["total_count"] == 4
+        todo = response.data["results"][str(states[0].id)]
+        assert todo["total_results"] == 3
+        assert len(todo["results"]["high"]["results"]) == 3
+        assert response.data["results"][str(states[1].id)]["results"]["low"]["total_results"] == 1
+
+        # Looking up the label values does not add a query to the state lookup
+        with CaptureQueriesContext(connection) as labels:
+            session_client.get(url, {"group_by": "state_id", "sub_group_by": "labels__id"})
+        assert len(labels.captured_queries) == len(grouped.captured_queries)
+
+        response = session_client.get(url, {"group_by": "priority", "sub_group_by": "priority"})
+        assert response.status_code == 400
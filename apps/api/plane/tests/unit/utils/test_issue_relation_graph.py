@@ -0,0 +1,141 @@
+import datetime
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from plane.db.models import Cycle, CycleIssue, Issue, IssueRelation, Project, ProjectMember, State
+from plane.utils.issue_relation_graph import (
+    classify_relation_edges,
+    get_cycle_critical_path,
+    get_dependency_depths,
+    get_dependency_edges,
+)
+
+
+@pytest.mark.unit
+class TestIssueRelationGraph:
+    """Test the relation graph loader and dependency traversal"""
+
+    @pytest.fixture
+    def project(self, create_user, workspace):
+        project = Project.objects.create(name="Test Project", identifier="TP", workspace=workspace)
+        ProjectMember.objects.create(project=project, member=create_user, role=20)
+        State.objects.create(name="Todo", group="unstarted", project=project, default=True)
+        return project
+
+    def create_issues(self, project, count, **kwargs):
+        return [Issue.objects.create(name=f"Issue {index}", project=project, **kwargs) for index in range(count)]
+
+    def block(self, issue, blocker):
+        IssueRelation.objects.create(
+            issue=issue, related_issue=blocker, relation_type="blocked_by", project=issue.project
+        )
+
+    def test_classify_uses_inverse_for_incoming_edges(self):
+        me, a, b, c = "me", "a", "b", "c"
+        edges = [
+            (me, a, "blocked_by"),
+            (b, me, "blocked_by"),
+            (c, me, "start_before"),
+            (me, c, "relates_to"),
+            (b, me, "duplicate"),
+        ]
+
+        relations = classify_relation_edges(me, edges)
+
+        assert relations["blocked_by"] == [a]
+        assert relations["blocking"] == [b]
+        assert relations["start_after"] == [c]
+        assert relations["relates_to"] == [c]
+        assert relations["duplicate"] == [b]
+        assert relations["finish_before"] == []
+
+    @pytest.mark.django_db
+    def test_relation_list_query_count_is_constant(self, session_client, workspace, project):
+        issue, *others = self.create_issues(project, 7)
+        url = f"/api/workspaces/{workspace.slug}/projects/{project.id}/issues/{issue.id}/issue-relation/"
+
+        self.block(issue, others[0])
+        with CaptureQueriesContext(connection) as few:
+            response = session_client.get(url)
+        assert response.status_code == 200
+        assert [related["id"] for related in response.data["blocked_by"]] == [others[0].id]
+
+        for other in others[1:4]:
+            self.block(other, issue)
+        IssueRelation.objects.create(issue=issue, related_issue=others[4], relation_type="relates_to", project=project)
+        IssueRelation.objects.create(
+            issue=others[5], related_issue=issue, relation_type="finish_before", project=project
+        )
+        with CaptureQueriesContext(connection) as many:
+            response = session_client.get(url)
+
+        assert {related["id"] for related in response.data["blocking"]} == {other.id for other in others[1:4]}
+        assert response.data["relates_to"][0]["relation_type"] == "relates_to"
+        assert response.data["finish_after"][0]["id"] == others[5].id
+        assert len(many.captured_queries) == len(few.captured_queries)
+
+    @pytest.mark.django_db
+    def test_dependency_chain_handles_circular_relations(self, workspace, project):
+        a, b, c, d = self.create_issues(project, 4)
+        self.block(a, b)
+        self.block(b, c)
+        self.block(c, a)
+        self.block(c, d)
+
+        edges = get_dependency_edges(workspace.id, [a.id])
+        assert set(edges) == {(a.id, b.id), (b.id, c.id), (c.id, a.id), (c.id, d.id)}
+        assert get_dependency_depths([a.id], edges) == {a.id: 0, b.id: 1, c.id: 2, d.id: 3}
+
+        blocked = get_dependency_edges(workspace.id, [d.id], direction="blocking")
+        assert get_dependency_depths([d.id], blocked, direction="blocking")[a.id] == 3
+
+    @pytest.mark.django_db
+    def test_cycle_critical_path(self, create_user, project):
+        cycle = Cycle.objects.create(name="Cycle", project=project, owned_by=create_user)
+        start = datetime.date(2025, 1, 1)
+        design, build, review, docs = [
+            Issue.objects.create(
+                name=name,
+                project=project,
+                start_date=start,
+                target_date=start + datetime.timedelta(days=days - 1),
+            )
+            for name, days in [("design", 2), ("build", 5), ("review", 1), ("docs", 3)]
+        ]
+        for issue in [design, build, review, docs]:
+            CycleIssue.objects.create(cycle=cycle, issue=issue, project=project)
+        self.block(build, design)
+        self.block(review, build)
+        self.block(review, docs)
+
+        path, duration = get_cycle_critical_path(cycle.id)
+
+        assert path == [design.id, build.id, review.id]
+        assert duration == 8
+
+    @pytest.mark.django_db
+    def test_dependencies_only_return_visible_issues(self, session_client, create_user, workspace, project):
+        private = Project.objects.create(name="Private Project", identifier="PP", workspace=workspace)
+        State.objects.create(name="Todo", group="unstarted", project=private, default=True)
+        (issue,) = self.create_issues(project, 1)
+        blocker, other = self.create_issues(private, 2)
+        self.block(issue, blocker)
+        url = f"/api/workspaces/{workspace.slug}/projects/{project.id}/issue-dependencies/"
+
+        response = session_client.get(url, {"issues": f"{issue.id},{other.id}"})
+
+        # The blocker and the seed of the project the user is not a member of are left out
+        assert response.status_code == 200
+        assert [item["id"] for item in response.data["issues"]] == [issue.id]
+        assert response.data["edges"] == []
+
+        # Guests only see their own issues unless the project shares all its features
+        ProjectMember.objects.filter(project=project, member=create_user).update(role=5)
+        response = session_client.get(url, {"issues": str(issue.id)})
+        assert response.data["issues"] == []
+
+        Project.objects.filter(pk=project.id).update(guest_view_all_features=True)
+        response = session_client.get(url, {"issues": str(issue.id)})
+        assert [item["id"] for item in response.data["issues"]] == [issue.id]
@@ -0,0 +1,132 @@
+import pytest
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from plane.db.models import (
+    Cycle,
+    CycleIssue,
+    CycleStats,
+    Issue,
+    IssueAssignee,
+    Module,
+    ModuleIssue,
+    ModuleStats,
+    Project,
+    ProjectMember,
+    State,
+)
+from plane.bgtasks.issue_stats_task import repair_issue_stats
+from plane.utils.issue_stats import refresh_module_stats
+
+
+@pytest.mark.unit
+class TestIssueStats:
+    """Test the precomputed module and cycle stats, refreshed once the writes commit"""
+
+    @pytest.fixture
+    def project(self, create_user, workspace):
+        project = Project.objects.create(name="Test Project", identifier="TP", workspace=workspace)
+        ProjectMember.objects.create(project=project, member=create_user, role=20)
+        return project
+
+    @pytest.fixture
+    def states(self, project):
+        return {
+            group: State.objects.create(name=group.title(), group=group, project=project)
+            for group in ["backlog", "started", "completed"]
+        }
+
+    def create_issues(self, project, state, count):
+        return [Issue.objects.create(name=f"Issue {index}", project=project, state=state) for index in range(count)]
+
+    def add_to_module(self, module, issues):
+        for issue in issues:
+            ModuleIssue.objects.create(module=module, issue=issue, project=module.project)
+
+    @pytest.mark.django_db(transaction=True)
+    def test_module_stats_follow_issue_changes(self, project, states):
+        module = Module.objects.create(name="Module", project=project)
+        backlog = self.create_issues(project, states["backlog"], 3)
+        self.add_to_module(module, backlog)
+
+        stats = ModuleStats.objects.get(module=module)
+        assert (stats.total_issues, stats.backlog_issues, stats.completed_issues) == (3, 3, 0)
+
+        backlog[0].state = states["completed"]
+        backlog[0].save()
+        stats.refresh_from_db()
+        assert (stats.total_issues, stats.backlog_issues, stats.completed_issues) == (3, 2, 1)
+
+        backlog[1].delete()
+        stats.refresh_from_db()
+        assert (stats.total_issues, stats.backlog_issues) == (2, 1)
+
+    @pytest.mark.django_db(transaction=True)
+    def test_stats_refresh_after_commit(self, project, states):
+        module = Module.objects.create(name="Module", project=project)
+        issues = self.create_issues(project, states["backlog"], 2)
+
+        with transaction.atomic():
+            self.add_to_module(module, issues)
+            # The refresh waits for the issues to be visible to every transaction
+            assert not ModuleStats.objects.filter(module=module, total_issues=2).exists()
+        assert ModuleStats.objects.get(module=module).total_issues == 2
+
+    @pytest.mark.django_db(transaction=True)
+    def test_unrelated_issue_saves_skip_refresh(self, project, states):
+        module = Module.objects.create(name="Module", project=project)
+        issue = self.create_issues(project, states["backlog"], 1)[0]
+        self.add_to_module(module, [issue])
+
+        issue = Issue.objects.get(pk=issue.pk)
+        issue.name = "Renamed"
+        with CaptureQueriesContext(connection) as context:
+            issue.save()
+        assert not any("module_stats" in query["sql"] for query in context.captured_queries)
+
+    @pytest.mark.django_db(transaction=True)
+    def test_cycle_stats_and_assignees(self, create_user, project, states):
+        cycle = Cycle.objects.create(name="Cycle", project=project, owned_by=create_user)
+        issues = self.create_issues(project, states["started"], 2)
+        for issue in issues:
+            CycleIssue.objects.create(cycle=cycle, issue=issue, project=project)
+        IssueAssignee.objects.create(issue=issues[0], assignee=create_user, project=project)
+
+        stats = CycleStats.objects.get(cycle=cycle)
+        assert (stats.total_issues, stats.started_issues) == (2, 2)
+        assert stats.assignee_ids == [create_user.id]
+
+    @pytest.mark.django_db(transaction=True)
+    def test_repair_recomputes_drifted_rows(self, project, states):
+        module = Module.objects.create(name="Module", project=project)
+        self.add_to_module(module, self.create_issues(project, states["backlog"], 2))
+        ModuleStats.objects.filter(module=module).update(total_issues=42)
+
+        repair_issue_stats()
+
+        assert ModuleStats.objects.get(module=module).total_issues == 2
+
+    @pytest.mark.django_db(transaction=True)
+    def test_module_list_query_count_is_constant(self, session_client, workspace, project, states):
+        url = f"/api/workspaces/{workspace.slug}/projects/{project.id}/modules/"
+
+        def create_modules(count):
+            modules = [
+                Module.objects.create(name=f"Module {Module.objects.count()}", project=project) for _ in range(count)
+            ]
+            for module in modules:
+                self.add_to_module(module, self.create_issues(project, states["started"], 2))
+            refresh_module_stats([module.id for module in modules])
+
+        create_modules(2)
+        with CaptureQueriesContext(connection) as few:
+            response = session_client.get(url)
+        assert response.status_code == 200
+
+        create_modules(20)
+        with CaptureQueriesContext(connection) as many:
+            response = session_client.get(url)
+        assert response.status_code == 200
+        assert len(response.data) == 22
+        assert all(module["total_issues"] == 2 for module in response.data)
+        assert len(many.captured_queries) == len(few.captured_queries)
@@ -0,0 +1,63 @@
+from types import SimpleNamespace
+
+import pytest
+
+from plane.db.models import Issue, IssueAssignee, Workspace
+from plane.utils.benchmark import compare_results, percentile, run_benchmarks
+from plane.utils.load_generator import LoadGenerator, LoadProfile, distribute, zipf_weights
+
+
+def get_issue_rows(seed, profile):
+    generator = LoadGenerator(seed, profile)
+    workspace = Workspace(id=generator.uuid(), slug="load")
+    owner = SimpleNamespace(id=generator.uuid())
+    project = generator.build_projects(workspace, owner)[0]
+    context = {
+        "states": generator.build_states(workspace, project, owner),
+        "labels": [generator.uuid() for _ in range(profile.labels)],
+        "cycles": [generator.uuid() for _ in range(profile.cycles)],
+        "modules": [generator.uuid() for _ in range(profile.modules)],
+        "members": [owner.id] + [generator.uuid() for _ in range(profile.members)],
+    }
+    return [
+        [(issue.id, issue.name, issue.parent_id, issue.state_id) for issue in rows[Issue]]
+        + [(row.issue_id, row.assignee_id) for row in rows[IssueAssignee]]
+        for rows in generator.iter_issue_batches(workspace, project, owner, profile.issues, context)
+    ]
+
+
+@pytest.mark.unit
+class TestLoadGenerator:
+    """Test the seeded load generator and the benchmark harness"""
+
+    def test_same_seed_generates_the_same_issues(self):
+        profile = LoadProfile(issues=300, batch_size=100, labels=10, cycles=2, modules=3, members=5)
+
+        batches = get_issue_rows(7, profile)
+        assert len(batches) == 3
+        assert batches == get_issue_rows(7, profile)
+        assert batches != get_issue_rows(8, profile)
+
+    def test_skew_helpers(self):
+        counts = distribute(1000, zipf_weights(4, 1.0))
+        assert sum(counts) == 1000
+        assert counts == sorted(counts, reverse=True)
+        assert percentile([1, 2, 3, 4], 50) == 2.5
+
+        baseline = {"issues": {"p95": 10.0, "queries": 5}}
+        assert compare_results({"issues": {"p95": 11.0, "queries": 5}}, baseline) == []
+        assert len(compare_results({"issues": {"p95": 13.0, "queries": 6}}, baseline)) == 2
+
+    @pytest.mark.django_db
+    def test_generated_workspace_serves_every_scenario(self, create_user):
+        profile = LoadProfile(projects=2, issues=120, members=4, labels=8, cycles=2, modules=2, pages=2, max_depth=3)
+        workspace, counts = LoadGenerator(1, profile).generate("load-test", create_user)
+
+        issues = Issue.objects.filter(workspace=workspace)
+        assert counts["Issue"] == issues.count() == 120
+        assert issues.filter(parent__isnull=False).exists()
+        assert not issues.filter(parent__parent__parent__parent__isnull=False).exists()
+
+        results = run_benchmarks(workspace, create_user, iterations=1, warmup=0)
+        assert {"issues-sub-grouped", "search", "notifications", "export-csv"} <= set(results)
+        assert all(result["queries"] > 0 for result in results.values())
@@ -0,0 +1,133 @@
+import pytest
+from django.utils import timezone
+
+from plane.db.models import Notification
+from plane.utils.notification_counter import (
+    NOTIFICATION_COUNT_TTL,
+    RECONCILE_MIN_TTL,
+    get_notification_count_key,
+    get_redis_client,
+    get_unread_notification_counts,
+    increment_unread_notification_counts,
+    invalidate_unread_notification_counts,
+    is_unread_notification,
+    reconcile_unread_notification_counts,
+    update_unread_notification_count,
+)
+
+MENTION_SENDER = "in_app:issue_activities:mentioned"
+ACTIVITY_SENDER = "in_app:issue_activities:subscribed"
+
+
+@pytest.mark.unit
+class TestUnreadNotificationCounter:
+    """Test the Redis maintained unread notification counters"""
+
+    @pytest.fixture(autouse=True)
+    def clean_counter(self, create_user, workspace):
+        key = get_notification_count_key(workspace.slug, create_user.id)
+        get_redis_client().delete(key)
+        yield
+        get_redis_client().delete(key)
+
+    def create_notifications(self, user, workspace, sender, count=1):
+        notifications = Notification.objects.bulk_create(
+            [
+                Notification(workspace=workspace, receiver=user, sender=sender, entity_name="issue", title="title")
+                for _ in range(count)
+            ]
+        )
+        increment_unread_notification_counts(workspace.slug, notifications)
+        return notifications
+
+    @pytest.mark.django_db
+    def test_cold_counter_is_computed_once(self, create_user, workspace, django_assert_num_queries):
+        self.create_notifications(create_user, workspace, ACTIVITY_SENDER, count=3)
+        self.create_notifications(create_user, workspace, MENTION_SENDER)
+
+        with django_assert_num_queries(1):
+            counts = get_unread_notification_counts(workspace.slug, create_user.id)
+        assert counts == {"unread": 3, "mention": 1}
+
+        with django_assert_num_queries(0):
+            assert get_unread_notification_counts(workspace.slug, create_user.id) == counts
+
+    @pytest.mark.django_db
+    def test_created_notifications_increment_warm_counter(self, create_user, workspace):
+        get_unread_notification_counts(workspace.slug, create_user.id)
+        self.create_notifications(create_user, workspace, ACTIVITY_SENDER, count=2)
+        self.create_notifications(create_user, workspace, MENTION_SENDER)
+
+        assert get_unread_notification_counts(workspace.slug, create_user.id) == {"unread": 2, "mention": 1}
+
+    @pytest.mark.django_db
+    def test_state_changes_adjust_counter(self, create_user, workspace):
+        (notification,) = self.create_notifications(create_user, workspace, MENTION_SENDER)
+        get_unread_notification_counts(workspace.slug, create_user.id)
+
+        was_unread = is_unread_notification(notification)
+        notification.read_at = timezone.now()
+        notification.save()
+        update_unread_notification_count(workspace.slug, notification, was_unread)
+        assert get_unread_notification_counts(workspace.slug, create_user.id) == {"unread": 0, "mention": 0}
+
+        # Archiving an already read notification does not change the counter
+        was_unread = is_unread_notification(notification)
+        notification.archived_at = timezone.now()
+        update_unread_notification_count(workspace.slug, notification, was_unread)
+        assert get_unread_notification_counts(workspace.slug, create_user.id)["mention"] == 0
+
+        was_unread = is_unread_notification(notification)
+        notification.read_at = None
+        notification.archived_at = None
+        update_unread_notification_count(workspace.slug, notification, was_unread)
+        assert get_unread_notification_counts(workspace.slug, create_user.id)["mention"] == 1
+
+    @pytest.mark.django_db
+    def test_invalidate_and_reconcile(self, create_user, workspace):
+        self.create_notifications(create_user, workspace, ACTIVITY_SENDER, count=2)
+        get_unread_notification_counts(workspace.slug, create_user.id)
+
+        # Bulk updates bypass the counter until it is reconciled
+        Notification.objects.filter(receiver=create_user).update(read_at=timezone.now())
+        assert get_unread_notification_counts(workspace.slug, create_user.id)["unread"] == 2
+        reconcile_unread_notification_counts()
+        assert get_unread_notification_counts(workspace.slug, create_user.id)["unread"] == 0
+
+        Notification.objects.filter(receiver=create_user).update(read_at=None)
+        invalidate_unread_notification_counts(workspace.slug, create_user.id)
+        assert get_unread_notification_counts(workspace.slug, create_user.id)["unread"] == 2
+
+    @pytest.mark.django_db
+    def test_reconcile_keeps_the_expiry(self, create_user, workspace):
+        key = get_notification_count_key(workspace.slug, create_user.id)
+        self.create_notifications(create_user, workspace, ACTIVITY_SENDER)
+        get_unread_notification_counts(workspace.slug, create_user.id)
+        client = get_redis_client()
+        client.expire(key, RECONCILE_MIN_TTL * 2)
+
+        Notification.objects.filter(receiver=create_user).update(read_at=timezone.now())
+        reconcile_unread_notification_counts()
+
+        assert client.hget(key, "unread") == b"0"
+        assert RECONCILE_MIN_TTL < client.ttl(key) < NOTIFICATION_COUNT_TTL
+
+        # Counters about to expire are left to be recomputed on read
+        client.expire(key, RECONCILE_MIN_TTL - 1)
+        Notification.objects.filter(receiver=create_user).update(read_at=None)
+        reconcile_unread_notification_counts()
+        assert client.hget(key, "unread") == b"0"
+        assert client.ttl(key) < RECONCILE_MIN_TTL
+
+    @pytest.mark.django_db
+    def test_endpoint_serves_counter(self, session_client, create_user, workspace):
+        (notification,) = self.create_notifications(create_user, workspace, MENTION_SENDER)
+        url = f"/api/workspaces/{workspace.slug}/users/notifications/unread/"
+
+        response = session_client.get(url)
+        assert response.status_code == 200
+        assert response.data == {"total_unread_notifications_count": 0, "mention_unread_notifications_count": 1}
+
+        session_client.post(f"/api/workspaces/{workspace.slug}/users/notifications/{notification.id}/read/")
+        response = session_client.get(url)
+        assert response.data["mention_unread_notifications_count"] == 0
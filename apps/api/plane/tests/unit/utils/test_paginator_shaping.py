@@ -0,0 +1,84 @@
+from datetime import datetime
+
+import pytest
+import pytz
+from django.db.models import Q
+
+from plane.db.models import Issue
+from plane.utils.paginator import ColumnarResults, GroupedOffsetPaginator, SubGroupedOffsetPaginator
+
+COLUMNS = ["id", "name", "state_id", "labels__id", "assignees__id"]
+ROWS = [
+    (1, "first", "todo", "bug", "ann"),
+    (1, "first", "todo", "ui", "ann"),
+    (1, "first", "todo", "bug", "bob"),
+    (2, "second", "done", None, "bob"),
+    (3, "third", "todo", "ui", None),
+]
+
+
+@pytest.mark.unit
+class TestPaginatorShaping:
+    """Test the grouped paginators shaping the rows of a page in one pass"""
+
+    def test_group_by_m2m(self, mocker):
+        mocker.patch.object(
+            GroupedOffsetPaginator,
+            "_GroupedOffsetPaginator__get_total_dict",
+            return_value={"bug": 1, "ui": 2, "None": 1},
+        )
+        paginator = GroupedOffsetPaginator(
+            queryset=Issue.objects.none(),
+            group_by_field_name="labels__id",
+            group_by_fields=["bug", "ui", None],
+            count_filter=Q(),
+            order_by="-created_at",
+        )
+
+        result = paginator.process_results(ColumnarResults(COLUMNS, ROWS))
+
+        # Every issue is added once to each of its groups, in order of appearance
+        assert list(result) == ["bug", "ui", "None"]
+        assert [row["id"] for row in result["bug"]["results"]] == [1]
+        assert [row["id"] for row in result["ui"]["results"]] == [1, 3]
+        assert result["ui"]["total_results"] == 2
+        assert result["bug"]["results"][0]["label_ids"] == ["bug", "ui"]
+        assert result["None"]["results"][0]["label_ids"] == []
+        # The dicts of values() give the same response
+        assert paginator.process_results([dict(zip(COLUMNS, row)) for row in ROWS]) == result
+
+    def test_sub_group_by_m2m(self, mocker):
+        mocker.patch.object(
+            SubGroupedOffsetPaginator,
+            "_SubGroupedOffsetPaginator__get_total_dict",
+            return_value=({"todo": 2, "done": 1}, {"todo": {"ann": 1, "bob": 1}, "done": {"bob": 1}}),
+        )
+        paginator = SubGroupedOffsetPaginator(
+            queryset=Issue.objects.none(),
+            group_by_field_name="state_id",
+            sub_group_by_field_name="assignees__id",
+            group_by_fields=["todo", "done"],
+            sub_group_by_fields=["ann", "bob"],
+            count_filter=Q(),
+            order_by="-created_at",
+        )
+
+        result = paginator.process_results(ColumnarResults(COLUMNS, ROWS))
+
+        ann = result["todo"]["results"]["ann"]["results"]
+        assert [row["id"] for row in ann] == [1, 1]
+        assert ann[0]["assignee_ids"] == ["ann", "bob"]
+        assert [row["id"] for row in result["done"]["results"]["bob"]["results"]] == [2]
+        assert result["todo"]["results"]["bob"]["total_results"] == 1
+
+    def test_datetime_columns(self):
+        created_at = datetime(2025, 1, 1, 12, tzinfo=pytz.utc)
+        results = ColumnarResults(
+            ["id", "created_at", "updated_at"],
+            [(1, created_at, None)],
+            datetime_fields=["created_at", "updated_at"],
+            timezone="Asia/Kolkata",
+        )
+
+        assert results.to_dicts() == [{"id": 1, "created_at": created_at, "updated_at": None}]
+        assert results.to_dicts()[0]["created_at"].utcoffset().total_seconds() == 5.5 * 3600
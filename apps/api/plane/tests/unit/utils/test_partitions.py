@@ -0,0 +1,106 @@
+from datetime import datetime, timezone
+
+import pytest
+from django.db import connection
+
+from plane.bgtasks.partition_task import maintain_partitions
+from plane.db.models import WebhookLog
+from plane.utils.partitions import (
+    add_months,
+    create_partitions,
+    drop_partition,
+    get_expired_partitions,
+    get_partitions,
+    month_start,
+    partition_table,
+)
+
+# The test database is built without migrations, so the tests partition a table of their own
+TABLE = "test_partitioned_events"
+
+
+@pytest.mark.unit
+class TestPartitions:
+    """Test the creation and removal of the monthly partitions"""
+
+    @pytest.fixture(autouse=True)
+    def table(self, db):
+        with connection.cursor() as cursor:
+            cursor.execute(f"CREATE TABLE {TABLE} (created_at timestamptz NOT NULL) PARTITION BY RANGE (created_at)")
+            cursor.execute(
+                f"CREATE TABLE {TABLE}_legacy PARTITION OF {TABLE} "
+                "FOR VALUES FROM (MINVALUE) TO ('2040-11-01 00:00:00+00')"
+            )
+            cursor.execute(f"CREATE TABLE {TABLE}_default PARTITION OF {TABLE} DEFAULT")
+
+    def get_names(self, table=TABLE):
+        return [partition.name for partition in get_partitions(table)]
+
+    @pytest.mark.django_db
+    def test_create_and_drop_partitions(self):
+        now = datetime(2040, 10, 15, tzinfo=timezone.utc)
+
+        created = create_partitions(TABLE, months_ahead=3, now=now)
+
+        # The legacy partition covers the current month
+        assert created == [f"{TABLE}_p204011", f"{TABLE}_p204012", f"{TABLE}_p204101"]
+        assert create_partitions(TABLE, months_ahead=3, now=now) == []
+        assert self.get_names() == [f"{TABLE}_legacy", *created, f"{TABLE}_default"]
+        partition = get_partitions(TABLE)[2]
+        assert (partition.lower, partition.upper) == (
+            datetime(2040, 12, 1, tzinfo=timezone.utc),
+            datetime(2041, 1, 1, tzinfo=timezone.utc),
+        )
+
+        expired = get_expired_partitions(TABLE, before=datetime(2040, 12, 15, tzinfo=timezone.utc))
+
+        # Only the partitions ending before the cutoff expire
+        assert [partition.name for partition in expired] == [f"{TABLE}_legacy", f"{TABLE}_p204011"]
+        for partition in expired:
+            drop_partition(TABLE, partition.name)
+        assert self.get_names() == [f"{TABLE}_p204012", f"{TABLE}_p204101", f"{TABLE}_default"]
+
+    @pytest.mark.django_db
+    def test_partition_existing_table(self, workspace):
+        log = WebhookLog.objects.create(workspace=workspace, webhook=workspace.id, retry_count=1)
+        with connection.cursor() as cursor:
+            # A table with deferred foreign key checks pending cannot be altered
+            cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+
+        created = partition_table("webhook_logs", months_ahead=1)
+
+        next_month = add_months(month_start(datetime.now(timezone.utc)), 1)
+        assert created == [f"webhook_logs_p{next_month:%Y%m}"]
+        assert self.get_names("webhook_logs") == ["webhook_logs_legacy", *created, "webhook_logs_default"]
+        # The primary key index built ahead of the swap is attached, not built again
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT indexrelid::regclass::text FROM pg_index WHERE indrelid = 'webhook_logs_legacy'::regclass "
+                "AND indisunique"
+            )
+            assert cursor.fetchall() == [("webhook_logs_legacy_pkey",)]
+        # The existing rows stay in the legacy partition until they move to their month
+        WebhookLog.objects.filter(pk=log.pk).update(created_at=next_month)
+        assert WebhookLog.objects.get(pk=log.pk).retry_count == 1
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT tableoid::regclass::text FROM webhook_logs")
+            assert cursor.fetchone()[0] == created[0]
+            cursor.execute(
+                "SELECT pg_get_constraintdef(oid) FROM pg_constraint WHERE conrelid = 'webhook_logs'::regclass"
+            )
+            constraints = [row[0] for row in cursor.fetchall()]
+        assert "PRIMARY KEY (id, created_at)" in constraints
+        assert "CHECK ((retry_count >= 0))" in constraints
+        assert "FOREIGN KEY (workspace_id) REFERENCES workspaces(id) DEFERRABLE INITIALLY DEFERRED" in constraints
+
+    @pytest.mark.django_db
+    def test_maintain_partitions_creates_months_ahead(self, mocker):
+        mocker.patch("plane.bgtasks.partition_task.PARTITIONED_TABLES", (TABLE,))
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE {TABLE}_legacy")
+
+        maintain_partitions()
+
+        months = [partition for partition in get_partitions(TABLE) if not partition.is_default]
+        assert len(months) == 4
+        assert months[0].lower <= datetime.now(timezone.utc) < months[0].upper
@@ -0,0 +1,79 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from plane.db.models import (
+    Issue,
+    IssueAssignee,
+    IssueSubscriber,
+    Project,
+    ProjectMember,
+    State,
+    WorkspaceMember,
+)
+from plane.utils.profile_stats import bump_profile_stats_version, get_profile_stats_version_key
+
+
+@pytest.mark.unit
+class TestProfileStats:
+    """Test the consolidated workspace profile stats"""
+
+    @pytest.fixture
+    def project(self, create_user, workspace):
+        WorkspaceMember.objects.get_or_create(workspace=workspace, member=create_user, defaults={"role": 20})
+        project = Project.objects.create(name="Test Project", identifier="TP", workspace=workspace)
+        ProjectMember.objects.create(project=project, member=create_user, role=20)
+        return project
+
+    @pytest.fixture
+    def issues(self, create_user, project):
+        cache.delete(get_profile_stats_version_key(project.workspace.slug))
+        started = State.objects.create(name="Started", group="started", project=project)
+        completed = State.objects.create(name="Done", group="completed", project=project)
+        issues = [
+            Issue.objects.create(name="A", project=project, state=started, priority="high"),
+            Issue.objects.create(name="B", project=project, state=started, priority="urgent"),
+            Issue.objects.create(name="C", project=project, state=completed, priority="high"),
+            Issue.objects.create(name="D", project=project, state=completed, priority="low"),
+        ]
+        for issue in issues[:3]:
+            IssueAssignee.objects.create(issue=issue, assignee=create_user, project=project)
+        Issue.objects.filter(pk__in=[issues[0].pk, issues[3].pk]).update(created_by=create_user)
+        IssueSubscriber.objects.create(issue=issues[3], subscriber=create_user, project=project)
+        return issues
+
+    @pytest.mark.django_db
+    def test_profile_stats(self, session_client, workspace, create_user, issues):
+        url = f"/api/workspaces/{workspace.slug}/user-stats/{create_user.id}/"
+
+        with CaptureQueriesContext(connection) as cold:
+            response = session_client.get(url)
+
+        assert response.status_code == 200
+        assert response.data["state_distribution"] == [
+            {"state_group": "completed", "state_count": 1},
+            {"state_group": "started", "state_count": 2},
+        ]
+        assert [item["priority"] for item in response.data["priority_distribution"]] == ["urgent", "high"]
+        assert response.data["priority_distribution"][1]["priority_count"] == 2
+        assert response.data["created_issues"] == 2
+        assert response.data["assigned_issues"] == 3
+        assert response.data["completed_issues"] == 1
+        assert response.data["pending_issues"] == 2
+        assert response.data["subscribed_issues"] == 1
+
+        with CaptureQueriesContext(connection) as warm:
+            assert session_client.get(url).data == response.data
+        assert len(warm.captured_queries) < len(cold.captured_queries)
+
+    @pytest.mark.django_db
+    def test_activity_invalidates_profile_stats(self, session_client, workspace, create_user, project, issues):
+        url = f"/api/workspaces/{workspace.slug}/user-stats/{create_user.id}/"
+        assert session_client.get(url).data["assigned_issues"] == 3
+
+        IssueAssignee.objects.create(issue=issues[3], assignee=create_user, project=project)
+        assert session_client.get(url).data["assigned_issues"] == 3
+
+        bump_profile_stats_version(workspace.slug)
+        assert session_client.get(url).data["assigned_issues"] == 4
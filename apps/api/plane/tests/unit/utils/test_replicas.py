@@ -0,0 +1,136 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.db import OperationalError
+
+from plane.utils.core import (
+    ReadReplicaRouter,
+    clear_read_replica_context,
+    get_read_replica_alias,
+    set_use_read_replica,
+)
+from plane.utils.core.replicas import ReplicaPool, ReplicaState, parse_lsn
+
+
+def mock_connections(rows):
+    """Return a connections mapping whose cursors yield rows[alias]"""
+
+    def get_connection(alias):
+        cursor = MagicMock()
+        row = rows[alias]
+        if isinstance(row, Exception):
+            cursor.execute.side_effect = row
+        cursor.fetchone.return_value = row
+        connection = MagicMock()
+        connection.cursor.return_value.__enter__.return_value = cursor
+        return connection
+
+    connections = MagicMock()
+    connections.__getitem__.side_effect = get_connection
+    return connections
+
+
+@pytest.fixture
+def pool(settings):
+    settings.READ_REPLICA_MAX_LAG_SECONDS = 5
+    settings.READ_REPLICA_MAX_LAG_BYTES = 1024
+    settings.READ_REPLICA_HEALTH_CHECK_INTERVAL = 60
+    replica_pool = ReplicaPool()
+    replica_pool._states = {
+        "replica": ReplicaState(alias="replica", weight=1),
+        "replica_2": ReplicaState(alias="replica_2", weight=3),
+    }
+    return replica_pool
+
+
+@pytest.mark.unit
+class TestReplicaPool:
+    """Test replica lag tracking and selection"""
+
+    def test_parse_lsn(self):
+        assert parse_lsn("0/10") == 16
+        assert parse_lsn("1/0") == 1 << 32
+        assert parse_lsn(None) is None
+
+    def test_lagging_replica_is_ejected(self, pool):
+        rows = {
+            "default": ("0/1000",),
+            "replica": (True, "0/1000", 0),
+            "replica_2": (True, "0/F00", 30.0),
+        }
+        with patch("plane.utils.core.replicas.connections", mock_connections(rows)):
+            healthy = pool.refresh(force=True)
+
+        assert [state.alias for state in healthy] == ["replica"]
+        assert pool._states["replica"].lag_bytes == 0
+        assert pool._states["replica_2"].lag_bytes == 256
+
+    def test_byte_lag_ejects_replica(self, pool):
+        rows = {
+            "default": ("0/10000",),
+            "replica": (True, "0/1000", 0),
+            "replica_2": (True, "0/10000", 0),
+        }
+        with patch("plane.utils.core.replicas.connections", mock_connections(rows)):
+            healthy = pool.refresh(force=True)
+
+        assert [state.alias for state in healthy] == ["replica_2"]
+
+    def test_unreachable_replica_is_ejected_and_falls_back_to_primary(self, pool):
+        error = OperationalError("connection refused")
+        rows = {"default": ("0/1000",), "replica": error, "replica_2": error}
+        with patch("plane.utils.core.replicas.connections", mock_connections(rows)):
+            assert pool.select() is None
+
+    def test_checks_are_skipped_within_interval(self, pool):
+        rows = {"default": ("0/0",), "replica": (True, "0/0", 0), "replica_2": (True, "0/0", 0)}
+        connections = mock_connections(rows)
+        with patch("plane.utils.core.replicas.connections", connections):
+            pool.select()
+            calls = connections.__getitem__.call_count
+            pool.select()
+
+        assert connections.__getitem__.call_count == calls
+
+    def test_selection_follows_weights(self, pool):
+        rows = {"default": ("0/0",), "replica": (True, "0/0", 0), "replica_2": (True, "0/0", 0)}
+        with patch("plane.utils.core.replicas.connections", mock_connections(rows)):
+            picks = [pool.select() for _ in range(2000)]
+
+        assert 0.65 < picks.count("replica_2") / len(picks) < 0.85
+
+
+@pytest.mark.unit
+class TestReadReplicaRouter:
+    """Test the router's per-request replica choice"""
+
+    @pytest.fixture(autouse=True)
+    def clean_context(self):
+        clear_read_replica_context()
+        yield
+        clear_read_replica_context()
+
+    def test_replica_is_chosen_once_per_request(self):
+        router = ReadReplicaRouter()
+        set_use_read_replica(True)
+        with patch("plane.utils.core.dbrouters.replica_pool") as replica_pool:
+            replica_pool.select.return_value = "replica_2"
+            assert router.db_for_read(MagicMock()) == "replica_2"
+            assert router.db_for_read(MagicMock()) == "replica_2"
+
+        replica_pool.select.assert_called_once()
+        assert get_read_replica_alias() == "replica_2"
+
+    def test_reads_fall_back_to_primary_without_healthy_replica(self):
+        router = ReadReplicaRouter()
+        set_use_read_replica(True)
+        with patch("plane.utils.core.dbrouters.replica_pool") as replica_pool:
+            replica_pool.select.return_value = None
+            assert router.db_for_read(MagicMock()) == "default"
+
+    def test_primary_requests_do_not_select_a_replica(self):
+        router = ReadReplicaRouter()
+        with patch("plane.utils.core.dbrouters.replica_pool") as replica_pool:
+            assert router.db_for_read(MagicMock()) == "default"
+
+        replica_pool.select.assert_not_called()
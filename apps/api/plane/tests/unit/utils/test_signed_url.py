@@ -0,0 +1,91 @@
+import time
+
+import pytest
+from unittest.mock import patch
+
+from django.core.cache import cache
+
+from plane.db.models import FileAsset
+from plane.settings.storage import S3Storage
+from plane.utils.signed_url import get_signed_url_cache_key
+
+
+@pytest.mark.unit
+class TestSignedUrlCache:
+    """Test the cached presigned URLs of the asset endpoints"""
+
+    @pytest.fixture
+    def avatars(self, create_user):
+        assets = [
+            FileAsset.objects.create(
+                asset=f"user-{index}-avatar.png",
+                attributes={"name": "avatar.png", "size": 100, "type": "image/png"},
+                entity_type=FileAsset.EntityTypeContext.USER_AVATAR,
+                user=create_user,
+                is_uploaded=True,
+            )
+            for index in range(2)
+        ]
+        cache.delete_many([get_signed_url_cache_key(asset.id) for asset in assets])
+        return assets
+
+    @pytest.mark.django_db
+    @patch.object(S3Storage, "generate_presigned_url", autospec=True)
+    def test_static_redirect_is_cached(
+        self, generate_presigned_url, session_client, avatars, django_assert_num_queries
+    ):
+        generate_presigned_url.side_effect = lambda storage, object_name, **kwargs: f"https://s3/{object_name}"
+        url = f"/api/assets/v2/static/{avatars[0].id}/"
+
+        response = session_client.get(url)
+        assert response.status_code == 302
+        assert response["Location"] == f"https://s3/{avatars[0].asset.name}"
+        assert "max-age=1800" in response["Cache-Control"]
+
+        # The cached URL is served without a lookup or a new signature
+        with django_assert_num_queries(0):
+            assert session_client.get(url)["Location"] == response["Location"]
+        assert generate_presigned_url.call_count == 1
+
+        # Saving the asset drops its cached URLs
+        avatars[0].save()
+        session_client.get(url)
+        assert generate_presigned_url.call_count == 2
+
+    @pytest.mark.django_db
+    @patch.object(S3Storage, "generate_presigned_url", autospec=True)
+    def test_batch_resolves_static_assets(self, generate_presigned_url, session_client, avatars):
+        generate_presigned_url.side_effect = lambda storage, object_name, **kwargs: f"https://s3/{object_name}"
+        session_client.get(f"/api/assets/v2/static/{avatars[0].id}/")
+
+        response = session_client.post(
+            "/api/assets/v2/static/batch/",
+            {"asset_ids": [str(asset.id) for asset in avatars] + ["not-a-uuid"]},
+            format="json",
+        )
+
+        assert response.status_code == 200
+        assert response.data == {str(asset.id): f"https://s3/{asset.asset.name}" for asset in avatars}
+        # Only the asset missing from the cache is signed again
+        assert generate_presigned_url.call_count == 2
+
+    @pytest.mark.django_db
+    @patch.object(S3Storage, "generate_presigned_url", autospec=True)
+    def test_expired_entries_are_signed_again(self, generate_presigned_url, session_client, avatars):
+        generate_presigned_url.side_effect = lambda storage, object_name, **kwargs: f"https://s3/new/{object_name}"
+        session_client.get(f"/api/assets/v2/static/{avatars[0].id}/")
+        # An entry past its expiry, kept by a key whose TTL another entry extended
+        cache_key = get_signed_url_cache_key(avatars[0].id)
+        urls = {url_key: ("https://s3/expired", time.time() - 1) for url_key in cache.get(cache_key)}
+        cache.set(cache_key, urls, 3600)
+
+        response = session_client.get(f"/api/assets/v2/static/{avatars[0].id}/")
+        assert response["Location"] == f"https://s3/new/{avatars[0].asset.name}"
+        # The expired entry is dropped from the key
+        assert [url for url, _ in cache.get(cache_key).values()] == [response["Location"]]
+
+        cache.set(cache_key, urls, 3600)
+        response = session_client.post(
+            "/api/assets/v2/static/batch/", {"asset_ids": [str(avatars[0].id)]}, format="json"
+        )
+        assert response.data == {str(avatars[0].id): f"https://s3/new/{avatars[0].asset.name}"}
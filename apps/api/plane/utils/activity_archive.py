@@ -0,0 +1,238 @@
+"""
+The cold tier of the issue activities.
+
+Recent activities stay in the issue_activities table, partitioned by month.
+The archive_issue_activities task moves the activities older than
+ISSUE_ACTIVITY_ARCHIVE_AFTER_DAYS to a zstd compressed Mongo collection, then
+drops the partitions it emptied. Activities are archived
+oldest first, so every archived activity is older than every activity still
+in Postgres and a page ordered by created_at is a slice of the hot rows
+followed (or preceded) by a slice of the archived ones. The activities of a
+batch stay in both tiers between their archive and their delete, the reads
+bound the archive to the activities older than the hot ones.
+"""
+
+# Python imports
+import math
+from datetime import timezone
+
+# Django imports
+from django.db.models import prefetch_related_objects
+
+# Third party imports
+from pymongo import ASCENDING, DESCENDING
+from pymongo.errors import CollectionInvalid, PyMongoError
+
+# Module imports
+from plane.db.models import IssueActivity
+from plane.settings.mongo import MongoConnection
+from plane.utils.exception_logger import log_exception
+from plane.utils.paginator import BadPaginationError, Cursor, CursorResult, OffsetPaginator
+
+COLLECTION_NAME = "issue_activities"
+
+ARCHIVE_FIELDS = [
+    "id",
+    "created_at",
+    "updated_at",
+    "deleted_at",
+    "created_by_id",
+    "updated_by_id",
+    "workspace_id",
+    "project_id",
+    "issue_id",
+    "issue_comment_id",
+    "actor_id",
+    "verb",
+    "field",
+    "old_value",
+    "new_value",
+    "comment",
+    "attachments",
+    "old_identifier",
+    "new_identifier",
+    "epoch",
+]
+
+ARCHIVE_INDEXES = [
+    [("issue_id", ASCENDING), ("created_at", ASCENDING)],
+    [("actor_id", ASCENDING), ("created_at", ASCENDING)],
+    [("workspace_id", ASCENDING), ("created_at", ASCENDING)],
+]
+
+UUID_FIELDS = {
+    "id",
+    "created_by_id",
+    "updated_by_id",
+    "workspace_id",
+    "project_id",
+    "issue_id",
+    "issue_comment_id",
+    "actor_id",
+    "old_identifier",
+    "new_identifier",
+}
+
+
+def get_archive_collection():
+    """The archive collection, None when Mongo is not configured"""
+    if not MongoConnection.is_configured():
+        return None
+    return MongoConnection.get_collection(COLLECTION_NAME)
+
+
+def ensure_archive_collection(collection):
+    """Create the archive collection compressed with zstd and its indexes"""
+    try:
+        collection.database.create_collection(
+            collection.name,
+            storageEngine={"wiredTiger": {"configString": "block_compressor=zstd"}},
+        )
+    except CollectionInvalid:
+        # Already exists
+        pass
+    for keys in ARCHIVE_INDEXES:
+        collection.create_index(keys)
+
+
+def to_document(record):
+    """Archive document of an issue activity values() row, keyed by the activity id"""
+    document = {
+        field: (str(record[field]) if field in UUID_FIELDS and record[field] is not None else record[field])
+        for field in ARCHIVE_FIELDS
+    }
+    # The dates are kept as dates so the archive sorts and filters by them
+    document["_id"] = document.pop("id")
+    return document
+
+
+def from_document(document):
+    """An unsaved IssueActivity instance holding an archived activity"""
+    values = {}
+    for field in ARCHIVE_FIELDS:
+        value = document.get("_id" if field == "id" else field)
+        if value is not None and field in ("created_at", "updated_at", "deleted_at") and value.tzinfo is None:
+            # Mongo returns naive dates in UTC
+            value = value.replace(tzinfo=timezone.utc)
+        values[field] = IssueActivity._meta.get_field(field).to_python(value)
+    activity = IssueActivity(**values)
+    activity._state.adding = False
+    return activity
+
+
+def get_archive_filter(exclude_fields=(), **conditions):
+    """Mongo filter of the archived activities that are not deleted, a list matches any of its values"""
+    archive_filter = {"deleted_at": None}
+    for field, value in conditions.items():
+        if isinstance(value, (list, tuple, set)):
+            archive_filter[field] = {"$in": [str(item) for item in value]}
+        else:
+            archive_filter[field] = str(value)
+    if exclude_fields:
+        archive_filter["field"] = {"$nin": list(exclude_fields)}
+    return archive_filter
+
+
+def bound_archive_filter(archive_filter, queryset):
+    """
+    Bound an archive filter to the activities older than the oldest one of a
+    queryset, which are only read from Postgres while in both tiers.
+    """
+    oldest = queryset.order_by("created_at").values_list("created_at", flat=True).first()
+    if oldest is None:
+        return archive_filter
+    tied_ids = [str(activity_id) for activity_id in queryset.filter(created_at=oldest).values_list("id", flat=True)]
+    return {
+        "$and": [
+            archive_filter,
+            {"$or": [{"created_at": {"$lt": oldest}}, {"created_at": oldest, "_id": {"$nin": tied_ids}}]},
+        ]
+    }
+
+
+def get_archived_activities(collection, archive_filter, sort=DESCENDING, skip=0, limit=None):
+    """The archived activities matching a filter, with the relations the serializers read"""
+    cursor = collection.find(archive_filter).sort([("created_at", sort), ("_id", sort)]).skip(skip)
+    if limit is not None:
+        cursor = cursor.limit(limit)
+    activities = [from_document(document) for document in cursor]
+    prefetch_related_objects(activities, "actor", "workspace", "issue", "project")
+    return activities
+
+
+class TieredActivityPaginator(OffsetPaginator):
+    """
+    Offset paginator over the issue activities of both tiers, when ordered by
+    created_at. The archive_filter is the Mongo filter equivalent to the
+    queryset. Any other ordering, or a missing archive, only pages the hot rows.
+    """
+
+    def __init__(self, queryset, order_by=None, archive_filter=None, **kwargs):
+        super().__init__(queryset, order_by=order_by, **kwargs)
+        self.archive_filter = archive_filter
+
+    def get_result(self, limit=1000, cursor=None):
+        collection = None
+        if self.archive_filter is not None and self.key == ("created_at",):
+            collection = get_archive_collection()
+        if collection is None:
+            return super().get_result(limit=limit, cursor=cursor)
+
+        if cursor is None:
+            cursor = Cursor(0, 0, 0)
+        limit = min(limit, self.max_limit)
+        page = cursor.offset
+        offset = cursor.offset * limit
+
+        if self.max_offset is not None and offset >= self.max_offset:
+            raise BadPaginationError("Pagination offset too large")
+        if offset < 0:
+            raise BadPaginationError("Pagination offset cannot be negative")
+
+        archive_filter = bound_archive_filter(self.archive_filter, self.queryset)
+        try:
+            cold_count = collection.count_documents(archive_filter)
+        except PyMongoError as e:
+            # Serve the hot rows rather than failing the request
+            log_exception(e)
+            return super().get_result(limit=limit, cursor=cursor)
+
+        ordering = ("-created_at", "-id") if self.desc else ("created_at", "id")
+        queryset = self.queryset.order_by(*ordering)
+        hot_count = self.total_count_queryset.count() if self.total_count_queryset is not None else queryset.count()
+
+        # Newest first reads the hot rows first, oldest first the archived ones
+        sort = DESCENDING if self.desc else ASCENDING
+        tiers = [
+            (hot_count, lambda start, stop: list(queryset[start:stop])),
+            (
+                cold_count,
+                lambda start, stop: get_archived_activities(
+                    collection, archive_filter, sort=sort, skip=start, limit=stop - start
+                ),
+            ),
+        ]
+        if not self.desc:
+            tiers.reverse()
+
+        results = []
+        start, stop = offset, offset + limit
+        for count, fetch in tiers:
+            if start < count and stop > 0:
+                results.extend(fetch(max(start, 0), min(stop, count)))
+            start, stop = start - count, stop - count
+
+        total_count = hot_count + cold_count
+        next_cursor = Cursor(limit, page + 1, False, offset + limit < total_count)
+        prev_cursor = Cursor(limit, page - 1, True, page > 0)
+
+        if self.on_results:
+            results = self.on_results(results)
+
+        return CursorResult(
+            results=results,
+            next=next_cursor,
+            prev=prev_cursor,
+            hits=total_count,
+            max_hits=math.ceil(total_count / limit),
+        )
@@ -0,0 +1,188 @@
+"""
+Benchmark harness of the hot API endpoints.
+
+Each scenario is a GET through the full middleware stack with the Django test
+client, or a callable for work done outside of a request such as exports. A
+scenario runs a few warmup iterations and then the measured ones, recording
+the latency percentiles and the number of queries of every database alias.
+Results are compared with a stored baseline: a scenario regresses when its
+p95 grows by more than the tolerance or when it runs more queries.
+"""
+
+# Python imports
+import json
+import math
+import time
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+# Django imports
+from django.db import connections
+from django.db.models import Count, Q
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+# Module imports
+from plane.bgtasks.export_task import get_export_queryset
+from plane.db.models import Issue, Project
+from plane.utils.exporters import Exporter, IssueExportSchema
+
+
+class BenchmarkError(Exception):
+    pass
+
+
+@dataclass
+class Scenario:
+    name: str
+    path: Optional[str] = None
+    params: dict = field(default_factory=dict)
+    func: Optional[Callable] = None
+
+
+def percentile(values, q):
+    """Linearly interpolated percentile q (0-100) of the values"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = (len(ordered) - 1) * q / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(durations, queries):
+    """Latencies in milliseconds and the query count of the slowest iteration"""
+    durations = [duration * 1000 for duration in durations]
+    return {
+        "iterations": len(durations),
+        "p50": round(percentile(durations, 50), 2),
+        "p95": round(percentile(durations, 95), 2),
+        "p99": round(percentile(durations, 99), 2),
+        "mean": round(sum(durations) / len(durations), 2) if durations else 0.0,
+        "max": round(max(durations, default=0.0), 2),
+        "queries": max(queries, default=0),
+    }
+
+
+def get_scenarios(workspace, user, export_limit=10_000):
+    """The hot endpoints of the workspace, on its project with the most issues"""
+    project = (
+        Project.objects.filter(workspace=workspace, archived_at__isnull=True)
+        .annotate(issue_count=Count("project_issue", filter=Q(project_issue__deleted_at__isnull=True)))
+        .order_by("-issue_count", "created_at")
+        .first()
+    )
+    if project is None:
+        raise BenchmarkError(f"Workspace {workspace.slug} has no project")
+
+    workspace_url = f"/api/workspaces/{workspace.slug}"
+    project_url = f"{workspace_url}/projects/{project.id}"
+    issue_name = Issue.issue_objects.filter(project=project).values_list("name", flat=True).first() or "issue"
+    search_term = issue_name.split()[0].strip(".").lower()
+    paginated = {"per_page": 100, "cursor": "100:0:0"}
+
+    def export(provider):
+        def run():
+            queryset = get_export_queryset(workspace.id, [project.id], user.id).order_by("sequence_id")[:export_limit]
+            exporter = Exporter(format_type=provider, schema_class=IssueExportSchema, options={"list_joiner": ", "})
+            exporter.export(f"{workspace.slug}-{project.id}", queryset)
+
+        return run
+
+    return [
+        Scenario("issues", f"{project_url}/issues/", paginated),
+        Scenario("issues-grouped", f"{project_url}/issues/", {**paginated, "group_by": "state_id"}),
+        Scenario("issues-grouped-labels", f"{project_url}/issues/", {**paginated, "group_by": "labels__id"}),
+        Scenario(
+            "issues-sub-grouped",
+            f"{project_url}/issues/",
+            {**paginated, "group_by": "state_id", "sub_group_by": "priority"},
+        ),
+        Scenario(
+            "issues-sub-grouped-assignees",
+            f"{project_url}/issues/",
+            {**paginated, "group_by": "assignees__id", "sub_group_by": "labels__id"},
+        ),
+        Scenario("cycles", f"{project_url}/cycles/"),
+        Scenario("modules", f"{project_url}/modules/"),
+        Scenario("analytics", f"{workspace_url}/analytics/", {"x_axis": "state_id", "y_axis": "issue_count"}),
+        Scenario(
+            "analytics-segmented",
+            f"{workspace_url}/analytics/",
+            {"x_axis": "labels__id", "y_axis": "issue_count", "segment": "priority"},
+        ),
+        Scenario("advance-analytics", f"{workspace_url}/advance-analytics/", {"tab": "overview"}),
+        Scenario("search", f"{workspace_url}/search/", {"search": search_term, "workspace_search": "true"}),
+        Scenario(
+            "notifications",
+            f"{workspace_url}/users/notifications/",
+            {"type": "assigned", "per_page": 30, "cursor": "30:0:0"},
+        ),
+        Scenario("export-csv", func=export("csv")),
+        Scenario("export-xlsx", func=export("xlsx")),
+    ]
+
+
+def run_scenario(client, scenario, iterations=20, warmup=2):
+    durations = []
+    queries = []
+    for iteration in range(warmup + iterations):
+        with ExitStack() as stack:
+            captured = [stack.enter_context(CaptureQueriesContext(connection)) for connection in connections.all()]
+            start = time.perf_counter()
+            if scenario.func is not None:
+                scenario.func()
+            else:
+                response = client.get(scenario.path, scenario.params)
+                if response.status_code >= 400:
+                    raise BenchmarkError(f"{scenario.name} returned {response.status_code}")
+            elapsed = time.perf_counter() - start
+
+        if iteration >= warmup:
+            durations.append(elapsed)
+            queries.append(sum(len(context) for context in captured))
+
+    return summarize(durations, queries)
+
+
+def run_benchmarks(workspace, user, iterations=20, warmup=2, only=None, stdout=None):
+    client = Client()
+    client.force_login(user)
+
+    results = {}
+    for scenario in get_scenarios(workspace, user):
+        if only and scenario.name not in only:
+            continue
+        results[scenario.name] = run_scenario(client, scenario, iterations=iterations, warmup=warmup)
+        if stdout is not None:
+            result = results[scenario.name]
+            stdout.write(
+                f"{scenario.name:<30} p50 {result['p50']:>9.2f}ms  p95 {result['p95']:>9.2f}ms  "
+                f"p99 {result['p99']:>9.2f}ms  queries {result['queries']}"
+            )
+    return results
+
+
+def compare_results(results, baseline, tolerance=0.2):
+    """Messages of the scenarios that are slower or run more queries than the baseline"""
+    regressions = []
+    for name, result in results.items():
+        expected = baseline.get(name)
+        if expected is None:
+            continue
+        if result["p95"] > expected["p95"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {result['p95']}ms, baseline {expected['p95']}ms")
+        if result["queries"] > expected["queries"]:
+            regressions.append(f"{name}: {result['queries']} queries, baseline {expected['queries']}")
+    return regressions
+
+
+def load_baseline(path):
+    with open(path) as baseline_file:
+        return json.load(baseline_file)
+
+
+def save_baseline(path, results, meta=None):
+    with open(path, "w") as baseline_file:
+        json.dump({"meta": meta or {}, "scenarios": results}, baseline_file, indent=2, sort_keys=True)
@@ -1,9 +1,10 @@
 # Python imports
 import base64
+import re
 import nh3
 from plane.utils.exception_logger import log_exception
-from bs4 import BeautifulSoup
 from collections import defaultdict
+from html.parser import HTMLParser
 import logging
 
 logger = logging.getLogger("plane.api")
@@ -159,6 +160,58 @@ ATTRIBUTES = {
 SAFE_PROTOCOLS = {"http", "https", "mailto", "tel"}
 
 
+# Attributes nh3 treats as URLs and filters against SAFE_PROTOCOLS
+URL_ATTRIBUTES = {"href", "src"}
+
+# Pre-merged per-tag attribute allowlist so lookups during tokenizing are O(1)
+_ALLOWED_ATTRIBUTES_BY_TAG = {
+    tag: ATTRIBUTES["*"] | ATTRIBUTES.get(tag, set()) for tag in ALLOWED_TAGS
+}
+
+_URL_SCHEME_PATTERN = re.compile(r"^\s*([a-zA-Z][a-zA-Z0-9+.\-]*):")
+
+
+def _is_safe_url(value):
+    """Return True when the URL is relative or uses an allowed scheme."""
+    match = _URL_SCHEME_PATTERN.match(value or "")
+    if not match:
+        return True
+    return match.group(1).lower() in SAFE_PROTOCOLS
+
+
+class SanitizationDiffParser(HTMLParser):
+    """
+    Streaming tokenizer that predicts what nh3 removes from the original HTML.
+
+    Every start tag and attribute is checked against the same allowlist that
+    is handed to nh3, so removals are reported from a single pass over the
+    input without building any document tree.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.removed_tags = defaultdict(int)
+        self.removed_attributes = defaultdict(set)
+
+    def handle_starttag(self, tag, attrs):
+        allowed_attributes = _ALLOWED_ATTRIBUTES_BY_TAG.get(tag)
+        if allowed_attributes is None:
+            self.removed_tags[tag] += 1
+            # The attributes go away together with the tag
+            for attr_name, _ in attrs:
+                if attr_name:
+                    self.removed_attributes[tag].add(attr_name)
+            return
+
+        for attr_name, attr_value in attrs:
+            if not attr_name:
+                continue
+            if attr_name not in allowed_attributes:
+                self.removed_attributes[tag].add(attr_name)
+            elif attr_name in URL_ATTRIBUTES and not _is_safe_url(attr_value):
+                self.removed_attributes[tag].add(attr_name)
+
+
 def _compute_html_sanitization_diff(before_html: str, after_html: str):
     """
     Compute a coarse diff between original and sanitized HTML.
@@ -167,47 +220,37 @@ def _compute_html_sanitization_diff(before_html: str, after_html: str):
     - removed_tags: mapping[tag] -> removed_count
     - removed_attributes: mapping[tag] -> sorted list of attribute names removed
     """
+    # nh3 left the content untouched, nothing can have been removed
+    if before_html == after_html:
+        return {"removed_tags": {}, "removed_attributes": {}}
+
     try:
+        parser = SanitizationDiffParser()
+        parser.feed(before_html or "")
+        parser.close()
 
-        def collect(soup):
-            tag_counts = defaultdict(int)
-            attrs_by_tag = defaultdict(set)
-            for el in soup.find_all(True):
-                tag_name = (el.name or "").lower()
-                if not tag_name:
-                    continue
-                tag_counts[tag_name] += 1
-                for attr_name in list(el.attrs.keys()):
-                    if isinstance(attr_name, str) and attr_name:
-                        attrs_by_tag[tag_name].add(attr_name.lower())
-            return tag_counts, attrs_by_tag
-
-        soup_before = BeautifulSoup(before_html or "", "html.parser")
-        soup_after = BeautifulSoup(after_html or "", "html.parser")
-
-        counts_before, attrs_before = collect(soup_before)
-        counts_after, attrs_after = collect(soup_after)
-
-        removed_tags = {}
-        for tag, cnt_before in counts_before.items():
-            cnt_after = counts_after.get(tag, 0)
-            if cnt_after < cnt_before:
-                removed = cnt_before - cnt_after
-                removed_tags[tag] = removed
-
-        removed_attributes = {}
-        for tag, before_set in attrs_before.items():
-            after_set = attrs_after.get(tag, set())
-            removed = before_set - after_set
-            if removed:
-                removed_attributes[tag] = sorted(list(removed))
-
-        return {"removed_tags": removed_tags, "removed_attributes": removed_attributes}
+        removed_attributes = {
+            tag: sorted(attrs) for tag, attrs in parser.removed_attributes.items()
+        }
+        return {
+            "removed_tags": dict(parser.removed_tags),
+            "removed_attributes": removed_attributes,
+        }
     except Exception:
         # Best-effort only; if diffing fails we don't block the request
         return {"removed_tags": {}, "removed_attributes": {}}
 
 
+def _exceeds_max_size(content: str):
+    """Check the UTF-8 size of content without encoding it when avoidable."""
+    # Every character takes between one and four bytes in UTF-8
+    if len(content) > MAX_SIZE:
+        return True
+    if len(content) * 4 <= MAX_SIZE:
+        return False
+    return len(content.encode("utf-8")) > MAX_SIZE
+
+
 def validate_html_content(html_content: str):
     """
     Sanitize HTML content using nh3.
@@ -217,7 +260,7 @@ def validate_html_content(html_content: str):
         return True, None, None
 
     # Size check - 10MB limit (consistent with binary validation)
-    if len(html_content.encode("utf-8")) > MAX_SIZE:
+    if _exceeds_max_size(html_content):
         return False, "HTML content exceeds maximum size limit (10MB)", None
 
     try:
@@ -6,10 +6,13 @@ and request-scoped context in the Plane application.
 
 from .dbrouters import ReadReplicaRouter
 from .mixins import ReadReplicaControlMixin
+from .replicas import replica_pool
 from .request_scope import (
     set_use_read_replica,
     should_use_read_replica,
     clear_read_replica_context,
+    get_read_replica_alias,
+    set_read_replica_alias,
 )
 
 __all__ = [
@@ -18,4 +21,7 @@ __all__ = [
     "set_use_read_replica",
     "should_use_read_replica",
     "clear_read_replica_context",
+    "get_read_replica_alias",
+    "set_read_replica_alias",
+    "replica_pool",
 ]
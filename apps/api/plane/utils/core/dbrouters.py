@@ -9,7 +9,12 @@ from typing import Type
 
 from django.db import models
 
-from .request_scope import should_use_read_replica
+from .replicas import replica_pool
+from .request_scope import (
+    get_read_replica_alias,
+    set_read_replica_alias,
+    should_use_read_replica,
+)
 
 logger = logging.getLogger("plane.db")
 
@@ -26,19 +31,25 @@ class ReadReplicaRouter:
     def db_for_read(self, model: Type[models.Model], **hints) -> str:
         """
         Determine which database to use for read operations.
+        The replica is chosen once per request among the healthy replicas,
+        falling back to the primary when all of them lag or are down.
         Args:
             model: The Django model class being queried
             **hints: Additional routing hints
         Returns:
-            str: Database alias ('replica' or 'default')
+            str: Database alias (a 'replica' alias or 'default')
         """
-        if should_use_read_replica():
-            logger.debug(f"Routing read for {model._meta.label} to replica database")
-            return "replica"
-        else:
+        if not should_use_read_replica():
             logger.debug(f"Routing read for {model._meta.label} to primary database")
             return "default"
 
+        alias = get_read_replica_alias()
+        if alias is None:
+            alias = replica_pool.select() or "default"
+            set_read_replica_alias(alias)
+        logger.debug(f"Routing read for {model._meta.label} to {alias} database")
+        return alias
+
     def db_for_write(self, model: Type[models.Model], **hints) -> str:
         """
         Determine which database to use for write operations.
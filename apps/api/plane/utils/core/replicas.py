@@ -0,0 +1,189 @@
+"""
+Read replica pool with lag tracking.
+This module keeps a per-process view of the configured read replicas, their
+replication lag and health, and picks the replica a request should read from.
+Replicas that lag too far behind the primary or fail their health check are
+ejected until a later check finds them healthy again.
+"""
+
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.db import DatabaseError, connections
+
+logger = logging.getLogger("plane.db")
+
+__all__ = [
+    "ReplicaState",
+    "ReplicaPool",
+    "replica_pool",
+    "parse_lsn",
+]
+
+# Replica lag, measured on the replica. When everything received has been
+# replayed the replica is caught up, whatever the age of the last transaction.
+REPLICA_LAG_QUERY = """
+SELECT
+    pg_is_in_recovery(),
+    CASE WHEN pg_is_in_recovery() THEN pg_last_wal_replay_lsn()::text ELSE pg_current_wal_lsn()::text END,
+    CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+"""
+
+PRIMARY_LSN_QUERY = "SELECT pg_current_wal_lsn()::text"
+
+
+def parse_lsn(lsn: Optional[str]) -> Optional[int]:
+    """
+    Convert a Postgres LSN such as '16/B374D848' to a byte position.
+    Args:
+        lsn: The textual LSN
+    Returns:
+        Optional[int]: The byte position, or None for a missing LSN
+    """
+    if not lsn:
+        return None
+    high, low = lsn.split("/")
+    return (int(high, 16) << 32) + int(low, 16)
+
+
+@dataclass
+class ReplicaState:
+    """Last known state of a replica"""
+
+    alias: str
+    weight: float = 1.0
+    healthy: bool = True
+    lag_seconds: float = 0.0
+    lag_bytes: Optional[int] = None
+    checked_at: float = 0.0
+
+
+class ReplicaPool:
+    """
+    Per-process registry of read replicas.
+    Replica health is checked lazily: a replica whose last check is older
+    than the health check interval is re-checked when it is next selected.
+    Selection is weighted random among healthy replicas, so a replica with
+    twice the weight receives twice the reads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._states: Optional[Dict[str, ReplicaState]] = None
+
+    @property
+    def max_lag_seconds(self) -> float:
+        return float(getattr(settings, "READ_REPLICA_MAX_LAG_SECONDS", 5))
+
+    @property
+    def max_lag_bytes(self) -> int:
+        return int(getattr(settings, "READ_REPLICA_MAX_LAG_BYTES", 64 * 1024 * 1024))
+
+    @property
+    def check_interval(self) -> float:
+        return float(getattr(settings, "READ_REPLICA_HEALTH_CHECK_INTERVAL", 5))
+
+    def get_states(self) -> Dict[str, ReplicaState]:
+        """
+        Return the state of every configured replica alias.
+        Aliases are the DATABASES entries starting with 'replica'; weights come
+        from the READ_REPLICA_WEIGHTS setting and default to 1.
+        """
+        with self._lock:
+            if self._states is None:
+                weights = getattr(settings, "READ_REPLICA_WEIGHTS", {})
+                self._states = {
+                    alias: ReplicaState(alias=alias, weight=float(weights.get(alias, 1)))
+                    for alias in settings.DATABASES
+                    if alias.startswith("replica")
+                }
+            return self._states
+
+    def reset(self) -> None:
+        """Forget all replica state, e.g. after the settings changed"""
+        with self._lock:
+            self._states = None
+
+    def check(self, state: ReplicaState, primary_lsn: Optional[int] = None) -> ReplicaState:
+        """
+        Measure the lag of a replica and mark it healthy or ejected.
+        Args:
+            state: The replica to check
+            primary_lsn: The current primary WAL position, if known
+        Returns:
+            ReplicaState: The updated state
+        """
+        try:
+            with connections[state.alias].cursor() as cursor:
+                cursor.execute(REPLICA_LAG_QUERY)
+                _, replay_lsn, lag_seconds = cursor.fetchone()
+
+            replay_position = parse_lsn(replay_lsn)
+            lag_bytes = None
+            if primary_lsn is not None and replay_position is not None:
+                lag_bytes = max(primary_lsn - replay_position, 0)
+
+            state.lag_seconds = float(lag_seconds or 0)
+            state.lag_bytes = lag_bytes
+            state.healthy = state.lag_seconds <= self.max_lag_seconds and (
+                lag_bytes is None or lag_bytes <= self.max_lag_bytes
+            )
+            if not state.healthy:
+                logger.warning(
+                    f"Ejecting replica {state.alias}: lag {state.lag_seconds:.1f}s / {lag_bytes} bytes",
+                )
+        except DatabaseError as e:
+            state.healthy = False
+            logger.warning(f"Ejecting replica {state.alias}: {e}")
+        finally:
+            state.checked_at = time.monotonic()
+        return state
+
+    def get_primary_lsn(self) -> Optional[int]:
+        try:
+            with connections["default"].cursor() as cursor:
+                cursor.execute(PRIMARY_LSN_QUERY)
+                return parse_lsn(cursor.fetchone()[0])
+        except DatabaseError:
+            return None
+
+    def refresh(self, force: bool = False) -> List[ReplicaState]:
+        """
+        Re-check replicas whose last check is older than the interval.
+        Returns:
+            List[ReplicaState]: The healthy replicas
+        """
+        states = list(self.get_states().values())
+        now = time.monotonic()
+        due = [state for state in states if force or now - state.checked_at >= self.check_interval]
+        if due:
+            primary_lsn = self.get_primary_lsn()
+            for state in due:
+                self.check(state, primary_lsn)
+        return [state for state in states if state.healthy]
+
+    def select(self) -> Optional[str]:
+        """
+        Pick a healthy replica for the current request.
+        Returns:
+            Optional[str]: A replica alias, or None when reads should go to
+            the primary because no replica is healthy
+        """
+        healthy = [state for state in self.refresh() if state.weight > 0]
+        if not healthy:
+            return None
+        if len(healthy) == 1:
+            return healthy[0].alias
+        return random.choices(healthy, weights=[state.weight for state in healthy])[0].alias
+
+
+replica_pool = ReplicaPool()
@@ -7,12 +7,16 @@ The context is maintained per request to ensure proper isolation between
 concurrent requests in async environments.
 """
 
+from typing import Optional
+
 from asgiref.local import Local
 
 __all__ = [
     "set_use_read_replica",
     "should_use_read_replica",
     "clear_read_replica_context",
+    "get_read_replica_alias",
+    "set_read_replica_alias",
 ]
 
 # Request-scoped context storage for database routing preferences
@@ -55,6 +59,26 @@ def should_use_read_replica() -> bool:
     return getattr(_db_routing_context, "use_read_replica", False)
 
 
+def get_read_replica_alias() -> Optional[str]:
+    """
+    Return the database alias chosen for the reads of the current request.
+    Returns:
+        Optional[str]: The alias, or None if no read has been routed yet
+    """
+    return getattr(_db_routing_context, "read_replica_alias", None)
+
+
+def set_read_replica_alias(alias: str) -> None:
+    """
+    Remember the database alias chosen for the current request.
+    All reads of a request go to the same database, so a request never mixes
+    rows from replicas at different replay positions.
+    Args:
+        alias (str): The chosen database alias
+    """
+    _db_routing_context.read_replica_alias = alias
+
+
 def clear_read_replica_context() -> None:
     """
     Clear the read replica context for the current request.
@@ -66,7 +90,8 @@ def clear_read_replica_context() -> None:
     - Ensuring clean state for each new request
     - Proper memory management in long-running processes
     """
-    try:
-        delattr(_db_routing_context, "use_read_replica")
-    except AttributeError:
-        pass
+    for attribute in ("use_read_replica", "read_replica_alias"):
+        try:
+            delattr(_db_routing_context, attribute)
+        except AttributeError:
+            pass
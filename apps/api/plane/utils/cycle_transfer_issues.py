@@ -26,6 +26,8 @@ from plane.db.models import (
 from plane.utils.analytics_plot import burndown_plot
 from plane.bgtasks.issue_activities_task import issue_activity
 from plane.utils.host import base_host
+from plane.utils.issue_counters import refresh_issue_counters
+from plane.utils.issue_stats import refresh_cycle_stats
 
 
 def transfer_cycle_issues(
@@ -464,6 +466,8 @@ def transfer_cycle_issues(
     cycle_issues = CycleIssue.objects.bulk_update(
         updated_cycles, ["cycle_id"], batch_size=100
     )
+    refresh_cycle_stats([cycle_id, new_cycle_id])
+    refresh_issue_counters([cycle_issue.issue_id for cycle_issue in updated_cycles])
 
     # Capture Issue Activity
     issue_activity.delay(
@@ -0,0 +1,355 @@
+"""
+Compiler for the issue filters.
+
+The rich JSON filters and the legacy query param filters are normalized into
+one canonical tree of JSON lists:
+
+    ["and", [node, ...]]
+    ["or", [node, ...]]
+    ["not", node]
+    ["filter", key, value]   # a FilterSet filter, e.g. state_id__in
+    ["lookup", key, value]   # a Django lookup built by issue_filters
+
+Nested nodes of the same operator are flattened, `__in` values are sorted and
+the children of a node are put in a stable order, so equivalent filters share
+one tree and one signature. The children of an AND node are ordered by
+selectivity: equality on indexed columns first, then IN lists, joined
+relations, ranges and text search last.
+
+Compiled Q objects are cached per process by FilterSet and signature, so
+repeated filters skip building and validating a FilterSet per leaf. The
+indexes the compiled filters rely on are published in
+FILTER_INDEX_REQUIREMENTS.
+"""
+
+# Python imports
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+# Django imports
+from django.apps import apps
+from django.core.exceptions import ValidationError
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import Q
+from django.http import QueryDict
+from django_filters.utils import translate_validation
+
+# Number of compiled filters kept per process
+COMPILED_FILTER_CACHE_SIZE = 1024
+
+# Lookups stripped from a filter key to find the filtered field
+LOOKUPS = {"exact", "iexact", "in", "range", "gt", "gte", "lt", "lte", "isnull", "contains", "icontains"}
+
+# Legacy lookup paths and the rich filter field they match
+LEGACY_FIELD_NAMES = {
+    "id": "id",
+    "project": "project_id",
+    "state": "state_id",
+    "state__group": "state_group",
+    "parent": "parent_id",
+    "created_by": "created_by_id",
+    "labels": "label_id",
+    "assignees": "assignee_id",
+    "issue_cycle__cycle_id": "cycle_id",
+    "issue_module__module_id": "module_id",
+    "issue_mention__mention_id": "mention_id",
+    "issue_subscribers__subscriber_id": "subscriber_id",
+}
+
+# Selectivity rank of the filtered fields, lower is applied first
+FIELD_RANKS = {
+    "id": 0,
+    "project_id": 1,
+    "state_id": 2,
+    "parent_id": 2,
+    "created_by_id": 3,
+    "cycle_id": 4,
+    "module_id": 4,
+    "assignee_id": 5,
+    "label_id": 5,
+    "mention_id": 5,
+    "subscriber_id": 5,
+    "priority": 6,
+    "state_group": 7,
+    "target_date": 8,
+    "start_date": 8,
+    "created_at": 8,
+    "updated_at": 8,
+    "is_draft": 9,
+    "is_archived": 9,
+}
+UNKNOWN_FIELD_RANK = 10
+LOOKUP_RANKS = {"exact": 0, "isnull": 1, "in": 2, "range": 3, "gt": 3, "gte": 3, "lt": 3, "lte": 3}
+UNKNOWN_LOOKUP_RANK = 4
+
+# Indexes the filters on each field rely on, as (model label, columns)
+FILTER_INDEX_REQUIREMENTS = {
+    "id": ("db.Issue", ("id",)),
+    "project_id": ("db.Issue", ("project_id",)),
+    "state_id": ("db.Issue", ("state_id",)),
+    "parent_id": ("db.Issue", ("parent_id",)),
+    "created_by_id": ("db.Issue", ("created_by_id",)),
+    "priority": ("db.Issue", ("priority",)),
+    "start_date": ("db.Issue", ("start_date",)),
+    "target_date": ("db.Issue", ("target_date",)),
+    "created_at": ("db.Issue", ("created_at",)),
+    "updated_at": ("db.Issue", ("updated_at",)),
+    "state_group": ("db.State", ("group",)),
+    "cycle_id": ("db.CycleIssue", ("cycle_id",)),
+    "module_id": ("db.ModuleIssue", ("module_id",)),
+    "assignee_id": ("db.IssueAssignee", ("assignee_id",)),
+    "label_id": ("db.IssueLabel", ("label_id",)),
+    "mention_id": ("db.IssueMention", ("mention_id",)),
+    "subscriber_id": ("db.IssueSubscriber", ("subscriber_id",)),
+}
+
+_compiled_cache = OrderedDict()
+_compiled_cache_lock = threading.Lock()
+
+
+def _canonical_json(value):
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _normalize_value(key, value):
+    # The order of a range is meaningful, the order of an IN list is not
+    if isinstance(value, (list, tuple)):
+        values = list(value)
+        if key.endswith("__in"):
+            values = sorted(values, key=str)
+        return values
+    if isinstance(value, str) and key.endswith("__in"):
+        return ",".join(sorted(value.split(",")))
+    return value
+
+
+def split_filter_key(key, kind="filter"):
+    """Return the rich field name and the lookup of a filter key"""
+    parts = key.split("__")
+    lookup = "exact"
+    while len(parts) > 1 and parts[-1] in LOOKUPS:
+        lookup = parts.pop()
+    path = "__".join(parts)
+    if kind == "lookup":
+        path = LEGACY_FIELD_NAMES.get(path, path)
+    return path, lookup
+
+
+def _rank(node):
+    if node[0] in ("filter", "lookup"):
+        field, lookup = split_filter_key(node[1], node[0])
+        return (
+            FIELD_RANKS.get(field, UNKNOWN_FIELD_RANK),
+            LOOKUP_RANKS.get(lookup, UNKNOWN_LOOKUP_RANK),
+            _canonical_json(node),
+        )
+    # Nested logical nodes are evaluated after the plain predicates
+    return (UNKNOWN_FIELD_RANK + 1, UNKNOWN_LOOKUP_RANK, _canonical_json(node))
+
+
+def _combine(operator, children):
+    flattened = []
+    for child in children:
+        if child is None:
+            continue
+        if child[0] == operator:
+            flattened.extend(child[1])
+        else:
+            flattened.append(child)
+
+    if not flattened:
+        return None
+    if len(flattened) == 1:
+        return flattened[0]
+    return [operator, sorted(flattened, key=_rank)]
+
+
+def normalize_rich_filters(filter_data):
+    """Canonical tree of a rich JSON filter, None when it filters nothing"""
+    if not isinstance(filter_data, dict) or not filter_data:
+        return None
+
+    for key, value in filter_data.items():
+        operator = key.lower() if isinstance(key, str) else None
+        if operator in ("and", "or"):
+            if not isinstance(value, list):
+                return None
+            return _combine(operator, [normalize_rich_filters(child) for child in value])
+        if operator == "not":
+            child = normalize_rich_filters(value)
+            if child is None:
+                return None
+            # Double negations cancel out
+            if child[0] == "not":
+                return child[1]
+            return ["not", child]
+
+    return _combine(
+        "and",
+        [["filter", key, _normalize_value(key, value)] for key, value in filter_data.items()],
+    )
+
+
+def normalize_legacy_filters(filters):
+    """Canonical tree of the lookups returned by issue_filters"""
+    if not filters:
+        return None
+    return _combine(
+        "and",
+        [["lookup", key, _normalize_value(key, value)] for key, value in filters.items()],
+    )
+
+
+def get_filter_signature(tree):
+    return hashlib.sha256(_canonical_json(tree).encode("utf-8")).hexdigest()
+
+
+def get_filter_fields(tree):
+    """Rich field names filtered anywhere in the tree"""
+    if tree is None:
+        return set()
+    if tree[0] in ("filter", "lookup"):
+        return {split_filter_key(tree[1], tree[0])[0]}
+    if tree[0] == "not":
+        return get_filter_fields(tree[1])
+    fields = set()
+    for child in tree[1]:
+        fields |= get_filter_fields(child)
+    return fields
+
+
+def get_index_requirements(tree):
+    """Indexes, as (model label, columns), the compiled filter relies on"""
+    return sorted(
+        {FILTER_INDEX_REQUIREMENTS[field] for field in get_filter_fields(tree) if field in FILTER_INDEX_REQUIREMENTS}
+    )
+
+
+def get_missing_filter_indexes(using=DEFAULT_DB_ALIAS):
+    """Index requirements with no index starting with the required columns"""
+    connection = connections[using]
+    missing = []
+    with connection.cursor() as cursor:
+        for model_label, columns in sorted(set(FILTER_INDEX_REQUIREMENTS.values())):
+            table = apps.get_model(model_label)._meta.db_table
+            constraints = connection.introspection.get_constraints(cursor, table)
+            if not any(
+                (constraint["index"] or constraint["primary_key"] or constraint["unique"])
+                and constraint["columns"][: len(columns)] == list(columns)
+                for constraint in constraints.values()
+            ):
+                missing.append((model_label, table, columns))
+    return missing
+
+
+def build_filterset_q(filterset_class, conditions, queryset=None):
+    """Validate leaf conditions with the FilterSet and return their Q object"""
+    # Build a QueryDict from the leaf conditions
+    qd = QueryDict(mutable=True)
+    for key, value in conditions.items():
+        # Default serialization to string; QueryDict expects strings
+        if isinstance(value, list):
+            # Repeat key for list values (e.g., __in)
+            qd.setlist(key, [str(v) for v in value])
+        else:
+            qd[key] = "" if value is None else str(value)
+
+    qd = qd.copy()
+    qd._mutable = False
+
+    # Custom filter methods may need access to the queryset for filtering
+    fs = filterset_class(data=qd, queryset=queryset)
+
+    if not fs.is_valid():
+        raise translate_validation(fs.errors)
+
+    if not hasattr(fs, "build_combined_q"):
+        raise ValidationError("FilterSet must have build_combined_q method for complex filtering")
+
+    return fs.build_combined_q()
+
+
+def _compile_node(tree, filterset_class, queryset):
+    operator = tree[0]
+
+    if operator == "lookup":
+        return Q(**{tree[1]: tree[2]})
+
+    if operator == "filter":
+        if filterset_class is None:
+            raise ValidationError("Filtering requires a filterset_class to be defined on the view")
+        return build_filterset_q(filterset_class, {tree[1]: tree[2]}, queryset)
+
+    if operator == "not":
+        return ~_compile_node(tree[1], filterset_class, queryset)
+
+    combined_q = Q()
+    for child in tree[1]:
+        child_q = _compile_node(child, filterset_class, queryset)
+        if operator == "or":
+            combined_q |= child_q
+        else:
+            combined_q &= child_q
+    return combined_q
+
+
+def _has_filterset_nodes(tree):
+    if tree[0] in ("filter", "lookup"):
+        return tree[0] == "filter"
+    if tree[0] == "not":
+        return _has_filterset_nodes(tree[1])
+    return any(_has_filterset_nodes(child) for child in tree[1])
+
+
+def _is_cacheable(tree, filterset_class):
+    # FilterSet methods may build their Q from the queryset, which is not part of the signature
+    if filterset_class is not None and _has_filterset_nodes(tree):
+        return getattr(filterset_class, "cache_compiled_filters", False)
+    return True
+
+
+def get_compiled_filter(filterset_class, signature):
+    with _compiled_cache_lock:
+        key = (filterset_class, signature)
+        compiled_q = _compiled_cache.get(key)
+        if compiled_q is not None:
+            _compiled_cache.move_to_end(key)
+        return compiled_q
+
+
+def set_compiled_filter(filterset_class, signature, compiled_q):
+    with _compiled_cache_lock:
+        _compiled_cache[(filterset_class, signature)] = compiled_q
+        _compiled_cache.move_to_end((filterset_class, signature))
+        while len(_compiled_cache) > COMPILED_FILTER_CACHE_SIZE:
+            _compiled_cache.popitem(last=False)
+
+
+def clear_compiled_filters():
+    with _compiled_cache_lock:
+        _compiled_cache.clear()
+
+
+def compile_filter_tree(tree, filterset_class=None, queryset=None, signature=None):
+    """Compile a canonical filter tree into a Q object, None when the tree filters nothing"""
+    if tree is None:
+        return None
+
+    cacheable = _is_cacheable(tree, filterset_class)
+    if cacheable:
+        signature = signature or get_filter_signature(tree)
+        compiled_q = get_compiled_filter(filterset_class, signature)
+        if compiled_q is not None:
+            return compiled_q
+
+    compiled_q = _compile_node(tree, filterset_class, queryset)
+    if cacheable:
+        set_compiled_filter(filterset_class, signature, compiled_q)
+    return compiled_q
+
+
+def compile_legacy_filters(filters):
+    """Q object of the lookups returned by issue_filters, ordered by selectivity"""
+    return compile_filter_tree(normalize_legacy_filters(filters))
@@ -1,11 +1,10 @@
 import json
 
 from django.core.exceptions import ValidationError
-from django.db.models import Q
-from django.http import QueryDict
-from django_filters.utils import translate_validation
 from rest_framework import filters
 
+from .compiler import compile_filter_tree, normalize_rich_filters
+
 
 class ComplexFilterBackend(filters.BaseFilterBackend):
     """
@@ -69,8 +68,12 @@ class ComplexFilterBackend(filters.BaseFilterBackend):
         # Validate against the view's FilterSet (only declared filters are allowed)
         self._validate_fields(filter_data, view)
 
-        # Build combined Q object from the filter tree
-        combined_q = self._evaluate_node(filter_data, view, queryset)
+        # Compile the canonical filter tree, reusing the Q of an identical filter
+        combined_q = compile_filter_tree(
+            normalize_rich_filters(filter_data),
+            filterset_class=getattr(view, "filterset_class", None),
+            queryset=queryset,
+        )
         if combined_q is None:
             return queryset
 
@@ -117,103 +120,6 @@ class ComplexFilterBackend(filters.BaseFilterBackend):
             return fields
         return []
 
-    def _evaluate_node(self, node, view, queryset):
-        """
-        Recursively evaluate a JSON node into a combined Q object.
-
-        Rules:
-        - leaf dict → evaluated through FilterSet to produce a Q object
-        - {"or": [...]} → Q() | Q() | ... (OR of children)
-        - {"and": [...]} → Q() & Q() & ... (AND of children)
-        - {"not": {...}} → ~Q() (negation of child)
-
-        Returns a Q object that can be applied to a queryset.
-        """
-        if not isinstance(node, dict):
-            return None
-
-        # 'or' combination - OR of child Q objects
-        if "or" in node:
-            children = node["or"]
-            if not isinstance(children, list) or not children:
-                return None
-            combined_q = Q()
-            for child in children:
-                child_q = self._evaluate_node(child, view, queryset)
-                if child_q is None:
-                    continue
-                combined_q |= child_q
-            return combined_q
-
-        # 'and' combination - AND of child Q objects
-        if "and" in node:
-            children = node["and"]
-            if not isinstance(children, list) or not children:
-                return None
-            combined_q = Q()
-            for child in children:
-                child_q = self._evaluate_node(child, view, queryset)
-                if child_q is None:
-                    continue
-                combined_q &= child_q
-            return combined_q
-
-        # 'not' negation - negate the child Q object
-        if "not" in node:
-            child = node["not"]
-            if not isinstance(child, dict):
-                return None
-            child_q = self._evaluate_node(child, view, queryset)
-            if child_q is None:
-                return None
-            return ~child_q
-
-        # Leaf dict: evaluate via FilterSet to get a Q object
-        return self._build_leaf_q(node, view, queryset)
-
-    def _build_leaf_q(self, leaf_conditions, view, queryset):
-        """Build a Q object from leaf filter conditions using the view's FilterSet.
-
-        We serialize the leaf dict into a QueryDict and let the view's
-        filterset_class perform validation and build a combined Q object
-        from all the field filters.
-
-        Returns a Q object representing all the field conditions in the leaf.
-        """
-        if not leaf_conditions:
-            return Q()
-
-        # Get the filterset class from the view
-        filterset_class = getattr(view, "filterset_class", None)
-        if not filterset_class:
-            raise ValidationError("Filtering requires a filterset_class to be defined on the view")
-
-        # Build a QueryDict from the leaf conditions
-        qd = QueryDict(mutable=True)
-        for key, value in leaf_conditions.items():
-            # Default serialization to string; QueryDict expects strings
-            if isinstance(value, list):
-                # Repeat key for list values (e.g., __in)
-                qd.setlist(key, [str(v) for v in value])
-            else:
-                qd[key] = "" if value is None else str(value)
-
-        qd = qd.copy()
-        qd._mutable = False
-
-        # Instantiate the filterset with the actual queryset
-        # Custom filter methods may need access to the queryset for filtering
-        fs = filterset_class(data=qd, queryset=queryset)
-
-        if not fs.is_valid():
-            raise translate_validation(fs.errors)
-
-        # Build and return the combined Q object
-        if not hasattr(fs, "build_combined_q"):
-            raise ValidationError("FilterSet must have build_combined_q method for complex filtering")
-
-        return fs.build_combined_q()
-
     def _get_max_depth(self, view):
         """Return the maximum allowed nesting depth for complex filters.
 
@@ -16,6 +16,10 @@ class CharInFilter(filters.BaseInFilter, filters.CharFilter):
 
 
 class BaseFilterSet(FilterSet):
+    # Set when every filter builds its Q object without reading the queryset,
+    # so the compiled filters can be reused across requests
+    cache_compiled_filters = False
+
     @classmethod
     def get_filters(cls):
         """
@@ -118,6 +122,8 @@ class BaseFilterSet(FilterSet):
 
 
 class IssueFilterSet(BaseFilterSet):
+    cache_compiled_filters = True
+
     # Custom filter methods to handle soft delete exclusion for relations
 
     assignee_id = filters.UUIDFilter(method="filter_assignee_id")
@@ -1,8 +1,8 @@
 # Django imports
 from django.contrib.postgres.aggregates import ArrayAgg
 from django.contrib.postgres.fields import ArrayField
-from django.db.models import Q, UUIDField, Value, QuerySet, OuterRef, Subquery
-from django.db.models.functions import Coalesce
+from django.db.models import CharField, F, Q, UUIDField, Value, QuerySet, OuterRef, Subquery, Window
+from django.db.models.functions import Coalesce, RowNumber
 
 # Module imports
 from plane.db.models import (
@@ -18,6 +18,7 @@ from plane.db.models import (
     ModuleIssue,
     IssueLabel,
 )
+from plane.utils.paginator import ColumnarResults
 from typing import Optional, Dict, Tuple, Any, Union, List
 
 
@@ -134,80 +135,100 @@ def issue_on_results(
         original_list.append(sub_group_by)
 
     required_fields.extend(original_list)
-    return list(issues.values(*required_fields))
+    # Read as tuples, the paginators shape the rows into the grouped response
+    return ColumnarResults.from_queryset(issues, required_fields)
 
 
-def issue_group_values(
-    field: str,
-    slug: str,
-    project_id: Optional[str] = None,
-    filters: Dict[str, Any] = {},
-    queryset: Optional[QuerySet] = None,
-) -> List[Union[str, Any]]:
-    if field == "state_id":
-        queryset = State.objects.filter(is_triage=False, workspace__slug=slug).values_list("id", flat=True)
-        if project_id:
-            return list(queryset.filter(project_id=project_id))
-        return list(queryset)
+# Group values that do not depend on the issues
+STATIC_GROUP_VALUES: Dict[str, List[str]] = {
+    "priority": ["low", "medium", "high", "urgent", "none"],
+    "state__group": ["backlog", "unstarted", "started", "completed", "cancelled"],
+}
 
-    if field == "labels__id":
-        queryset = Label.objects.filter(workspace__slug=slug).values_list("id", flat=True)
-        if project_id:
-            return list(queryset.filter(project_id=project_id)) + ["None"]
-        return list(queryset) + ["None"]
+# Group values read from the issues themselves
+ISSUE_GROUP_FIELDS: List[str] = ["target_date", "start_date", "created_by"]
 
-    if field == "assignees__id":
-        if project_id:
-            return list(
-                ProjectMember.objects.filter(workspace__slug=slug, project_id=project_id, is_active=True).values_list(
-                    "member_id", flat=True
-                )
-            )
-        return list(
-            WorkspaceMember.objects.filter(workspace__slug=slug, is_active=True).values_list("member_id", flat=True)
-        )
+# Groups that also hold the issues without a value
+NULLABLE_GROUP_FIELDS: List[str] = ["labels__id", "issue_module__module_id", "cycle_id"]
 
-    if field == "issue_module__module_id":
-        queryset = Module.objects.filter(workspace__slug=slug).values_list("id", flat=True)
-        if project_id:
-            return list(queryset.filter(project_id=project_id)) + ["None"]
-        return list(queryset) + ["None"]
 
-    if field == "cycle_id":
-        queryset = Cycle.objects.filter(workspace__slug=slug).values_list("id", flat=True)
+def get_group_value_queryset(field: str, slug: str, project_id: Optional[str] = None) -> Optional[Tuple[QuerySet, str]]:
+    """Queryset and column holding the possible values of a related group"""
+    if field == "assignees__id":
         if project_id:
-            return list(queryset.filter(project_id=project_id)) + ["None"]
-        return list(queryset) + ["None"]
+            return ProjectMember.objects.filter(
+                workspace__slug=slug, project_id=project_id, is_active=True
+            ), "member_id"
+        return WorkspaceMember.objects.filter(workspace__slug=slug, is_active=True), "member_id"
 
     if field == "project_id":
-        queryset = Project.objects.filter(workspace__slug=slug).values_list("id", flat=True)
-        return list(queryset)
-
-    if field == "priority":
-        return ["low", "medium", "high", "urgent", "none"]
+        return Project.objects.filter(workspace__slug=slug), "id"
 
-    if field == "state__group":
-        return ["backlog", "unstarted", "started", "completed", "cancelled"]
-
-    if field == "target_date":
-        queryset = queryset.values_list("target_date", flat=True).distinct()
-        if project_id:
-            return list(queryset.filter(project_id=project_id))
-        else:
-            return list(queryset)
-
-    if field == "start_date":
-        queryset = queryset.values_list("start_date", flat=True).distinct()
-        if project_id:
-            return list(queryset.filter(project_id=project_id))
+    if field == "state_id":
+        queryset = State.objects.filter(is_triage=False, workspace__slug=slug)
+    elif field == "labels__id":
+        queryset = Label.objects.filter(workspace__slug=slug)
+    elif field == "issue_module__module_id":
+        queryset = Module.objects.filter(workspace__slug=slug)
+    elif field == "cycle_id":
+        queryset = Cycle.objects.filter(workspace__slug=slug)
+    else:
+        return None
+
+    if project_id:
+        queryset = queryset.filter(project_id=project_id)
+    return queryset, "id"
+
+
+def issue_group_values_batch(
+    fields: List[str],
+    slug: str,
+    project_id: Optional[str] = None,
+    queryset: Optional[QuerySet] = None,
+) -> Dict[str, List[Union[str, Any]]]:
+    """
+    Possible values of several group fields, e.g. the group and sub group of
+    a board. The related groups are read together with a single UNION ALL
+    query, each keeping the default ordering of its model.
+    """
+    values: Dict[str, List[Union[str, Any]]] = {field: [] for field in fields}
+    lookups = []
+    for field in fields:
+        if field in STATIC_GROUP_VALUES:
+            values[field] = list(STATIC_GROUP_VALUES[field])
+        elif field in ISSUE_GROUP_FIELDS:
+            issue_values = queryset.values_list(field, flat=True).order_by().distinct()
+            if project_id:
+                issue_values = issue_values.filter(project_id=project_id)
+            values[field] = list(issue_values)
         else:
-            return list(queryset)
+            lookup = get_group_value_queryset(field, slug, project_id)
+            if lookup is None:
+                continue
+            lookup, column = lookup
+            lookups.append(
+                lookup.annotate(
+                    group_field=Value(field, output_field=CharField()),
+                    group_value=F(column),
+                    group_position=Window(
+                        expression=RowNumber(),
+                        order_by=[
+                            F(name[1:]).desc() if name.startswith("-") else F(name).asc()
+                            for name in lookup.model._meta.ordering
+                        ]
+                        or None,
+                    ),
+                )
+                .values_list("group_field", "group_value", "group_position")
+                .order_by()
+            )
 
-    if field == "created_by":
-        queryset = queryset.values_list("created_by", flat=True).distinct()
-        if project_id:
-            return list(queryset.filter(project_id=project_id))
-        else:
-            return list(queryset)
+    if lookups:
+        rows = lookups[0].union(*lookups[1:], all=True) if len(lookups) > 1 else lookups[0]
+        for field, value, _ in sorted(rows, key=lambda row: (row[0], row[2])):
+            values[field].append(value)
 
-    return []
+    for field in fields:
+        if field in NULLABLE_GROUP_FIELDS:
+            values[field].append("None")
+    return values
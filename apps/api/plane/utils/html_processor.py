@@ -1,27 +1,158 @@
-from io import StringIO
+# Python imports
+import hashlib
+import threading
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
 from html.parser import HTMLParser
+from io import StringIO
+from types import MappingProxyType
+
+# Editor components whose attributes are collected while extracting
+COMPONENT_TAGS = ("mention-component", "image-component")
+
+# Total size of the HTML values whose extraction results are kept per process
+EXTRACTION_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# Values larger than this are parsed on every call rather than cached
+EXTRACTION_CACHE_MAX_ENTRY_BYTES = 1024 * 1024
 
 
-class MLStripper(HTMLParser):
+@dataclass(frozen=True)
+class HTMLContent:
     """
-    Markup Language Stripper
+    Everything downstream consumers need from one parse of an HTML value.
+    Results are shared through the cache, so the mappings are read-only.
+    """
+
+    content_hash: str
+    text: str = ""
+    word_count: int = 0
+    # Entity identifiers of `user_mention` mention components, in document order
+    mentions: tuple = ()
+    # Mapping of tag name -> tuple of `src` values found on that tag
+    assets: MappingProxyType = field(default_factory=lambda: MappingProxyType({}))
+    # Mapping of component tag -> tuple of attribute mappings, one per occurrence
+    components: MappingProxyType = field(default_factory=lambda: MappingProxyType({}))
+
+
+class HTMLContentExtractor(HTMLParser):
+    """
+    Streaming extractor that collects text, mentions, asset sources and
+    editor components in a single tokenizer pass.
     """
 
     def __init__(self):
-        super().__init__()
-        self.reset()
-        self.strict = False
-        self.convert_charrefs = True
+        super().__init__(convert_charrefs=True)
         self.text = StringIO()
+        self.mentions = []
+        self.assets = defaultdict(list)
+        self.components = defaultdict(list)
+
+    def handle_starttag(self, tag, attrs):
+        if not attrs:
+            return
+
+        attributes = dict(attrs)
+        src = attributes.get("src")
+        if src:
+            self.assets[tag].append(src)
+
+        if tag in COMPONENT_TAGS:
+            self.components[tag].append(attributes)
+            if attributes.get("entity_name") == "user_mention" and attributes.get("entity_identifier"):
+                self.mentions.append(attributes["entity_identifier"])
 
     def handle_data(self, d):
         self.text.write(d)
 
-    def get_data(self):
-        return self.text.getvalue()
+    def get_content(self, content_hash):
+        text = self.text.getvalue()
+        return HTMLContent(
+            content_hash=content_hash,
+            text=text,
+            word_count=len(text.split()),
+            mentions=tuple(self.mentions),
+            assets=MappingProxyType({tag: tuple(srcs) for tag, srcs in self.assets.items()}),
+            components=MappingProxyType(
+                {tag: tuple(MappingProxyType(item) for item in items) for tag, items in self.components.items()}
+            ),
+        )
+
+
+class _ExtractionCache:
+    """
+    Thread safe, process local LRU of extraction results keyed by content hash,
+    bounded by the total size of the HTML values they were extracted from.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key, content, size):
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= previous[1]
+            self._entries[key] = (content, size)
+            self.size += size
+            while self.size > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.size -= evicted_size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+extraction_cache = _ExtractionCache(EXTRACTION_CACHE_MAX_BYTES)
+
+
+def get_content_hash(html):
+    """Stable hash of an HTML value, usable as a cache key across processes"""
+    return hashlib.blake2b((html or "").encode("utf-8"), digest_size=16).hexdigest()
+
+
+def extract_html_content(html, use_cache=True):
+    """
+    Parse the HTML once and return its text, mentions, assets and components.
+
+    Results are memoized per process by content hash, so repeated saves of an
+    unchanged description and the background tasks consuming it share a parse.
+    Values above EXTRACTION_CACHE_MAX_ENTRY_BYTES are always parsed afresh.
+    """
+    content_hash = get_content_hash(html)
+    if not html:
+        return HTMLContent(content_hash=content_hash)
+
+    # The text and attributes kept are at most as large as the value itself
+    size = len(html)
+    use_cache = use_cache and size <= EXTRACTION_CACHE_MAX_ENTRY_BYTES
+    if use_cache:
+        content = extraction_cache.get(content_hash)
+        if content is not None:
+            return content
+
+    extractor = HTMLContentExtractor()
+    extractor.feed(html)
+    extractor.close()
+    content = extractor.get_content(content_hash)
+
+    if use_cache:
+        extraction_cache.set(content_hash, content, size)
+    return content
 
 
 def strip_tags(html):
-    s = MLStripper()
-    s.feed(html)
-    return s.get_data()
+    return extract_html_content(html).text
@@ -0,0 +1,114 @@
+"""
+Maintenance of the precomputed issue counters.
+
+Every issue with sub issues, links, attachments or a cycle has an
+issue_counters row holding its counts and current cycle, so the issue lists
+read them as columns instead of running four correlated subqueries per row.
+An issue without a row has no sub issues, links, attachments nor cycle.
+
+As with the module and cycle stats, rows are recomputed rather than
+incremented, once the transaction commits and under a lock per issue.
+Single-row saves of issues, links, attachments, cycle issues and
+intake issues are covered by the receivers below, bulk writes refresh
+explicitly and the daily repair_issue_counters task corrects any drift.
+"""
+
+# Django imports
+from django.db.models import Count, F, IntegerField, Value
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+# Module imports
+from plane.db.models import CycleIssue, FileAsset, IntakeIssue, Issue, IssueCounter, IssueLink
+from plane.utils.issue_stats import refresh_on_commit
+
+
+def get_issue_counter_annotations():
+    """Annotations reading the precomputed counters of an issue queryset"""
+    return {
+        "cycle_id": F("counters__cycle_id"),
+        **{
+            field: Coalesce(F(f"counters__{field}"), Value(0, output_field=IntegerField()))
+            for field in IssueCounter.COUNTER_FIELDS
+        },
+    }
+
+
+def get_counts(queryset, field):
+    return dict(queryset.values(field).annotate(count=Count("id", distinct=True)).values_list(field, "count"))
+
+
+def refresh_issue_counters(issue_ids):
+    """Recompute the counters and current cycle of the given issues once the transaction commits"""
+    issue_ids = {issue_id for issue_id in issue_ids if issue_id}
+    if issue_ids:
+        refresh_on_commit(recompute_issue_counters, issue_ids)
+
+
+def recompute_issue_counters(issue_ids):
+    issues = Issue.all_objects.filter(id__in=issue_ids).values_list("id", "workspace_id", "project_id")
+    counts = {
+        "sub_issues_count": get_counts(Issue.issue_objects.filter(parent_id__in=issue_ids), "parent_id"),
+        "link_count": get_counts(IssueLink.objects.filter(issue_id__in=issue_ids), "issue_id"),
+        "attachment_count": get_counts(
+            FileAsset.objects.filter(issue_id__in=issue_ids, entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT),
+            "issue_id",
+        ),
+    }
+    cycle_ids = dict(CycleIssue.objects.filter(issue_id__in=issue_ids).values_list("issue_id", "cycle_id"))
+
+    IssueCounter.objects.bulk_create(
+        [
+            IssueCounter(
+                workspace_id=workspace_id,
+                project_id=project_id,
+                issue_id=issue_id,
+                cycle_id=cycle_ids.get(issue_id),
+                **{field: counts[field].get(issue_id, 0) for field in IssueCounter.COUNTER_FIELDS},
+            )
+            for issue_id, workspace_id, project_id in issues
+        ],
+        batch_size=500,
+        update_conflicts=True,
+        unique_fields=["issue"],
+        update_fields=[*IssueCounter.COUNTER_FIELDS, "cycle", "updated_at"],
+    )
+
+
+def refresh_parent_counters(issue_ids):
+    """Recompute the sub issue counts of the parents of the issues, e.g. after bulk archive"""
+    refresh_issue_counters(Issue.all_objects.filter(id__in=issue_ids).values_list("parent_id", flat=True))
+
+
+@receiver(post_save, sender=Issue)
+def issue_counters_on_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    counter_values = instance.get_counter_values()
+    loaded_values = getattr(instance, "_loaded_counter_values", None)
+    instance._loaded_counter_values = counter_values
+    if loaded_values == counter_values:
+        return
+    # Both the old and the new parent when the issue moves
+    refresh_issue_counters([instance.parent_id, loaded_values[0] if loaded_values else None])
+
+
+@receiver(post_save, sender=IssueLink)
+@receiver(post_save, sender=CycleIssue)
+def issue_counters_on_related_save(sender, instance, raw=False, **kwargs):
+    if not raw:
+        refresh_issue_counters([instance.issue_id])
+
+
+@receiver(post_save, sender=FileAsset)
+def issue_counters_on_attachment_save(sender, instance, raw=False, **kwargs):
+    if not raw and instance.issue_id and instance.entity_type == FileAsset.EntityTypeContext.ISSUE_ATTACHMENT:
+        refresh_issue_counters([instance.issue_id])
+
+
+@receiver(post_save, sender=IntakeIssue)
+def issue_counters_on_intake_save(sender, instance, raw=False, **kwargs):
+    # Accepting or declining an intake issue shows or hides it as a sub issue
+    if not raw:
+        refresh_parent_counters([instance.issue_id])
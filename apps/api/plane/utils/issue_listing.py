@@ -0,0 +1,122 @@
+# Django imports
+from django.db.models import Q
+
+# Third party imports
+from rest_framework import status
+from rest_framework.response import Response
+
+# Module imports
+from plane.utils.filters.compiler import compile_legacy_filters
+from plane.utils.grouper import issue_group_values_batch, issue_on_results, issue_queryset_grouper
+from plane.utils.issue_filters import issue_filters
+from plane.utils.order_queryset import order_issue_queryset
+from plane.utils.paginator import GroupedOffsetPaginator, SubGroupedOffsetPaginator
+
+# Issues counted in the group totals of a board
+ISSUE_COUNT_FILTER = Q(
+    Q(issue_intake__status=1) | Q(issue_intake__status=-1) | Q(issue_intake__status=2) | Q(issue_intake__isnull=True),
+    archived_at__isnull=True,
+    is_draft=False,
+)
+
+
+class IssueListQuery:
+    """
+    Builds the queries of a paginated issue listing from a single base.
+
+    The rich filters of the view and the legacy query param filters are
+    applied once. The total count and the issue-derived group values are read
+    from that base, while the page queryset adds the annotations, ordering and
+    grouping on top of it. Every queryset method returns a clone, so the base
+    is shared without copying it.
+    """
+
+    def __init__(
+        self,
+        view,
+        request,
+        queryset,
+        order_by="-created_at",
+        filter_backends=True,
+        grouped=True,
+        grouper=issue_queryset_grouper,
+    ):
+        self.view = view
+        self.grouper = grouper
+        self.request = request
+        self.filters = issue_filters(request.query_params, "GET")
+
+        # Apply rich filters
+        if filter_backends:
+            queryset = view.filter_queryset(queryset)
+
+        # Apply legacy filters, compiled separately as they may join the same relations
+        legacy_q = compile_legacy_filters(self.filters)
+        self.queryset = queryset.filter(legacy_q) if legacy_q is not None else queryset
+
+        # Flat listings skip the grouping and the m2m id annotations
+        self.grouped = grouped
+        self.order_by_param = request.GET.get("order_by", order_by)
+        self.group_by = request.GET.get("group_by", False) if grouped else False
+        self.sub_group_by = request.GET.get("sub_group_by", False) if grouped else False
+
+    def filter(self, *args, **kwargs):
+        """Narrow the base, e.g. for permissions, before any query is built"""
+        self.queryset = self.queryset.filter(*args, **kwargs)
+        return self
+
+    def get_count_queryset(self):
+        # Only the ids are needed to count the distinct issues
+        return self.queryset.values("id")
+
+    def get_page_queryset(self, annotate=None):
+        """Annotated, ordered and grouped queryset with the resolved order by"""
+        queryset = annotate(self.queryset) if annotate else self.queryset
+        queryset, order_by_param = order_issue_queryset(issue_queryset=queryset, order_by_param=self.order_by_param)
+        if self.grouped:
+            queryset = self.grouper(queryset=queryset, group_by=self.group_by, sub_group_by=self.sub_group_by)
+        return queryset, order_by_param
+
+    def get_group_values(self, slug, project_id=None):
+        fields = [field for field in [self.group_by, self.sub_group_by] if field]
+        return issue_group_values_batch(fields=fields, slug=slug, project_id=project_id, queryset=self.queryset)
+
+    def paginate(self, slug, project_id=None, annotate=None, on_results=None, count_filter=ISSUE_COUNT_FILTER):
+        group_by = self.group_by
+        sub_group_by = self.sub_group_by
+        if group_by and sub_group_by and group_by == sub_group_by:
+            return Response(
+                {"error": "Group by and sub group by cannot have same parameters"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if on_results is None:
+
+            def on_results(issues):
+                return issue_on_results(group_by=group_by, issues=issues, sub_group_by=sub_group_by)
+
+        queryset, order_by_param = self.get_page_queryset(annotate=annotate)
+        paginate_kwargs = {
+            "request": self.request,
+            "order_by": order_by_param,
+            "queryset": queryset,
+            "total_count_queryset": self.get_count_queryset(),
+            "on_results": on_results,
+        }
+
+        if group_by:
+            group_values = self.get_group_values(slug=slug, project_id=project_id)
+            paginate_kwargs.update(
+                paginator_cls=GroupedOffsetPaginator,
+                group_by_fields=group_values[group_by],
+                group_by_field_name=group_by,
+                count_filter=count_filter,
+            )
+            if sub_group_by:
+                paginate_kwargs.update(
+                    paginator_cls=SubGroupedOffsetPaginator,
+                    sub_group_by_fields=group_values[sub_group_by],
+                    sub_group_by_field_name=sub_group_by,
+                )
+
+        return self.view.paginate(**paginate_kwargs)
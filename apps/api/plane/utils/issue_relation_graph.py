@@ -0,0 +1,227 @@
+"""
+Issue relation graph loading and dependency traversal.
+
+Relations are stored once per pair of issues, e.g. "A blocked_by B" is a
+single row which reads as "B blocking A" from the other side. The helpers
+below fetch every edge touching an issue in one query and classify them in
+memory, and walk blocked_by chains with a recursive CTE so timeline views get
+the whole dependency graph in one request.
+"""
+
+# Python imports
+from collections import defaultdict, deque
+
+# Django imports
+from django.db import connection
+from django.db.models import Q
+
+# Module imports
+from plane.db.models import Issue, IssueRelation
+from plane.utils.issue_relation_mapper import get_inverse_relation
+
+# Relation groups returned by the issue relation listing
+RELATION_KEYS = (
+    "blocking",
+    "blocked_by",
+    "duplicate",
+    "relates_to",
+    "start_after",
+    "start_before",
+    "finish_after",
+    "finish_before",
+)
+
+DEPENDENCY_DIRECTIONS = ("blocked_by", "blocking")
+
+# Upper bound of edges returned by a single dependency traversal
+DEPENDENCY_EDGE_LIMIT = 5000
+
+# Follow blocked_by edges from the seed issues towards their blockers. UNION
+# (not UNION ALL) discards edges already visited, so the walk terminates on
+# circular relations and visits every edge once.
+BLOCKED_BY_CHAIN_QUERY = """
+WITH RECURSIVE chain(issue_id, blocked_by_id) AS (
+    SELECT r.issue_id, r.related_issue_id
+    FROM {table} r
+    WHERE r.issue_id = ANY(%s::uuid[])
+        AND r.relation_type = 'blocked_by'
+        AND r.deleted_at IS NULL
+        AND r.workspace_id = %s
+    UNION
+    SELECT r.issue_id, r.related_issue_id
+    FROM {table} r
+    JOIN chain c ON r.issue_id = c.blocked_by_id
+    WHERE r.relation_type = 'blocked_by'
+        AND r.deleted_at IS NULL
+        AND r.workspace_id = %s
+)
+SELECT issue_id, blocked_by_id FROM chain LIMIT %s
+"""
+
+# Same walk in the other direction, from the seed issues to the issues they block
+BLOCKING_CHAIN_QUERY = """
+WITH RECURSIVE chain(issue_id, blocked_by_id) AS (
+    SELECT r.issue_id, r.related_issue_id
+    FROM {table} r
+    WHERE r.related_issue_id = ANY(%s::uuid[])
+        AND r.relation_type = 'blocked_by'
+        AND r.deleted_at IS NULL
+        AND r.workspace_id = %s
+    UNION
+    SELECT r.issue_id, r.related_issue_id
+    FROM {table} r
+    JOIN chain c ON r.related_issue_id = c.issue_id
+    WHERE r.relation_type = 'blocked_by'
+        AND r.deleted_at IS NULL
+        AND r.workspace_id = %s
+)
+SELECT issue_id, blocked_by_id FROM chain LIMIT %s
+"""
+
+
+def get_relation_edges(issue_id, slug):
+    """All (issue_id, related_issue_id, relation_type) edges touching an issue"""
+    return list(
+        IssueRelation.objects.filter(Q(issue_id=issue_id) | Q(related_issue_id=issue_id))
+        .filter(workspace__slug=slug)
+        .order_by("-created_at")
+        .values_list("issue_id", "related_issue_id", "relation_type")
+    )
+
+
+def classify_relation_edges(issue_id, edges):
+    """
+    Group the other end of every edge by the relation as seen from issue_id.
+    An edge stored on issue_id keeps its type; an edge stored on the other
+    issue reads as the inverse relation.
+    """
+    relations = {key: [] for key in RELATION_KEYS}
+    for source_id, target_id, relation_type in edges:
+        if source_id == issue_id:
+            key, other_id = relation_type, target_id
+        else:
+            key, other_id = get_inverse_relation(relation_type), source_id
+        if key in relations and other_id not in relations[key]:
+            relations[key].append(other_id)
+    return relations
+
+
+def get_issue_relations(issue_id, slug, queryset, fields):
+    """
+    Return {relation: [issue values]} for an issue with two queries, one for
+    the edges and one for the related issues.
+    """
+    relations = classify_relation_edges(issue_id, get_relation_edges(issue_id, slug))
+    related_ids = {related_id for related_ids in relations.values() for related_id in related_ids}
+    if not related_ids:
+        return {key: [] for key in RELATION_KEYS}
+
+    issues = {issue["id"]: issue for issue in queryset.filter(pk__in=related_ids).values(*fields)}
+    return {
+        key: [{**issues[related_id], "relation_type": key} for related_id in related_ids if related_id in issues]
+        for key, related_ids in relations.items()
+    }
+
+
+def get_dependency_edges(workspace_id, issue_ids, direction="blocked_by", limit=DEPENDENCY_EDGE_LIMIT):
+    """
+    Transitive blocked_by edges reachable from the given issues.
+    Args:
+        workspace_id: The workspace the relations belong to
+        issue_ids: The issues to start from
+        direction: "blocked_by" walks towards blockers, "blocking" towards
+            the issues that are blocked
+        limit: Maximum number of edges returned
+    Returns:
+        list: (issue_id, blocked_by_id) tuples
+    """
+    query = BLOCKED_BY_CHAIN_QUERY if direction == "blocked_by" else BLOCKING_CHAIN_QUERY
+    with connection.cursor() as cursor:
+        cursor.execute(
+            query.format(table=IssueRelation._meta.db_table),
+            [[str(issue_id) for issue_id in issue_ids], workspace_id, workspace_id, limit],
+        )
+        return cursor.fetchall()
+
+
+def get_dependency_depths(issue_ids, edges, direction="blocked_by"):
+    """Shortest number of hops from the seed issues to every issue in the edges"""
+    adjacency = defaultdict(list)
+    for issue_id, blocked_by_id in edges:
+        if direction == "blocked_by":
+            adjacency[issue_id].append(blocked_by_id)
+        else:
+            adjacency[blocked_by_id].append(issue_id)
+
+    depths = {issue_id: 0 for issue_id in issue_ids}
+    queue = deque(issue_ids)
+    while queue:
+        current = queue.popleft()
+        for neighbour in adjacency[current]:
+            if neighbour not in depths:
+                depths[neighbour] = depths[current] + 1
+                queue.append(neighbour)
+    return depths
+
+
+def get_issue_duration(issue):
+    """Planned duration in days, issues without both dates count as one day"""
+    if issue["start_date"] and issue["target_date"]:
+        return max((issue["target_date"] - issue["start_date"]).days + 1, 1)
+    return 1
+
+
+def get_cycle_critical_path(cycle_id):
+    """
+    Longest blocked_by chain among the issues of a cycle, weighted by the
+    planned duration of each issue.
+    Returns:
+        tuple: (ordered issue ids from the first blocker to the last blocked
+        issue, total duration in days)
+    """
+    issues = {
+        issue["id"]: issue
+        for issue in Issue.issue_objects.filter(
+            issue_cycle__cycle_id=cycle_id,
+            issue_cycle__deleted_at__isnull=True,
+        ).values("id", "start_date", "target_date")
+    }
+    if not issues:
+        return [], 0
+
+    edges = IssueRelation.objects.filter(
+        relation_type="blocked_by",
+        issue_id__in=issues.keys(),
+        related_issue_id__in=issues.keys(),
+    ).values_list("related_issue_id", "issue_id")
+
+    # Kahn's algorithm: blockers come before the issues they block. Issues on
+    # a circular chain never reach zero in-degree and are left out.
+    successors = defaultdict(list)
+    in_degree = dict.fromkeys(issues, 0)
+    for blocker_id, blocked_id in edges:
+        successors[blocker_id].append(blocked_id)
+        in_degree[blocked_id] += 1
+
+    durations = {issue_id: get_issue_duration(issue) for issue_id, issue in issues.items()}
+    finish = dict(durations)
+    previous = {}
+    queue = deque(issue_id for issue_id, degree in in_degree.items() if degree == 0)
+    while queue:
+        current = queue.popleft()
+        for successor in successors[current]:
+            if finish[current] + durations[successor] > finish[successor]:
+                finish[successor] = finish[current] + durations[successor]
+                previous[successor] = current
+            in_degree[successor] -= 1
+            if in_degree[successor] == 0:
+                queue.append(successor)
+
+    # Issues left with blockers are on a circular chain
+    last = max((issue_id for issue_id, degree in in_degree.items() if degree == 0), key=finish.get, default=None)
+    if last is None:
+        return [], 0
+    path = [last]
+    while path[-1] in previous:
+        path.append(previous[path[-1]])
+    return path[::-1], finish[last]
@@ -0,0 +1,250 @@
+"""
+Maintenance of the precomputed module and cycle stats.
+
+Stats rows are recomputed, not incremented: every refresh aggregates the
+current issues of the given modules or cycles. A refresh runs once the
+transaction that asked for it commits, holding a lock per module or cycle,
+so concurrent refreshes of a row run one after the other and the last one
+reads every committed change. Saves of single rows are covered by the signal receivers
+below; bulk writes (bulk_create, bulk_update, queryset update/delete) do not
+send signals and call the refresh helpers explicitly. The daily
+repair_issue_stats task recomputes every row to correct any drift.
+"""
+
+# Django imports
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.db import connection, transaction
+from django.db.models import Count, F, FloatField, IntegerField, Q, Sum, Value
+from django.db.models.functions import Cast, Coalesce
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+# Module imports
+from plane.db.models import (
+    Cycle,
+    CycleIssue,
+    CycleStats,
+    EstimatePoint,
+    Issue,
+    IssueAssignee,
+    Module,
+    ModuleIssue,
+    ModuleMember,
+    ModuleStats,
+    State,
+)
+from plane.db.models.stats import STATS_STATE_GROUPS
+from plane.utils.uuid import convert_uuid_to_integer
+
+# Issue fields that can change the stats, used to skip unrelated saves
+ISSUE_STATS_UPDATE_FIELDS = {
+    "state",
+    "state_id",
+    "estimate_point",
+    "estimate_point_id",
+    "archived_at",
+    "is_draft",
+    "deleted_at",
+}
+
+
+def get_stats_aggregates():
+    """Per state group issue counts and point estimate totals"""
+    points = Cast("estimate_point__value", FloatField())
+    is_points = Q(estimate_point__estimate__type="points")
+    aggregates = {
+        "total_issues": Count("id", distinct=True),
+        "total_estimate_points": Sum(points, filter=is_points),
+    }
+    for group in STATS_STATE_GROUPS:
+        aggregates[f"{group}_issues"] = Count("id", distinct=True, filter=Q(state__group=group))
+        aggregates[f"{group}_estimate_points"] = Sum(points, filter=is_points & Q(state__group=group))
+    return aggregates
+
+
+def get_stats_annotations(stats_model):
+    """Annotations reading the precomputed stats of a module or cycle queryset"""
+    return {
+        field: Coalesce(
+            F(f"stats__{field}"),
+            Value(0, output_field=FloatField() if field.endswith("estimate_points") else IntegerField()),
+        )
+        for field in stats_model.stats_fields()
+    }
+
+
+def refresh_on_commit(recompute, ids):
+    """
+    Run recompute(ids) once the current transaction commits, in a transaction
+    of its own holding an advisory lock per id until it ends
+    """
+
+    def run():
+        with transaction.atomic(), connection.cursor() as cursor:
+            # Sorted, so that overlapping refreshes cannot deadlock
+            cursor.execute(
+                "SELECT pg_advisory_xact_lock(lock_key) FROM unnest(%s::bigint[]) AS lock_key",
+                [sorted({convert_uuid_to_integer(entity_id) for entity_id in ids})],
+            )
+            recompute(ids)
+
+    transaction.on_commit(run)
+
+
+def save_stats(stats_model, entity_field, entities, issue_stats, ids_field, ids):
+    """Upsert one stats row per (entity_id, workspace_id, project_id)"""
+    fields = stats_model.stats_fields()
+    rows = []
+    for entity_id, workspace_id, project_id in entities:
+        values = issue_stats.get(entity_id, {})
+        rows.append(
+            stats_model(
+                workspace_id=workspace_id,
+                project_id=project_id,
+                **{f"{entity_field}_id": entity_id},
+                **{field: values.get(field) or 0 for field in fields},
+                **{ids_field: ids.get(entity_id) or []},
+            )
+        )
+    stats_model.objects.bulk_create(
+        rows,
+        batch_size=500,
+        update_conflicts=True,
+        unique_fields=[entity_field],
+        update_fields=[*fields, ids_field, "updated_at"],
+    )
+
+
+def refresh_module_stats(module_ids):
+    """Recompute the stats of the given modules once the transaction commits"""
+    module_ids = {module_id for module_id in module_ids if module_id}
+    if module_ids:
+        refresh_on_commit(recompute_module_stats, module_ids)
+
+
+def recompute_module_stats(module_ids):
+    modules = Module.objects.filter(id__in=module_ids).values_list("id", "workspace_id", "project_id")
+    issue_stats = {
+        row.pop("stats_id"): row
+        for row in Issue.issue_objects.filter(
+            issue_module__module_id__in=module_ids,
+            issue_module__deleted_at__isnull=True,
+        )
+        .values(stats_id=F("issue_module__module_id"))
+        .annotate(**get_stats_aggregates())
+    }
+    member_ids = dict(
+        ModuleMember.objects.filter(module_id__in=module_ids)
+        .values("module_id")
+        .annotate(ids=ArrayAgg("member_id", distinct=True))
+        .values_list("module_id", "ids")
+    )
+    save_stats(ModuleStats, "module", modules, issue_stats, "member_ids", member_ids)
+
+
+def refresh_cycle_stats(cycle_ids):
+    """Recompute the stats of the given cycles once the transaction commits"""
+    cycle_ids = {cycle_id for cycle_id in cycle_ids if cycle_id}
+    if cycle_ids:
+        refresh_on_commit(recompute_cycle_stats, cycle_ids)
+
+
+def recompute_cycle_stats(cycle_ids):
+    cycles = Cycle.objects.filter(id__in=cycle_ids).values_list("id", "workspace_id", "project_id")
+    issue_stats = {
+        row.pop("stats_id"): row
+        for row in Issue.objects.filter(
+            issue_cycle__cycle_id__in=cycle_ids,
+            issue_cycle__deleted_at__isnull=True,
+            archived_at__isnull=True,
+            is_draft=False,
+        )
+        .values(stats_id=F("issue_cycle__cycle_id"))
+        .annotate(**get_stats_aggregates())
+    }
+    assignee_ids = dict(
+        IssueAssignee.objects.filter(
+            issue__issue_cycle__cycle_id__in=cycle_ids,
+            issue__issue_cycle__deleted_at__isnull=True,
+            issue__deleted_at__isnull=True,
+        )
+        .values(stats_id=F("issue__issue_cycle__cycle_id"))
+        .annotate(ids=ArrayAgg("assignee_id", distinct=True))
+        .values_list("stats_id", "ids")
+    )
+    save_stats(CycleStats, "cycle", cycles, issue_stats, "assignee_ids", assignee_ids)
+
+
+def refresh_issue_stats(issue_ids):
+    """Recompute the stats of every module and cycle containing the issues"""
+    issue_ids = list(issue_ids)
+    if not issue_ids:
+        return
+    refresh_module_stats(ModuleIssue.objects.filter(issue_id__in=issue_ids).values_list("module_id", flat=True))
+    refresh_cycle_stats(CycleIssue.objects.filter(issue_id__in=issue_ids).values_list("cycle_id", flat=True))
+
+
+def refresh_issue_cycle_stats(issue_ids):
+    """Recompute the stats of the cycles containing the issues, e.g. after assignee changes"""
+    refresh_cycle_stats(CycleIssue.objects.filter(issue_id__in=issue_ids).values_list("cycle_id", flat=True))
+
+
+def refresh_project_stats(project_id):
+    """Recompute the stats of every module and cycle of a project"""
+    refresh_module_stats(Module.objects.filter(project_id=project_id).values_list("id", flat=True))
+    refresh_cycle_stats(Cycle.objects.filter(project_id=project_id).values_list("id", flat=True))
+
+
+def ensure_module_stats(project_id):
+    """Create the missing stats rows of a project's modules"""
+    refresh_module_stats(Module.objects.filter(project_id=project_id, stats__isnull=True).values_list("id", flat=True))
+
+
+def ensure_cycle_stats(project_id):
+    """Create the missing stats rows of a project's cycles"""
+    refresh_cycle_stats(Cycle.objects.filter(project_id=project_id, stats__isnull=True).values_list("id", flat=True))
+
+
+@receiver(post_save, sender=Issue)
+def issue_stats_on_save(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    # New issues are added to modules and cycles afterwards
+    if created or raw:
+        return
+    if update_fields is not None and not ISSUE_STATS_UPDATE_FIELDS.intersection(update_fields):
+        return
+    stats_values = instance.get_stats_values()
+    if getattr(instance, "_loaded_stats_values", None) == stats_values:
+        return
+    refresh_issue_stats([instance.id])
+    instance._loaded_stats_values = stats_values
+
+
+# Only saves are tracked: rows are soft deleted by saving deleted_at, while
+# hard deletes run from cleanup jobs cascading from already deleted parents
+
+
+@receiver(post_save, sender=ModuleIssue)
+@receiver(post_save, sender=ModuleMember)
+def module_stats_on_save(sender, instance, raw=False, **kwargs):
+    if not raw:
+        refresh_module_stats([instance.module_id])
+
+
+@receiver(post_save, sender=CycleIssue)
+def cycle_stats_on_save(sender, instance, raw=False, **kwargs):
+    if not raw:
+        refresh_cycle_stats([instance.cycle_id])
+
+
+@receiver(post_save, sender=IssueAssignee)
+def cycle_assignees_on_save(sender, instance, raw=False, **kwargs):
+    if not raw:
+        refresh_issue_cycle_stats([instance.issue_id])
+
+
+@receiver(post_save, sender=State)
+@receiver(post_save, sender=EstimatePoint)
+def project_stats_on_save(sender, instance, created, raw=False, **kwargs):
+    # A new state or estimate point has no issues yet
+    if not created and not raw:
+        refresh_project_stats(instance.project_id)
@@ -0,0 +1,533 @@
+"""
+Seeded generator of large workspaces for load testing.
+
+Every id, name, date and relation is drawn from one random.Random(seed), so a
+seed and a LoadProfile always produce the same workspace. The data is skewed
+the way real workspaces are:
+
+- issues are spread over the projects with a Zipf distribution, so a few hot
+  projects hold most of them and have the most members
+- sub-issues extend deep chains or hang off recent issues, up to max_depth
+- assignees and labels per issue follow a Pareto distribution and favour a
+  few popular members and labels
+
+Issues are generated and copied in batches, with their sequences, activity,
+assignees, labels, cycles, modules and notifications, so millions of issues
+never sit in memory.
+"""
+
+# Python imports
+import bisect
+import random
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+
+# Django imports
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+# Third party imports
+from faker import Faker
+
+# Module imports
+from plane.db.models import (
+    Cycle,
+    CycleIssue,
+    Issue,
+    IssueActivity,
+    IssueAssignee,
+    IssueLabel,
+    IssueSequence,
+    Label,
+    Module,
+    ModuleIssue,
+    Notification,
+    Page,
+    Project,
+    ProjectMember,
+    ProjectPage,
+    State,
+    User,
+    Workspace,
+    WorkspaceMember,
+)
+from plane.utils.issue_counters import refresh_issue_counters
+
+STATE_GROUP_WEIGHTS = {
+    "backlog": 20,
+    "unstarted": 25,
+    "started": 15,
+    "completed": 35,
+    "cancelled": 5,
+}
+PRIORITY_WEIGHTS = {"urgent": 5, "high": 15, "medium": 30, "low": 25, "none": 25}
+
+STATES = [
+    {"name": "Backlog", "color": "#A3A3A3", "sequence": 15000, "group": "backlog", "default": True},
+    {"name": "Todo", "color": "#3A3A3A", "sequence": 25000, "group": "unstarted"},
+    {"name": "In Progress", "color": "#F59E0B", "sequence": 35000, "group": "started"},
+    {"name": "Done", "color": "#16A34A", "sequence": 45000, "group": "completed"},
+    {"name": "Cancelled", "color": "#EF4444", "sequence": 55000, "group": "cancelled"},
+]
+
+
+@dataclass
+class LoadProfile:
+    projects: int = 10
+    issues: int = 100_000
+    members: int = 50
+    labels: int = 60
+    cycles: int = 12
+    modules: int = 20
+    pages: int = 20
+    # Zipf exponents of the project, member and label popularity
+    project_skew: float = 1.1
+    member_skew: float = 1.0
+    label_skew: float = 1.0
+    # Share of the issues that are sub-issues and of those that extend a deep chain
+    sub_issue_ratio: float = 0.4
+    deep_chain_ratio: float = 0.3
+    max_depth: int = 10
+    # Pareto shape of the assignee and label counts, lower is heavier
+    fanout_alpha: float = 1.2
+    max_assignees: int = 12
+    max_labels: int = 20
+    cycle_ratio: float = 0.6
+    module_ratio: float = 0.5
+    notification_ratio: float = 0.1
+    batch_size: int = 5000
+    start_date: date = field(default_factory=lambda: date(2025, 1, 1))
+
+    def to_dict(self):
+        return {**asdict(self), "start_date": self.start_date.isoformat()}
+
+
+def zipf_weights(count, skew):
+    return [1 / rank**skew for rank in range(1, count + 1)]
+
+
+def distribute(total, weights):
+    """Split total over the weights, giving the remainders to the largest fractions"""
+    weight_sum = sum(weights)
+    shares = [total * weight / weight_sum for weight in weights]
+    counts = [int(share) for share in shares]
+    by_fraction = sorted(range(len(shares)), key=lambda index: (counts[index] - shares[index], index))
+    for index in by_fraction[: total - sum(counts)]:
+        counts[index] += 1
+    return counts
+
+
+def copy_rows(model, rows):
+    """
+    Insert unsaved rows with COPY, several times faster than the INSERTs of
+    bulk_create for large batches. Like bulk_create, signals and save() are
+    skipped.
+    """
+    if not rows:
+        return
+
+    # Resolve the connection once, the proxy lookup would dominate the per value cost
+    connection = connections[DEFAULT_DB_ALIAS]
+    quote_name = connection.ops.quote_name
+    fields = model._meta.concrete_fields
+    columns = ", ".join(quote_name(field.column) for field in fields)
+    with connection.cursor() as cursor:
+        with cursor.copy(f"COPY {quote_name(model._meta.db_table)} ({columns}) FROM STDIN") as copy:
+            for row in rows:
+                copy.write_row(
+                    [field.get_db_prep_save(field.pre_save(row, add=True), connection=connection) for field in fields]
+                )
+
+
+class WeightedSampler:
+    """Draws distinct items, the most popular ones most often"""
+
+    def __init__(self, items, weights):
+        self.items = list(items)
+        self.cum_weights = []
+        total = 0
+        for weight in weights:
+            total += weight
+            self.cum_weights.append(total)
+
+    def sample(self, rng, count):
+        count = min(count, len(self.items))
+        if count <= 0:
+            return []
+
+        chosen = {}
+        total = self.cum_weights[-1]
+        for _ in range(count * 4):
+            index = bisect.bisect_right(self.cum_weights, rng.random() * total)
+            chosen.setdefault(min(index, len(self.items) - 1), None)
+            if len(chosen) == count:
+                break
+        return [self.items[index] for index in chosen]
+
+
+class LoadGenerator:
+    def __init__(self, seed, profile=None):
+        self.seed = seed
+        self.profile = profile or LoadProfile()
+        self.rng = random.Random(seed)
+
+        # Texts are drawn from pools, generating a million Faker texts would dominate the run
+        fake = Faker()
+        fake.seed_instance(seed)
+        self.words = sorted(set(fake.words(nb=500)))
+        self.sentences = [fake.sentence(nb_words=8) for _ in range(2000)]
+        self.paragraphs = [fake.paragraph(nb_sentences=5) for _ in range(500)]
+
+    def uuid(self):
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def pareto_count(self, maximum):
+        return min(int(self.rng.paretovariate(self.profile.fanout_alpha)) - 1, maximum)
+
+    def day(self, offset):
+        return self.profile.start_date + timedelta(days=offset)
+
+    def as_datetime(self, value):
+        return datetime.combine(value, time.min, tzinfo=timezone.utc)
+
+    def build_members(self, slug):
+        members = []
+        for index in range(self.profile.members):
+            member = User(
+                id=self.uuid(),
+                username=f"{slug}-member-{index}",
+                email=f"member{index}.{slug}@example.com",
+                first_name=self.rng.choice(self.words).title(),
+                last_name=self.rng.choice(self.words).title(),
+            )
+            member.set_unusable_password()
+            members.append(member)
+        return members
+
+    def build_projects(self, workspace, owner):
+        return [
+            Project(
+                id=self.uuid(),
+                workspace=workspace,
+                name=f"{self.rng.choice(self.words).title()} {index + 1}",
+                identifier=f"LD{index + 1}",
+                created_by_id=owner.id,
+                cycle_view=True,
+                module_view=True,
+                page_view=True,
+            )
+            for index in range(self.profile.projects)
+        ]
+
+    def build_project_members(self, workspace, projects, owner, members, issue_counts):
+        """The owner joins every project, hot projects get the most members"""
+        project_members = {}
+        rows = []
+        hottest = max(issue_counts, default=0) or 1
+        for project, issue_count in zip(projects, issue_counts):
+            count = max(min(len(members), 3), round(len(members) * issue_count / hottest))
+            project_members[project.id] = [owner.id] + [member.id for member in self.rng.sample(members, count)]
+            rows.extend(
+                ProjectMember(
+                    id=self.uuid(),
+                    project=project,
+                    workspace=workspace,
+                    member_id=member_id,
+                    role=20,
+                    sort_order=self.rng.randint(0, 65535),
+                )
+                for member_id in project_members[project.id]
+            )
+        return project_members, rows
+
+    def build_states(self, workspace, project, owner):
+        return [
+            State(
+                id=self.uuid(),
+                name=state["name"],
+                color=state["color"],
+                sequence=state["sequence"],
+                group=state["group"],
+                default=state.get("default", False),
+                project=project,
+                workspace=workspace,
+                created_by_id=owner.id,
+            )
+            for state in STATES
+        ]
+
+    def build_labels(self, workspace, project, owner):
+        return [
+            Label(
+                id=self.uuid(),
+                name=f"{self.rng.choice(self.words)}-{index + 1}",
+                color=f"#{self.rng.getrandbits(24):06X}",
+                sort_order=self.rng.randint(0, 65535),
+                project=project,
+                workspace=workspace,
+                created_by_id=owner.id,
+            )
+            for index in range(self.profile.labels)
+        ]
+
+    def build_cycles(self, workspace, project, owner):
+        """Back to back two week cycles from the profile start date"""
+        return [
+            Cycle(
+                id=self.uuid(),
+                name=f"Cycle {index + 1}",
+                start_date=self.as_datetime(self.day(index * 14)),
+                end_date=self.as_datetime(self.day(index * 14 + 13)),
+                owned_by_id=owner.id,
+                sort_order=self.rng.randint(0, 65535),
+                project=project,
+                workspace=workspace,
+            )
+            for index in range(self.profile.cycles)
+        ]
+
+    def build_modules(self, workspace, project, owner):
+        modules = []
+        for index in range(self.profile.modules):
+            start = self.rng.randrange(365)
+            modules.append(
+                Module(
+                    id=self.uuid(),
+                    name=f"{self.rng.choice(self.words).title()} {index + 1}",
+                    start_date=self.day(start),
+                    target_date=self.day(start + self.rng.randint(7, 90)),
+                    status=self.rng.choice(["backlog", "planned", "in-progress", "paused", "completed"]),
+                    lead_id=owner.id,
+                    sort_order=self.rng.randint(0, 65535),
+                    project=project,
+                    workspace=workspace,
+                    created_by_id=owner.id,
+                )
+            )
+        return modules
+
+    def build_pages(self, workspace, owner):
+        pages = []
+        for _ in range(self.profile.pages):
+            text = " ".join(self.rng.choice(self.paragraphs) for _ in range(self.rng.randint(1, 20)))
+            pages.append(
+                Page(
+                    id=self.uuid(),
+                    name=self.rng.choice(self.sentences),
+                    workspace=workspace,
+                    owned_by_id=owner.id,
+                    access=self.rng.randint(0, 1),
+                    description_html=f"<p>{text}</p>",
+                    description_stripped=text,
+                )
+            )
+        return pages
+
+    def iter_issue_batches(self, workspace, project, owner, issue_count, context):
+        """
+        Yield the issues of a project in batches of unsaved rows by model.
+
+        context holds the ids the issues point to: states, labels, cycles,
+        modules and the project members.
+        """
+        profile = self.profile
+        states = context["states"]
+        state_groups = [state.group for state in states]
+        state_weights = [STATE_GROUP_WEIGHTS[group] for group in state_groups]
+        priorities = list(PRIORITY_WEIGHTS)
+        priority_weights = list(PRIORITY_WEIGHTS.values())
+        members = context["members"]
+        assignee_sampler = WeightedSampler(members, zipf_weights(len(members), profile.member_skew))
+        label_sampler = WeightedSampler(context["labels"], zipf_weights(len(context["labels"]), profile.label_skew))
+        cycles = context["cycles"]
+        modules = context["modules"]
+
+        # Recent issues that can get sub-issues and the tip of the chain being deepened
+        recent = []
+        recent_size = 10_000
+        chain_tip = None
+
+        for batch_start in range(0, issue_count, profile.batch_size):
+            rows = {model: [] for model in BATCH_MODELS}
+            for sequence_id in range(batch_start + 1, min(batch_start + profile.batch_size, issue_count) + 1):
+                issue_id = self.uuid()
+                parent = None
+                extends_chain = False
+                if recent and self.rng.random() < profile.sub_issue_ratio:
+                    extends_chain = self.rng.random() < profile.deep_chain_ratio
+                    if extends_chain and chain_tip is not None and chain_tip[1] < profile.max_depth:
+                        parent = chain_tip
+                    elif not extends_chain:
+                        parent = recent[self.rng.randrange(len(recent))]
+                        if parent[1] >= profile.max_depth:
+                            parent = None
+                depth = parent[1] + 1 if parent else 0
+                if extends_chain:
+                    chain_tip = (issue_id, depth)
+                if len(recent) < recent_size:
+                    recent.append((issue_id, depth))
+                else:
+                    recent[sequence_id % recent_size] = (issue_id, depth)
+
+                state = self.rng.choices(states, weights=state_weights)[0]
+                start_date = self.day(self.rng.randrange(365)) if self.rng.random() < 0.5 else None
+                target_date = start_date + timedelta(days=self.rng.randint(1, 60)) if start_date else None
+                name = self.rng.choice(self.sentences)
+                description = self.rng.choice(self.paragraphs)
+                creator_id = assignee_sampler.sample(self.rng, 1)[0]
+                rows[Issue].append(
+                    Issue(
+                        id=issue_id,
+                        name=name,
+                        description_html=f"<p>{description}</p>",
+                        description_stripped=description,
+                        priority=self.rng.choices(priorities, weights=priority_weights)[0],
+                        state_id=state.id,
+                        parent_id=parent[0] if parent else None,
+                        sequence_id=sequence_id,
+                        sort_order=65535 + sequence_id * 1000,
+                        start_date=start_date,
+                        target_date=target_date,
+                        completed_at=self.as_datetime(target_date or self.day(0))
+                        if state.group == "completed"
+                        else None,
+                        project=project,
+                        workspace=workspace,
+                        created_by_id=creator_id,
+                    )
+                )
+                rows[IssueSequence].append(
+                    IssueSequence(issue_id=issue_id, sequence=sequence_id, project=project, workspace=workspace)
+                )
+                rows[IssueActivity].append(
+                    IssueActivity(
+                        issue_id=issue_id,
+                        actor_id=creator_id,
+                        verb="created",
+                        comment="created the issue",
+                        project=project,
+                        workspace=workspace,
+                        created_by_id=creator_id,
+                    )
+                )
+
+                assignee_ids = assignee_sampler.sample(self.rng, self.pareto_count(profile.max_assignees))
+                rows[IssueAssignee].extend(
+                    IssueAssignee(issue_id=issue_id, assignee_id=assignee_id, project=project, workspace=workspace)
+                    for assignee_id in assignee_ids
+                )
+                rows[IssueLabel].extend(
+                    IssueLabel(issue_id=issue_id, label_id=label_id, project=project, workspace=workspace)
+                    for label_id in label_sampler.sample(self.rng, self.pareto_count(profile.max_labels))
+                )
+                if cycles and self.rng.random() < profile.cycle_ratio:
+                    rows[CycleIssue].append(
+                        CycleIssue(
+                            cycle_id=self.rng.choice(cycles), issue_id=issue_id, project=project, workspace=workspace
+                        )
+                    )
+                if modules and self.rng.random() < profile.module_ratio:
+                    rows[ModuleIssue].extend(
+                        ModuleIssue(module_id=module_id, issue_id=issue_id, project=project, workspace=workspace)
+                        for module_id in self.rng.sample(modules, min(len(modules), self.rng.randint(1, 3)))
+                    )
+                if owner.id in assignee_ids or self.rng.random() < profile.notification_ratio:
+                    rows[Notification].append(
+                        Notification(
+                            workspace=workspace,
+                            project=project,
+                            entity_identifier=issue_id,
+                            entity_name="issue",
+                            title=name,
+                            sender="in_app:issue_activities:assigned",
+                            triggered_by_id=creator_id,
+                            receiver_id=owner.id,
+                            data={
+                                "issue": {
+                                    "id": str(issue_id),
+                                    "name": name,
+                                    "sequence_id": sequence_id,
+                                    "identifier": project.identifier,
+                                    "state_name": state.name,
+                                    "state_group": state.group,
+                                },
+                                "issue_activity": {"field": "assignees", "verb": "updated"},
+                            },
+                        )
+                    )
+            yield rows
+
+    def generate(self, slug, owner, stdout=None):
+        """Create the workspace slug owned by owner and fill it, returning the row counts"""
+        profile = self.profile
+        counts = {}
+
+        def log(message):
+            if stdout is not None:
+                stdout.write(message)
+
+        with transaction.atomic():
+            workspace = Workspace.objects.create(id=self.uuid(), slug=slug, name=slug.title(), owner=owner)
+            members = self.build_members(slug)
+            for member in members:
+                member.save()
+            WorkspaceMember.objects.bulk_create(
+                [WorkspaceMember(workspace=workspace, member=owner, role=20)]
+                + [WorkspaceMember(workspace=workspace, member=member, role=15) for member in members]
+            )
+
+            projects = self.build_projects(workspace, owner)
+            for project in projects:
+                project.save()
+            issue_counts = distribute(profile.issues, zipf_weights(len(projects), profile.project_skew))
+            project_members, rows = self.build_project_members(workspace, projects, owner, members, issue_counts)
+            ProjectMember.objects.bulk_create(rows)
+
+            pages = Page.objects.bulk_create(self.build_pages(workspace, owner))
+            ProjectPage.objects.bulk_create(
+                [ProjectPage(page=page, project=self.rng.choice(projects), workspace=workspace) for page in pages]
+            )
+
+            contexts = {}
+            for project in projects:
+                contexts[project.id] = {
+                    "states": State.objects.bulk_create(self.build_states(workspace, project, owner)),
+                    "labels": [
+                        label.id for label in Label.objects.bulk_create(self.build_labels(workspace, project, owner))
+                    ],
+                    "cycles": [
+                        cycle.id for cycle in Cycle.objects.bulk_create(self.build_cycles(workspace, project, owner))
+                    ],
+                    "modules": [
+                        module.id
+                        for module in Module.objects.bulk_create(self.build_modules(workspace, project, owner))
+                    ],
+                    "members": project_members[project.id],
+                }
+
+        for project, issue_count in zip(projects, issue_counts):
+            for rows in self.iter_issue_batches(workspace, project, owner, issue_count, contexts[project.id]):
+                with transaction.atomic():
+                    for model in BATCH_MODELS:
+                        copy_rows(model, rows[model])
+                        counts[model.__name__] = counts.get(model.__name__, 0) + len(rows[model])
+                    # COPY sends no signals, count the sub issues and cycles of the batch and its parents
+                    refresh_issue_counters(
+                        [issue.id for issue in rows[Issue]] + [issue.parent_id for issue in rows[Issue]]
+                    )
+                log(f"{project.identifier}: {counts['Issue']} issues created")
+
+        return workspace, counts
+
+
+# Insert order of the rows of an issue batch
+BATCH_MODELS = [
+    Issue,
+    IssueSequence,
+    IssueActivity,
+    IssueAssignee,
+    IssueLabel,
+    CycleIssue,
+    ModuleIssue,
+    Notification,
+]
@@ -0,0 +1,176 @@
+# Python imports
+from collections import defaultdict
+
+# Django imports
+from django.db.models import Count, Q
+
+# Third party imports
+from redis.exceptions import RedisError
+
+# Module imports
+from plane.db.models import Notification
+from plane.settings.redis import redis_instance
+from plane.utils.exception_logger import log_exception
+
+# Counters are recomputed at least hourly, bounding any drift
+NOTIFICATION_COUNT_TTL = 60 * 60
+
+# Counters expiring before the next reconcile run are left to be recomputed on read
+RECONCILE_MIN_TTL = 60 * 10
+
+NOTIFICATION_COUNT_KEY_PREFIX = "notifications:unread"
+
+UNREAD_FIELD = "unread"
+MENTION_FIELD = "mention"
+
+# Adjust a counter only when it is warm, a cold counter is computed on read
+INCREMENT_IF_EXISTS_SCRIPT = """
+if redis.call("EXISTS", KEYS[1]) == 1 then
+    local value = redis.call("HINCRBY", KEYS[1], ARGV[1], ARGV[2])
+    if value < 0 then
+        redis.call("HSET", KEYS[1], ARGV[1], 0)
+    end
+end
+return 0
+"""
+
+# Overwrite a warm counter, keeping its TTL so that it still expires
+SET_IF_EXISTS_SCRIPT = """
+if redis.call("EXISTS", KEYS[1]) == 1 then
+    redis.call("HSET", KEYS[1], ARGV[1], ARGV[2], ARGV[3], ARGV[4])
+end
+return 0
+"""
+
+_redis_client = None
+_increment_script = None
+_set_script = None
+
+
+def get_redis_client():
+    global _redis_client, _increment_script, _set_script
+    if _redis_client is None:
+        _redis_client = redis_instance()
+        _increment_script = _redis_client.register_script(INCREMENT_IF_EXISTS_SCRIPT)
+        _set_script = _redis_client.register_script(SET_IF_EXISTS_SCRIPT)
+    return _redis_client
+
+
+def get_notification_count_key(slug, user_id):
+    return f"{NOTIFICATION_COUNT_KEY_PREFIX}:{slug}:{user_id}"
+
+
+def is_mention_notification(notification):
+    # Mirrors the `sender__icontains="mentioned"` filter used by the listing
+    return "mentioned" in (notification.sender or "").lower()
+
+
+def is_unread_notification(notification):
+    """Notifications counted as unread are not read, archived or snoozed"""
+    return notification.read_at is None and notification.archived_at is None and notification.snoozed_till is None
+
+
+def get_counter_field(notification):
+    return MENTION_FIELD if is_mention_notification(notification) else UNREAD_FIELD
+
+
+def count_unread_notifications(slug, user_id):
+    """Compute both counters with a single aggregate query"""
+    counts = Notification.objects.filter(
+        workspace__slug=slug,
+        receiver_id=user_id,
+        read_at__isnull=True,
+        archived_at__isnull=True,
+        snoozed_till__isnull=True,
+    ).aggregate(
+        total=Count("id"),
+        mention=Count("id", filter=Q(sender__icontains="mentioned")),
+    )
+    return {
+        UNREAD_FIELD: counts["total"] - counts["mention"],
+        MENTION_FIELD: counts["mention"],
+    }
+
+
+def store_unread_notification_counts(slug, user_id, counts):
+    pipe = get_redis_client().pipeline(transaction=True)
+    key = get_notification_count_key(slug, user_id)
+    pipe.hset(key, mapping=counts)
+    pipe.expire(key, NOTIFICATION_COUNT_TTL)
+    pipe.execute()
+
+
+def get_unread_notification_counts(slug, user_id):
+    """
+    Return {"unread": int, "mention": int} from the counter, computing and
+    storing it when it is cold. Falls back to the database when Redis is
+    unavailable.
+    """
+    try:
+        stored = get_redis_client().hgetall(get_notification_count_key(slug, user_id))
+        if len(stored) == 2:
+            return {field.decode(): int(value) for field, value in stored.items()}
+
+        counts = count_unread_notifications(slug, user_id)
+        store_unread_notification_counts(slug, user_id, counts)
+        return counts
+    except RedisError as e:
+        log_exception(e, warning=True)
+        return count_unread_notifications(slug, user_id)
+
+
+def adjust_unread_notification_counts(slug, deltas):
+    """Apply {(user_id, field): delta} to the warm counters of a workspace"""
+    try:
+        pipe = get_redis_client().pipeline(transaction=False)
+        for (user_id, field), delta in deltas.items():
+            if delta:
+                _increment_script(keys=[get_notification_count_key(slug, user_id)], args=[field, delta], client=pipe)
+        pipe.execute()
+    except RedisError as e:
+        log_exception(e, warning=True)
+
+
+def increment_unread_notification_counts(slug, notifications):
+    """Count newly created notifications"""
+    deltas = defaultdict(int)
+    for notification in notifications:
+        if is_unread_notification(notification):
+            deltas[(notification.receiver_id, get_counter_field(notification))] += 1
+    adjust_unread_notification_counts(slug, deltas)
+
+
+def update_unread_notification_count(slug, notification, was_unread):
+    """Account for a single notification that was read, archived, snoozed or restored"""
+    is_unread = is_unread_notification(notification)
+    if is_unread != was_unread:
+        adjust_unread_notification_counts(
+            slug,
+            {(notification.receiver_id, get_counter_field(notification)): 1 if is_unread else -1},
+        )
+
+
+def invalidate_unread_notification_counts(slug, user_id):
+    """Drop the counter after bulk changes, the next read recomputes it"""
+    try:
+        get_redis_client().delete(get_notification_count_key(slug, user_id))
+    except RedisError as e:
+        log_exception(e, warning=True)
+
+
+def reconcile_unread_notification_counts(batch_size=500):
+    """
+    Recompute the warm counters from the database. Only the values are
+    rewritten, the TTL set on read is kept, so counters that are no longer
+    read still expire and drop out of the reconciled set.
+    """
+    client = get_redis_client()
+    for key in client.scan_iter(match=f"{NOTIFICATION_COUNT_KEY_PREFIX}:*", count=batch_size):
+        if client.ttl(key) < RECONCILE_MIN_TTL:
+            continue
+        slug, user_id = key.decode()[len(NOTIFICATION_COUNT_KEY_PREFIX) + 1 :].rsplit(":", 1)
+        counts = count_unread_notifications(slug, user_id)
+        _set_script(
+            keys=[key],
+            args=[UNREAD_FIELD, counts[UNREAD_FIELD], MENTION_FIELD, counts[MENTION_FIELD]],
+        )
@@ -1,6 +1,5 @@
 # Python imports
 import math
-from collections import defaultdict
 from collections.abc import Sequence
 
 # Django imports
@@ -12,6 +11,7 @@ from rest_framework.exceptions import ParseError
 from rest_framework.response import Response
 
 # Module imports
+from plane.utils.timezone_converter import convert_datetime_columns
 
 
 class Cursor:
@@ -86,6 +86,67 @@ class BadPaginationError(Exception):
     pass
 
 
+class ColumnarResults:
+    """
+    A page of rows read as tuples with values_list, with their column names.
+
+    The grouped paginators shape them into the response in one pass, building
+    the dict of a row only once it is placed in a group. Iterating yields the
+    rows as dicts, so the results can stand in for a list of values() dicts.
+    """
+
+    def __init__(self, columns, rows, datetime_fields=None, timezone=None):
+        self.columns = list(columns)
+        self.rows = list(rows)
+        # Convert the datetimes a column at a time instead of walking the dicts later
+        if datetime_fields and timezone:
+            self.rows = convert_datetime_columns(self.columns, self.rows, datetime_fields, timezone)
+
+    @classmethod
+    def from_queryset(cls, queryset, fields, **kwargs):
+        return cls(fields, queryset.values_list(*fields), **kwargs)
+
+    @classmethod
+    def from_dicts(cls, results):
+        results = list(results)
+        columns = list(results[0]) if results else []
+        return cls(columns, [tuple(result.get(column) for column in columns) for result in results])
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __iter__(self):
+        columns = self.columns
+        return (dict(zip(columns, row)) for row in self.rows)
+
+    def to_dicts(self):
+        return list(self)
+
+
+def get_group_ids(rows, id_index, group_index):
+    """
+    Group values of every row id for an m2m group by, which returns a row per
+    id and value. Returns the first row of each id, in order, and its values
+    as strings in order of appearance.
+    """
+    first_rows = {}
+    group_ids = {}
+    for row in rows:
+        row_id = row[id_index]
+        values = group_ids.get(row_id)
+        if values is None:
+            first_rows[row_id] = row
+            group_ids[row_id] = values = []
+        value = str(row[group_index])
+        if value not in values:
+            values.append(value)
+    return first_rows, group_ids
+
+
+def as_columnar(results):
+    return results if isinstance(results, ColumnarResults) else ColumnarResults.from_dicts(results)
+
+
 class OffsetPaginator:
     """
     The Offset paginator using the offset and limit
@@ -152,7 +213,7 @@ class OffsetPaginator:
         if cursor.value != limit and cursor.is_prev:
             results = results[-(limit + 1) :]
 
-        total_count = self.total_count_queryset.count() if self.total_count_queryset else queryset.count()
+        total_count = self.total_count_queryset.count() if self.total_count_queryset is not None else queryset.count()
 
         # Check if there are more results available after the current page
 
@@ -318,61 +379,47 @@ class GroupedOffsetPaginator(OffsetPaginator):
             for field in self.group_by_fields
         }
 
-    def __result_already_added(self, result, group):
-        # Check if the result is already added then add it
-        for existing_issue in group:
-            if existing_issue["id"] == result["id"]:
-                return True
-        return False
-
     def __query_multi_grouper(self, results):
-        # Grouping for m2m values
+        # Grouping for m2m values, the group totals are read first
         total_group_dict = self.__get_total_dict()
+        columns = results.columns
+        field_name = self.FIELD_MAPPER.get(self.group_by_field_name)
+        first_rows, group_ids = get_group_ids(
+            results.rows, columns.index("id"), columns.index(self.group_by_field_name)
+        )
 
-        # Preparing a dict to keep track of group IDs associated with each entity ID
-        result_group_mapping = defaultdict(set)
-        # Preparing a dict to group result by group ID
-        grouped_by_field_name = defaultdict(list)
-
-        # Iterate over results to fill the above dictionaries
-        for result in results:
-            result_id = result["id"]
-            group_id = result[self.group_by_field_name]
-            result_group_mapping[str(result_id)].add(str(group_id))
-
-        # Adding group_ids key to each issue and grouping by group_name
-        for result in results:
-            result_id = result["id"]
-            group_ids = list(result_group_mapping[str(result_id)])
-            result[self.FIELD_MAPPER.get(self.group_by_field_name)] = [] if "None" in group_ids else group_ids
-            # If a result belongs to multiple groups, add it to each group
-            for group_id in group_ids:
-                if not self.__result_already_added(result, grouped_by_field_name[group_id]):
-                    grouped_by_field_name[group_id].append(result)
-
-        # Convert grouped_by_field_name back to a list for each group
-        processed_results = {
-            str(group_id): {
-                "results": issues,
-                "total_results": total_group_dict.get(str(group_id)),
-            }
-            for group_id, issues in grouped_by_field_name.items()
-        }
+        # Add every result once to each of its groups, in order of appearance
+        processed_results = {}
+        for result_id, row in first_rows.items():
+            ids = group_ids[result_id]
+            result = dict(zip(columns, row))
+            result[field_name] = [] if "None" in ids else ids
+            for group_id in ids:
+                group = processed_results.get(group_id)
+                if group is None:
+                    group = processed_results[group_id] = {
+                        "results": [],
+                        "total_results": total_group_dict.get(group_id),
+                    }
+                group["results"].append(result)
 
         return processed_results
 
     def __query_grouper(self, results):
         # Grouping for values that are not m2m
         processed_results = self.__get_field_dict()
-        for result in results:
-            group_value = str(result.get(self.group_by_field_name))
-            if group_value in processed_results:
-                processed_results[str(group_value)]["results"].append(result)
+        columns = results.columns
+        group_index = columns.index(self.group_by_field_name)
+        for row in results.rows:
+            group = processed_results.get(str(row[group_index]))
+            if group is not None:
+                group["results"].append(dict(zip(columns, row)))
         return processed_results
 
     def process_results(self, results):
         # Process results
         if results:
+            results = as_columnar(results)
             if self.group_by_field_name in self.FIELD_MAPPER:
                 processed_results = self.__query_multi_grouper(results=results)
             else:
@@ -563,60 +610,51 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
     def __query_multi_grouper(self, results):
         # Multi grouper
         processed_results = self.__get_field_dict()
-        # Preparing a dict to keep track of group IDs associated with each label ID
-        result_group_mapping = defaultdict(set)
-        result_sub_group_mapping = defaultdict(set)
-
-        # Iterate over results to fill the above dictionaries
-        if self.group_by_field_name in self.FIELD_MAPPER:
-            for result in results:
-                result_id = result["id"]
-                group_id = result[self.group_by_field_name]
-                result_group_mapping[str(result_id)].add(str(group_id))
-        # Use the same calculation for the sub group
-        if self.sub_group_by_field_name in self.FIELD_MAPPER:
-            for result in results:
-                result_id = result["id"]
-                sub_group_id = result[self.sub_group_by_field_name]
-                result_sub_group_mapping[str(result_id)].add(str(sub_group_id))
-
-        # Iterate over results
-        for result in results:
-            # Get the group value
-            group_value = str(result.get(self.group_by_field_name))
-            # Get the sub group value
-            sub_group_value = str(result.get(self.sub_group_by_field_name))
-            # Check if the group value is in the processed results
-            result_id = result["id"]
-
-            if group_value in processed_results and sub_group_value in processed_results[str(group_value)]["results"]:
-                if self.group_by_field_name in self.FIELD_MAPPER:
-                    # for multi grouper
-                    group_ids = list(result_group_mapping[str(result_id)])
-                    result[self.FIELD_MAPPER.get(self.group_by_field_name)] = [] if "None" in group_ids else group_ids
-                if self.sub_group_by_field_name in self.FIELD_MAPPER:
-                    sub_group_ids = list(result_sub_group_mapping[str(result_id)])
-                    # for multi groups
-                    result[self.FIELD_MAPPER.get(self.sub_group_by_field_name)] = (
-                        [] if "None" in sub_group_ids else sub_group_ids
-                    )
-                # If a result belongs to multiple groups, add it to each group
-                processed_results[str(group_value)]["results"][str(sub_group_value)]["results"].append(result)
+        columns = results.columns
+        id_index = columns.index("id")
+        group_index = columns.index(self.group_by_field_name)
+        sub_group_index = columns.index(self.sub_group_by_field_name)
+
+        # Group and sub group values of each result for the m2m fields
+        group_field_name = self.FIELD_MAPPER.get(self.group_by_field_name)
+        sub_group_field_name = self.FIELD_MAPPER.get(self.sub_group_by_field_name)
+        group_ids = get_group_ids(results.rows, id_index, group_index)[1] if group_field_name else None
+        sub_group_ids = get_group_ids(results.rows, id_index, sub_group_index)[1] if sub_group_field_name else None
+
+        for row in results.rows:
+            group = processed_results.get(str(row[group_index]))
+            sub_group = group["results"].get(str(row[sub_group_index])) if group is not None else None
+            if sub_group is None:
+                continue
+
+            result = dict(zip(columns, row))
+            if group_ids is not None:
+                ids = group_ids[row[id_index]]
+                result[group_field_name] = [] if "None" in ids else list(ids)
+            if sub_group_ids is not None:
+                ids = sub_group_ids[row[id_index]]
+                result[sub_group_field_name] = [] if "None" in ids else list(ids)
+            # A result belonging to several groups is added to each of them
+            sub_group["results"].append(result)
 
         return processed_results
 
     def __query_grouper(self, results):
         # Single grouper
         processed_results = self.__get_field_dict()
-        for result in results:
-            group_value = str(result.get(self.group_by_field_name))
-            sub_group_value = str(result.get(self.sub_group_by_field_name))
-            processed_results[group_value]["results"][sub_group_value]["results"].append(result)
+        columns = results.columns
+        group_index = columns.index(self.group_by_field_name)
+        sub_group_index = columns.index(self.sub_group_by_field_name)
+        for row in results.rows:
+            processed_results[str(row[group_index])]["results"][str(row[sub_group_index])]["results"].append(
+                dict(zip(columns, row))
+            )
 
         return processed_results
 
     def process_results(self, results):
         if results:
+            results = as_columnar(results)
             if self.group_by_field_name in self.FIELD_MAPPER or self.sub_group_by_field_name in self.FIELD_MAPPER:
                 # if the grouping is done through m2m then
                 processed_results = self.__query_multi_grouper(results=results)
@@ -701,6 +739,8 @@ class BasePaginator:
 
         if group_by_field_name:
             results = paginator.process_results(results=results)
+        elif isinstance(results, ColumnarResults):
+            results = results.to_dicts()
 
         # Add Manipulation functions to the response
         if controller is not None:
@@ -0,0 +1,193 @@
+"""
+Monthly range partitions of the tables partitioned by created_at.
+
+A partition covers one calendar month in UTC and is named <table>_pYYYYMM.
+The rows that existed when a table was partitioned stay in <table>_legacy,
+and <table>_default only catches rows outside of every other partition.
+The maintenance task creates the partitions of the coming months ahead of
+time, so rows never land in the default partition, and the cleanup tasks
+archive and drop the partitions past their retention as a whole.
+"""
+
+# Python imports
+import logging
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import List, Optional
+
+# Django imports
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+logger = logging.getLogger("plane.worker")
+
+PARTITION_BOUND_PATTERN = re.compile(r"FROM \((.+?)\) TO \((.+?)\)")
+INDEX_METHOD_PATTERN = re.compile(r"USING .+$")
+
+
+@dataclass
+class Partition:
+    name: str
+    # None for MINVALUE and MAXVALUE, both are None for the default partition
+    lower: Optional[datetime]
+    upper: Optional[datetime]
+    is_default: bool = False
+
+
+def month_start(value):
+    return datetime(value.year, value.month, 1, tzinfo=timezone.utc)
+
+
+def add_months(value, months):
+    month = value.month - 1 + months
+    return datetime(value.year + month // 12, month % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+def get_partition_name(table, month):
+    return f"{table}_p{month:%Y%m}"
+
+
+def parse_bound(value):
+    # Timestamps are rendered with the offset of the session timezone
+    if value in ("MINVALUE", "MAXVALUE"):
+        return None
+    return datetime.fromisoformat(value.strip("'")).astimezone(timezone.utc)
+
+
+def get_partitions(table, using=DEFAULT_DB_ALIAS) -> List[Partition]:
+    """The partitions of a table, ordered by their lower bound"""
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = %s
+            """,
+            [table],
+        )
+        rows = cursor.fetchall()
+
+    partitions = []
+    for name, bound in rows:
+        match = PARTITION_BOUND_PATTERN.search(bound)
+        if match is None:
+            partitions.append(Partition(name, None, None, is_default=True))
+        else:
+            partitions.append(Partition(name, parse_bound(match.group(1)), parse_bound(match.group(2))))
+    earliest = datetime.min.replace(tzinfo=timezone.utc)
+    return sorted(partitions, key=lambda partition: (partition.is_default, partition.lower or earliest))
+
+
+def create_partitions(table, months_ahead=3, now=None, using=DEFAULT_DB_ALIAS):
+    """Create the missing monthly partitions from the current month to months_ahead"""
+    now = now or datetime.now(timezone.utc)
+    partitions = [partition for partition in get_partitions(table, using=using) if not partition.is_default]
+    created = []
+    for offset in range(months_ahead + 1):
+        lower = add_months(month_start(now), offset)
+        upper = add_months(lower, 1)
+        # Skip the months already covered, e.g. by the legacy partition
+        if any(
+            (partition.lower is None or partition.lower < upper)
+            and (partition.upper is None or partition.upper > lower)
+            for partition in partitions
+        ):
+            continue
+
+        name = get_partition_name(table, lower)
+        # DDL takes no parameters, the bounds are literals built from datetimes
+        with transaction.atomic(using=using), connections[using].cursor() as cursor:
+            cursor.execute(
+                f'CREATE TABLE "{name}" PARTITION OF "{table}" '
+                f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+            )
+        partitions.append(Partition(name, lower, upper))
+        created.append(name)
+        logger.info(f"Created partition {name}")
+    return created
+
+
+def get_expired_partitions(table, before, using=DEFAULT_DB_ALIAS):
+    """The partitions only holding rows created before the given time"""
+    return [
+        partition
+        for partition in get_partitions(table, using=using)
+        if not partition.is_default and partition.upper is not None and partition.upper <= before
+    ]
+
+
+def drop_partition(table, name, using=DEFAULT_DB_ALIAS):
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        cursor.execute(f'ALTER TABLE "{table}" DETACH PARTITION "{name}"')
+        cursor.execute(f'DROP TABLE "{name}"')
+    logger.info(f"Dropped partition {name}")
+
+
+def partition_table(table, months_ahead=3, using=DEFAULT_DB_ALIAS):
+    """
+    Turn a table into one partitioned by month of created_at. The existing
+    rows are not copied, the table is attached as the legacy partition of
+    everything before next month. The parent gets the same checks, foreign
+    keys and indexes, and its primary key becomes (id, created_at).
+
+    The bound of the legacy rows is checked, and the unique index backing
+    the new primary key built, ahead of the swap, so that the attach neither
+    scans nor indexes the table. Run outside of a transaction, e.g. from a
+    non-atomic migration, both happen without blocking writes.
+    """
+    legacy = f"{table}_legacy"
+    upper = add_months(month_start(datetime.now(timezone.utc)), 1)
+    bound_check = f"{legacy}_bound_check"
+    # CONCURRENTLY cannot run inside a transaction
+    concurrently = "" if connections[using].in_atomic_block else "CONCURRENTLY "
+    with connections[using].cursor() as cursor:
+        cursor.execute(f'CREATE UNIQUE INDEX {concurrently}IF NOT EXISTS "{legacy}_pkey" ON "{table}" (id, created_at)')
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        cursor.execute(
+            f'ALTER TABLE "{table}" ADD CONSTRAINT "{bound_check}" '
+            f"CHECK (created_at < '{upper.isoformat()}') NOT VALID"
+        )
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        cursor.execute(f'ALTER TABLE "{table}" VALIDATE CONSTRAINT "{bound_check}"')
+
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        cursor.execute(
+            "SELECT conname, contype, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = %s::regclass AND contype IN ('p', 'f')",
+            [table],
+        )
+        constraints = cursor.fetchall()
+        # A unique index has to include created_at on the parent, so those
+        # stay on the legacy partition only
+        cursor.execute(
+            "SELECT pg_get_indexdef(indexrelid) FROM pg_index WHERE indrelid = %s::regclass AND NOT indisunique",
+            [table],
+        )
+        indexes = [row[0] for row in cursor.fetchall()]
+
+        cursor.execute(f'ALTER TABLE "{table}" RENAME TO "{legacy}"')
+        for name, kind, _ in constraints:
+            if kind == "p":
+                cursor.execute(f'ALTER TABLE "{legacy}" DROP CONSTRAINT "{name}"')
+        # The attach only reuses an index backing a constraint
+        cursor.execute(f'ALTER TABLE "{legacy}" ADD CONSTRAINT "{legacy}_pkey" PRIMARY KEY USING INDEX "{legacy}_pkey"')
+        cursor.execute(
+            f'CREATE TABLE "{table}" (LIKE "{legacy}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+            "PARTITION BY RANGE (created_at)"
+        )
+        cursor.execute(f'ALTER TABLE "{table}" DROP CONSTRAINT "{bound_check}"')
+        cursor.execute(f'ALTER TABLE "{table}" ADD PRIMARY KEY (id, created_at)')
+        for name, kind, definition in constraints:
+            if kind == "f":
+                cursor.execute(f'ALTER TABLE "{table}" ADD CONSTRAINT "{name}" {definition}')
+        for definition in indexes:
+            cursor.execute(f'CREATE INDEX ON "{table}" {INDEX_METHOD_PATTERN.search(definition).group(0)}')
+        cursor.execute(
+            f'ALTER TABLE "{table}" ATTACH PARTITION "{legacy}" FOR VALUES FROM (MINVALUE) TO (\'{upper.isoformat()}\')'
+        )
+        cursor.execute(f'ALTER TABLE "{legacy}" DROP CONSTRAINT "{bound_check}"')
+        cursor.execute(f'CREATE TABLE "{table}_default" PARTITION OF "{table}" DEFAULT')
+    logger.info(f"Partitioned {table}")
+    return create_partitions(table, months_ahead=months_ahead, using=using)
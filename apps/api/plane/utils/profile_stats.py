@@ -0,0 +1,154 @@
+# Python imports
+import hashlib
+
+# Django imports
+from django.core.cache import cache
+from django.db.models import BooleanField, Count, Exists, ExpressionWrapper, OuterRef, Q
+from django.utils import timezone
+
+# Module imports
+from plane.db.models import CycleIssue, Issue, IssueAssignee, IssueSubscriber
+from plane.utils.issue_filters import issue_filters
+
+# Stats are recomputed at least this often, covering changes that do not go
+# through the activity stream (e.g. subscriptions or cycle dates)
+PROFILE_STATS_TTL = 60 * 10
+
+PRIORITY_ORDER = ["urgent", "high", "medium", "low", "none"]
+
+
+def get_profile_stats_version_key(slug):
+    return f"profile:stats:version:{slug}"
+
+
+def get_profile_stats_version(slug):
+    return cache.get(get_profile_stats_version_key(slug), 0)
+
+
+def bump_profile_stats_version(slug):
+    """Outdate every cached profile of a workspace"""
+    key = get_profile_stats_version_key(slug)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # The key does not exist yet
+        cache.set(key, 1, timeout=None)
+
+
+def get_profile_stats_key(slug, user_id, viewer_id, query_params, version):
+    """Stats depend on the projects the viewer can see and on the filters"""
+    signature = "&".join(f"{key}={','.join(sorted(query_params.getlist(key)))}" for key in sorted(query_params.keys()))
+    digest = hashlib.sha256(signature.encode("utf-8")).hexdigest()[:32]
+    return f"profile:stats:{slug}:{user_id}:{viewer_id}:{version}:{digest}"
+
+
+def get_issue_stats(slug, user_id, viewer, filters):
+    """
+    Counts of the issues created by or assigned to the user, grouped once by
+    (state group, priority, assigned, created) and folded in memory.
+    """
+    rows = (
+        Issue.issue_objects.filter(
+            workspace__slug=slug,
+            project__project_projectmember__member=viewer,
+            project__project_projectmember__is_active=True,
+        )
+        .filter(**filters)
+        .annotate(
+            is_assigned=Exists(IssueAssignee.objects.filter(issue_id=OuterRef("id"), assignee_id=user_id)),
+            is_created=ExpressionWrapper(Q(created_by_id=user_id), output_field=BooleanField()),
+        )
+        .filter(Q(is_assigned=True) | Q(is_created=True))
+        .values("state__group", "priority", "is_assigned", "is_created")
+        .annotate(count=Count("id", distinct=True))
+        .order_by()
+    )
+
+    states = {}
+    priorities = {}
+    stats = {"created_issues": 0, "assigned_issues": 0, "completed_issues": 0, "pending_issues": 0}
+    for row in rows:
+        count = row["count"]
+        if row["is_created"]:
+            stats["created_issues"] += count
+        if not row["is_assigned"]:
+            continue
+
+        state_group = row["state__group"]
+        stats["assigned_issues"] += count
+        if state_group == "completed":
+            stats["completed_issues"] += count
+        if state_group not in ["completed", "cancelled"]:
+            stats["pending_issues"] += count
+        if state_group is not None:
+            states[state_group] = states.get(state_group, 0) + count
+        if row["priority"] is not None:
+            priorities[row["priority"]] = priorities.get(row["priority"], 0) + count
+
+    stats["state_distribution"] = [
+        {"state_group": state_group, "state_count": count} for state_group, count in sorted(states.items())
+    ]
+    stats["priority_distribution"] = sorted(
+        (
+            {
+                "priority": priority,
+                "priority_count": count,
+                "priority_order": (
+                    PRIORITY_ORDER.index(priority) if priority in PRIORITY_ORDER else len(PRIORITY_ORDER)
+                ),
+            }
+            for priority, count in priorities.items()
+        ),
+        key=lambda item: item["priority_order"],
+    )
+    return stats
+
+
+def get_cycle_stats(slug, user_id):
+    """Present and upcoming cycles containing issues assigned to the user"""
+    now = timezone.now()
+    cycles = (
+        CycleIssue.objects.filter(workspace__slug=slug, issue__assignees__in=[user_id])
+        .filter(Q(cycle__start_date__gt=now) | Q(cycle__start_date__lt=now, cycle__end_date__gt=now))
+        .values("cycle__name", "cycle__id", "cycle__project_id", "cycle__start_date")
+        .distinct()
+    )
+
+    present_cycles = []
+    upcoming_cycles = []
+    for cycle in cycles:
+        start_date = cycle.pop("cycle__start_date")
+        (upcoming_cycles if start_date > now else present_cycles).append(cycle)
+    return {"present_cycles": present_cycles, "upcoming_cycles": upcoming_cycles}
+
+
+def compute_profile_stats(slug, user_id, viewer, query_params):
+    filters = issue_filters(query_params, "GET")
+    stats = get_issue_stats(slug, user_id, viewer, filters)
+    stats["subscribed_issues"] = (
+        IssueSubscriber.objects.filter(
+            workspace__slug=slug,
+            subscriber_id=user_id,
+            project__project_projectmember__member=viewer,
+            project__project_projectmember__is_active=True,
+            project__archived_at__isnull=True,
+        )
+        .filter(**{f"issue__{key}": value for key, value in filters.items()})
+        .count()
+    )
+    stats.update(get_cycle_stats(slug, user_id))
+    return stats
+
+
+def get_profile_stats(slug, user_id, viewer, query_params):
+    """
+    Profile statistics of a workspace member as seen by the viewer, cached
+    until the next issue activity in the workspace or PROFILE_STATS_TTL.
+    """
+    version = get_profile_stats_version(slug)
+    key = get_profile_stats_key(slug, user_id, viewer.id, query_params, version)
+    stats = cache.get(key)
+    if stats is None:
+        stats = compute_profile_stats(slug, user_id, viewer, query_params)
+        cache.set(key, stats, PROFILE_STATS_TTL)
+    return stats
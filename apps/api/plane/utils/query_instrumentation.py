@@ -0,0 +1,184 @@
+"""
+Per-request database query instrumentation.
+
+QueryInstrumentation is installed with connection.execute_wrapper around a
+request and records the number of statements, the time spent in the database,
+the slowest statements and how often each statement shape (fingerprint) ran.
+A fingerprint executed many times in one request is the signature of an N+1
+access pattern. Slow SELECT statements can optionally be sampled and explained
+with EXPLAIN (ANALYZE, BUFFERS) once the request is done.
+"""
+
+# Python imports
+import hashlib
+import heapq
+import random
+import re
+import time
+from contextlib import ExitStack, contextmanager
+
+# Django imports
+from django.conf import settings
+from django.db import connections, transaction
+
+# Module imports
+from plane.utils.exception_logger import log_exception
+
+# Longest SQL text kept in the log records
+MAX_SQL_LENGTH = 1000
+
+STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+PLACEHOLDER = re.compile(r"%s|%\(\w+\)s")
+VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(sql):
+    """Replace literals and parameters so statements differing only in values match"""
+    sql = STRING_LITERAL.sub("?", sql)
+    sql = PLACEHOLDER.sub("?", sql)
+    sql = NUMBER_LITERAL.sub("?", sql)
+    sql = VALUE_LIST.sub("(...)", sql)
+    return WHITESPACE.sub(" ", sql).strip()
+
+
+def get_sql_fingerprint(sql):
+    return hashlib.md5(normalize_sql(sql).encode("utf-8")).hexdigest()[:12]
+
+
+class QueryInstrumentation:
+    """
+    Execute wrapper collecting query statistics for one request. A single
+    instance can be installed on several connections.
+    """
+
+    def __init__(self, slow_threshold_ms=None, repeat_threshold=None, slowest_limit=None):
+        self.slow_threshold_ms = settings.QUERY_SLOW_THRESHOLD_MS if slow_threshold_ms is None else slow_threshold_ms
+        self.repeat_threshold = settings.QUERY_REPEAT_THRESHOLD if repeat_threshold is None else repeat_threshold
+        self.slowest_limit = settings.QUERY_SLOWEST_LIMIT if slowest_limit is None else slowest_limit
+        self.query_count = 0
+        self.db_time = 0.0
+        # fingerprint -> [count, total duration, sample sql]
+        self.fingerprints = {}
+        # Min-heap of (duration, sequence, query) holding the slowest statements
+        self.slowest = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.record(sql, params, many, time.perf_counter() - start, context["connection"].alias)
+
+    def record(self, sql, params, many, duration, alias):
+        self.query_count += 1
+        self.db_time += duration
+
+        fingerprint = get_sql_fingerprint(sql)
+        stats = self.fingerprints.setdefault(fingerprint, [0, 0.0, sql])
+        stats[0] += 1
+        stats[1] += duration
+
+        query = {
+            "fingerprint": fingerprint,
+            "duration": duration,
+            "sql": sql,
+            "params": params,
+            "many": many,
+            "alias": alias,
+        }
+        entry = (duration, self.query_count, query)
+        if len(self.slowest) < self.slowest_limit:
+            heapq.heappush(self.slowest, entry)
+        elif self.slowest and duration > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, entry)
+
+    def get_slowest_queries(self):
+        return [query for _, _, query in sorted(self.slowest, key=lambda entry: entry[0], reverse=True)]
+
+    def get_slow_queries(self):
+        return [query for query in self.get_slowest_queries() if query["duration"] * 1000 >= self.slow_threshold_ms]
+
+    def get_repeated_queries(self):
+        """Statements run at least repeat_threshold times, the N+1 signatures"""
+        repeated = [
+            {
+                "fingerprint": fingerprint,
+                "count": count,
+                "db_time_ms": round(duration * 1000, 2),
+                "sql": normalize_sql(sql)[:MAX_SQL_LENGTH],
+            }
+            for fingerprint, (count, duration, sql) in self.fingerprints.items()
+            if count >= self.repeat_threshold
+        ]
+        return sorted(repeated, key=lambda item: item["count"], reverse=True)
+
+    def get_log_fields(self):
+        """Structured fields added to the request log record"""
+        return {
+            "query_count": self.query_count,
+            "db_time_ms": round(self.db_time * 1000, 2),
+            "slowest_queries": [
+                {
+                    "fingerprint": query["fingerprint"],
+                    "duration_ms": round(query["duration"] * 1000, 2),
+                    "sql": query["sql"][:MAX_SQL_LENGTH],
+                }
+                for query in self.get_slowest_queries()
+            ],
+            "repeated_queries": self.get_repeated_queries(),
+        }
+
+
+@contextmanager
+def instrument_queries(instrumentation):
+    """Install the instrumentation on every configured database connection"""
+    with ExitStack() as stack:
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(instrumentation))
+        yield instrumentation
+
+
+def should_explain():
+    sample_rate = settings.QUERY_EXPLAIN_SAMPLE_RATE
+    return sample_rate > 0 and random.random() < sample_rate
+
+
+def explain_query(query):
+    """
+    Run EXPLAIN (ANALYZE, BUFFERS) for a recorded statement. ANALYZE executes
+    the statement again, so only single SELECT statements are explained and
+    the run is bounded by QUERY_EXPLAIN_TIMEOUT_MS.
+    """
+    if query["many"] or not query["sql"].lstrip().upper().startswith("SELECT"):
+        return None
+
+    connection = connections[query["alias"]]
+    if connection.vendor != "postgresql" or connection.needs_rollback:
+        return None
+
+    try:
+        with transaction.atomic(using=query["alias"]), connection.cursor() as cursor:
+            cursor.execute(f"SET LOCAL statement_timeout = {int(settings.QUERY_EXPLAIN_TIMEOUT_MS)}")
+            cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {query['sql']}", query["params"])
+            return "\n".join(row[0] for row in cursor.fetchall())
+    except Exception as e:
+        log_exception(e, warning=True)
+        return None
+
+
+def explain_slow_queries(instrumentation):
+    """Plans of the slow statements of a sampled request"""
+    plans = []
+    for query in instrumentation.get_slow_queries()[: settings.QUERY_EXPLAIN_MAX_PER_REQUEST]:
+        plan = explain_query(query)
+        if plan is not None:
+            plans.append(
+                {
+                    "fingerprint": query["fingerprint"],
+                    "duration_ms": round(query["duration"] * 1000, 2),
+                    "plan": plan,
+                }
+            )
+    return plans
@@ -0,0 +1,158 @@
+# Python imports
+import time
+import uuid
+from datetime import datetime, timezone as dt_timezone
+
+# Module imports
+from plane.settings.redis import redis_instance
+
+# Maximum number of recent visits kept per user and workspace
+RECENT_VISIT_LIMIT = 20
+
+# Buffers of inactive users expire after 30 days
+RECENT_VISIT_TTL = 60 * 60 * 24 * 30
+
+# Set of buffer keys that received visits since the last flush
+RECENT_VISIT_DIRTY_KEY = "recent_visits:dirty"
+
+RECENT_VISIT_KEY_PREFIX = "recent_visits:user"
+
+_redis_client = None
+
+
+def get_redis_client():
+    """Reuse a single client (and its connection pool) per process"""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis_instance()
+    return _redis_client
+
+
+def get_recent_visit_key(slug, user_id):
+    return f"{RECENT_VISIT_KEY_PREFIX}:{slug}:{user_id}"
+
+
+def parse_recent_visit_key(key):
+    """Return (slug, user_id) for a buffer key"""
+    if isinstance(key, bytes):
+        key = key.decode()
+    slug, user_id = key[len(RECENT_VISIT_KEY_PREFIX) + 1 :].rsplit(":", 1)
+    return slug, user_id
+
+
+def _encode_member(entity_name, entity_identifier, project_id):
+    return f"{entity_name}:{entity_identifier}:{project_id or ''}"
+
+
+def _decode_member(member, score):
+    if isinstance(member, bytes):
+        member = member.decode()
+    entity_name, entity_identifier, project_id = member.split(":")
+    return {
+        "entity_name": entity_name,
+        "entity_identifier": entity_identifier,
+        "project_id": project_id or None,
+        "visited_at": datetime.fromtimestamp(score, tz=dt_timezone.utc),
+    }
+
+
+def get_recent_visit_id(slug, user_id, entity_name, entity_identifier):
+    """Stable identifier for a visit served straight from the buffer"""
+    return uuid.uuid5(uuid.NAMESPACE_URL, f"{slug}/{user_id}/{entity_name}/{entity_identifier}")
+
+
+def record_recent_visit(entity_name, entity_identifier, user_id, project_id, slug):
+    """
+    Record a visit in the user's sorted set and mark it for flushing.
+
+    The add, the trim to RECENT_VISIT_LIMIT and the dirty marker run in a
+    single MULTI block, so concurrent visits can never leave more than
+    RECENT_VISIT_LIMIT entries behind.
+    """
+    key = get_recent_visit_key(slug, user_id)
+    pipe = get_redis_client().pipeline(transaction=True)
+    pipe.zadd(key, {_encode_member(entity_name, entity_identifier, project_id): time.time()})
+    pipe.zremrangebyrank(key, 0, -(RECENT_VISIT_LIMIT + 1))
+    pipe.expire(key, RECENT_VISIT_TTL)
+    pipe.sadd(RECENT_VISIT_DIRTY_KEY, key)
+    pipe.execute()
+
+
+def get_recent_visits(slug, user_id):
+    """
+    Return the buffered visits, newest first, or None when the buffer is cold.
+    """
+    members = get_redis_client().zrevrange(get_recent_visit_key(slug, user_id), 0, -1, withscores=True)
+    if not members:
+        return None
+    return [_decode_member(member, score) for member, score in members]
+
+
+def warm_recent_visits(slug, user_id, visits):
+    """Seed a cold buffer from persisted visits without marking it dirty"""
+    if not visits:
+        return
+    key = get_recent_visit_key(slug, user_id)
+    mapping = {
+        _encode_member(visit["entity_name"], visit["entity_identifier"], visit["project_id"]): visit[
+            "visited_at"
+        ].timestamp()
+        for visit in visits
+    }
+    pipe = get_redis_client().pipeline(transaction=True)
+    # Never move a visit recorded meanwhile back in time
+    pipe.zadd(key, mapping, gt=True)
+    pipe.zremrangebyrank(key, 0, -(RECENT_VISIT_LIMIT + 1))
+    pipe.expire(key, RECENT_VISIT_TTL)
+    pipe.execute()
+
+
+def remove_recent_visit(slug, user_ids, entity_name, entity_identifier, project_id):
+    """
+    Remove a deleted entity from the buffers of the given users and from
+    every buffer of the workspace awaiting a flush, which would otherwise
+    write the visit back to the database.
+    """
+    client = get_redis_client()
+    prefix = get_recent_visit_key(slug, "")
+    keys = {get_recent_visit_key(slug, user_id) for user_id in user_ids}
+    keys.update(key.decode() for key in client.sscan_iter(RECENT_VISIT_DIRTY_KEY, match=f"{prefix}*"))
+    if not keys:
+        return
+
+    member = _encode_member(entity_name, entity_identifier, project_id)
+    pipe = client.pipeline(transaction=False)
+    for key in keys:
+        pipe.zrem(key, member)
+    pipe.execute()
+
+
+def pop_dirty_recent_visits(count):
+    """
+    Pop up to `count` dirty buffers and return {(slug, user_id): [visits]}.
+
+    Buffers that receive new visits after being popped are marked dirty again
+    and picked up by the next flush.
+    """
+    client = get_redis_client()
+    keys = client.spop(RECENT_VISIT_DIRTY_KEY, count)
+    if not keys:
+        return {}
+
+    pipe = client.pipeline(transaction=False)
+    for key in keys:
+        pipe.zrange(key, 0, -1, withscores=True)
+    results = pipe.execute()
+
+    return {
+        parse_recent_visit_key(key): [_decode_member(member, score) for member, score in members]
+        for key, members in zip(keys, results)
+        if members
+    }
+
+
+def mark_recent_visits_dirty(owners):
+    """Queue (slug, user_id) buffers for the next flush"""
+    keys = [get_recent_visit_key(slug, user_id) for slug, user_id in owners]
+    if keys:
+        get_redis_client().sadd(RECENT_VISIT_DIRTY_KEY, *keys)
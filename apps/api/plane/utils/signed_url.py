@@ -0,0 +1,125 @@
+"""
+Cache of the presigned URLs the asset endpoints redirect to.
+
+The URLs of an asset are cached under one key per asset, by storage endpoint
+(MinIO URLs are signed for the host of the request) and content disposition.
+An entry lives for SIGNED_URL_CACHE_FRACTION of the URL expiry, so a cached
+URL always stays valid for the rest of its lifetime, which is also how long
+browsers may cache the redirect. Entries past their own expiry are misses,
+and the key expires with the earliest of its entries.
+"""
+
+# Python imports
+import time
+
+# Django imports
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponseRedirect
+from django.utils.cache import patch_cache_control
+
+SIGNED_URL_CACHE_PREFIX = "asset_signed_url:"
+
+
+def get_signed_url_cache_key(asset_id):
+    return f"{SIGNED_URL_CACHE_PREFIX}{asset_id}"
+
+
+def get_signed_url_cache_ttl():
+    return int(settings.SIGNED_URL_EXPIRATION * settings.SIGNED_URL_CACHE_FRACTION)
+
+
+def _get_url_key(storage, disposition):
+    return f"{storage.s3_client.meta.endpoint_url}|{disposition}"
+
+
+def _get_entry(urls, url_key):
+    """The cached (url, max age) under url_key, None when missing or expired"""
+    entry = urls.get(url_key)
+    if entry is None:
+        return None
+    url, cached_until = entry
+    max_age = int(cached_until - time.time())
+    return (url, max_age) if max_age > 0 else None
+
+
+def _add_entry(urls, url_key, url, ttl):
+    """
+    Add a signed URL to the cached URLs of an asset, dropping the expired ones,
+    and return the TTL of the key, which ends with its earliest entry.
+    """
+    now = time.time()
+    urls[url_key] = (url, now + ttl)
+    for key in [key for key, (_, cached_until) in urls.items() if cached_until <= now]:
+        del urls[key]
+    return max(int(min(cached_until for _, cached_until in urls.values()) - now), 1)
+
+
+def get_cached_signed_url(storage, asset_id, disposition="inline"):
+    """Return the cached (url, max age) of an asset or None"""
+    return _get_entry(cache.get(get_signed_url_cache_key(asset_id)) or {}, _get_url_key(storage, disposition))
+
+
+def get_signed_url(storage, asset, disposition="inline", filename=None):
+    """Return a presigned (url, max age) for the asset, signing it on a cache miss"""
+    cache_key = get_signed_url_cache_key(asset.id)
+    urls = cache.get(cache_key) or {}
+    url_key = _get_url_key(storage, disposition)
+    entry = _get_entry(urls, url_key)
+    if entry is not None:
+        return entry
+
+    url = storage.generate_presigned_url(
+        object_name=asset.asset.name,
+        expiration=settings.SIGNED_URL_EXPIRATION,
+        disposition=disposition,
+        filename=filename,
+    )
+    if url is None:
+        return None, 0
+
+    ttl = get_signed_url_cache_ttl()
+    cache.set(cache_key, urls, _add_entry(urls, url_key, url, ttl))
+    return url, ttl
+
+
+def get_signed_urls(storage, assets, disposition="inline"):
+    """Presigned URLs of many assets by asset id, reading the cache in one call"""
+    cache_keys = {asset.id: get_signed_url_cache_key(asset.id) for asset in assets}
+    cached = cache.get_many(list(cache_keys.values()))
+    url_key = _get_url_key(storage, disposition)
+    ttl = get_signed_url_cache_ttl()
+
+    signed_urls = {}
+    for asset in assets:
+        urls = cached.get(cache_keys[asset.id]) or {}
+        entry = _get_entry(urls, url_key)
+        if entry is not None:
+            signed_urls[asset.id] = entry[0]
+            continue
+
+        url = storage.generate_presigned_url(
+            object_name=asset.asset.name,
+            expiration=settings.SIGNED_URL_EXPIRATION,
+            disposition=disposition,
+        )
+        if url is None:
+            continue
+        signed_urls[asset.id] = url
+        # The keys end with their earliest entry, so each is stored with its own TTL
+        cache.set(cache_keys[asset.id], urls, _add_entry(urls, url_key, url, ttl))
+    return signed_urls
+
+
+def invalidate_signed_urls(*asset_ids):
+    cache.delete_many([get_signed_url_cache_key(asset_id) for asset_id in asset_ids])
+
+
+def signed_url_redirect(url, max_age):
+    """Redirect to a signed URL, letting the browser reuse it while it is cached"""
+    response = HttpResponseRedirect(url)
+    if max_age > 0:
+        patch_cache_control(response, private=True, max_age=max_age)
+    else:
+        patch_cache_control(response, no_store=True)
+    return response
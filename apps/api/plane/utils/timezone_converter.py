@@ -35,6 +35,23 @@ def user_timezone_converter(queryset, datetime_fields, user_timezone):
         return queryset_values
 
 
+def convert_datetime_columns(columns, rows, datetime_fields, user_timezone):
+    """
+    Convert the datetime columns of value tuples to the user's timezone, one
+    column at a time. Datetimes read from the database are already in UTC, so
+    the rows are returned as is for UTC users.
+    """
+    indexes = [columns.index(field) for field in datetime_fields if field in columns]
+    user_tz = pytz.timezone(user_timezone)
+    if not indexes or not rows or user_tz is pytz.utc:
+        return rows
+
+    data = list(zip(*rows))
+    for index in indexes:
+        data[index] = [value.astimezone(user_tz) if value else value for value in data[index]]
+    return list(zip(*data))
+
+
 def convert_to_utc(date, project_id, is_start_date=False):
     """
     Converts a start date string to the project's local timezone at 12:00 AM